@@ -0,0 +1,6 @@
+"""
+성능 측정 스크립트 패키지
+
+디스플레이나 관리자 권한 없이 실행할 수 있는 벤치마크를 제공합니다.
+저장소 루트에서 `python -m benchmarks.<스크립트>` 형태로 실행합니다.
+"""
@@ -0,0 +1,45 @@
+"""
+연속 클릭(버스트) 처리량 벤치마크
+
+기록 백엔드(RecordingBackend)에 주입 호출 한 번당 지연을 설정하고,
+클릭을 하나씩 주입할 때와 N개씩 한 번에 주입할 때의 초당 이벤트 수를 비교합니다.
+기록 백엔드는 SendInput 배치 전송처럼 연속 클릭 한 번에 지연을 한 번만 적용합니다.
+
+실행 방법:
+    python -m benchmarks.bench_burst [호출당 지연(us)] [측정 시간(초)]
+"""
+import sys
+import time
+
+from src.core.input_backend import RecordingBackend
+
+def measure(backend, clicks_per_tick, duration):
+    """지정한 시간 동안 최대한 빠르게 주입하고 초당 이벤트 수 반환"""
+    backend.clear()
+    events = 0
+    end = time.perf_counter() + duration
+    started = time.perf_counter()
+    if clicks_per_tick == 1:
+        while time.perf_counter() < end:
+            backend.click(100, 100)
+            events += 2
+    else:
+        while time.perf_counter() < end:
+            events += backend.click_burst(100, 100, clicks_per_tick)
+    return events / (time.perf_counter() - started)
+
+def main():
+    latency_us = float(sys.argv[1]) if len(sys.argv) > 1 else 20.0
+    duration = float(sys.argv[2]) if len(sys.argv) > 2 else 1.0
+    backend = RecordingBackend(latency=latency_us / 1_000_000)
+
+    print(f"주입 호출당 지연 {latency_us:.0f}us, 항목당 {duration:.1f}초 측정")
+    baseline = None
+    for clicks_per_tick in (1, 5, 10, 50):
+        rate = measure(backend, clicks_per_tick, duration)
+        baseline = baseline or rate
+        label = "개별 주입" if clicks_per_tick == 1 else f"틱당 {clicks_per_tick}클릭"
+        print(f"  {label:>10}: {rate:12,.0f} 이벤트/초 ({rate / baseline:5.1f}배)")
+
+if __name__ == "__main__":
+    main()
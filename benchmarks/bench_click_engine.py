@@ -0,0 +1,49 @@
+"""
+클릭 엔진 처리량/지연 벤치마크
+
+기록 백엔드(RecordingBackend)로 입력을 메모리에 기록하면서 ClickEngine을
+실행하고, 목표 대비 실제 클릭 속도와 데드라인 대비 지연 분포를 측정합니다.
+
+실행 방법:
+    python -m benchmarks.bench_click_engine [클릭 간격(초)] [측정 시간(초)]
+"""
+import sys
+import time
+
+from src.core.click_engine import ClickEngine
+from src.core.input_backend import EVENT_MOUSE_DOWN, RecordingBackend, set_backend
+from src.core.mouse_click import click_at_position
+from src.core.timing import percentile
+
+def run(interval, duration):
+    """지정한 간격으로 클릭 엔진을 실행하고 결과 출력"""
+    backend = set_backend(RecordingBackend())
+    engine = ClickEngine(click_at_position, lambda: (100, 100), interval)
+
+    engine.start()
+    time.sleep(duration)
+    engine.stop()
+    engine.thread.join()
+
+    stats = engine.get_stats()
+    downs = backend.timestamps(EVENT_MOUSE_DOWN)
+    period_ns = engine.period_ns
+    start_ns = engine.started_ns
+
+    # 각 클릭의 이상적인 데드라인 대비 지연 (마이크로초)
+    lags = sorted((t - (start_ns + i * period_ns)) / 1000 for i, t in enumerate(downs))
+
+    print(f"간격 {interval * 1000:.1f}ms, {duration:.1f}초 측정 ({backend.name} 백엔드)")
+    print(f"  목표 {stats['target_cps']:.2f} CPS / 실제 {stats['achieved_cps']:.2f} CPS "
+          f"(클릭 {stats['click_count']}회, 건너뜀 {stats['skipped']}회)")
+    print(f"  데드라인 대비 지연: p50 {percentile(lags, 50):.0f}us, "
+          f"p95 {percentile(lags, 95):.0f}us, p99 {percentile(lags, 99):.0f}us, "
+          f"최대 {lags[-1] if lags else 0:.0f}us")
+
+def main():
+    interval = float(sys.argv[1]) if len(sys.argv) > 1 else 0.1
+    duration = float(sys.argv[2]) if len(sys.argv) > 2 else 5.0
+    run(interval, duration)
+
+if __name__ == "__main__":
+    main()
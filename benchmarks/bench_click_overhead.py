@@ -0,0 +1,111 @@
+"""
+클릭 한 번의 파이썬 측 오버헤드 마이크로벤치마크
+
+Windows 백엔드를 아무 일도 하지 않는 user32 대체 객체로 생성하여
+운영체제 호출을 제외한 순수 파이썬 처리 비용(좌표 변환, 구조체 생성,
+함수 조회 등)만 클릭당 나노초로 측정합니다.
+- 이전 방식: 매번 int() 변환, SetCursorPos 호출, INPUT 구조체 새로 생성
+- 현재 방식: 미리 만든 INPUT 재사용, int() 변환 없음, 실제 커서 위치(GetCursorPos)가 목표와 같으면 SetCursorPos 생략
+  ("생략 끔"은 skip_unchanged=False로 위치 확인 없이 매번 SetCursorPos 호출)
+대체 객체의 GetCursorPos는 파이썬 함수이므로 위치 확인 비용은 실제보다 크게 나오고,
+생략한 SetCursorPos(커서 이동 이벤트 주입)에 드는 운영체제 쪽 비용은 측정에 포함되지 않습니다.
+
+실행 방법:
+    python -m benchmarks.bench_click_overhead [반복 횟수]
+"""
+import sys
+import time
+import ctypes
+
+from src.core.input_backend import (
+    INPUT, INPUT_MOUSE, MOUSE_BUTTON_FLAGS, Win32MouseEventBackend, Win32SendInputBackend,
+)
+
+class NullUser32:
+    """운영체제 호출 대신 아무 일도 하지 않는 user32 대체 객체"""
+
+    def __init__(self):
+        self.x = 0
+        self.y = 0
+
+    def SetCursorPos(self, x, y):
+        self.x = x
+        self.y = y
+        return 1
+
+    def GetCursorPos(self, point_ref):
+        point = point_ref._obj
+        point.x = self.x
+        point.y = self.y
+        return 1
+
+    def mouse_event(self, flags, dx, dy, data, extra):
+        pass
+
+    def SendInput(self, count, inputs, size):
+        return count
+
+    def keybd_event(self, code, scan, flags, extra):
+        pass
+
+    def MapVirtualKeyW(self, code, map_type):
+        return 0
+
+    def VkKeyScanW(self, char):
+        return -1
+
+def legacy_mouse_event_click(user32, x, y):
+    """이전 click_at_position의 mouse_event 경로 (지연 제외)"""
+    try:
+        user32.SetCursorPos(int(x), int(y))
+        user32.mouse_event(0x0002, 0, 0, 0, 0)
+        user32.mouse_event(0x0004, 0, 0, 0, 0)
+    except Exception as e:
+        print(e)
+
+def legacy_sendinput_click(user32, x, y):
+    """클릭마다 INPUT 구조체를 새로 만드는 SendInput 경로"""
+    try:
+        user32.SetCursorPos(int(x), int(y))
+        for flags in MOUSE_BUTTON_FLAGS["left"]:
+            event = INPUT(type=INPUT_MOUSE)
+            event.mi.dwFlags = flags
+            user32.SendInput(1, ctypes.byref(event), ctypes.sizeof(INPUT))
+    except Exception as e:
+        print(e)
+
+def measure(func, count, moving):
+    """클릭당 평균 소요 시간(ns) 측정"""
+    started = time.perf_counter_ns()
+    if moving:
+        for i in range(count):
+            func(i & 1023, 500)
+    else:
+        for _ in range(count):
+            func(500, 500)
+    return (time.perf_counter_ns() - started) / count
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    user32 = NullUser32()
+    mouse_event_backend = Win32MouseEventBackend(user32=user32)
+    sendinput_backend = Win32SendInputBackend(user32=user32)
+    sendinput_always_move = Win32SendInputBackend(user32=user32, skip_unchanged=False)
+
+    cases = [
+        ("이전 mouse_event", lambda x, y: legacy_mouse_event_click(user32, x, y)),
+        ("이전 SendInput", lambda x, y: legacy_sendinput_click(user32, x, y)),
+        ("현재 mouse_event", mouse_event_backend.click),
+        ("현재 SendInput", sendinput_backend.click),
+        ("SendInput 생략 끔", sendinput_always_move.click),
+    ]
+
+    print(f"클릭 {count:,}회, 운영체제 호출 제외 파이썬 오버헤드")
+    for moving in (False, True):
+        print("  [같은 좌표 반복]" if not moving else "  [매번 다른 좌표]")
+        for name, func in cases:
+            per_click = measure(func, count, moving)
+            print(f"    {name:>16}: {per_click:7.0f}ns/클릭 (파이썬 한계 {1e9 / per_click:12,.0f} CPS)")
+
+if __name__ == "__main__":
+    main()
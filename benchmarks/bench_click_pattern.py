@@ -0,0 +1,82 @@
+"""
+클릭 패턴 벤치마크
+
+1. 격자/무작위/좌표 목록 패턴(기본 10만 개)의 NumPy 생성 시간
+2. 클릭마다 좌표를 읽는 비용 비교 - ClickPattern의 파이썬 정수 목록을 색인으로 순회 /
+   NumPy 배열에서 매번 한 행을 꺼냄 (읽을 때마다 행 배열과 NumPy 정수 객체를 새로 만듦)
+3. 클릭 엔진이 패턴을 순서대로 한 바퀴 돌고 스스로 멈추는지 (실제 클릭 없이 좌표만 기록)
+
+실행 방법:
+    python -m benchmarks.bench_click_pattern [좌표 수]
+"""
+import sys
+import time
+
+from src.core.click_engine import ClickEngine
+from src.core.click_pattern import ClickPattern, grid_points, parse_points, random_points
+
+# 좌표 읽기 비교 반복 횟수
+READS = 1_000_000
+
+def _timed(func):
+    """(결과, 소요 시간 ms)"""
+    started = time.perf_counter_ns()
+    result = func()
+    return result, (time.perf_counter_ns() - started) / 1e6
+
+def _walk_lists(pattern, reads):
+    """클릭 엔진과 같은 방식 - 색인으로 목록 순회"""
+    xs, ys = pattern.xs, pattern.ys
+    count = len(xs)
+    index = 0
+    for _ in range(reads):
+        x = xs[index]
+        y = ys[index]
+        index += 1
+        if index == count:
+            index = 0
+
+def _walk_array(pattern, reads):
+    """비교 기준 - 클릭마다 NumPy 배열에서 한 행을 꺼냄"""
+    points = pattern.points
+    count = len(points)
+    index = 0
+    for _ in range(reads):
+        x, y = points[index]
+        index += 1
+        if index == count:
+            index = 0
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    columns = max(int(count ** 0.5), 1)
+    rows = max(count // columns, 1)
+    grid_points(0, 0, 1, 1, 1, 1)  # NumPy 불러오기는 측정에서 제외
+
+    grid, grid_ms = _timed(lambda: grid_points(0, 0, 1919, 1079, columns, rows))
+    randoms, random_ms = _timed(lambda: random_points(0, 0, 1919, 1079, count, seed=1))
+    text = "\n".join(f"{x}, {y}" for x, y in randoms.tolist())
+    parsed, parse_ms = _timed(lambda: parse_points(text))
+    pattern, pattern_ms = _timed(lambda: ClickPattern(randoms))
+    print(f"패턴 생성 (좌표 {count:,}개)")
+    print(f"  격자 {columns}x{rows} {grid_ms:.2f}ms, 무작위 {random_ms:.2f}ms, "
+          f"좌표 목록 해석 {parse_ms:.1f}ms ({len(text) / 1024:,.0f}KB), ClickPattern 변환 {pattern_ms:.2f}ms")
+
+    _, lists_ms = _timed(lambda: _walk_lists(pattern, READS))
+    _, array_ms = _timed(lambda: _walk_array(pattern, READS))
+    print(f"클릭당 좌표 읽기 ({READS:,}번)")
+    print(f"  색인으로 목록 순회 {lists_ms * 1e6 / READS:.0f}ns, NumPy 행 꺼내기 {array_ms * 1e6 / READS:.0f}ns")
+
+    # 클릭 엔진으로 격자 한 바퀴 (간격 1us, 클릭 대신 좌표 기록)
+    small = ClickPattern(grid_points(0, 0, 100, 100, 10, 10), cycles=1)
+    clicked = []
+    engine = ClickEngine(lambda x, y: clicked.append((x, y)), lambda: (0, 0), interval=1e-6)
+    engine.set_pattern(small)
+    engine.start()
+    engine.thread.join(timeout=5)
+    in_order = clicked == list(zip(small.xs, small.ys))
+    print(f"클릭 엔진 격자 10x10 한 바퀴: 클릭 {len(clicked)}회, 순서 일치 {in_order}, "
+          f"스스로 종료 {not engine.is_running()}")
+
+if __name__ == "__main__":
+    main()
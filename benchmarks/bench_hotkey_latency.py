@@ -0,0 +1,105 @@
+"""
+단축키 시작 지연 벤치마크
+
+단축키 콜백이 불리는 훅 스레드를 별도 스레드로 흉내 내어 엔진을 직접 시작하고,
+단축키 시각부터 첫 입력이 주입될 때까지의 지연을 측정합니다.
+- 자동 클릭: ClickEngine.toggle() 후 첫 마우스 누름까지
+- 키 반복: KeyboardController.start_key_repeat() 후 첫 키 누름까지
+
+기록 백엔드(RecordingBackend)의 타임스탬프를 기준으로 측정하므로 디스플레이나
+관리자 권한 없이 실행할 수 있습니다. 릴리스마다 결과를 비교하는 용도입니다.
+
+실행 방법:
+    python -m benchmarks.bench_hotkey_latency [반복 횟수]
+"""
+import sys
+import threading
+import time
+
+from src.core.click_engine import ClickEngine
+from src.core.input_backend import EVENT_KEY_DOWN, EVENT_MOUSE_DOWN, RecordingBackend, set_backend
+from src.core.keyboard_control import KeyboardController
+from src.core.mouse_click import click_at_position
+from src.core.timing import now_ns, percentile
+
+def _in_hook_thread(func):
+    """훅 스레드 대신 새 스레드에서 func를 실행하고 단축키 시각 반환"""
+    result = []
+    thread = threading.Thread(target=lambda: result.append(func()))
+    thread.start()
+    thread.join()
+    return result[0]
+
+def _wait_first(backend, kind, value=None, timeout=1.0):
+    """첫 이벤트가 기록될 때까지 대기 후 시각 반환"""
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        timestamps = backend.timestamps(kind, value)
+        if timestamps:
+            return timestamps[0]
+        time.sleep(0.0005)
+    return None
+
+def bench_click(repeats):
+    """자동 클릭 시작 지연 측정 (나노초 목록)"""
+    backend = set_backend(RecordingBackend())
+    engine = ClickEngine(click_at_position, lambda: (100, 100), 0.05)
+    latencies = []
+
+    for _ in range(repeats):
+        backend.clear()
+
+        def hotkey():
+            trigger_ns = now_ns()
+            engine.toggle(trigger_ns)
+            return trigger_ns
+
+        trigger_ns = _in_hook_thread(hotkey)
+        first = _wait_first(backend, EVENT_MOUSE_DOWN)
+        engine.toggle()
+        engine.thread.join()
+        if first is not None:
+            latencies.append(first - trigger_ns)
+
+    return latencies, engine.start_latency.get_summary()
+
+def bench_key_repeat(repeats):
+    """키 반복 시작 지연 측정 (나노초 목록)"""
+    backend = set_backend(RecordingBackend())
+    controller = KeyboardController()
+    controller.debug_mode = False
+    controller.set_repeat_rate(20, 0.01)
+    latencies = []
+
+    for _ in range(repeats):
+        backend.clear()
+
+        def hotkey():
+            trigger_ns = now_ns()
+            controller.start_key_repeat("a", trigger_ns=trigger_ns)
+            return trigger_ns
+
+        trigger_ns = _in_hook_thread(hotkey)
+        first = _wait_first(backend, EVENT_KEY_DOWN, "a")
+        controller.stop_key_repeat("a")
+        time.sleep(0.01)
+        if first is not None:
+            latencies.append(first - trigger_ns)
+
+    return latencies, controller.scheduler.start_latency.get_summary()
+
+def _print(name, latencies, summary):
+    """측정 결과 출력"""
+    values = sorted(latency / 1000 for latency in latencies)
+    print(f"{name:>10}: p50 {percentile(values, 50):7.0f}us, p95 {percentile(values, 95):7.0f}us, "
+          f"최대 {values[-1] if values else 0:7.0f}us ({len(values)}회) "
+          f"| 엔진 자체 기록 p50 {summary['p50_ms'] * 1000:.0f}us")
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    print(f"단축키 → 첫 입력 주입 지연, {repeats}회 측정")
+    _print("자동 클릭", *bench_click(repeats))
+    _print("키 반복", *bench_key_repeat(repeats))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+전역 키보드 훅 분배 비용 벤치마크
+
+KeyHook에 키를 1개 등록했을 때와 많이 등록했을 때 키 이벤트 하나를 처리하는
+비용을 비교합니다. 키마다 훅을 등록하던 이전 방식은 등록한 키 수만큼 콜백을
+확인했지만, 현재 방식은 스캔 코드 표를 한 번 조회하고 기록을 큐에 넣습니다.
+측정값은 훅 스레드가 쓰는 시간이며, 처리 함수는 소비 스레드에서 호출됩니다.
+
+실제 훅 대신 이벤트를 직접 넣어 주는 가짜 keyboard 모듈을 사용하므로
+관리자 권한이나 키보드 장치 없이 실행할 수 있습니다.
+
+실행 방법:
+    python -m benchmarks.bench_key_hook [등록 키 수] [이벤트 수]
+"""
+import sys
+import time
+
+from src.core.key_hook import KEY_DOWN, KeyHook
+
+class _Event:
+    __slots__ = ("scan_code", "event_type")
+
+    def __init__(self, scan_code, event_type):
+        self.scan_code = scan_code
+        self.event_type = event_type
+
+class _FakeKeyboard:
+    """키 이름 i의 스캔 코드를 i로 돌려주고 등록된 훅을 보관하는 가짜 keyboard 모듈"""
+
+    def __init__(self):
+        self.callback = None
+
+    def key_to_scan_codes(self, key):
+        return (int(key),)
+
+    def hook(self, callback, suppress=False):
+        self.callback = callback
+        return callback
+
+    def unhook(self, handle):
+        self.callback = None
+
+def _legacy_per_event_ns(key_count, events):
+    """이전 방식: 키마다 등록된 콜백을 모두 확인"""
+    handlers = [(code, lambda: None) for code in range(key_count)]
+    started = time.perf_counter_ns()
+    for event in events:
+        for code, handler in handlers:
+            if event.scan_code == code:
+                handler()
+    return (time.perf_counter_ns() - started) / len(events)
+
+def _hook_per_event_ns(key_count, events):
+    """현재 방식: 훅 하나에서 스캔 코드 표 조회"""
+    keyboard = _FakeKeyboard()
+    hook = KeyHook(keyboard, capacity=len(events))  # 연속으로 넣는 측정이므로 버리지 않도록 큐를 크게 잡음
+    for code in range(key_count):
+        hook.add_key(str(code), on_press=lambda event_ns: None, on_release=lambda event_ns: None)
+    callback = keyboard.callback
+    started = time.perf_counter_ns()
+    for event in events:
+        callback(event)
+    elapsed = time.perf_counter_ns() - started
+    stats = hook.get_stats()
+    hook.close()
+    return elapsed / len(events), stats
+
+def main():
+    key_count = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    event_count = int(sys.argv[2]) if len(sys.argv) > 2 else 200_000
+
+    print(f"키 이벤트 {event_count}회, 이벤트당 처리 시간")
+    for count in (1, key_count):
+        # 등록한 키 중 마지막 키와 등록하지 않은 키가 번갈아 눌리는 경우
+        events = [_Event(count - 1 if i % 2 else 500, KEY_DOWN) for i in range(event_count)]
+        hook_ns, stats = _hook_per_event_ns(count, events)
+        print(f"  등록 키 {count:3d}개: 키별 훅 {_legacy_per_event_ns(count, events):7.0f}ns, "
+              f"전역 훅 + 표 {hook_ns:7.0f}ns "
+              f"(큐 최대 {stats['queue_max_depth']}, 버림 {stats['dropped']}, "
+              f"콜백 최대 {stats['callback_max_us']:.1f}us)")
+
+if __name__ == "__main__":
+    main()
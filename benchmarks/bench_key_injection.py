@@ -0,0 +1,49 @@
+"""
+키 주입 처리량 벤치마크
+
+입력 백엔드에서 키 누름/해제를 연속으로 주입하여 키별 초당 주입 횟수를 비교합니다.
+- 이름: key_down(키 이름) / key_up(키 이름) - 주입할 때마다 키 이름을 해석
+- 코드: resolve_key()로 한 번 구한 가상 키 코드로 key_down_code / key_up_code
+
+기본 백엔드는 recording이므로 파이썬 측 비용만 측정합니다. Windows 백엔드를 지정하면
+실제로 키가 입력되므로, 기본 키는 대부분의 프로그램에서 아무 동작도 하지 않는 f13-f16입니다.
+
+실행 방법:
+    python -m benchmarks.bench_key_injection [반복 횟수] [백엔드 이름...]
+"""
+import sys
+import time
+
+from src.core.input_backend import RecordingBackend, create_backend
+
+KEYS = ("f13", "f14", "f15", "f16")
+
+def _rate(down, up, key, count):
+    """누름/해제를 count번 주입한 초당 주입 횟수"""
+    started = time.perf_counter_ns()
+    for _ in range(count):
+        down(key)
+        up(key)
+    elapsed = time.perf_counter_ns() - started
+    return count * 2 * 1_000_000_000 / elapsed
+
+def run(backend, count):
+    """백엔드 하나의 키별 이름/코드 주입 속도 출력"""
+    print(f"[{backend.name}] 키마다 누름/해제 {count}회")
+    for key in KEYS:
+        if isinstance(backend, RecordingBackend):
+            backend.clear()
+        by_name = _rate(backend.key_down, backend.key_up, key, count)
+        code = backend.resolve_key(key)
+        by_code = _rate(backend.key_down_code, backend.key_up_code, code, count)
+        print(f"  {key:>4} (0x{code:02X}): 이름 {by_name:10,.0f}회/초, 코드 {by_code:10,.0f}회/초 "
+              f"({by_code / by_name:.2f}배)")
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    names = sys.argv[2:] or [RecordingBackend.name]
+    for name in names:
+        run(create_backend(name), count)
+
+if __name__ == "__main__":
+    main()
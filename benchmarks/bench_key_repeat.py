@@ -0,0 +1,57 @@
+"""
+키 반복 엔진 처리량/지연 벤치마크
+
+기록 백엔드(RecordingBackend)로 KeyboardController의 키 반복을 실행하고,
+키별 목표 대비 실제 반복 속도와 누름 간격의 흔들림(지터)을 측정합니다.
+
+실행 방법:
+    python -m benchmarks.bench_key_repeat [키 개수] [목표 속도(Hz)] [측정 시간(초)] [주입 지연(ms)]
+"""
+import sys
+import time
+
+from src.core.input_backend import EVENT_KEY_DOWN, RecordingBackend, set_backend
+from src.core.keyboard_control import KeyboardController
+from src.core.timing import percentile
+
+def run(key_count, rate_hz, duration, latency):
+    """지정한 개수의 키를 반복시키고 결과 출력"""
+    backend = set_backend(RecordingBackend(latency=latency))
+    controller = KeyboardController()
+    controller.debug_mode = False
+    controller.set_repeat_rate(rate_hz, hold_duration=min(0.02, 0.5 / rate_hz))
+
+    keys = "1234567890qwertyuiop"[:key_count]
+    for key in keys:
+        controller.start_key_repeat(key)
+    time.sleep(duration)
+    controller.stop_all_repeats()
+
+    target_ns = 1_000_000_000 / rate_hz
+    print(f"키 {key_count}개, 목표 {rate_hz:.1f}Hz, {duration:.1f}초 측정 "
+          f"(주입 지연 {latency * 1000:.1f}ms)")
+
+    errors = []
+    rates = []
+    for key in keys:
+        downs = backend.timestamps(EVENT_KEY_DOWN, key)
+        if len(downs) < 2:
+            continue
+        rates.append((len(downs) - 1) * 1_000_000_000 / (downs[-1] - downs[0]))
+        errors.extend(abs((b - a) - target_ns) / 1000 for a, b in zip(downs, downs[1:]))
+
+    errors.sort()
+    print(f"  실제 속도: 평균 {sum(rates) / len(rates):.2f}Hz, 최저 {min(rates):.2f}Hz, 최고 {max(rates):.2f}Hz")
+    print(f"  누름 간격 오차: p50 {percentile(errors, 50):.0f}us, p95 {percentile(errors, 95):.0f}us, "
+          f"p99 {percentile(errors, 99):.0f}us")
+    print(f"  스케줄러: {controller.scheduler.get_stats()}")
+
+def main():
+    key_count = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    rate_hz = float(sys.argv[2]) if len(sys.argv) > 2 else 20.0
+    duration = float(sys.argv[3]) if len(sys.argv) > 3 else 5.0
+    latency = float(sys.argv[4]) / 1000 if len(sys.argv) > 4 else 0.0
+    run(key_count, rate_hz, duration, latency)
+
+if __name__ == "__main__":
+    main()
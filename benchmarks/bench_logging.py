@@ -0,0 +1,63 @@
+"""
+로그 호출 비용 벤치마크
+
+키 반복 경로에서 한 번 로그를 남길 때 호출한 스레드가 쓰는 시간을 비교합니다.
+- print: 이전 KeyboardController._log 방식 (f-string + print)
+- fast_log 비활성화: 디버그 수준이 꺼져 있을 때 (기본값)
+- fast_log 활성화: 링 버퍼에 넣고 출력은 백그라운드 스레드가 처리
+
+출력은 모두 os.devnull로 보내므로 콘솔 속도와 관계없이 파이썬 측 비용만 측정합니다.
+실제 콘솔에서는 print 쪽 비용이 훨씬 커집니다.
+
+실행 방법:
+    python -m benchmarks.bench_logging [호출 횟수]
+"""
+import os
+import sys
+import time
+
+from src.utils import fast_log
+
+def _per_call_ns(func, count):
+    """func를 count번 호출한 평균 시간 (나노초)"""
+    started = time.perf_counter_ns()
+    for i in range(count):
+        func(i)
+    return (time.perf_counter_ns() - started) / count
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    key = "a"
+
+    original_stdout = sys.stdout
+    with open(os.devnull, "w", encoding="utf-8") as devnull:
+        sys.stdout = devnull
+        try:
+            log = fast_log.get_logger("bench")
+
+            def legacy(i):
+                print(f"[KeyboardController] 키 '{key}' 반복 시작됨 ({i})")
+            legacy_ns = _per_call_ns(legacy, count)
+
+            log.set_level(fast_log.INFO)
+            disabled_ns = _per_call_ns(lambda i: log.debug("키 '%s' 반복 시작됨 (%d)", key, i), count)
+
+            log.set_level(fast_log.DEBUG)
+            log.rate_limit = count  # 속도 제한 없이 모두 링 버퍼에 넣는 경우
+            enabled_ns = _per_call_ns(lambda i: log.debug("키 '%s' 반복 시작됨 (%d)", key, i), count)
+
+            log.rate_limit = fast_log.RATE_LIMIT
+            limited_ns = _per_call_ns(lambda i: log.debug("키 '%s' 반복 시작됨 (%d)", key, i), count)
+            fast_log.flush()
+        finally:
+            sys.stdout = original_stdout
+
+    print(f"로그 {count}회 호출, 호출당 평균")
+    print(f"  print (이전 방식)        : {legacy_ns:8.0f}ns")
+    print(f"  fast_log 비활성화 (기본) : {disabled_ns:8.0f}ns")
+    print(f"  fast_log 활성화          : {enabled_ns:8.0f}ns")
+    print(f"  fast_log 활성화+속도 제한: {limited_ns:8.0f}ns")
+    print(f"  버퍼 통계: {fast_log.get_stats()}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+매크로 컴파일러 벤치마크
+
+bench_timeline과 같은 가상 녹화 세션(기본 10분)을 타임라인으로 만든 뒤
+compile_timeline()으로 최적화하여 컴파일 시간과 줄어든 이벤트 수/크기를 출력합니다.
+
+실행 방법:
+    python -m benchmarks.bench_macro_compile [녹화 시간(분)] [경로 허용 오차(픽셀)]
+"""
+import sys
+import time
+
+from benchmarks.bench_timeline import _NoHook, _record_all, _session
+from src.core.macro_compiler import DEFAULT_EPSILON, compile_timeline
+from src.core.recorder import InputRecorder
+
+def main():
+    minutes = float(sys.argv[1]) if len(sys.argv) > 1 else 10
+    epsilon = float(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_EPSILON
+
+    recorder = InputRecorder(key_hook=_NoHook(), record_mouse=False)
+    recorder.start()
+    # 녹화 시작 2초 뒤 첫 입력 (줄일 대기 시간)
+    _record_all(recorder, list(_session(minutes)), time.perf_counter_ns() + 2_000_000_000)
+    timeline = recorder.stop()
+
+    started = time.perf_counter_ns()
+    compiled, report = compile_timeline(timeline, epsilon=epsilon)
+    elapsed_ms = (time.perf_counter_ns() - started) / 1e6
+
+    print(f"녹화 {minutes:g}분, 경로 허용 오차 {epsilon:g}px, 컴파일 {elapsed_ms:.1f}ms")
+    print(f"  이벤트 {report['events_before']:,} -> {report['events_after']:,}개 "
+          f"({report['event_reduction'] * 100:.1f}% 감소)")
+    print(f"  크기   {report['bytes_before'] / 1e6:.2f} -> {report['bytes_after'] / 1e6:.2f}MB "
+          f"({report['size_reduction'] * 100:.1f}% 감소)")
+    print(f"  이동 합침 {report['moves_merged']:,}, 경로 단순화 {report['moves_simplified']:,}, "
+          f"키 누름/해제 합침 {report['key_taps']:,}, 클릭 합침 {report['clicks']:,}, "
+          f"줄인 대기 {report['idle_trimmed_s']:.1f}초")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+매크로 스크립트 실행기 벤치마크
+
+대기 없는 스크립트를 실행해 명령 하나당 해석 비용(실행 시간 / 명령 수)을 측정하고,
+같은 동작을 파이썬 반복문으로 직접 호출한 시간과 비교합니다.
+이어서 "click ... every 5ms" 스크립트로 대기 데드라인 대비 지연을 측정합니다.
+
+클릭/키/커서 이동은 아무 일도 하지 않는 함수로 주입하므로 실제 입력이 발생하지 않습니다.
+
+실행 방법:
+    python -m benchmarks.bench_macro_script [반복 횟수]
+"""
+import sys
+import time
+
+from src.core.input_backend import RecordingBackend
+from src.core.macro_script import MacroRunner, compile_script
+
+SCRIPT = """
+set x = 0
+macro step
+    set x = x + 1
+    set y = x % 1080
+end
+loop {count}
+    call step
+    click x y hold 0
+    press a
+    move x y
+end
+"""
+
+TIMED_SCRIPT = """
+loop 2
+    click 100 200 100 times every 5ms hold 0
+    press q
+end
+"""
+
+class _NullKeyboard:
+    """주입 횟수만 세는 키보드 컨트롤러"""
+
+    def __init__(self):
+        self.count = 0
+
+    def press_code(self, code):
+        self.count += 1
+
+    def release_code(self, code):
+        self.count += 1
+
+class _NullBackend:
+    """커서 이동 횟수만 세는 백엔드"""
+
+    def __init__(self):
+        self.count = 0
+
+    def move(self, x, y):
+        self.count += 1
+
+def _null_click(x, y, hold):
+    pass
+
+def _direct(count, click, keyboard, backend):
+    """같은 동작을 파이썬 반복문으로 직접 호출 (비교 기준)"""
+    x = 0
+    for _ in range(count):
+        x = x + 1
+        y = x % 1080
+        click(x, y, 0.0)
+        keyboard.press_code(0x41)
+        keyboard.release_code(0x41)
+        backend.move(x, y)
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    resolve_key = RecordingBackend().resolve_key
+
+    started = time.perf_counter_ns()
+    program = compile_script(SCRIPT.format(count=count), resolve_key)
+    compile_us = (time.perf_counter_ns() - started) / 1000
+
+    keyboard, backend = _NullKeyboard(), _NullBackend()
+    runner = MacroRunner(_null_click, keyboard, lambda: backend)
+    runner.load(program)
+    runner.run()
+    stats = runner.get_stats()
+    per_instruction_ns = stats["elapsed"] * 1e9 / stats["instructions"]
+
+    started = time.perf_counter_ns()
+    _direct(count, _null_click, _NullKeyboard(), _NullBackend())
+    direct_ns = (time.perf_counter_ns() - started) / count
+
+    print(f"스크립트 컴파일 {compile_us:.0f}us (명령 {len(program)}개, 레지스터 {len(program.registers)}개)")
+    print(f"  반복 {count:,}번, 명령 {stats['instructions']:,}개 실행, {stats['elapsed'] * 1000:.0f}ms")
+    print(f"  명령당 {per_instruction_ns:.0f}ns ({per_instruction_ns / 1000:.3f}us), "
+          f"반복 한 번 {stats['elapsed'] * 1e9 / count:.0f}ns (파이썬 직접 호출 {direct_ns:.0f}ns)")
+    print(f"  주입: 키 {keyboard.count:,}회, 이동 {backend.count:,}회")
+
+    runner.load(compile_script(TIMED_SCRIPT, resolve_key))
+    runner.run()
+    stats = runner.get_stats()
+    print(f"5ms 간격 클릭 200회: {stats['elapsed'] * 1000:.1f}ms (목표 1000ms), "
+          f"대기 지연 평균 {stats['avg_lag_ms'] * 1000:.1f}us / 최대 {stats['max_lag_ms'] * 1000:.1f}us, "
+          f"건너뛴 대기 {stats['skipped_waits']}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+긴 타임라인 재생 벤치마크
+
+기록 수가 많은 타임라인 파일(기본 100만 개)을 만든 뒤 Timeline.open()으로 메모리 매핑해
+재생하면서 다음을 측정합니다.
+- 파일을 연 뒤 첫 이벤트를 주입할 때까지의 시간 (파일 전체를 해석하지 않으므로 기록 수와 무관)
+- 재생 중 파이썬 메모리 할당 최댓값 (tracemalloc, 이벤트마다 객체를 보관하지 않으면 일정)
+  tracemalloc은 재생을 크게 느리게 하므로 처음 1초만 따로 측정합니다.
+- 전체 재생의 이벤트별 데드라인 대비 타이밍 오차
+
+입력은 아무 일도 하지 않는 백엔드로 주입하므로 실제 입력이 발생하지 않습니다.
+
+실행 방법:
+    python -m benchmarks.bench_playback [기록 수] [재생 속도]
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from src.core.input_backend import InputBackend
+from src.core.playback import TimelinePlayer
+from src.core.timeline import EVENT_KEY_DOWN, EVENT_KEY_UP, EVENT_MOUSE_MOVE, RECORD, Timeline
+
+# 기록 간격 (ns) - 실제 입력보다 훨씬 촘촘한 10kHz
+EVENT_SPACING_NS = 100_000
+
+# 메모리 측정 재생 시간 (초)
+MEMORY_SAMPLE_SECONDS = 1.0
+
+class _NullBackend(InputBackend):
+    """주입 횟수만 세는 백엔드 (첫 주입 시각 기록)"""
+    name = "null"
+
+    def __init__(self):
+        self.count = 0
+        self.first_ns = 0
+
+    def _inject(self, *args):
+        if not self.count:
+            self.first_ns = time.perf_counter_ns()
+        self.count += 1
+
+    move = mouse_down = mouse_up = scroll = key_down = key_up = key_down_code = key_up_code = _inject
+
+def _write_timeline(path, count):
+    """마우스 이동과 키 누름/해제가 섞인 타임라인 파일 생성"""
+    records = bytearray()
+    for i in range(count):
+        if i % 10 == 0:
+            records += RECORD.pack(EVENT_KEY_DOWN if i % 20 == 0 else EVENT_KEY_UP, 0, 0, 0, 0, EVENT_SPACING_NS)
+        else:
+            records += RECORD.pack(EVENT_MOUSE_MOVE, 0, 0, i % 1920, i % 1080, EVENT_SPACING_NS)
+    Timeline(records, ["a"]).save(path)
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    speed = float(sys.argv[2]) if len(sys.argv) > 2 else 10.0
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "long.aitl")
+        _write_timeline(path, count)
+        size = os.path.getsize(path)
+
+        # 열기/첫 주입 시간과 메모리 (처음 1초)
+        backend = _NullBackend()
+        player = TimelinePlayer(lambda: backend, speed=speed)
+        tracemalloc.start()
+        opened = time.perf_counter_ns()
+        timeline = Timeline.open(path)
+        player.load(timeline)
+        player.start()
+        time.sleep(MEMORY_SAMPLE_SECONDS)
+        _, peak = tracemalloc.get_traced_memory()
+        player.stop(wait=True)
+        tracemalloc.stop()
+        first_ms = (backend.first_ns - opened) / 1e6
+        sampled = backend.count
+
+        # 전체 재생 타이밍 오차
+        backend = _NullBackend()
+        player = TimelinePlayer(lambda: backend, speed=speed)
+        player.load(timeline)
+        player.start()
+        player.thread.join()
+        stats = player.get_stats()
+        timeline.close()
+
+    duration = count * EVENT_SPACING_NS / 1e9
+    print(f"기록 {count:,}개 ({size / 1e6:.1f}MB, {duration:.1f}초 분량), 재생 속도 {speed:g}배")
+    print(f"  열기부터 첫 주입까지 {first_ms:.2f}ms")
+    print(f"  재생 중 파이썬 할당 최댓값 {peak / 1024:.0f}KB (tracemalloc 측정 중 {sampled:,}개 재생)")
+    print(f"  전체 재생: 주입 {backend.count:,}회")
+    print(f"  타이밍 오차 p50 {stats['p50_us']:.1f}us / p95 {stats['p95_us']:.1f}us / p99 {stats['p99_us']:.1f}us "
+          f"/ 최대 {stats['error_max_us']:.1f}us (평균 {stats['error_avg_us']:.1f}us)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+키 반복 CPU 사용량 벤치마크
+
+키를 누르고 있는 동안 반복 루프가 소비하는 CPU 시간을 측정합니다.
+- 이전 방식: 키마다 스레드를 만들고 최소 사이클 시간이 지나지 않으면
+  time.sleep(0.002)로 바쁜 대기를 하던 _key_repeat_worker 루프
+- 현재 방식: 하나의 스레드가 데드라인까지 차단 대기하는 RepeatScheduler
+
+실제 키 입력 대신 아무 것도 하지 않는 함수를 주입하므로 디스플레이나
+관리자 권한 없이 실행할 수 있습니다.
+
+실행 방법:
+    python -m benchmarks.bench_repeat_cpu [키 개수] [측정 시간(초)]
+"""
+import sys
+import threading
+import time
+
+from src.core.repeat_scheduler import RepeatScheduler
+
+# KeyboardController 기본값과 동일한 반복 설정
+PRESS_DELAY = 0.02
+RELEASE_DELAY = 0.02
+MIN_CYCLE_TIME = 0.01
+
+def _noop(key):
+    """키 입력 대체 함수"""
+    pass
+
+def _legacy_worker(stop_signal, counter):
+    """이전 _key_repeat_worker 루프 재현 (바쁜 대기 포함)"""
+    last_executed = time.time()
+    pressed = {"k": True}
+    while not stop_signal.is_set() and pressed.get("k", False):
+        if stop_signal.is_set():
+            break
+        if not pressed.get("k", False):
+            pressed["k"] = True
+
+        current_time = time.time()
+        if current_time - last_executed < MIN_CYCLE_TIME:
+            time.sleep(0.002)
+            continue
+
+        _noop("k")
+        time.sleep(PRESS_DELAY)
+        _noop("k")
+        time.sleep(RELEASE_DELAY)
+        last_executed = time.time()
+        counter[0] += 1
+
+        if stop_signal.is_set():
+            break
+
+def bench_legacy(key_count, duration):
+    """키마다 스레드를 사용하는 이전 방식 측정"""
+    stop_signal = threading.Event()
+    counter = [0]
+    threads = [
+        threading.Thread(target=_legacy_worker, args=(stop_signal, counter), daemon=True)
+        for _ in range(key_count)
+    ]
+
+    cpu_start = time.process_time()
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop_signal.set()
+    for thread in threads:
+        thread.join()
+    cpu_used = time.process_time() - cpu_start
+
+    return cpu_used, counter[0]
+
+def bench_scheduler(key_count, duration):
+    """공유 스케줄러 방식 측정"""
+    scheduler = RepeatScheduler(_noop, _noop)
+    scheduler.set_timing(PRESS_DELAY, RELEASE_DELAY, MIN_CYCLE_TIME)
+    keys = [f"k{i}" for i in range(key_count)]
+
+    cpu_start = time.process_time()
+    for key in keys:
+        scheduler.start(key)
+    time.sleep(duration)
+    repeats = sum(scheduler.get_repeat_count(key) for key in keys)
+    scheduler.stop_all()
+    scheduler.close()
+    cpu_used = time.process_time() - cpu_start
+
+    return cpu_used, repeats
+
+def main():
+    key_count = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    duration = float(sys.argv[2]) if len(sys.argv) > 2 else 5.0
+
+    print(f"키 {key_count}개, {duration:.1f}초 측정 (누름 {PRESS_DELAY}초 / 해제 {RELEASE_DELAY}초)")
+    for name, bench in (("이전 방식 (키별 스레드)", bench_legacy), ("공유 스케줄러", bench_scheduler)):
+        cpu_used, repeats = bench(key_count, duration)
+        cpu_percent = cpu_used / duration * 100
+        print(f"{name:>24}: CPU {cpu_percent:6.2f}% (키당 {cpu_percent / key_count:5.2f}%), "
+              f"반복 {repeats}회 ({repeats / duration / key_count:.1f}회/초/키)")
+
+if __name__ == "__main__":
+    main()
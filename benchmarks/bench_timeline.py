@@ -0,0 +1,99 @@
+"""
+입력 녹화 타임라인 크기/불러오기 시간 벤치마크
+
+가상의 녹화 세션(기본 10분)을 InputRecorder에 직접 넣어 만든 타임라인의
+파일 크기와 저장/불러오기/전체 순회 시간을 측정합니다. 비교를 위해 같은 이벤트를
+dict 목록으로 보관해 JSON으로 저장/불러오는 경우도 측정합니다.
+
+세션 구성: 마우스 보고율 1000Hz로 절반의 시간 동안 이동, 초당 키 입력 5회, 초당 클릭 1회.
+실제 훅을 설치하지 않으므로 관리자 권한이나 입력 장치 없이 실행할 수 있습니다.
+
+실행 방법:
+    python -m benchmarks.bench_timeline [녹화 시간(분)]
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+from src.core.recorder import InputRecorder
+from src.core.timeline import EVENT_MOUSE_DOWN, EVENT_MOUSE_MOVE, EVENT_MOUSE_UP, Timeline
+
+MS = 1_000_000
+KEYS = "asdfqwer"
+
+class _NoHook:
+    """관찰 함수 등록만 받는 가짜 키보드 훅"""
+
+    def add_listener(self, listener):
+        pass
+
+    def remove_listener(self, listener):
+        pass
+
+def _session(minutes):
+    """(종류, 코드, x, y, 시각) 이벤트를 시간 순으로 생성 (키 이벤트는 종류가 None, 코드가 (키, 누름 여부))"""
+    for ms in range(int(minutes * 60_000)):
+        t = ms * MS
+        if (ms // 2000) % 2 == 0:
+            yield EVENT_MOUSE_MOVE, 0, ms % 1920, ms % 1080, t
+        if ms % 200 == 0:
+            yield None, (KEYS[(ms // 200) % len(KEYS)], True), 0, 0, t
+        elif ms % 200 == 50:
+            yield None, (KEYS[(ms // 200) % len(KEYS)], False), 0, 0, t
+        if ms % 1000 == 500:
+            yield EVENT_MOUSE_DOWN, 0, 100, 100, t
+            yield EVENT_MOUSE_UP, 0, 100, 100, t + MS // 2
+
+def _record_all(recorder, events, base_ns):
+    for kind, code, x, y, t in events:
+        if kind is None:
+            recorder.record_key(code[0], code[1], base_ns + t)
+        else:
+            recorder.record(kind, code, x, y, base_ns + t)
+
+def _save_json(path, data):
+    with open(path, "w") as f:
+        json.dump(data, f)
+
+def _load_json(path):
+    with open(path) as f:
+        return json.load(f)
+
+def _timed(func, *args):
+    started = time.perf_counter_ns()
+    result = func(*args)
+    return result, (time.perf_counter_ns() - started) / MS
+
+def main():
+    minutes = float(sys.argv[1]) if len(sys.argv) > 1 else 10
+    events = list(_session(minutes))
+
+    recorder = InputRecorder(key_hook=_NoHook(), record_mouse=False)
+    recorder.start()
+    _, record_ms = _timed(_record_all, recorder, events, time.perf_counter_ns())
+    timeline = recorder.stop()
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "session.aitl")
+        _, save_ms = _timed(timeline.save, path)
+        loaded, load_ms = _timed(Timeline.load, path)
+        _, iterate_ms = _timed(lambda: sum(1 for _ in loaded))
+        size = os.path.getsize(path)
+
+        # 비교: dict 목록 + JSON
+        json_path = os.path.join(folder, "session.json")
+        dicts = [{"type": kind or 0, "code": code, "x": x, "y": y, "t": t} for kind, code, x, y, t in events]
+        _, json_save_ms = _timed(_save_json, json_path, dicts)
+        _, json_load_ms = _timed(_load_json, json_path)
+        json_size = os.path.getsize(json_path)
+
+    print(f"녹화 {minutes:g}분: 입력 이벤트 {len(events):,}개 -> 기록 {len(timeline):,}개 "
+          f"(이동 {recorder.coalesced_moves:,}개 합침), 기록 {record_ms / len(events) * 1000:.2f}us/이벤트")
+    print(f"  타임라인: {size / 1e6:6.2f}MB, 저장 {save_ms:7.1f}ms, 불러오기 {load_ms:7.1f}ms, 전체 순회 {iterate_ms:7.1f}ms")
+    print(f"  dict+JSON: {json_size / 1e6:6.2f}MB, 저장 {json_save_ms:7.1f}ms, 불러오기 {json_load_ms:7.1f}ms "
+          f"(이동을 합치지 않은 원본 이벤트)")
+
+if __name__ == "__main__":
+    main()
@@ -9,7 +9,7 @@ from cx_Freeze import setup, Executable
 
 # 빌드 옵션
 build_exe_options = {
-    "packages": ["tkinter", "pyautogui", "ctypes", "keyboard"],
+    "packages": ["tkinter", "pyautogui", "ctypes", "keyboard", "numpy"],
     "includes": ["src"],
     "include_files": ["mouse_icon.ico"],
     "excludes": [],
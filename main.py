@@ -2,19 +2,51 @@
 마우스 자동 클릭 프로그램 진입점
 
 프로그램 실행을 위한 메인 파일입니다.
+--profile-startup 옵션으로 실행하면 첫 화면이 표시될 때까지의
+단계별(모듈 불러오기, 객체 생성) 소요 시간을 출력합니다.
+--debug 옵션으로 실행하면 디버그 로그를 출력합니다.
 """
-import tkinter as tk
+import importlib
 import traceback
 import sys
-from src.gui.tab_based_app import TabBasedApp
+from src.utils import fast_log
+from src.utils.startup_profile import startup_profiler
+
+# 시작할 때 불러오는 모듈 (의존 순서대로, 탭 모듈은 탭을 만들 때 따로 측정)
+STARTUP_MODULES = (
+    "ctypes",
+    "src.utils.admin_check",
+    "src.core.key_hook",
+    "src.core.mouse_position",
+    "src.gui.tab_based_app",
+)
 
 if __name__ == "__main__":
+    if "--profile-startup" in sys.argv:
+        startup_profiler.enable()
+    if "--debug" in sys.argv:
+        fast_log.set_level(fast_log.DEBUG)
+
     try:
-        root = tk.Tk()
-        app = TabBasedApp(root)
+        with startup_profiler.phase("import tkinter"):
+            import tkinter as tk
+        # 화면 모듈이 불러오는 모듈을 먼저 하나씩 불러와 모듈별 소요 시간 측정
+        for module_name in STARTUP_MODULES:
+            with startup_profiler.phase(f"import {module_name}"):
+                importlib.import_module(module_name)
+        from src.gui.tab_based_app import TabBasedApp
+
+        with startup_profiler.phase("Tk 생성"):
+            root = tk.Tk()
+        with startup_profiler.phase("TabBasedApp 생성"):
+            app = TabBasedApp(root)
         print("[메인] 애플리케이션 초기화 완료")
+
+        # 첫 화면이 그려진 뒤 측정 결과 출력
+        if startup_profiler.enabled:
+            root.after_idle(startup_profiler.report)
         root.mainloop()
     except Exception as e:
         print(f"[오류] 프로그램 실행 중 예외 발생: {e}")
         traceback.print_exc()
-        sys.exit(1) 
\ No newline at end of file
+        sys.exit(1) 
@@ -0,0 +1,265 @@
+"""
+클릭 엔진 모듈
+
+절대 데드라인(perf_counter_ns) 기반으로 자동 클릭을 수행하는 엔진을 제공합니다.
+클릭 자체에 걸린 시간이나 OS 대기 오차가 다음 주기로 누적되지 않으므로
+설정한 간격이 어떤 PC에서도 동일한 처리량을 의미합니다.
+좌표 패턴(src.core.click_pattern)을 설정하면 데드라인마다 패턴의 다음 좌표를 클릭합니다.
+"""
+import threading
+import traceback
+from array import array
+
+from src.core.timing import (
+    NS_PER_SEC, LatencyRecorder, high_resolution_timer, now_ns, percentile, seconds_to_ns,
+    sleep_until,
+)
+from src.utils.fast_log import get_logger
+
+log = get_logger("ClickEngine")
+
+# 지연 처리 정책
+POLICY_SKIP = "skip"          # 놓친 데드라인은 건너뛰고 다음 데드라인에 맞춤
+POLICY_CATCH_UP = "catch_up"  # 놓친 클릭을 연속으로 수행해 따라잡음
+
+# 중지 요청 직후 다시 시작할 때 이전 클릭 스레드가 끝나기를 기다리는 최대 시간 (초)
+# toggle()은 단축키 스레드에서 호출되므로 오래 막히지 않도록 제한
+STOP_JOIN_TIMEOUT = 0.2
+
+# 지연(지터) 기록 개수 - 최근 클릭만 유지하는 원형 버퍼 (2의 거듭제곱)
+LAG_HISTORY_SIZE = 4096
+
+class ClickEngine:
+    def __init__(self, click_func, position_func, interval=0.1, policy=POLICY_SKIP, burst_func=None):
+        """
+        클릭 엔진 초기화
+
+        Args:
+            click_func (function): (x, y)를 받아 클릭을 수행하는 함수
+            position_func (function): 클릭할 (x, y) 좌표를 반환하는 함수
+            interval (float): 클릭 간격 (초)
+            policy (str): 지연 처리 정책 (POLICY_SKIP 또는 POLICY_CATCH_UP)
+            burst_func (function): (x, y, 횟수)를 받아 연속 클릭을 한 번에 수행하는 함수
+        """
+        self.click_func = click_func
+        self.burst_func = burst_func
+        self.position_func = position_func
+
+        # 스케줄 설정
+        self.period_ns = seconds_to_ns(interval)
+        self.policy = policy
+        self.max_catch_up = 10         # 따라잡기 정책에서 연속으로 보충할 최대 클릭 수
+        self.clicks_per_tick = 1       # 데드라인마다 수행할 클릭 수 (2 이상이면 연속 클릭)
+        self.spin_ns = 1_000_000       # 데드라인 직전 바쁜 대기로 맞출 구간 (1ms)
+        self.pattern = None            # 차례로 클릭할 좌표 패턴 (None이면 position_func 위치)
+
+        # 실행 상태
+        self.thread = None
+        self.stop_event = threading.Event()
+        self._control_lock = threading.Lock()  # 시작/중지 요청 직렬화 (단축키 스레드와 GUI 스레드)
+        self._trigger_ns = 0           # 시작 요청 시각 (첫 클릭 후 0)
+
+        # 통계
+        self.ticks = 0                 # 이번 실행에서 처리한 데드라인 수
+        self.click_count = 0           # 이번 실행에서 수행한 클릭 수
+        self.skipped_count = 0         # 건너뛴 데드라인 수
+        self.max_lag_ns = 0            # 데드라인 대비 최대 지연
+        self.point_index = 0           # 패턴에서 다음에 클릭할 좌표 색인
+        self.pattern_cycles = 0        # 패턴을 끝까지 클릭한 바퀴 수
+        self.lag_history = array('q', bytes(8 * LAG_HISTORY_SIZE))  # 최근 클릭의 지연 (나노초)
+        self.started_ns = 0
+        self.stopped_ns = 0
+        self.start_latency = LatencyRecorder()  # 시작 요청부터 첫 클릭 주입까지의 지연
+
+    def set_interval(self, interval):
+        """클릭 간격 설정 (실행 중에도 다음 주기부터 적용)"""
+        self.period_ns = max(seconds_to_ns(interval), 1)
+
+    def set_clicks_per_tick(self, count):
+        """데드라인마다 수행할 클릭 수 설정 (연속 클릭 함수가 있을 때만 2 이상 허용)"""
+        count = max(int(count), 1)
+        self.clicks_per_tick = count if self.burst_func else 1
+
+    def set_pattern(self, pattern):
+        """
+        차례로 클릭할 좌표 패턴 설정 (None이면 position_func 위치 클릭, 다음 실행부터 적용)
+
+        패턴의 반복 횟수를 다 채우면 클릭 스레드가 스스로 끝납니다.
+        """
+        self.pattern = pattern
+
+    def set_policy(self, policy):
+        """지연 처리 정책 설정"""
+        if policy not in (POLICY_SKIP, POLICY_CATCH_UP):
+            raise ValueError(f"알 수 없는 정책: {policy}")
+        self.policy = policy
+
+    def is_running(self):
+        """엔진 실행 중인지 확인"""
+        return self.thread is not None and self.thread.is_alive()
+
+    def start(self, trigger_ns=None):
+        """
+        클릭 스레드 시작
+
+        Args:
+            trigger_ns (int): 시작 지연 측정 기준 시각 (perf_counter_ns, 기본값: 호출 시각)
+        """
+        with self._control_lock:
+            if self.is_running():
+                return False
+
+            self.stop_event.clear()
+            self.ticks = 0
+            self.click_count = 0
+            self.skipped_count = 0
+            self.max_lag_ns = 0
+            self.point_index = 0
+            self.pattern_cycles = 0
+            self.started_ns = now_ns()
+            self.stopped_ns = 0
+            self._trigger_ns = trigger_ns or self.started_ns
+
+            self.thread = threading.Thread(target=self._run, daemon=True)
+            self.thread.start()
+            return True
+
+    def stop(self):
+        """클릭 스레드 중지 (대기 중이면 즉시 깨움)"""
+        self.stop_event.set()
+
+    def toggle(self, trigger_ns=None):
+        """
+        실행 중이면 중지, 아니면 시작 (단축키 스레드에서 직접 호출 가능)
+
+        중지 요청 직후라면 이전 클릭 스레드가 끝나기를 최대 STOP_JOIN_TIMEOUT초만 기다리고,
+        그때까지 끝나지 않으면 시작하지 않고 반환합니다 (단축키 스레드가 막히지 않도록).
+
+        Returns:
+            bool: 호출 후 실행 상태
+        """
+        with self._control_lock:
+            if self.is_running() and not self.stop_event.is_set():
+                self.stop_event.set()
+                return False
+        thread = self.thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(STOP_JOIN_TIMEOUT)
+            if thread.is_alive():
+                log.warning("이전 클릭 스레드가 아직 끝나지 않아 시작하지 않음")
+                return False
+        return self.start(trigger_ns) or self.is_running()
+
+    def _run(self):
+        """클릭 스레드 함수 - 절대 데드라인에 맞춰 클릭 수행"""
+        with high_resolution_timer():
+            self._run_loop()
+
+    def _run_loop(self):
+        """클릭 루프 - 데드라인 직전까지 대기 후 남은 구간은 스핀으로 맞춤"""
+        next_deadline = self.started_ns
+        stop_event = self.stop_event
+        lag_history = self.lag_history
+        lag_mask = LAG_HISTORY_SIZE - 1
+        ticks = 0
+
+        # 패턴 좌표는 색인으로만 순회 (클릭마다 좌표를 계산하거나 객체를 만들지 않음)
+        pattern = self.pattern
+        if pattern is not None:
+            xs, ys = pattern.xs, pattern.ys
+            point_count = len(xs)
+            cycles = pattern.cycles
+        point_index = 0
+        last_click = False
+        try:
+            while not stop_event.is_set():
+                if not sleep_until(next_deadline, stop_event, self.spin_ns):
+                    break
+
+                # 데드라인 대비 실제 클릭 시각의 지연 기록
+                fired = now_ns()
+                lag = fired - next_deadline
+                if lag > self.max_lag_ns:
+                    self.max_lag_ns = lag
+                lag_history[ticks & lag_mask] = lag
+                ticks += 1
+
+                if self._trigger_ns:
+                    # 시작 요청부터 첫 클릭 주입 시작까지의 지연
+                    self.start_latency.record(fired - self._trigger_ns)
+                    self._trigger_ns = 0
+
+                if pattern is None:
+                    x, y = self.position_func()
+                else:
+                    x = xs[point_index]
+                    y = ys[point_index]
+                    point_index += 1
+                    if point_index == point_count:
+                        point_index = 0
+                        self.pattern_cycles += 1
+                        last_click = self.pattern_cycles == cycles
+                    self.point_index = point_index
+                burst = self.clicks_per_tick
+                if burst > 1:
+                    self.burst_func(x, y, burst)
+                    self.click_count += burst
+                else:
+                    self.click_func(x, y)
+                    self.click_count += 1
+                self.ticks = ticks
+                if last_click:
+                    break
+
+                # 다음 데드라인은 이전 데드라인 기준으로 계산 (소요 시간 누적 방지)
+                period = self.period_ns
+                next_deadline += period
+
+                # 한 주기 이상 밀렸으면 정책에 따라 처리
+                lag = now_ns() - next_deadline
+                if lag >= period:
+                    missed = lag // period
+                    if self.policy == POLICY_CATCH_UP and missed <= self.max_catch_up:
+                        continue  # 데드라인이 이미 지났으므로 바로 연속 클릭
+                    next_deadline += missed * period
+                    self.skipped_count += missed
+        except Exception as e:
+            log.error("자동 클릭 중 오류: %s\n%s", e, traceback.format_exc())
+        finally:
+            self.stopped_ns = now_ns()
+
+    def get_jitter(self):
+        """최근 클릭의 데드라인 대비 지연 백분위수 반환 (마이크로초)"""
+        count = min(self.ticks, LAG_HISTORY_SIZE)
+        lags = sorted(self.lag_history[:count])
+        return {
+            "p50_us": percentile(lags, 50) / 1000,
+            "p95_us": percentile(lags, 95) / 1000,
+            "p99_us": percentile(lags, 99) / 1000,
+        }
+
+    def get_stats(self):
+        """목표/실제 클릭 속도, 지연 백분위수 등 통계 반환"""
+        end_ns = self.stopped_ns if self.stopped_ns else now_ns()
+        elapsed = (end_ns - self.started_ns) / NS_PER_SEC if self.started_ns else 0.0
+        target_cps = NS_PER_SEC / self.period_ns * self.clicks_per_tick
+        achieved_cps = self.click_count / elapsed if elapsed > 0 else 0.0
+
+        stats = {
+            "target_cps": target_cps,
+            "achieved_cps": achieved_cps,
+            "click_count": self.click_count,
+            "skipped": self.skipped_count,
+            "max_lag_ms": self.max_lag_ns / 1_000_000,
+            "elapsed": elapsed,
+            "start_latency_ms": self.start_latency.last_ns / 1_000_000,
+            "point_index": self.point_index,
+            "pattern_cycles": self.pattern_cycles,
+        }
+        stats.update(self.get_jitter())
+
+        # 1초 이상 실행했는데 건너뛴 데드라인이 있거나 지연 p99가 한 주기를 넘으면 목표 달성 불가
+        stats["unreachable"] = elapsed >= 1.0 and (
+            self.skipped_count > 0 or stats["p99_us"] * 1000 > self.period_ns
+        )
+        return stats
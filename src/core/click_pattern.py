@@ -0,0 +1,159 @@
+"""
+클릭 패턴 모듈
+
+여러 좌표를 차례로 클릭하는 패턴(격자, 좌표 목록, 사각형 안의 무작위 점)의 좌표를
+NumPy 배열로 미리 만들어 둡니다. ClickPattern은 좌표를 x, y 파이썬 정수 목록으로 한 번만 바꿔 두므로
+클릭 엔진은 클릭마다 색인만 올려 좌표를 읽고, 좌표를 계산하거나 새 객체를 만들지 않습니다.
+NumPy는 패턴을 만들 때 처음 불러옵니다.
+
+사용 예:
+    pattern = ClickPattern(grid_points(100, 100, 500, 400, columns=10, rows=5), cycles=3)
+    engine.set_pattern(pattern)
+"""
+import re
+
+# 패턴 종류
+PATTERN_GRID = "grid"      # 사각형을 columns x rows 격자로 나눈 점
+PATTERN_LIST = "list"      # 직접 입력한 좌표 목록
+PATTERN_RANDOM = "random"  # 사각형 안의 무작위 점
+
+# 패턴 하나의 최대 좌표 수
+MAX_POINTS = 100_000
+
+_NUMBER = re.compile(r"-?\d+")
+
+def _check_rect(left, top, right, bottom):
+    """사각형 좌표 확인"""
+    if right < left or bottom < top:
+        raise ValueError(f"잘못된 영역: ({left}, {top}) - ({right}, {bottom})")
+
+def _check_count(count):
+    """좌표 수 확인"""
+    if not 0 < count <= MAX_POINTS:
+        raise ValueError(f"좌표 수는 1-{MAX_POINTS:,}개여야 합니다: {count:,}")
+
+def grid_points(left, top, right, bottom, columns, rows, snake=True):
+    """
+    사각형 영역을 columns x rows로 나눈 격자점 배열 반환 (양 끝 포함)
+
+    Args:
+        left, top, right, bottom (int): 영역 (화면 좌표)
+        columns, rows (int): 가로/세로 점 개수
+        snake (bool): True이면 줄마다 방향을 바꿔 커서 이동 거리를 줄임 (지그재그)
+
+    Returns:
+        numpy.ndarray: (columns * rows, 2) int32 좌표 배열
+    """
+    import numpy as np
+
+    _check_rect(left, top, right, bottom)
+    if columns < 1 or rows < 1:
+        raise ValueError(f"격자 크기는 1 이상이어야 합니다: {columns} x {rows}")
+    _check_count(columns * rows)
+    xs = np.rint(np.linspace(left, right, columns)).astype(np.int32)
+    ys = np.rint(np.linspace(top, bottom, rows)).astype(np.int32)
+    grid_x = np.tile(xs, (rows, 1))
+    if snake:
+        grid_x[1::2] = grid_x[1::2, ::-1]
+    return np.column_stack((grid_x.ravel(), np.repeat(ys, columns)))
+
+def random_points(left, top, right, bottom, count, seed=None):
+    """
+    사각형 영역 안의 무작위 점 배열 반환 (경계 포함, 균등 분포)
+
+    Args:
+        count (int): 점 개수
+        seed (int): 난수 시드 (같은 시드면 같은 점, None이면 매번 다름)
+
+    Returns:
+        numpy.ndarray: (count, 2) int32 좌표 배열
+    """
+    import numpy as np
+
+    _check_rect(left, top, right, bottom)
+    _check_count(count)
+    rng = np.random.default_rng(seed)
+    return np.column_stack((
+        rng.integers(left, right, count, dtype=np.int32, endpoint=True),
+        rng.integers(top, bottom, count, dtype=np.int32, endpoint=True),
+    ))
+
+def parse_points(text):
+    """
+    "x, y" 좌표 목록 문자열을 좌표 배열로 변환 (줄바꿈, 쉼표, 괄호 등 숫자가 아닌 문자는 구분자)
+
+    Returns:
+        numpy.ndarray: (n, 2) int32 좌표 배열
+
+    Raises:
+        ValueError: 좌표가 없거나 숫자 개수가 홀수
+    """
+    import numpy as np
+
+    numbers = _NUMBER.findall(text)
+    if len(numbers) % 2:
+        raise ValueError(f"x, y 쌍이 맞지 않습니다 (숫자 {len(numbers)}개)")
+    _check_count(len(numbers) // 2)
+    return np.array(numbers, dtype=np.int32).reshape(-1, 2)
+
+class ClickPattern:
+    """클릭 엔진이 차례로 클릭할 좌표 패턴"""
+
+    def __init__(self, points, cycles=0, name=""):
+        """
+        Args:
+            points: (n, 2) 좌표 배열 (grid_points, random_points, parse_points 결과 등)
+            cycles (int): 전체 좌표를 몇 바퀴 클릭할지 (0이면 중지할 때까지)
+            name (str): 표시 이름
+        """
+        import numpy as np
+
+        points = np.asarray(points, dtype=np.int32)
+        if points.ndim != 2 or points.shape[1] != 2:
+            raise ValueError(f"좌표 배열은 (n, 2) 형태여야 합니다: {points.shape}")
+        _check_count(len(points))
+        if cycles < 0:
+            raise ValueError(f"반복 횟수는 0 이상이어야 합니다: {cycles}")
+        self.points = points
+        self.cycles = int(cycles)
+        self.name = name
+        # 클릭 루프에서 읽을 좌표 (파이썬 정수로 미리 변환 - 읽을 때 객체를 만들지 않음)
+        self.xs = points[:, 0].tolist()
+        self.ys = points[:, 1].tolist()
+
+    def __len__(self):
+        return len(self.xs)
+
+    def bounds(self):
+        """좌표를 모두 포함하는 (left, top, right, bottom)"""
+        low = self.points.min(axis=0)
+        high = self.points.max(axis=0)
+        return int(low[0]), int(low[1]), int(high[0]), int(high[1])
+
+    def path_length(self):
+        """한 바퀴 동안 커서가 이동하는 거리 (픽셀, 마지막 점에서 첫 점으로 돌아가는 거리 포함)"""
+        import numpy as np
+
+        steps = np.diff(self.points, axis=0, append=self.points[:1]).astype(np.float64)
+        return float(np.hypot(steps[:, 0], steps[:, 1]).sum())
+
+    def dry_run(self, interval, clicks_per_tick=1):
+        """
+        실제로 클릭하지 않고 실행 계획 계산 (미리보기용)
+
+        Args:
+            interval (float): 클릭 엔진의 데드라인 간격 (초, 데드라인마다 좌표 하나)
+            clicks_per_tick (int): 데드라인마다 같은 좌표를 클릭하는 횟수
+
+        Returns:
+            dict: 좌표 수, 영역, 이동 거리, 한 바퀴/전체 소요 시간(초, 무한 반복이면 None), 총 클릭 수
+        """
+        cycle_s = len(self) * interval
+        return {
+            "points": len(self),
+            "bounds": self.bounds(),
+            "path_px": self.path_length(),
+            "cycle_s": cycle_s,
+            "total_s": cycle_s * self.cycles if self.cycles else None,
+            "clicks": len(self) * clicks_per_tick * self.cycles if self.cycles else None,
+        }
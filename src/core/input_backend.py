@@ -0,0 +1,623 @@
+"""
+입력 백엔드 모듈
+
+마우스/키보드 입력을 실제로 주입하는 방식을 추상화합니다.
+- win32_mouse_event: Windows API mouse_event 사용 (기존 방식)
+- win32_sendinput: Windows API SendInput 사용
+- pyautogui: pyautogui 사용 (Windows 이외 환경)
+- recording: 입력을 주입하지 않고 메모리에 기록 (디스플레이 없는 벤치마크용)
+
+사용할 백엔드는 실행 중에 set_backend()로 바꿀 수 있으며,
+AUTO_INPUT_BACKEND 환경 변수로 기본값을 지정할 수 있습니다.
+
+키 입력은 이름(key_down/key_up) 또는 가상 키 코드(key_down_code/key_up_code)로
+주입할 수 있습니다. 반복 입력처럼 같은 키를 계속 주입할 때는 resolve_key()로
+코드를 한 번만 구해 두고 코드로 주입하면 매번 키 이름을 해석하지 않습니다.
+"""
+import os
+import sys
+import threading
+import time
+import ctypes
+from ctypes import wintypes
+
+from src.utils.fast_log import get_logger
+from src.utils.startup_profile import startup_profiler
+
+log = get_logger("InputBackend")
+
+# Windows API 상수
+INPUT_MOUSE = 0
+INPUT_KEYBOARD = 1
+KEYEVENTF_EXTENDEDKEY = 0x0001
+KEYEVENTF_KEYUP = 0x0002
+MAPVK_VK_TO_VSC = 0
+MAPVK_VSC_TO_VK = 1
+
+# 키 이름별 가상 키 코드 (Windows VK_* 값, 운영체제와 관계없이 키 코드로 사용)
+VK_CODES = {
+    "backspace": 0x08, "tab": 0x09, "enter": 0x0D, "shift": 0x10, "ctrl": 0x11, "alt": 0x12,
+    "pause": 0x13, "caps lock": 0x14, "esc": 0x1B, "space": 0x20,
+    "page up": 0x21, "page down": 0x22, "end": 0x23, "home": 0x24,
+    "left": 0x25, "up": 0x26, "right": 0x27, "down": 0x28,
+    "insert": 0x2D, "delete": 0x2E,
+    ";": 0xBA, "=": 0xBB, ",": 0xBC, "-": 0xBD, ".": 0xBE, "/": 0xBF, "`": 0xC0,
+    "[": 0xDB, "\\": 0xDC, "]": 0xDD, "'": 0xDE,
+}
+VK_CODES.update({chr(code).lower(): code for code in range(0x30, 0x3A)})   # 0-9
+VK_CODES.update({chr(code).lower(): code for code in range(0x41, 0x5B)})   # a-z
+VK_CODES.update({f"f{i}": 0x6F + i for i in range(1, 25)})                 # f1-f24
+
+# 가상 키 코드별 키 이름 (코드를 이름으로만 주입할 수 있는 백엔드용)
+KEY_NAMES = [None] * 256
+for _name, _code in VK_CODES.items():
+    KEY_NAMES[_code] = _name
+del _name, _code
+
+# 확장 키 플래그가 필요한 가상 키 코드 (방향키, 편집 키 등)
+EXTENDED_VK_CODES = frozenset(range(0x21, 0x29)) | {0x2D, 0x2E}
+
+def virtual_key_code(key):
+    """
+    키 이름을 가상 키 코드로 변환
+
+    Raises:
+        ValueError: 알 수 없는 키 이름
+    """
+    code = VK_CODES.get(key.lower())
+    if code is None:
+        raise ValueError(f"알 수 없는 키: {key}")
+    return code
+
+# 휠 이동 플래그 (mouseData: 이동량, 120 = 한 칸)
+MOUSEEVENTF_WHEEL = 0x0800
+
+# 버튼별 (누름, 해제) 플래그
+MOUSE_BUTTON_FLAGS = {
+    "left": (0x0002, 0x0004),    # MOUSEEVENTF_LEFTDOWN, MOUSEEVENTF_LEFTUP
+    "right": (0x0008, 0x0010),   # MOUSEEVENTF_RIGHTDOWN, MOUSEEVENTF_RIGHTUP
+    "middle": (0x0020, 0x0040),  # MOUSEEVENTF_MIDDLEDOWN, MOUSEEVENTF_MIDDLEUP
+}
+
+# SendInput 구조체 정의
+ULONG_PTR = ctypes.c_size_t
+
+class MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx", wintypes.LONG),
+        ("dy", wintypes.LONG),
+        ("mouseData", wintypes.DWORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ULONG_PTR),
+    ]
+
+class KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ("wVk", wintypes.WORD),
+        ("wScan", wintypes.WORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ULONG_PTR),
+    ]
+
+class HARDWAREINPUT(ctypes.Structure):
+    _fields_ = [
+        ("uMsg", wintypes.DWORD),
+        ("wParamL", wintypes.WORD),
+        ("wParamH", wintypes.WORD),
+    ]
+
+class _INPUTUNION(ctypes.Union):
+    _fields_ = [("mi", MOUSEINPUT), ("ki", KEYBDINPUT), ("hi", HARDWAREINPUT)]
+
+class INPUT(ctypes.Structure):
+    _anonymous_ = ("u",)
+    _fields_ = [("type", wintypes.DWORD), ("u", _INPUTUNION)]
+
+class InputBackend:
+    """입력 백엔드 기본 클래스"""
+    name = "base"
+
+    def move(self, x, y):
+        """커서를 (x, y)로 이동"""
+        raise NotImplementedError
+
+    def mouse_down(self, button="left"):
+        """마우스 버튼 누름"""
+        raise NotImplementedError
+
+    def mouse_up(self, button="left"):
+        """마우스 버튼 해제"""
+        raise NotImplementedError
+
+    def click(self, x, y, button="left", hold=0.0):
+        """
+        (x, y)에서 클릭
+
+        Args:
+            x (int): 클릭할 x 좌표
+            y (int): 클릭할 y 좌표
+            button (str): "left", "right", "middle"
+            hold (float): 누름과 해제 사이 지연 (초)
+        """
+        self.move(x, y)
+        self.mouse_down(button)
+        if hold:
+            time.sleep(hold)
+        self.mouse_up(button)
+
+    def click_burst(self, x, y, count, button="left"):
+        """
+        (x, y)에서 누름/해제 쌍을 count번 연속으로 주입
+
+        Returns:
+            int: 주입한 이벤트 수
+        """
+        self.move(x, y)
+        for _ in range(count):
+            self.mouse_down(button)
+            self.mouse_up(button)
+        return count * 2
+
+    def scroll(self, amount):
+        """마우스 휠 이동 (120 = 한 칸, 양수는 위쪽)"""
+        raise NotImplementedError
+
+    def key_down(self, key):
+        """키 누름"""
+        raise NotImplementedError
+
+    def key_up(self, key):
+        """키 해제"""
+        raise NotImplementedError
+
+    def resolve_key(self, key):
+        """
+        키 이름을 key_down_code/key_up_code에 넘길 가상 키 코드(0-255)로 변환 (키마다 한 번만 호출)
+
+        Raises:
+            ValueError: 알 수 없는 키 이름
+        """
+        return virtual_key_code(key)
+
+    def key_down_code(self, code):
+        """resolve_key()로 구한 코드로 키 누름 (기본 구현은 이름으로 주입)"""
+        self.key_down(KEY_NAMES[code])
+
+    def key_up_code(self, code):
+        """resolve_key()로 구한 코드로 키 해제 (기본 구현은 이름으로 주입)"""
+        self.key_up(KEY_NAMES[code])
+
+    def close(self):
+        """백엔드 정리"""
+        pass
+
+class _KeyboardLibKeysMixin:
+    """키 입력을 keyboard 라이브러리로 처리하는 백엔드 공통 기능 (첫 키 입력 시 불러옴)"""
+
+    def _init_keys(self):
+        self._keyboard = None
+
+    def _get_keyboard(self):
+        if self._keyboard is None:
+            import keyboard
+            self._keyboard = keyboard
+        return self._keyboard
+
+    def key_down(self, key):
+        self._get_keyboard().press(key)
+
+    def key_up(self, key):
+        self._get_keyboard().release(key)
+
+def load_user32():
+    """user32.dll을 불러와 사용하는 함수의 인자/반환 형식을 설정"""
+    user32 = ctypes.WinDLL('user32', use_last_error=True)
+    user32.SetCursorPos.argtypes = [wintypes.INT, wintypes.INT]
+    user32.SetCursorPos.restype = wintypes.BOOL
+    user32.GetCursorPos.argtypes = [ctypes.POINTER(wintypes.POINT)]
+    user32.GetCursorPos.restype = wintypes.BOOL
+    user32.mouse_event.argtypes = [wintypes.DWORD, wintypes.DWORD, wintypes.DWORD, wintypes.DWORD, ULONG_PTR]
+    user32.SendInput.argtypes = [wintypes.UINT, ctypes.POINTER(INPUT), ctypes.c_int]
+    user32.SendInput.restype = wintypes.UINT
+    user32.keybd_event.argtypes = [wintypes.BYTE, wintypes.BYTE, wintypes.DWORD, ULONG_PTR]
+    user32.MapVirtualKeyW.argtypes = [wintypes.UINT, wintypes.UINT]
+    user32.MapVirtualKeyW.restype = wintypes.UINT
+    user32.VkKeyScanW.argtypes = [wintypes.WCHAR]
+    user32.VkKeyScanW.restype = ctypes.c_short
+    return user32
+
+class _Win32CursorMixin:
+    """
+    Windows 백엔드 공통 커서 이동 기능
+
+    skip_unchanged가 True이면 GetCursorPos로 실제 커서 위치를 읽어 이미 목표 좌표에 있을 때
+    SetCursorPos(커서 이동 이벤트 주입)를 생략합니다. 마지막으로 설정한 좌표가 아니라 실제 위치와
+    비교하므로 사용자가 커서를 움직였으면 다시 옮깁니다. 위치를 읽을 POINT 구조체는 스레드마다 한 번만 만듭니다.
+    좌표는 정수여야 합니다 (클릭 경로에서 int()로 변환하지 않음).
+    """
+
+    def _init_cursor(self, user32, skip_unchanged=True):
+        self._set_cursor_pos = user32.SetCursorPos
+        self._get_cursor_pos = user32.GetCursorPos
+        self._cursor_local = threading.local()
+        self.skip_unchanged = skip_unchanged
+
+    def move(self, x, y):
+        if self.skip_unchanged:
+            try:
+                point, point_ref = self._cursor_local.point
+            except AttributeError:
+                point = wintypes.POINT()
+                point_ref = ctypes.byref(point)
+                self._cursor_local.point = (point, point_ref)
+            if self._get_cursor_pos(point_ref) and point.x == x and point.y == y:
+                return
+        self._set_cursor_pos(x, y)
+
+class _Win32KeyCodesMixin:
+    """
+    Windows 백엔드 공통 키 코드 기능
+
+    가상 키 코드별 스캔 코드와 플래그를 256칸 표에 한 번만 계산해 두므로
+    코드로 주입할 때는 표를 읽기만 합니다.
+    """
+
+    def _init_key_codes(self, user32):
+        self._map_virtual_key = user32.MapVirtualKeyW
+        self._vk_key_scan = user32.VkKeyScanW
+        self._key_scan = bytearray(256)    # 가상 키 코드별 스캔 코드
+        self._key_flags = bytearray(256)   # 가상 키 코드별 누름 플래그 (확장 키)
+        self._key_ready = bytearray(256)   # 표를 계산한 코드 표시
+
+    def resolve_key(self, key):
+        code = VK_CODES.get(key.lower())
+        if code is None and len(key) == 1:
+            # 현재 자판 배치에서 문자를 입력하는 키 (하위 바이트가 가상 키 코드)
+            result = self._vk_key_scan(key)
+            if result != -1:
+                code = result & 0xFF
+        if code is None:
+            # keyboard 라이브러리의 키 이름 해석 사용 (스캔 코드 -> 가상 키 코드)
+            scan_codes = self._get_keyboard().key_to_scan_codes(key, False)
+            if scan_codes:
+                code = self._map_virtual_key(scan_codes[0], MAPVK_VSC_TO_VK) or None
+        if code is None:
+            raise ValueError(f"알 수 없는 키: {key}")
+        self._prepare_key(code)
+        return code
+
+    def _prepare_key(self, code):
+        """가상 키 코드의 스캔 코드와 플래그 계산"""
+        self._key_scan[code] = self._map_virtual_key(code, MAPVK_VK_TO_VSC) & 0xFF
+        self._key_flags[code] = KEYEVENTF_EXTENDEDKEY if code in EXTENDED_VK_CODES else 0
+        self._key_ready[code] = 1
+
+class Win32MouseEventBackend(_Win32CursorMixin, _Win32KeyCodesMixin, _KeyboardLibKeysMixin, InputBackend):
+    """Windows API mouse_event 백엔드 (관리자 권한으로 모든 애플리케이션에서 작동)"""
+    name = "win32_mouse_event"
+
+    def __init__(self, user32=None, skip_unchanged=True):
+        """
+        Args:
+            user32: user32 함수 제공 객체 (None이면 load_user32() 사용)
+            skip_unchanged (bool): 커서가 이미 목표 좌표에 있으면 SetCursorPos 생략
+        """
+        user32 = user32 or load_user32()
+        self._init_cursor(user32, skip_unchanged)
+        self._mouse_event = user32.mouse_event
+        self._keybd_event = user32.keybd_event
+        self._init_keys()
+        self._init_key_codes(user32)
+
+    def key_down_code(self, code):
+        if not self._key_ready[code]:
+            self._prepare_key(code)
+        self._keybd_event(code, self._key_scan[code], self._key_flags[code], 0)
+
+    def key_up_code(self, code):
+        if not self._key_ready[code]:
+            self._prepare_key(code)
+        self._keybd_event(code, self._key_scan[code], self._key_flags[code] | KEYEVENTF_KEYUP, 0)
+
+    def mouse_down(self, button="left"):
+        self._mouse_event(MOUSE_BUTTON_FLAGS[button][0], 0, 0, 0, 0)
+
+    def mouse_up(self, button="left"):
+        self._mouse_event(MOUSE_BUTTON_FLAGS[button][1], 0, 0, 0, 0)
+
+    def scroll(self, amount):
+        self._mouse_event(MOUSEEVENTF_WHEEL, 0, 0, amount & 0xFFFFFFFF, 0)
+
+    def click(self, x, y, button="left", hold=0.0):
+        down_flag, up_flag = MOUSE_BUTTON_FLAGS[button]
+        mouse_event = self._mouse_event
+        self.move(x, y)
+        mouse_event(down_flag, 0, 0, 0, 0)
+        if hold:
+            time.sleep(hold)
+        mouse_event(up_flag, 0, 0, 0, 0)
+
+class Win32SendInputBackend(_Win32CursorMixin, _Win32KeyCodesMixin, _KeyboardLibKeysMixin, InputBackend):
+    """
+    Windows API SendInput 백엔드
+
+    클릭에 사용하는 INPUT 구조체는 버튼/클릭 수별로, 키 입력에 사용하는 구조체는
+    가상 키 코드/누름 여부별로 한 번만 만들어 재사용하므로 입력마다 구조체를 새로 할당하지 않습니다.
+    """
+    name = "win32_sendinput"
+
+    def __init__(self, user32=None, skip_unchanged=True):
+        """
+        Args:
+            user32: user32 함수 제공 객체 (None이면 load_user32() 사용)
+            skip_unchanged (bool): 커서가 이미 목표 좌표에 있으면 SetCursorPos 생략
+        """
+        user32 = user32 or load_user32()
+        self._init_cursor(user32, skip_unchanged)
+        self._send_input = user32.SendInput
+        self._input_size = ctypes.sizeof(INPUT)
+        self._burst_cache = {}  # {(클릭 수, 버튼): 미리 만든 INPUT 배열}
+        self._single_cache = {}  # {플래그: 미리 만든 INPUT 1개}
+        self._click_cache = {}   # {버튼: 누름/해제 INPUT 2개} - 클릭 경로에서 튜플 키 생성을 피함
+        self._key_inputs = [None] * 512  # [코드 * 2 + 해제 여부]: 미리 만든 키 INPUT
+        self._init_keys()
+        self._init_key_codes(user32)
+
+    def _prepare_key(self, code):
+        """스캔 코드 계산 후 누름/해제 INPUT 구조체를 미리 만들어 둠"""
+        super()._prepare_key(code)
+        for up in (0, 1):
+            event = INPUT(type=INPUT_KEYBOARD)
+            event.ki.wVk = code
+            event.ki.wScan = self._key_scan[code]
+            event.ki.dwFlags = self._key_flags[code] | (KEYEVENTF_KEYUP if up else 0)
+            self._key_inputs[code * 2 + up] = event
+
+    def key_down_code(self, code):
+        event = self._key_inputs[code * 2]
+        if event is None:
+            self._prepare_key(code)
+            event = self._key_inputs[code * 2]
+        self._send(event, 1)
+
+    def key_up_code(self, code):
+        event = self._key_inputs[code * 2 + 1]
+        if event is None:
+            self._prepare_key(code)
+            event = self._key_inputs[code * 2 + 1]
+        self._send(event, 1)
+
+    def _get_burst_inputs(self, count, button):
+        """누름/해제 쌍 count개로 된 INPUT 배열 반환 (처음 한 번만 생성 후 재사용)"""
+        inputs = self._burst_cache.get((count, button))
+        if inputs is None:
+            down_flag, up_flag = MOUSE_BUTTON_FLAGS[button]
+            inputs = (INPUT * (count * 2))()
+            for i in range(count * 2):
+                inputs[i].type = INPUT_MOUSE
+                inputs[i].mi.dwFlags = up_flag if i % 2 else down_flag
+            self._burst_cache[(count, button)] = inputs
+        return inputs
+
+    def _send(self, inputs, count):
+        """미리 만든 INPUT 배열 전송"""
+        if self._send_input(count, inputs, self._input_size) != count:
+            raise ctypes.WinError(ctypes.get_last_error())
+        return count
+
+    def click_burst(self, x, y, count, button="left"):
+        """누름/해제 쌍 count개를 SendInput 한 번으로 전송"""
+        inputs = self._get_burst_inputs(count, button)
+        self.move(x, y)
+        return self._send(inputs, count * 2)
+
+    def click(self, x, y, button="left", hold=0.0):
+        self.move(x, y)
+        if hold:
+            down_flag, up_flag = MOUSE_BUTTON_FLAGS[button]
+            self._send_mouse(down_flag)
+            time.sleep(hold)
+            self._send_mouse(up_flag)
+        else:
+            # 누름/해제를 한 번의 SendInput으로 전송
+            inputs = self._click_cache.get(button)
+            if inputs is None:
+                inputs = self._click_cache[button] = self._get_burst_inputs(1, button)
+            self._send(inputs, 2)
+
+    def _send_mouse(self, flags):
+        """마우스 버튼 이벤트 하나를 SendInput으로 전송 (미리 만든 구조체 재사용)"""
+        event = self._single_cache.get(flags)
+        if event is None:
+            event = INPUT(type=INPUT_MOUSE)
+            event.mi.dwFlags = flags
+            self._single_cache[flags] = event
+        self._send(event, 1)
+
+    def mouse_down(self, button="left"):
+        self._send_mouse(MOUSE_BUTTON_FLAGS[button][0])
+
+    def mouse_up(self, button="left"):
+        self._send_mouse(MOUSE_BUTTON_FLAGS[button][1])
+
+    def scroll(self, amount):
+        event = INPUT(type=INPUT_MOUSE)
+        event.mi.dwFlags = MOUSEEVENTF_WHEEL
+        event.mi.mouseData = amount & 0xFFFFFFFF
+        self._send(event, 1)
+
+class PyAutoGuiBackend(InputBackend):
+    """pyautogui 백엔드 (Windows API를 사용할 수 없을 때)"""
+    name = "pyautogui"
+
+    def __init__(self):
+        import pyautogui
+        self._pyautogui = pyautogui
+
+    def move(self, x, y):
+        self._pyautogui.moveTo(x, y, _pause=False)
+
+    def mouse_down(self, button="left"):
+        self._pyautogui.mouseDown(button=button, _pause=False)
+
+    def mouse_up(self, button="left"):
+        self._pyautogui.mouseUp(button=button, _pause=False)
+
+    def scroll(self, amount):
+        self._pyautogui.scroll(amount // 120, _pause=False)
+
+    def key_down(self, key):
+        self._pyautogui.keyDown(key, _pause=False)
+
+    def key_up(self, key):
+        self._pyautogui.keyUp(key, _pause=False)
+
+# 기록 백엔드 이벤트 종류
+EVENT_MOVE = 0
+EVENT_MOUSE_DOWN = 1
+EVENT_MOUSE_UP = 2
+EVENT_KEY_DOWN = 3
+EVENT_KEY_UP = 4
+EVENT_SCROLL = 5
+
+class RecordingBackend(InputBackend):
+    """
+    입력을 주입하지 않고 (시각, 종류, 값1, 값2) 형태로 메모리에 기록하는 백엔드
+
+    실제 입력 장치 없이 클릭 엔진과 키 반복 엔진의 처리량/지연을
+    결정적으로 측정하는 데 사용합니다.
+    """
+    name = "recording"
+
+    def __init__(self, latency=0.0):
+        """
+        Args:
+            latency (float): 주입 한 번에 걸리는 시간을 흉내 낼 지연 (초, 바쁜 대기)
+        """
+        self.events = []
+        self.latency_ns = int(latency * 1_000_000_000)
+        self.position = (0, 0)
+        self.keys_down = set()
+
+    def _wait_latency(self):
+        """주입 호출 한 번의 지연 흉내 (바쁜 대기)"""
+        now = time.perf_counter_ns()
+        if self.latency_ns:
+            end = now + self.latency_ns
+            while time.perf_counter_ns() < end:
+                pass
+        return now
+
+    def _record(self, kind, a, b=0):
+        now = self._wait_latency()
+        self.events.append((now, kind, a, b))
+
+    def move(self, x, y):
+        self.position = (x, y)
+        self._record(EVENT_MOVE, x, y)
+
+    def mouse_down(self, button="left"):
+        self._record(EVENT_MOUSE_DOWN, button)
+
+    def mouse_up(self, button="left"):
+        self._record(EVENT_MOUSE_UP, button)
+
+    def click_burst(self, x, y, count, button="left"):
+        # 배치 전송을 흉내 내어 지연은 한 번만 적용
+        self.position = (x, y)
+        now = self._wait_latency()
+        events = [(now, EVENT_MOVE, x, y)]
+        for _ in range(count):
+            events.append((now, EVENT_MOUSE_DOWN, button, 0))
+            events.append((now, EVENT_MOUSE_UP, button, 0))
+        self.events.extend(events)
+        return count * 2
+
+    def scroll(self, amount):
+        self._record(EVENT_SCROLL, amount)
+
+    def key_down(self, key):
+        self.keys_down.add(key)
+        self._record(EVENT_KEY_DOWN, key)
+
+    def key_up(self, key):
+        self.keys_down.discard(key)
+        self._record(EVENT_KEY_UP, key)
+
+    def timestamps(self, kind, value=None):
+        """특정 종류(및 값)의 이벤트 시각 목록 반환"""
+        return [t for t, k, a, _ in self.events if k == kind and (value is None or a == value)]
+
+    def clear(self):
+        """기록 초기화"""
+        self.events = []
+        self.keys_down.clear()
+
+# 사용 가능한 백엔드 목록
+BACKENDS = {
+    Win32MouseEventBackend.name: Win32MouseEventBackend,
+    Win32SendInputBackend.name: Win32SendInputBackend,
+    PyAutoGuiBackend.name: PyAutoGuiBackend,
+    RecordingBackend.name: RecordingBackend,
+}
+
+_backend = None
+_backend_lock = threading.Lock()
+
+def default_backend_name():
+    """환경 변수 또는 운영체제에 따른 기본 백엔드 이름 반환"""
+    name = os.environ.get("AUTO_INPUT_BACKEND")
+    if name in BACKENDS:
+        return name
+    return Win32MouseEventBackend.name if sys.platform == "win32" else PyAutoGuiBackend.name
+
+def create_backend(name, **kwargs):
+    """이름으로 새 백엔드 인스턴스 생성"""
+    if name not in BACKENDS:
+        raise ValueError(f"알 수 없는 입력 백엔드: {name}")
+    return BACKENDS[name](**kwargs)
+
+def current_backend_name():
+    """현재 백엔드 이름 반환 (아직 생성되지 않았으면 생성하지 않고 기본값 이름 반환)"""
+    backend = _backend
+    return backend.name if backend is not None else default_backend_name()
+
+def get_backend():
+    """현재 입력 백엔드 반환 (처음 호출 시 기본 백엔드 생성)"""
+    global _backend
+    backend = _backend
+    if backend is None:
+        with _backend_lock:
+            if _backend is None:
+                name = default_backend_name()
+                try:
+                    with startup_profiler.phase(f"입력 백엔드 생성 ({name})"):
+                        _backend = create_backend(name)
+                except Exception as e:
+                    # Windows API를 사용할 수 없으면 pyautogui 사용
+                    log.warning("입력 백엔드 '%s' 생성 실패, pyautogui 사용: %s", name, e)
+                    _backend = create_backend(PyAutoGuiBackend.name)
+            backend = _backend
+    return backend
+
+def set_backend(backend):
+    """
+    입력 백엔드 변경
+
+    Args:
+        backend: InputBackend 인스턴스 또는 백엔드 이름
+
+    Returns:
+        InputBackend: 새로 설정된 백엔드
+    """
+    global _backend
+    if isinstance(backend, str):
+        backend = create_backend(backend)
+    with _backend_lock:
+        old = _backend
+        _backend = backend
+    if old is not None and old is not backend:
+        old.close()
+    return backend
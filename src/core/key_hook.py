@@ -0,0 +1,321 @@
+"""
+전역 키보드 훅 모듈
+
+keyboard 라이브러리에 훅을 하나만 등록하고, 키 이벤트를 스캔 코드로 색인한
+표에서 찾아 처리 함수를 호출합니다.
+- 키마다 훅을 따로 등록하지 않으므로 등록한 키(단축키, 연타 키)가 많아도
+  키 입력 한 번의 비용은 표 조회 한 번입니다.
+- 키 등록/해제는 훅을 다시 등록하지 않고 표만 바꿉니다 (O(1)).
+- 훅 콜백은 처리 함수를 직접 호출하지 않고 (스캔 코드, 누름 여부, 시각) 기록을
+  제한된 크기의 큐에 넣은 뒤 바로 반환합니다. 처리 함수는 전용 소비 스레드에서
+  호출되므로 락 대기나 입력 주입이 훅 스레드를 막지 않습니다
+  (Windows는 응답이 늦은 저수준 훅을 제거하며, 그러면 키가 눌린 채로 남습니다).
+- 키를 누르고 있는 동안 운영체제가 반복해서 보내는 누름 이벤트는 훅 콜백에서
+  걸러내므로, 처리 함수는 해제 후 첫 누름과 해제에서만 호출됩니다.
+- 입력 녹화처럼 모든 키 이벤트가 필요한 경우 add_listener()로 관찰 함수를 등록합니다.
+  관찰 함수는 훅 스레드에서 걸러내기 전의 이벤트를 받으므로 짧게 끝나야 합니다.
+
+처리 함수는 키 이벤트가 들어온 시각(perf_counter_ns)을 인자로 받습니다.
+
+사용 예:
+    hook = get_key_hook()
+    hook.add_hotkey("f6", toggle)                 # 누를 때 호출, 키 입력은 다른 프로그램에 전달하지 않음
+    hook.add_key("a", on_press=press, on_release=release)
+"""
+import threading
+import time
+from collections import deque
+
+from src.utils.fast_log import get_logger
+from src.utils.startup_profile import startup_profiler
+
+log = get_logger("KeyHook")
+
+# keyboard 라이브러리의 이벤트 종류
+KEY_DOWN = "down"
+
+# 훅 스레드에서 소비 스레드로 넘기는 큐의 최대 길이
+QUEUE_CAPACITY = 1024
+
+class KeyBinding:
+    """스캔 코드 하나에 연결된 처리 함수"""
+    __slots__ = ("key", "on_press", "on_release", "suppress", "is_down")
+
+    def __init__(self, key, on_press, on_release, suppress):
+        self.key = key                # 등록한 키 이름
+        self.on_press = on_press      # 누름 처리 함수 (이벤트 시각 전달)
+        self.on_release = on_release  # 해제 처리 함수 (이벤트 시각 전달)
+        self.suppress = suppress      # True면 키 입력을 다른 프로그램에 전달하지 않음
+        self.is_down = False          # 마지막으로 받은 이벤트가 누름인지 (훅 스레드만 기록)
+
+class KeyHook:
+    """
+    전역 키보드 훅 하나로 모든 키 처리 함수를 호출하는 분배기
+
+    _bindings는 {스캔 코드: KeyBinding} 사전이며, 훅 콜백은 락 없이 읽습니다.
+    등록/해제는 사전 항목 하나를 바꾸는 것이므로 훅 스레드에서 보기에 원자적입니다.
+
+    훅 콜백과 소비 스레드 사이의 큐는 deque이며 append/popleft가 스레드 안전하므로
+    훅 콜백은 락을 잡지 않습니다. 소비 스레드가 잠들어 있을 때만 이벤트로 깨웁니다.
+    """
+
+    def __init__(self, keyboard_module=None, capacity=QUEUE_CAPACITY):
+        """
+        Args:
+            keyboard_module: keyboard 라이브러리와 같은 인터페이스의 모듈 (None이면 처음 등록할 때 불러옴)
+            capacity (int): 처리 대기 큐의 최대 길이
+        """
+        self._keyboard = keyboard_module
+        self._bindings = {}           # {스캔 코드: KeyBinding}
+        self._codes = {}              # {키 이름: 스캔 코드 튜플}
+        self._listeners = ()          # 모든 키 이벤트 관찰 함수 (훅 콜백이 락 없이 읽도록 튜플로 교체)
+        self._handle = None           # keyboard.hook() 반환값
+        self._lock = threading.Lock() # 등록/해제 직렬화 (훅 콜백은 사용하지 않음)
+
+        # 훅 스레드 -> 소비 스레드 큐 ((스캔 코드, 누름 여부, 시각) 기록)
+        self.capacity = capacity
+        self._queue = deque()
+        self._wake = threading.Event()
+        self._consumer = None
+        self._closed = False
+
+        # 통계
+        self.events = 0               # 훅으로 들어온 키 이벤트 수
+        self.dispatched = 0           # 처리 함수를 호출한 이벤트 수
+        self.errors = 0               # 처리 함수에서 발생한 예외 수
+        self.dropped = 0              # 큐가 가득 차서 버린 이벤트 수
+        self.repeats_filtered = 0     # 운영체제 자동 반복으로 판단해 걸러낸 누름 이벤트 수
+        self.max_depth = 0            # 큐 길이 최댓값
+        self.callback_ns_max = 0      # 훅 콜백 한 번의 최대 소요 시간
+        self.lag_ns_max = 0           # 훅 콜백부터 처리 함수 호출까지의 최대 지연
+
+    def _get_keyboard(self):
+        if self._keyboard is None:
+            import keyboard
+            self._keyboard = keyboard
+        return self._keyboard
+
+    def add_key(self, key, on_press=None, on_release=None, suppress=False):
+        """
+        키 처리 함수 등록 (같은 키가 이미 등록되어 있으면 교체)
+
+        Args:
+            key (str): 키 이름 (예: "a", "f6")
+            on_press (function): 키를 누를 때 호출할 함수 (이벤트 시각을 인자로 받음)
+            on_release (function): 키를 뗄 때 호출할 함수 (이벤트 시각을 인자로 받음)
+            suppress (bool): True면 키 입력을 다른 프로그램에 전달하지 않음
+
+        Returns:
+            tuple: 등록된 스캔 코드
+        """
+        keyboard = self._get_keyboard()
+        codes = tuple(keyboard.key_to_scan_codes(key))
+        binding = KeyBinding(key, on_press, on_release, suppress)
+        with self._lock:
+            self._remove_locked(key)
+            self._codes[key] = codes
+            for code in codes:
+                self._bindings[code] = binding
+            self._ensure_hook()
+        return codes
+
+    def add_hotkey(self, key, callback, suppress=True):
+        """단축키 등록 - 키를 누를 때 callback(이벤트 시각) 호출"""
+        return self.add_key(key, on_press=callback, suppress=suppress)
+
+    def remove_key(self, key):
+        """키 처리 함수 해제 (등록되지 않은 키면 False 반환)"""
+        with self._lock:
+            return self._remove_locked(key)
+
+    def _remove_locked(self, key):
+        """키 처리 함수 해제 (락 보유 상태에서 호출)"""
+        codes = self._codes.pop(key, None)
+        if codes is None:
+            return False
+        for code in codes:
+            binding = self._bindings.get(code)
+            if binding is not None and binding.key == key:
+                del self._bindings[code]
+        return True
+
+    def add_listener(self, listener):
+        """
+        모든 키 이벤트 관찰 함수 등록
+
+        listener(event, event_ns)는 훅 스레드에서 등록 여부, 자동 반복과 관계없이
+        모든 키 이벤트마다 호출되며, 반환값은 키 입력 전달 여부에 영향을 주지 않습니다.
+        """
+        with self._lock:
+            if listener not in self._listeners:
+                self._listeners = self._listeners + (listener,)
+            self._ensure_hook()
+
+    def remove_listener(self, listener):
+        """관찰 함수 해제 (등록되지 않은 함수면 False 반환)"""
+        with self._lock:
+            if listener not in self._listeners:
+                return False
+            self._listeners = tuple(item for item in self._listeners if item != listener)
+            return True
+
+    def is_registered(self, key):
+        """키가 등록되어 있는지 확인"""
+        return key in self._codes
+
+    def _ensure_hook(self):
+        """소비 스레드와 전역 훅이 없으면 시작/등록 (락 보유 상태에서 호출)"""
+        if self._consumer is None:
+            self._closed = False
+            self._consumer = threading.Thread(target=self._consume, daemon=True, name="KeyEventConsumer")
+            self._consumer.start()
+        if self._handle is None:
+            with startup_profiler.phase("전역 키보드 훅 등록"):
+                # suppress=True 훅은 콜백이 False를 반환한 이벤트만 다른 프로그램에 전달하지 않음
+                self._handle = self._get_keyboard().hook(self._on_event, suppress=True)
+
+    def _on_event(self, event):
+        """
+        키 이벤트 콜백 (훅 스레드) - True를 반환하면 다른 프로그램에 전달
+
+        등록된 키면 기록만 큐에 넣고 바로 반환합니다. 처리 함수는 소비 스레드가 호출합니다.
+        이미 눌린 키의 누름 이벤트(운영체제 자동 반복)는 큐에 넣지 않습니다.
+        """
+        started = time.perf_counter_ns()
+        self.events += 1
+        if self._listeners:
+            self._notify_listeners(event, started)
+        binding = self._bindings.get(event.scan_code)
+        if binding is None:
+            return True
+
+        # 누름/해제 경계만 통과 (해제 후 첫 누름, 누름 후 해제)
+        is_down = event.event_type == KEY_DOWN
+        if is_down and binding.is_down:
+            self.repeats_filtered += 1
+            return not binding.suppress
+        binding.is_down = is_down
+
+        queue = self._queue
+        if len(queue) >= self.capacity:
+            # 소비 스레드가 멈춘 경우 - 훅 스레드를 막지 않도록 새 이벤트를 버림
+            self.dropped += 1
+        else:
+            queue.append((event.scan_code, is_down, started))
+            depth = len(queue)
+            if depth > self.max_depth:
+                self.max_depth = depth
+            if not self._wake.is_set():
+                self._wake.set()
+
+        elapsed = time.perf_counter_ns() - started
+        if elapsed > self.callback_ns_max:
+            self.callback_ns_max = elapsed
+        return not binding.suppress
+
+    def _notify_listeners(self, event, event_ns):
+        """관찰 함수 호출 (훅 스레드) - 예외가 훅 콜백 밖으로 나가지 않도록 처리"""
+        for listener in self._listeners:
+            try:
+                listener(event, event_ns)
+            except Exception as e:
+                self.errors += 1
+                log.error("키 이벤트 관찰 함수 오류: %s", e)
+
+    def _consume(self):
+        """소비 스레드 함수 - 큐의 기록을 순서대로 처리 함수에 전달"""
+        queue = self._queue
+        wake = self._wake
+        while not self._closed:
+            wake.wait()
+            wake.clear()
+            while True:
+                try:
+                    record = queue.popleft()
+                except IndexError:
+                    break
+                self._dispatch(*record)
+
+    def _dispatch(self, scan_code, is_down, event_ns):
+        """기록 하나를 처리 함수에 전달 (소비 스레드)"""
+        binding = self._bindings.get(scan_code)
+        if binding is None:
+            return
+        func = binding.on_press if is_down else binding.on_release
+        if func is None:
+            return
+
+        lag = time.perf_counter_ns() - event_ns
+        if lag > self.lag_ns_max:
+            self.lag_ns_max = lag
+        self.dispatched += 1
+        try:
+            func(event_ns)
+        except Exception as e:
+            self.errors += 1
+            log.error("키 '%s' 처리 중 오류: %s", binding.key, e)
+
+    def close(self):
+        """전역 훅 해제, 소비 스레드 종료 및 모든 등록 제거"""
+        with self._lock:
+            self._bindings.clear()
+            self._codes.clear()
+            self._listeners = ()
+            handle = self._handle
+            self._handle = None
+            consumer = self._consumer
+            self._consumer = None
+            self._closed = True
+        if handle is not None:
+            try:
+                self._get_keyboard().unhook(handle)
+            except Exception as e:
+                log.warning("전역 키보드 훅 해제 실패: %s", e)
+        self._wake.set()
+        if consumer is not None and consumer is not threading.current_thread():
+            consumer.join(timeout=0.05)
+        self._queue.clear()
+
+    def get_stats(self):
+        """등록 수, 큐 길이, 훅 콜백 소요 시간 통계 반환"""
+        return {
+            "keys": len(self._codes),
+            "scan_codes": len(self._bindings),
+            "listeners": len(self._listeners),
+            "events": self.events,
+            "dispatched": self.dispatched,
+            "errors": self.errors,
+            "queue_depth": len(self._queue),
+            "queue_max_depth": self.max_depth,
+            "dropped": self.dropped,
+            "repeats_filtered": self.repeats_filtered,
+            "callback_max_us": self.callback_ns_max / 1000,
+            "dispatch_lag_max_us": self.lag_ns_max / 1000,
+        }
+
+# 전역 인스턴스 (처음 사용할 때 생성)
+_key_hook = None
+_key_hook_lock = threading.Lock()
+
+def get_key_hook(create=True):
+    """
+    전역 키보드 훅 분배기 반환
+
+    매개변수:
+        create: False이면 아직 생성되지 않은 경우 None 반환
+    """
+    global _key_hook
+    if _key_hook is None and create:
+        with _key_hook_lock:
+            if _key_hook is None:
+                _key_hook = KeyHook()
+    return _key_hook
+
+def close_key_hook():
+    """전역 훅 해제 (프로그램 종료 시 호출, 생성되지 않았으면 아무 작업도 하지 않음)"""
+    global _key_hook
+    with _key_hook_lock:
+        hook = _key_hook
+        _key_hook = None
+    if hook is not None:
+        hook.close()
@@ -2,98 +2,163 @@
 키보드 연속 입력 모듈
 
 키보드 키를 연속으로 입력하는 기능을 제공합니다.
+키 이름은 enable_key()에서 입력 백엔드를 통해 가상 키 코드로 한 번만 변환하고,
+이후 상태 관리와 키 주입은 모두 코드로 처리합니다.
 """
-import time
 import threading
-import keyboard
 import traceback
+from array import array
+
+from src.core.input_backend import get_backend
+from src.core.repeat_scheduler import RepeatScheduler
+from src.core.timing import seconds_to_ns
+from src.utils.fast_log import DEBUG, INFO, get_level, get_logger
+from src.utils.instrumented_lock import InstrumentedLock
+from src.utils.startup_profile import startup_profiler
+
+# 모든 반복 중지/종료 시 눌린 키 해제를 기다리는 최대 시간 (초)
+STOP_TIMEOUT = 0.05
+
+# 키 상태 표의 비트 (가상 키 코드별 1바이트)
+KEY_ENABLED = 0x01   # 반복 대상으로 활성화됨
+KEY_PRESSED = 0x02   # 사용자가 누른 상태 (반복 요청 중)
 
 # 키보드 컨트롤러 클래스
 class KeyboardController:
     def __init__(self):
         # 기본 상태
         self.mode_active = False     # 전체 모드 활성화 상태
-        self.enabled_keys = set()    # 활성화된 키 목록
-        self.pressed_keys = {}       # 각 키별 눌림 상태 {키: 눌림여부}
-        self.active_threads = {}     # 각 키별 스레드 {키: 스레드}
-        self.stop_signals = {}       # 각 키별 종료 신호 {키: 이벤트}
+        
+        # 키 상태 - 가상 키 코드(0-255)로 색인하는 고정 크기 표
+        self._codes = {}                         # {키 이름: 가상 키 코드} (enable_key에서 한 번만 변환)
+        self._names = [None] * 256               # 코드별 키 이름 (로그/상태 표시용)
+        self._key_state = bytearray(256)         # 코드별 KEY_ENABLED/KEY_PRESSED 비트 (락으로 보호)
+        self._key_down = bytearray(256)          # 코드별 누름 주입 여부 (주입한 스레드가 직접 기록)
+        self._key_tokens = array('I', [0]) * 256 # 코드별 상태 전환 번호 (락 밖에서 실행할 해제의 취소 토큰)
         
         # 키 반복 설정 - 더 안정적인 값으로 조정
         self.press_delay = 0.02      # 키 누름 지속 시간 (초)
         self.release_delay = 0.02    # 키 해제 지속 시간 (초)
         
+        # 반복 방식: "split" = 간격을 누름/해제 시간으로 분할, "rate" = 목표 속도 + 누름 유지 시간
+        self.repeat_mode = "split"
+        self.target_rate_hz = 10.0   # 목표 반복 속도 (Hz)
+        self.hold_duration = 0.02    # 누름 유지 시간 (초)
+        
         # 안정성 설정
         self.retry_delay = 0.05      # 키 입력 실패 시 재시도 간격 (증가)
         self.min_cycle_time = 0.01   # 최소 사이클 타임 (증가)
         self.max_retries = 2         # 최대 재시도 횟수 (감소)
         
-        # 디버깅 설정
-        self.debug_mode = True       # 디버깅 모드 활성화
+        # 로그 (디버그 로그는 기본적으로 꺼져 있음 - debug_mode 또는 AUTO_LOG_LEVEL로 켬)
+        self.log = get_logger("KeyboardController")
+        
+        # 스레드 안전 락 - 상태 변경만 보호하고 키 주입 같은 차단 호출은 락 밖에서 수행
+        self.lock = InstrumentedLock()  # 재진입 가능, 대기/보유 시간 측정
         
-        # 스레드 안전 락
-        self.lock = threading.RLock()  # 재진입 가능한 락으로 변경
+        # 모든 반복 키를 하나의 스레드에서 처리하는 스케줄러 (키 대신 가상 키 코드로 예약)
+        self.scheduler = RepeatScheduler(self._inject_press, self._inject_release)
+        self.scheduler.max_retries = self.max_retries
+        self.scheduler.retry_delay_ns = seconds_to_ns(self.retry_delay)
+        self.scheduler.on_finished = self._on_repeat_finished
+        self.scheduler.on_thread_exit = self._on_scheduler_exit
+        self._apply_timing()
         
-        # 키 입력 상태 확인용 타이머
-        self.watchdog_timer = None
-        self.watchdog_interval = 0.5  # 0.5초마다 상태 확인
+        # 감독 (스케줄러 알림을 받았을 때만 실행, 주기적 확인 없음)
+        self.watchdog_interventions = 0  # 감독이 상태를 바로잡은 횟수
+        self.redundant_presses = 0       # 이미 반복 중인 키의 시작 요청 수 (락 없이 바로 반환)
         
         # 초기화 로그
-        self._log("초기화 완료")
-        
-        # 워치독 타이머 시작
-        self._start_watchdog()
-    
-    def _log(self, message):
-        """디버깅 로그 출력"""
-        if self.debug_mode:
-            print(f"[KeyboardController] {message}")
-    
-    def _start_watchdog(self):
-        """워치독 타이머 시작 - 키 상태를 주기적으로 확인하여 문제 감지 및 수정"""
-        def watchdog_worker():
-            while True:
-                try:
-                    # 모드가 활성화된 경우에만 검사
-                    if self.mode_active:
-                        with self.lock:
-                            # 활성 스레드 확인
-                            for key in list(self.active_threads.keys()):
-                                # 스레드가 죽었는데 키가 눌린 상태로 남아있는지 확인
-                                if not self.active_threads[key].is_alive() and self.pressed_keys.get(key, False):
-                                    self._log(f"워치독: 키 {key}의 스레드가 죽었지만 눌린 상태로 감지됨, 상태 초기화")
-                                    self.pressed_keys[key] = False
-                                    self._clean_key_state(key)
-                                
-                                # 키가 눌려있지 않은데 스레드가 살아있는지 확인
-                                if not self.pressed_keys.get(key, False) and key in self.active_threads:
-                                    self._log(f"워치독: 키 {key}가 눌려있지 않은데 스레드가 활성 상태, 스레드 종료")
-                                    self._stop_key_repeat(key)
-                    
-                    # ※ 다음 체크는 연타 모드에서는 무시 - 연타 모드는 실제 키보드 상태와 관계없이 계속 반복해야 함
-                    """
-                    # 실제 키보드 상태와 내부 상태 동기화 확인
-                    for key in self.enabled_keys:
-                        # 키보드 라이브러리를 통해 실제 키 상태 확인
-                        try:
-                            is_physically_pressed = keyboard.is_pressed(key)
-                            internal_state = self.pressed_keys.get(key, False)
-                            
-                            # 불일치 감지 및 수정
-                            if not is_physically_pressed and internal_state:
-                                self._log(f"워치독: 키 {key}가 실제로는 눌려있지 않은데 내부 상태는 눌림, 상태 수정")
-                                self.handle_key_release(key)
-                        except:
-                            pass
-                    """
-                except Exception as e:
-                    self._log(f"워치독 오류: {e}")
-                
-                # 일정 간격으로 실행
-                time.sleep(self.watchdog_interval)
+        self.log.debug("초기화 완료")
+    
+    @property
+    def debug_mode(self):
+        """디버그 로그 출력 여부"""
+        return self.log.debug_enabled
+    
+    @debug_mode.setter
+    def debug_mode(self, enabled):
+        self.log.set_level(DEBUG if enabled else max(get_level(), INFO))
+    
+    @property
+    def enabled_keys(self):
+        """활성화된 키 이름 집합"""
+        state = self._key_state
+        return {key for key, code in self._codes.items() if state[code] & KEY_ENABLED}
+    
+    @property
+    def pressed_keys(self):
+        """활성화된 키별 눌림 상태 {키: 눌림여부}"""
+        state = self._key_state
+        return {key: bool(state[code] & KEY_PRESSED)
+                for key, code in self._codes.items() if state[code] & KEY_ENABLED}
+    
+    def _inject_press(self, code):
+        """현재 입력 백엔드로 키 누름 주입"""
+        get_backend().key_down_code(code)
+        self._key_down[code] = 1
+    
+    def _inject_release(self, code):
+        """현재 입력 백엔드로 키 해제 주입"""
+        get_backend().key_up_code(code)
+        self._key_down[code] = 0
+    
+    def _apply_timing(self):
+        """현재 반복 설정을 스케줄러에 반영"""
+        if self.repeat_mode == "rate":
+            self.scheduler.set_rate(self.target_rate_hz, self.hold_duration)
+        else:
+            self.scheduler.set_timing(self.press_delay, self.release_delay, self.min_cycle_time)
+    
+    def _on_repeat_finished(self, code):
+        """스케줄러가 입력 실패로 반복을 종료했을 때 호출 (스케줄러 스레드)"""
+        self.log.warning("키 %s 최대 재시도 횟수 초과, 반복 종료", self._names[code])
+        self._supervise(code)
+    
+    def _on_scheduler_exit(self, error):
+        """스케줄러 스레드가 예기치 않게 종료되었을 때 호출"""
+        self.log.error("키 반복 스레드 종료됨: %s", error)
+        self._supervise()
+    
+    def _supervise(self, code=None):
+        """
+        키 상태와 스케줄러 상태 맞추기 (감독)
         
-        # 워치독 스레드 시작
-        self.watchdog_timer = threading.Thread(target=watchdog_worker, daemon=True)
-        self.watchdog_timer.start()
+        주기적으로 깨어나 검사하는 대신 스케줄러의 반복 종료/스레드 종료 알림을 받았을 때만
+        실행되므로 반복 중인 키가 없으면 아무 스레드도 깨어나지 않습니다.
+        
+        Args:
+            code: 알림을 보낸 키의 코드 (None이면 모든 키 검사)
+        """
+        releases = []
+        try:
+            with self.lock:
+                codes = [code] if code is not None else list(self._codes.values())
+                for code in codes:
+                    pressed = self._key_state[code] & KEY_PRESSED
+                    active = self.scheduler.is_active(code)
+                    
+                    # 반복이 끝났는데 키가 눌린 상태로 남아 있음
+                    if pressed and not active:
+                        self.log.debug("감독: 키 %s의 반복이 끝났지만 눌린 상태로 감지됨, 상태 초기화", self._names[code])
+                        releases.append(self._clean_key_state(code))
+                        self.watchdog_interventions += 1
+                    
+                    # 키가 눌려있지 않은데 반복 중
+                    elif not pressed and active:
+                        self.log.debug("감독: 키 %s가 눌려있지 않은데 반복 중, 반복 중지", self._names[code])
+                        self._stop_key_repeat(code)
+                        self.watchdog_interventions += 1
+            
+            # 반복할 키가 남아 있는데 스케줄러 스레드가 없으면 다시 시작 (스레드 시작은 락 밖에서)
+            if self.scheduler.active_keys() and not self.scheduler.is_alive():
+                self.log.warning("감독: 키 반복 스레드 재시작")
+                self.scheduler.restart()
+                with self.lock:
+                    self.watchdog_interventions += 1
+        except Exception as e:
+            self.log.error("감독 오류: %s", e)
+        self._release_keys(releases)
     
     def enable_mode(self, enable=True):
         """모드 활성화/비활성화"""
@@ -107,33 +172,20 @@ class KeyboardController:
                 
                 # 상태 변경
                 self.mode_active = enable
-                self._log(f"모드 {'활성화됨' if enable else '비활성화됨'}")
+                self.log.debug("모드 %s", '활성화됨' if enable else '비활성화됨')
                 
-                # 비활성화 시 모든 반복 중지 및 상태 초기화
+                # 비활성화 시 모든 반복 중지, 활성화된 키 상태 초기화
                 if not enable:
                     self._stop_all_repeats()
-                    
-                    # 모든 키 눌림 상태 초기화
-                    active_keys = list(self.pressed_keys.keys())
-                    for key in active_keys:
-                        self.pressed_keys[key] = False
-                        try:
-                            keyboard.release(key)  # 실제 키 상태도 해제
-                        except:
-                            pass
-                else:
-                    # 활성화 시 모든 키 상태 초기화
-                    active_keys = list(self.enabled_keys)
-                    for key in active_keys:
-                        self.pressed_keys[key] = False
-                        try:
-                            keyboard.release(key)  # 실제 키 상태도 해제
-                        except:
-                            pass
-                
-                return old_state
+                state = self._key_state
+                releases = [self._set_released(code) for code in self._codes.values()
+                            if state[code] & KEY_ENABLED]
+            
+            # 실제 키 상태도 해제 (락 밖에서)
+            self._release_keys(releases)
+            return old_state
         except Exception as e:
-            self._log(f"모드 {'활성화' if enable else '비활성화'} 중 오류: {e}")
+            self.log.error("모드 %s 중 오류: %s", '활성화' if enable else '비활성화', e)
             traceback.print_exc()
             return not enable  # 오류 시 요청한 상태의 반대를 반환
     
@@ -146,42 +198,62 @@ class KeyboardController:
         """모드 활성화 상태 확인"""
         return self.mode_active
     
-    def enable_key(self, key):
-        """키 활성화"""
+    def _resolve(self, key):
+        """
+        키 이름을 가상 키 코드로 변환 - 키마다 처음 한 번만 백엔드에 요청 (락을 보유하지 않은 상태에서 호출)
+        
+        백엔드 변환(자판 배치 조회)은 락 밖에서 하고 결과만 락 안에서 저장합니다.
+        """
+        code = self._codes.get(key)
+        if code is not None:
+            return code
+        code = get_backend().resolve_key(key)
         with self.lock:
-            if key not in self.enabled_keys:
-                self.enabled_keys.add(key)
-                self.pressed_keys[key] = False
-                self._log(f"키 '{key}' 활성화됨")
-                return True
+            # 그 사이 다른 스레드가 먼저 저장했으면 그 값을 사용
+            stored = self._codes.get(key)
+            if stored is not None:
+                return stored
+            self._names[code] = key
+            self._codes[key] = code
+        return code
+    
+    def enable_key(self, key):
+        """키 활성화 (키 이름을 코드로 변환해 둠)"""
+        try:
+            code = self._resolve(key)
+        except ValueError as e:
+            self.log.warning("키 '%s' 활성화 실패: %s", key, e)
             return False
+        with self.lock:
+            if self._key_state[code] & KEY_ENABLED:
+                return False
+            self._key_state[code] = KEY_ENABLED
+            self.log.debug("키 '%s' 활성화됨 (코드 0x%02X)", key, code)
+            return True
     
     def disable_key(self, key):
         """키 비활성화"""
         with self.lock:
-            if key in self.enabled_keys:
-                # 반복 중이면 중지
-                if key in self.active_threads:
-                    self._stop_key_repeat(key)
-                
-                # 상태 제거
-                self.enabled_keys.remove(key)
-                if key in self.pressed_keys:
-                    del self.pressed_keys[key]
-                
-                # 키 상태 초기화
-                try:
-                    keyboard.release(key)
-                except:
-                    pass
-                
-                self._log(f"키 '{key}' 비활성화됨")
-                return True
-            return False
+            code = self._codes.get(key)
+            if code is None or not self._key_state[code] & KEY_ENABLED:
+                return False
+            
+            # 반복 중이면 중지
+            if self.scheduler.is_active(code):
+                self._stop_key_repeat(code)
+            
+            # 상태 제거
+            self._key_state[code] = 0
+            release = (code, self._next_token(code))
+        
+        # 키 상태 초기화 (락 밖에서)
+        self._release_keys([release])
+        self.log.debug("키 '%s' 비활성화됨", key)
+        return True
     
     def toggle_key(self, key):
         """키 활성화 상태 토글"""
-        if key in self.enabled_keys:
+        if self.is_key_enabled(key):
             return not self.disable_key(key)
         else:
             return self.enable_key(key)
@@ -192,250 +264,217 @@ class KeyboardController:
     
     def is_key_enabled(self, key):
         """키 활성화 상태 확인"""
-        return key in self.enabled_keys
+        code = self._codes.get(key)
+        return code is not None and bool(self._key_state[code] & KEY_ENABLED)
     
     def is_key_pressed(self, key):
         """키 눌림 상태 확인"""
-        return self.pressed_keys.get(key, False)
+        code = self._codes.get(key)
+        return code is not None and bool(self._key_state[code] & KEY_PRESSED)
     
     def is_key_repeating(self, key):
         """키 반복 중인지 확인"""
-        return key in self.active_threads and self.active_threads[key].is_alive()
+        code = self._codes.get(key)
+        return code is not None and self.scheduler.is_active(code)
+    
+    def _next_token(self, code):
+        """키의 상태 전환 번호 증가 (락 보유 상태에서 호출)"""
+        token = (self._key_tokens[code] + 1) & 0xFFFFFFFF
+        self._key_tokens[code] = token
+        return token
     
-    def _clean_key_state(self, key):
-        """키 상태 정리 - 모든 관련 상태를 초기화"""
+    def _set_released(self, code):
+        """
+        키를 해제 상태로 전환 (락 보유 상태에서 호출)
+        
+        Returns:
+            tuple: 락 밖에서 _release_keys()로 넘길 (코드, 전환 번호)
+        """
+        self._key_state[code] &= ~KEY_PRESSED
+        return code, self._next_token(code)
+    
+    def _clear_pressed(self):
+        """모든 키를 해제 상태로 표시 (락 보유 상태에서 호출)"""
+        state = self._key_state
+        for code in self._codes.values():
+            state[code] &= ~KEY_PRESSED
+    
+    def _down_codes(self):
+        """누름이 주입되어 아직 해제되지 않은 키 코드 목록"""
+        key_down = self._key_down
+        codes = []
+        code = key_down.find(1)
+        while code >= 0:
+            codes.append(code)
+            code = key_down.find(1, code + 1)
+        return codes
+    
+    def _clean_key_state(self, code):
+        """키 상태 정리 - 스케줄러에서 제거하고 해제 상태로 전환 (락 보유 상태에서 호출)"""
         try:
-            # 키 해제
-            keyboard.release(key)
-            
-            # 스레드 목록에서 제거
-            if key in self.active_threads:
-                del self.active_threads[key]
-            
-            # 종료 신호 목록에서 제거
-            if key in self.stop_signals:
-                del self.stop_signals[key]
-                
+            # 스케줄러에서 제거 (눌린 상태면 스케줄러가 해제)
+            self.scheduler.stop(code)
         except Exception as e:
-            self._log(f"키 상태 정리 중 오류: {e}")
+            self.log.error("키 상태 정리 중 오류: %s", e)
+        return self._set_released(code)
+    
+    def _release_keys(self, releases):
+        """
+        실제 키 해제 주입 (락을 보유하지 않은 상태에서 호출)
+        
+        해제를 예약한 뒤 그 키가 다시 눌렸으면 전환 번호가 바뀌므로 해제를 건너뜁니다.
+        누름을 주입하지 않은 키도 건너뛰므로 비용은 실제로 눌린 키 수에 비례합니다.
+        """
+        key_down = self._key_down
+        tokens = self._key_tokens
+        for code, token in releases:
+            if not key_down[code] or tokens[code] != token:
+                continue
+            try:
+                self._inject_release(code)
+            except Exception:
+                pass
     
-    def handle_key_press(self, key):
-        """키 눌림 처리"""
+    def handle_key_press(self, key, trigger_ns=None):
+        """키 눌림 처리 (trigger_ns: 시작 지연 측정 기준 시각)"""
         try:
             # 모드가 비활성화면 무시
             if not self.mode_active:
                 return False
-
+            
             # 키가 활성화되어 있는지 확인
-            if key not in self.enabled_keys:
+            code = self._codes.get(key)
+            if code is None or not self._key_state[code] & KEY_ENABLED:
                 return False
-
+            
             with self.lock:
-                # 이미 눌린 상태이고 스레드가 정상 작동 중이면 무시
-                if self.pressed_keys.get(key, False) and key in self.active_threads:
-                    if self.active_threads[key].is_alive():
-                        return False
-                    else:
-                        # 스레드가 죽어있으면 상태 초기화 후 재시작
-                        self._log(f"키 {key}의 스레드가 죽어 있음, 상태 초기화 후 재시작")
-                        self._clean_key_state(key)
-                        self.pressed_keys[key] = False
-                        time.sleep(0.05)  # 더 긴 지연으로 안정성 확보
-
-                # 눌림 상태 업데이트
-                self.pressed_keys[key] = True
-
-                # 반복 시작
-                success = self._start_key_repeat(key)
-                if not success:
-                    self._log(f"키 {key} 반복 시작 실패, 상태 초기화")
-                    self.pressed_keys[key] = False
-                    self._clean_key_state(key)
-                return success
-
+                # 이미 눌린 상태이고 반복 중이면 무시
+                if self._key_state[code] & KEY_PRESSED and self.scheduler.is_active(code):
+                    return False
+                
+                # 눌림 상태로 전환 (이전에 예약된 해제는 취소됨)
+                self._key_state[code] |= KEY_PRESSED
+                self._next_token(code)
+                
+                # 반복 시작 (스케줄러 등록만 하고 주입은 스케줄러 스레드가 수행)
+                success = self._start_key_repeat(code, trigger_ns)
+                if success:
+                    return True
+                self.log.debug("키 %s 반복 시작 실패, 상태 초기화", key)
+                release = self._clean_key_state(code)
+            
+            self._release_keys([release])
+            return False
+        
         except Exception as e:
-            self._log(f"키 눌림 처리 중 오류: {e}")
+            self.log.error("키 눌림 처리 중 오류: %s", e)
             traceback.print_exc()
             return False
-
+    
     def handle_key_release(self, key):
         """키 해제 처리"""
         try:
             # 모드가 비활성화면 무시
             if not self.mode_active:
                 return False
-
+            
             # 키가 활성화되어 있는지 확인
-            if key not in self.enabled_keys:
+            code = self._codes.get(key)
+            if code is None or not self._key_state[code] & KEY_ENABLED:
                 return False
-
+            
             with self.lock:
                 # 이미 해제된 상태면 무시
-                if not self.pressed_keys.get(key, False):
+                if not self._key_state[code] & KEY_PRESSED:
                     return False
-
-                # 눌림 상태 업데이트
-                self.pressed_keys[key] = False
-
-                # 반복 중지
-                self._stop_key_repeat(key)
-
+                
+                # 해제 상태로 전환 후 반복 중지 (눌려 있으면 스케줄러 스레드가 해제)
+                self._set_released(code)
+                self._stop_key_repeat(code)
+                
                 return True
         except Exception as e:
-            self._log(f"키 {key} 해제 처리 중 오류: {e}")
+            self.log.error("키 %s 해제 처리 중 오류: %s", key, e)
             traceback.print_exc()
             return False
     
-    def _start_key_repeat(self, key):
-        """키 반복 스레드 시작"""
+    def _start_key_repeat(self, code, trigger_ns=None):
+        """키 반복 시작 (스케줄러에 등록)"""
         try:
-            # 이미 실행 중인 스레드가 있으면 중지
-            if key in self.active_threads:
-                self._stop_key_repeat(key)
-                time.sleep(0.05)  # 스레드 종료까지 기다림
-
-            # 새 종료 이벤트 생성
-            self.stop_signals[key] = threading.Event()
-            
-            # 키 반복 스레드 시작
-            repeat_thread = threading.Thread(
-                target=self._key_repeat_worker,
-                args=(key, self.stop_signals[key]),
-                daemon=True
-            )
-            self.active_threads[key] = repeat_thread
-            repeat_thread.start()
+            # 이미 반복 중이면 그대로 유지
+            if not self.scheduler.start(code, trigger_ns):
+                return self.scheduler.is_active(code)
             
+            self.log.debug("키 '%s' 반복 시작됨 (모드 활성화: %s)", self._names[code], self.mode_active)
             return True
         except Exception as e:
-            self._log(f"키 {key} 반복 시작 중 오류: {e}")
+            self.log.error("키 %s 반복 시작 중 오류: %s", self._names[code], e)
             traceback.print_exc()
             return False
-
-    def _stop_key_repeat(self, key):
-        """키 반복 스레드 중지"""
+    
+    def _stop_key_repeat(self, code):
+        """키 반복 중지 (스케줄러에서 제거)"""
         try:
-            # 키가 없으면 무시
-            if key not in self.active_threads:
-                return True
-
-            # 종료 신호 설정
-            if key in self.stop_signals:
-                self.stop_signals[key].set()
-            
-            # 스레드 종료 대기 (최대 0.2초)
-            if self.active_threads[key].is_alive():
-                self.active_threads[key].join(0.2)
-            
-            # 상태 초기화
-            self._clean_key_state(key)
+            if self.scheduler.stop(code):
+                if self.log.debug_enabled:
+                    self.log.debug("키 '%s' 반복 종료됨 (총 %s회 입력)", self._names[code], self.scheduler.get_repeat_count(code))
             return True
         except Exception as e:
-            self._log(f"키 {key} 반복 중지 중 오류: {e}")
+            self.log.error("키 %s 반복 중지 중 오류: %s", self._names[code], e)
             return False
     
     def _stop_all_repeats(self):
         """모든 키 반복 중지 (내부 메서드)"""
-        keys = list(self.active_threads.keys())
-        for key in keys:
-            self._stop_key_repeat(key)
+        self.scheduler.stop_all()
     
     def stop_all_repeats(self):
         """모든 키 반복 중지 (공개 인터페이스)"""
-        self._log("모든 키 반복 중지 요청 - 모든 스레드 종료 시작")
-        
-        # 모든 스레드 중지
-        self._stop_all_repeats()
+        self.log.debug("모든 키 반복 중지 요청")
         
-        # 키 상태 초기화
+        # 모든 반복을 한 번에 중지하고 키 상태 초기화
         with self.lock:
-            for key in list(self.pressed_keys.keys()):
-                self.pressed_keys[key] = False
-                try:
-                    keyboard.release(key)
-                except:
-                    pass
-        
-        self._log("모든 키 반복 중지 완료")
+            self._stop_all_repeats()
+            self._clear_pressed()
+        
+        # 눌린 키 해제 (락 밖에서, 최대 STOP_TIMEOUT)
+        self._release_down_keys(STOP_TIMEOUT)
+        
+        self.log.debug("모든 키 반복 중지 완료")
         return True
     
-    def _key_repeat_worker(self, key, stop_signal):
-        """키 반복 작업 스레드"""
-        try:
-            # 시작 상태 로깅
-            self._log(f"키 '{key}' 반복 스레드 시작됨 (모드 활성화: {self.mode_active})")
-            
-            # 재실행 방지를 위한 마지막 실행 시간 기록
-            last_executed = time.time()
-            retry_count = 0
-            repeat_count = 0
-            
-            # 종료 신호가 올 때까지 반복 - 연타 모드에서는 키가 눌린 상태로 계속 유지
-            while not stop_signal.is_set() and self.pressed_keys.get(key, False) and self.mode_active:
-                # 키 상태 재확인 - 중요한 안정성 체크
-                if stop_signal.is_set() or not self.mode_active:
-                    self._log(f"키 '{key}' 반복 중지 요청 감지: stop_signal={stop_signal.is_set()}, mode={self.mode_active}")
-                    break
-                
-                # 내부 상태에서만 키가 해제되었는지 확인 (워치독에 의한 강제 해제 방지)
-                if not self.pressed_keys.get(key, False):
-                    # 연타 모드에서는 키를 다시 눌린 상태로 설정 (워치독에 의한 자동 해제 방지)
-                    self.pressed_keys[key] = True
-                    self._log(f"키 '{key}' 상태가 해제되었지만 연타 모드에서 다시 설정됨")
-                
-                current_time = time.time()
-                # 너무 빠른 실행 방지 (최소 간격 보장)
-                if current_time - last_executed < self.min_cycle_time:
-                    time.sleep(0.002)  # 짧게 대기
-                    continue
-                
-                try:
-                    # 키 입력
-                    keyboard.press(key)
-                    time.sleep(self.press_delay)
-                    keyboard.release(key)
-                    time.sleep(self.release_delay)
-                    
-                    # 성공적으로 실행됨을 기록
-                    last_executed = time.time()
-                    repeat_count += 1
-                    
-                    # 10회마다 상태 로깅
-                    if repeat_count % 10 == 0:
-                        self._log(f"키 '{key}' {repeat_count}회 입력됨")
-                        
-                    retry_count = 0  # 성공 시 재시도 카운트 초기화
-                except Exception as e:
-                    # 개별 키 입력 실패 시 재시도
-                    retry_count += 1
-                    self._log(f"키 {key} 입력 실패, 재시도 중 ({retry_count}/{self.max_retries}): {e}")
-                    
-                    # 키 상태 강제 초기화 시도
-                    try:
-                        keyboard.release(key)
-                    except:
-                        pass
-                        
-                    # 최대 재시도 횟수 초과 시 중단
-                    if retry_count >= self.max_retries:
-                        self._log(f"키 {key} 최대 재시도 횟수 초과, 스레드 종료")
-                        break
-                    else:
-                        time.sleep(self.retry_delay)
-                
-                # 종료 조건 다시 확인 - 연타 모드에서는 stop_signal과 mode_active만 확인
-                if stop_signal.is_set() or not self.mode_active:
-                    break
-        except Exception as e:
-            self._log(f"키 '{key}' 반복 스레드 오류: {e}")
-            traceback.print_exc()
-        finally:
-            # 항상 키 해제 및 상태 정리
-            try:
-                keyboard.release(key)
-                self._log(f"키 '{key}' 반복 스레드 종료됨 (총 {repeat_count}회 입력)")
-            except:
-                pass
+    def _release_down_keys(self, timeout):
+        """
+        중지된 키의 해제를 기다린 뒤 남은 눌린 키만 직접 해제 (락을 보유하지 않은 상태에서 호출)
+        
+        스케줄러가 해제를 마칠 때까지 하나의 데드라인(timeout초)까지만 기다립니다.
+        """
+        self.scheduler.wait_idle(timeout)
+        with self.lock:
+            releases = [(code, self._next_token(code)) for code in self._down_codes()]
+        self._release_keys(releases)
+    
+    def shutdown(self, timeout=STOP_TIMEOUT):
+        """
+        종료 정리 - 모든 반복 중지, 눌린 키 해제, 스케줄러 스레드 종료
+        
+        키 개수와 관계없이 timeout초 안에 끝납니다.
+        
+        Returns:
+            bool: 제시간에 모든 정리가 끝났으면 True
+        """
+        with self.lock:
+            self.mode_active = False
+            self._clear_pressed()
+        
+        clean = self.scheduler.close(timeout)
+        
+        # 스케줄러가 제시간에 해제하지 못한 키만 직접 해제
+        with self.lock:
+            releases = [(code, self._next_token(code)) for code in self._down_codes()]
+        self._release_keys(releases)
+        
+        self.log.debug("종료 정리 완료 (%s)", "정상" if clean else "시간 초과")
+        return clean
     
     def set_repeat_speed(self, speed_level=2):
         """
@@ -447,12 +486,15 @@ class KeyboardController:
                 - 실수인 경우: 키 입력 사이의 지연 시간(초)
         """
         with self.lock:
+            self.repeat_mode = "split"
+            
             # 실수값으로 직접 전달된 경우 (초 단위 지연)
             if isinstance(speed_level, float) and 0.01 <= speed_level <= 1.0:
                 delay = max(min(speed_level / 2, 0.5), 0.005)  # 안전한 범위로 조정
                 self.press_delay = delay
                 self.release_delay = delay
-                self._log(f"반복 속도 직접 설정: {speed_level}초")
+                self._apply_timing()
+                self.log.debug("반복 속도 직접 설정: %s초", speed_level)
                 return True
                 
             # 정수 레벨로 전달된 경우
@@ -479,31 +521,69 @@ class KeyboardController:
                 self.press_delay = 0.02
                 self.release_delay = 0.02
                 
+            self._apply_timing()
             return True
 
+    def set_repeat_rate(self, rate_hz, hold_duration=None):
+        """
+        목표 반복 속도 설정 (속도 기반 모드)
+        
+        매개변수:
+            rate_hz: 초당 반복 횟수 (0.5-100)
+            hold_duration: 키 누름 유지 시간(초), None이면 현재 값 유지
+        """
+        with self.lock:
+            self.repeat_mode = "rate"
+            self.target_rate_hz = max(min(float(rate_hz), 100.0), 0.5)
+            if hold_duration is not None:
+                self.hold_duration = max(min(float(hold_duration), 0.5), 0.001)
+            self._apply_timing()
+            self.log.debug("반복 속도 설정: %.1fHz (누름 유지 %.0fms)", self.target_rate_hz, self.hold_duration * 1000)
+            return True
+    
+    
+    def get_achieved_rate(self, key=None):
+        """실제 반복 속도(Hz) 반환 - key가 None이면 반복 중인 키의 평균"""
+        if key is None:
+            return self.scheduler.get_achieved_rate()
+        code = self._codes.get(key)
+        return self.scheduler.get_achieved_rate(code) if code is not None else 0.0
+
     def get_status_info(self):
         """현재 컨트롤러 상태 정보 반환 (디버깅용)"""
         with self.lock:
             status = {
                 "mode_active": self.mode_active,
                 "enabled_keys": list(self.enabled_keys),
-                "active_threads": len(self.active_threads),
+                "active_repeats": len(self.scheduler.active_keys()),
                 "pressed_keys": {k: v for k, v in self.pressed_keys.items() if v is True},
+                "keys_down": [self._names[code] for code in self._down_codes()],
                 "press_delay": self.press_delay,
-                "release_delay": self.release_delay
+                "release_delay": self.release_delay,
+                "repeat_mode": self.repeat_mode,
+                "target_rate_hz": self.target_rate_hz,
+                "hold_duration": self.hold_duration,
+                "achieved_rate_hz": self.get_achieved_rate(),
+                "start_latency": self.scheduler.start_latency.get_summary(),
+                "watchdog_interventions": self.watchdog_interventions,
+                "redundant_presses": self.redundant_presses,
+                "lock": self.lock.get_stats()
             }
         return status
     
     def print_status(self):
         """현재 상태 콘솔 출력 (디버깅용)"""
         status = self.get_status_info()
-        self._log("==== 현재 상태 ====")
-        self._log(f"모드 활성화: {status['mode_active']}")
-        self._log(f"활성화된 키: {status['enabled_keys']}")
-        self._log(f"눌린 키: {status['pressed_keys']}")
-        self._log(f"활성 스레드 수: {status['active_threads']}")
-        self._log(f"반복 간격: {status['press_delay']}초 / {status['release_delay']}초")
-        self._log("===================")
+        self.log.info("==== 현재 상태 ====")
+        self.log.info("모드 활성화: %s", status['mode_active'])
+        self.log.info("활성화된 키: %s", status['enabled_keys'])
+        self.log.info("눌린 키: %s", status['pressed_keys'])
+        self.log.info("반복 중인 키 수: %s", status['active_repeats'])
+        if status['repeat_mode'] == "rate":
+            self.log.info("반복 속도: 목표 %.1fHz / 실제 %.1fHz", status['target_rate_hz'], status['achieved_rate_hz'])
+        else:
+            self.log.info("반복 간격: %s초 / %s초", status['press_delay'], status['release_delay'])
+        self.log.info("===================")
 
     def reset_all_states(self):
         """모든 키 상태 초기화 (디버깅용)"""
@@ -511,49 +591,50 @@ class KeyboardController:
             # 모드 비활성화
             self.mode_active = False
             
-            # 모든 스레드 종료
+            # 모든 반복 종료
             self._stop_all_repeats()
             
-            # 모든 키 해제
-            for key in "abcdefghijklmnopqrstuvwxyz0123456789":
-                try:
-                    keyboard.release(key)
-                except:
-                    pass
-            
-            # 상태 초기화
-            self.active_threads.clear()
-            self.stop_signals.clear()
-            
             # 눌림 상태 초기화
-            for key in self.pressed_keys:
-                self.pressed_keys[key] = False
-                
-            return True
+            self._clear_pressed()
+        
+        # 실제로 눌린 키만 해제 (락 밖에서, 최대 STOP_TIMEOUT)
+        self._release_down_keys(STOP_TIMEOUT)
+        return True
 
     # 공개 인터페이스: KeyboardTab에서 사용
-    def start_key_repeat(self, key, repeat_speed=None):
-        """키 반복 시작 (공개 인터페이스)"""
+    def start_key_repeat(self, key, repeat_speed=None, trigger_ns=None):
+        """
+        키 반복 시작 (공개 인터페이스)
+        
+        trigger_ns를 지정하면 그 시각부터 첫 누름 주입까지의 지연을 기록합니다.
+        """
+        # 이미 눌린 상태로 반복 중이면 설정/락/로그 없이 바로 반환
+        code = self._codes.get(key)
+        if (repeat_speed is None and code is not None and self.mode_active
+                and self._key_state[code] & KEY_PRESSED and self.scheduler.is_active(code)):
+            self.redundant_presses += 1
+            return True
+        
         # 모드가 비활성화 상태라면 활성화
         if not self.mode_active:
             self.enable_mode(True)
-            self._log(f"키 반복 시작 요청으로 모드 자동 활성화됨")
+            self.log.debug("키 반복 시작 요청으로 모드 자동 활성화됨")
         
         # 반복 속도 설정
         if repeat_speed is not None:
             self.set_repeat_speed(repeat_speed)
             
-        # 키 활성화 확인
-        if key not in self.enabled_keys:
-            self.enable_key(key)
+        # 키 활성화 확인 (처음 활성화할 때 코드로 변환)
+        if not self.is_key_enabled(key) and not self.enable_key(key):
+            return False
             
         # 워치독에서 실제 키 상태를 확인하지 않도록 키를 눌린 상태로 명시적 설정
         with self.lock:
-            self.pressed_keys[key] = True
-            self._log(f"키 '{key}' 반복 모드에서 눌린 상태로 설정됨")
+            self._key_state[self._codes[key]] |= KEY_PRESSED
+            self.log.debug("키 '%s' 반복 모드에서 눌린 상태로 설정됨", key)
             
         # 키 눌림 처리
-        return self.handle_key_press(key)
+        return self.handle_key_press(key, trigger_ns)
     
     def update_repeat_speed(self, key, repeat_speed):
         """키 반복 속도 업데이트 (공개 인터페이스)"""
@@ -562,28 +643,67 @@ class KeyboardController:
     
     def stop_key_repeat(self, key):
         """특정 키의 반복을 중지 (공개 인터페이스)"""
-        self._log(f"키 '{key}' 반복 중지 요청")
+        self.log.debug("키 '%s' 반복 중지 요청", key)
         
         # 키가 없으면 무시
-        if key not in self.active_threads:
-            self._log(f"키 '{key}'는 현재 반복 중이 아님")
+        code = self._codes.get(key)
+        if code is None or not self.scheduler.is_active(code):
+            self.log.debug("키 '%s'는 현재 반복 중이 아님", key)
             return True
 
         # 키 반복 중지
-        success = self._stop_key_repeat(key)
+        success = self._stop_key_repeat(code)
         
-        # 키 상태 초기화
+        # 키 상태 초기화 (해제 주입은 락 밖에서)
         with self.lock:
-            if key in self.pressed_keys:
-                self.pressed_keys[key] = False
-            
-            try:
-                keyboard.release(key)
-            except:
-                pass
+            release = self._set_released(code)
+        self._release_keys([release])
         
-        self._log(f"키 '{key}' 반복 중지 완료")
+        self.log.debug("키 '%s' 반복 중지 완료", key)
         return success
+    
+    # 공개 인터페이스: 매크로 스크립트(src.core.macro_script)에서 사용
+    def resolve_key(self, key):
+        """
+        키 이름을 가상 키 코드로 변환 (키마다 처음 한 번만 백엔드에 요청)
+        
+        Raises:
+            ValueError: 알 수 없는 키 이름
+        """
+        return self._resolve(key)
+    
+    def press_code(self, code):
+        """resolve_key()로 구한 코드로 키 누름 (눌린 키는 종료 정리 때 해제됨)"""
+        self._inject_press(code)
+    
+    def release_code(self, code):
+        """resolve_key()로 구한 코드로 키 해제"""
+        self._inject_release(code)
+
+# 전역 인스턴스 (처음 사용할 때 생성)
+_keyboard_controller = None
+_controller_lock = threading.Lock()
+
+def get_keyboard_controller(create=True):
+    """
+    전역 키보드 컨트롤러 반환
+    
+    처음 호출될 때 컨트롤러를 생성하므로 모듈을 불러오는 것만으로는
+    워치독 스레드가 시작되지 않습니다.
+    
+    매개변수:
+        create: False이면 아직 생성되지 않은 경우 None 반환
+    """
+    global _keyboard_controller
+    if _keyboard_controller is None and create:
+        with _controller_lock:
+            if _keyboard_controller is None:
+                with startup_profiler.phase("KeyboardController 생성"):
+                    _keyboard_controller = KeyboardController()
+    return _keyboard_controller
 
-# 전역 인스턴스
-keyboard_controller = KeyboardController() 
\ No newline at end of file
+def __getattr__(name):
+    """기존 코드 호환용 - keyboard_controller 속성 접근 시 지연 생성"""
+    if name == "keyboard_controller":
+        return get_keyboard_controller()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}") 
\ No newline at end of file
@@ -0,0 +1,197 @@
+"""
+매크로 컴파일러 모듈
+
+녹화한 타임라인을 재생하기 좋은 형태로 미리 최적화합니다 (오프라인, 재생 전에 한 번).
+- 마우스 이동 합치기: merge_ms 구간마다 마지막 이동만 남기고, 바로 뒤에 같은 구간의
+  클릭/휠 기록(좌표 포함)이 오면 그 앞의 이동은 지웁니다.
+- 마우스 경로 단순화: 연속된 이동 구간마다 Ramer-Douglas-Peucker 알고리즘으로
+  경로에서 epsilon 픽셀 이상 벗어나지 않는 점만 남깁니다 (거리 계산은 NumPy 벡터 연산).
+- 누름 직후 해제(유지 시간 tap_max_hold_ms 이하)는 기록 하나(EVENT_KEY_TAP, EVENT_CLICK)로 합칩니다.
+- 대기 시간 줄이기: 첫 입력 전 대기는 없애고, max_idle_ms보다 긴 대기는 max_idle_ms로 줄입니다.
+- 키는 이름 표 색인 그대로 둡니다. 가상 키 코드는 자판 배치와 입력 백엔드에 따라 달라지므로
+  재생기가 재생을 시작할 때 그 컴퓨터의 배치로 이름 표를 한 번만 변환합니다.
+
+기록은 np.frombuffer로 복사 없이 구조화 배열로 읽어 전부 배열 연산으로 처리하며,
+RDP만 이동 구간별로 반복합니다. NumPy는 컴파일할 때 처음 불러옵니다.
+
+사용 예:
+    compiled, report = compile_timeline(timeline)
+    log.info("기록 %.0f%%, 크기 %.0f%% 감소", report["event_reduction"] * 100, report["size_reduction"] * 100)
+"""
+from src.core.timeline import (
+    EVENT_CLICK, EVENT_IDLE, EVENT_KEY_DOWN, EVENT_KEY_TAP, EVENT_KEY_UP, EVENT_MOUSE_DOWN,
+    EVENT_MOUSE_MOVE, EVENT_MOUSE_UP, EVENT_WHEEL, MAX_DELTA_NS, Timeline,
+)
+from src.utils.fast_log import get_logger
+
+log = get_logger("MacroCompiler")
+
+# 기본 설정
+DEFAULT_EPSILON = 2.0          # 경로 단순화 허용 오차 (픽셀)
+DEFAULT_MERGE_MS = 8.0         # 마우스 이동 합치기 구간 (ms)
+DEFAULT_TAP_MAX_HOLD_MS = 1.0  # 누름/해제를 하나로 합칠 최대 유지 시간 (ms)
+DEFAULT_MAX_IDLE_MS = 1000.0   # 남길 최대 대기 시간 (ms, None이면 줄이지 않음)
+
+# RECORD와 같은 배치의 NumPy 구조화 자료형 정의
+RECORD_FIELDS = [("type", "u1"), ("flags", "u1"), ("code", "<i2"), ("x", "<i4"), ("y", "<i4"), ("delta", "<u4")]
+
+def _rdp_mask(np, points, epsilon):
+    """
+    Ramer-Douglas-Peucker로 남길 점 표시 배열 반환
+
+    재귀 대신 구간 스택을 사용하며, 구간마다 모든 점의 선분 거리를 한 번에 계산합니다.
+
+    Args:
+        points: (n, 2) 실수 배열
+        epsilon (float): 허용 오차
+    """
+    count = len(points)
+    keep = np.zeros(count, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, count - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        ax, ay = points[start]
+        dx, dy = points[end] - points[start]
+        inner = points[start + 1:end]
+        length = np.hypot(dx, dy)
+        if length == 0:
+            dist = np.hypot(inner[:, 0] - ax, inner[:, 1] - ay)
+        else:
+            dist = np.abs(dx * (inner[:, 1] - ay) - dy * (inner[:, 0] - ax)) / length
+        farthest = int(dist.argmax())
+        if dist[farthest] > epsilon:
+            middle = start + 1 + farthest
+            keep[middle] = True
+            stack.append((start, middle))
+            stack.append((middle, end))
+    return keep
+
+def _runs(np, mask):
+    """mask가 True인 연속 구간의 (시작, 끝) 색인 목록 (끝은 포함하지 않음)"""
+    edges = np.diff(np.concatenate(([0], mask.view(np.int8), [0])))
+    return zip(np.flatnonzero(edges == 1), np.flatnonzero(edges == -1))
+
+def compile_timeline(timeline, epsilon=DEFAULT_EPSILON, merge_ms=DEFAULT_MERGE_MS,
+                     tap_max_hold_ms=DEFAULT_TAP_MAX_HOLD_MS, max_idle_ms=DEFAULT_MAX_IDLE_MS):
+    """
+    타임라인 최적화
+
+    Args:
+        timeline (Timeline): 녹화한 타임라인
+        epsilon (float): 경로 단순화 허용 오차 (픽셀, 0이면 단순화하지 않음)
+        merge_ms (float): 마우스 이동 합치기 구간 (ms, 0이면 합치지 않음)
+        tap_max_hold_ms (float): 누름/해제를 하나로 합칠 최대 유지 시간 (ms, None이면 합치지 않음)
+        max_idle_ms (float): 남길 최대 대기 시간 (ms, None이면 줄이지 않음)
+
+    Returns:
+        tuple: (최적화한 Timeline, 줄어든 크기/이벤트 수 보고 dict)
+    """
+    import numpy as np
+
+    dtype = np.dtype(RECORD_FIELDS)
+    source = np.frombuffer(timeline.records, dtype=dtype)
+    times = np.cumsum(source["delta"], dtype=np.int64)
+
+    # 대기 기록은 시각만 담고 있으므로 버리고 절대 시각으로 다시 계산 (불리언 색인은 복사본을 만듦)
+    real = source["type"] != EVENT_IDLE
+    events = source[real]
+    times = times[real]
+    kinds = events["type"]
+    report = {
+        "events_before": len(source),
+        "bytes_before": timeline.nbytes,
+        "duration_before_s": float(times[-1]) / 1e9 if len(times) else 0.0,
+    }
+
+    # 1. 마우스 이동 합치기 - 다음 기록이 같은 시간 구간의 좌표 기록이면 지움
+    is_move = kinds == EVENT_MOUSE_MOVE
+    merged = 0
+    if merge_ms and len(events) > 1:
+        positional = (kinds >= EVENT_MOUSE_MOVE) & (kinds <= EVENT_WHEEL)
+        bucket = times // int(merge_ms * 1_000_000)
+        drop = np.zeros(len(events), dtype=bool)
+        drop[:-1] = is_move[:-1] & positional[1:] & (bucket[:-1] == bucket[1:])
+        merged = int(drop.sum())
+        events, times = events[~drop], times[~drop]
+        kinds = events["type"]
+        is_move = kinds == EVENT_MOUSE_MOVE
+
+    # 2. 연속된 이동 구간마다 경로 단순화
+    simplified = 0
+    if epsilon and is_move.any():
+        keep = np.ones(len(events), dtype=bool)
+        points = np.column_stack((events["x"], events["y"])).astype(np.float64)
+        for start, end in _runs(np, is_move):
+            if end - start > 2:
+                keep[start:end] = _rdp_mask(np, points[start:end], epsilon)
+        simplified = int(len(keep) - keep.sum())
+        events, times = events[keep], times[keep]
+        kinds = events["type"]
+
+    # 3. 누름 직후 해제를 기록 하나로 합침
+    taps = clicks = 0
+    if tap_max_hold_ms is not None and len(events) > 1:
+        hold_ok = np.diff(times) <= int(tap_max_hold_ms * 1_000_000)
+        same_code = events["code"][:-1] == events["code"][1:]
+        key_pair = (kinds[:-1] == EVENT_KEY_DOWN) & (kinds[1:] == EVENT_KEY_UP) & same_code & hold_ok
+        click_pair = ((kinds[:-1] == EVENT_MOUSE_DOWN) & (kinds[1:] == EVENT_MOUSE_UP) & same_code & hold_ok
+                      & (events["x"][:-1] == events["x"][1:]) & (events["y"][:-1] == events["y"][1:]))
+        first = np.flatnonzero(key_pair)
+        events["type"][first] = EVENT_KEY_TAP
+        second = np.flatnonzero(click_pair)
+        events["type"][second] = EVENT_CLICK
+        drop = np.zeros(len(events), dtype=bool)
+        drop[first + 1] = True
+        drop[second + 1] = True
+        taps, clicks = len(first), len(second)
+        events, times = events[~drop], times[~drop]
+        kinds = events["type"]
+
+    # 4. 시간 차 다시 계산 - 첫 입력 전 대기는 없애고 긴 대기는 줄임
+    deltas = np.diff(times, prepend=0)
+    idle_trimmed = 0
+    if max_idle_ms is not None and len(deltas):
+        clipped = np.minimum(deltas, int(max_idle_ms * 1_000_000))
+        clipped[0] = 0
+        idle_trimmed = int(deltas.sum() - clipped.sum())
+        deltas = clipped
+
+    # uint32를 넘는 시간 차는 대기 기록으로 나눔 (max_idle_ms를 끈 경우에만 발생)
+    long_gaps = np.flatnonzero(deltas > MAX_DELTA_NS)
+    if len(long_gaps):
+        pieces = []
+        previous = 0
+        idle = np.zeros(1, dtype=dtype)
+        idle["type"] = EVENT_IDLE
+        idle["delta"] = MAX_DELTA_NS
+        for index in long_gaps:
+            pieces.append(events[previous:index])
+            pieces.append(np.repeat(idle, int((deltas[index] - 1) // MAX_DELTA_NS)))
+            deltas[index] = (deltas[index] - 1) % MAX_DELTA_NS + 1
+            previous = index
+        pieces.append(events[previous:])
+        events["delta"] = deltas
+        events = np.concatenate(pieces)
+    else:
+        events["delta"] = deltas
+
+    compiled = Timeline(events.tobytes(), timeline.names, timeline.created_ns)
+    report.update({
+        "events_after": len(compiled),
+        "bytes_after": compiled.nbytes,
+        "duration_after_s": float(deltas.sum()) / 1e9 if len(deltas) else 0.0,
+        "moves_merged": merged,
+        "moves_simplified": simplified,
+        "key_taps": taps,
+        "clicks": clicks,
+        "idle_trimmed_s": idle_trimmed / 1e9,
+    })
+    report["event_reduction"] = 1 - report["events_after"] / report["events_before"] if report["events_before"] else 0.0
+    report["size_reduction"] = 1 - report["bytes_after"] / report["bytes_before"]
+    log.info("매크로 컴파일 - 이벤트 %d -> %d개 (%.0f%% 감소), %d -> %d바이트 (%.0f%% 감소)",
+             report["events_before"], report["events_after"], report["event_reduction"] * 100,
+             report["bytes_before"], report["bytes_after"], report["size_reduction"] * 100)
+    return compiled, report
@@ -0,0 +1,633 @@
+"""
+매크로 스크립트 모듈
+
+"(x, y)를 15ms마다 20번 클릭, q 누름, 200ms 대기, 500번 반복" 같은 입력 순서를
+짧은 스크립트로 작성해 실행합니다. 클릭은 click_at_position, 키 입력은 KeyboardController로 주입합니다.
+
+문법 (한 줄에 문장 하나, # 뒤는 주석, 괄호와 쉼표는 무시):
+    set x = 100                         변수 설정 (정수, 값 / 값 연산자 값, 연산자: + - * / %)
+    move x 200                          커서 이동
+    click (x, 200) 20 times every 15ms  클릭 (횟수, 간격, 누름 유지 hold 10ms는 생략 가능)
+    press q / down shift / up shift     키 누름 후 해제 / 누름 / 해제
+    wait 200ms                          대기 (단위 us, ms, s, 생략하면 ms / 변수는 "wait t ms")
+    loop 500 ... end                    반복 (횟수를 생략하면 중지할 때까지)
+    macro 이름 ... end / call 이름      서브 매크로 정의 / 호출 (재귀 호출 불가)
+
+스크립트는 compile_script()로 한 번만 컴파일되어 명령마다 [명령 코드, 피연산자 3개]를 담은
+평탄한 정수 배열이 됩니다. 변수와 상수는 모두 레지스터 목록의 색인으로 바뀌므로 실행 중에는
+이름을 찾거나 문자열을 해석하지 않고, 반복과 호출은 배열 위치로 이동하는 것만으로 처리합니다.
+대기는 절대 데드라인으로 계산해 클릭/키 주입에 걸린 시간이 누적되지 않습니다.
+
+사용 예:
+    program = compile_script("loop 500\\n  click 100 200 20 every 15ms\\n  press q\\n  wait 200ms\\nend")
+    runner = MacroRunner()
+    runner.load(program)
+    runner.start()
+"""
+import re
+import threading
+import traceback
+from array import array
+
+from src.core.input_backend import get_backend
+from src.core.mouse_click import CLICK_HOLD, click_at_position
+from src.core.timing import NS_PER_SEC, high_resolution_timer, now_ns, sleep_until
+from src.utils.fast_log import get_logger
+
+log = get_logger("MacroScript")
+
+# 명령 코드 - 명령마다 [코드, a, b, c] 4칸 (a, b, c는 레지스터 색인 또는 배열 위치)
+OP_HALT = 0       # 실행 끝
+OP_CLICK = 1      # click_at_position(r[a], r[b], hold=r[c]ns)
+OP_WAIT = 2       # 데드라인 += r[a]ns 까지 대기
+OP_NEXT = 3       # r[a] -= 1, 0보다 크면 b 위치로 이동
+OP_TAP = 4        # 가상 키 코드 a 누름 후 해제
+OP_KEY_DOWN = 5   # 가상 키 코드 a 누름
+OP_KEY_UP = 6     # 가상 키 코드 a 해제
+OP_MOVE = 7       # 커서를 (r[a], r[b])로 이동
+OP_SET = 8        # r[a] = r[b]
+OP_ADD = 9        # r[a] = r[b] + r[c]
+OP_SUB = 10       # r[a] = r[b] - r[c]
+OP_MUL = 11       # r[a] = r[b] * r[c]
+OP_DIV = 12       # r[a] = r[b] // r[c]
+OP_MOD = 13       # r[a] = r[b] % r[c]
+OP_LOOP = 14      # r[a] = r[b], 0 이하면 c 위치로 이동 (반복 시작)
+OP_JUMP = 15      # a 위치로 이동
+OP_CALL = 16      # 다음 위치를 호출 스택에 넣고 a 위치로 이동
+OP_RET = 17       # 호출 스택에서 꺼낸 위치로 이동
+
+OP_NAMES = (
+    "halt", "click", "wait", "next", "tap", "key_down", "key_up", "move", "set",
+    "add", "sub", "mul", "div", "mod", "loop", "jump", "call", "ret",
+)
+
+# 명령 하나의 크기 (배열 칸 수)
+WIDTH = 4
+
+# 연산자 -> 명령 코드
+OPERATORS = {"+": OP_ADD, "-": OP_SUB, "*": OP_MUL, "/": OP_DIV, "%": OP_MOD}
+
+# 시간 단위 -> 나노초
+UNITS = {"us": 1_000, "ms": 1_000_000, "s": NS_PER_SEC}
+
+# 문장 키워드 (변수/매크로 이름으로 사용 불가)
+KEYWORDS = frozenset((
+    "set", "move", "click", "press", "down", "up", "wait", "loop", "macro", "call", "end",
+    "times", "every", "hold",
+))
+
+_DURATION = re.compile(r"(\d+(?:\.\d*)?)(us|ms|s)?")
+_COUNT_SUFFIX = re.compile(r"(\d+)[x×]")
+_SEPARATORS = str.maketrans("(),", "   ")
+
+def _parse(source):
+    """
+    소스를 (줄 번호, 토큰 목록, 본문) 문장 트리로 변환 (본문은 loop/macro 블록만 목록, 나머지는 None)
+
+    Raises:
+        ValueError: 블록의 시작/끝이 맞지 않음
+    """
+    root = []
+    blocks = []     # 열린 블록의 (줄 번호, 본문을 담을 목록)
+    body = root
+    for lineno, line in enumerate(source.splitlines(), 1):
+        tokens = line.split("#", 1)[0].translate(_SEPARATORS).lower().split()
+        if not tokens:
+            continue
+        word = tokens[0]
+        if word == "end":
+            if len(tokens) > 1 or not blocks:
+                raise ValueError(f"{lineno}번째 줄: 짝이 맞지 않는 end")
+            blocks.pop()
+            body = blocks[-1][1] if blocks else root
+        elif word in ("loop", "macro"):
+            if word == "macro" and blocks:
+                raise ValueError(f"{lineno}번째 줄: macro는 블록 밖에서만 정의할 수 있습니다")
+            block = []
+            body.append((lineno, tokens, block))
+            blocks.append((lineno, block))
+            body = block
+        else:
+            body.append((lineno, tokens, None))
+    if blocks:
+        raise ValueError(f"{blocks[-1][0]}번째 줄: 블록이 end로 닫히지 않았습니다")
+    return root
+
+class MacroProgram:
+    """컴파일한 매크로 스크립트 (평탄한 명령 배열과 레지스터 초기값)"""
+
+    def __init__(self, code, registers, variables, macros):
+        """
+        Args:
+            code (array): 명령 배열 (명령마다 WIDTH칸)
+            registers (list): 레지스터 초기값 (변수, 상수, 반복 카운터)
+            variables (dict): 변수 이름 -> 레지스터 색인
+            macros (dict): 서브 매크로 이름 -> 시작 위치
+        """
+        self.code = code
+        self.registers = registers
+        self.variables = variables
+        self.macros = macros
+
+    def __len__(self):
+        return len(self.code) // WIDTH
+
+    def disassemble(self):
+        """명령 목록을 사람이 읽을 수 있는 문자열 목록으로 반환 (디버깅용)"""
+        lines = []
+        for pc in range(0, len(self.code), WIDTH):
+            op, a, b, c = self.code[pc:pc + WIDTH]
+            lines.append(f"{pc:5d} {OP_NAMES[op]:<8} {a} {b} {c}")
+        return lines
+
+class _Compiler:
+    """문장 트리 -> 명령 배열 변환기"""
+
+    def __init__(self, resolve_key):
+        self.resolve_key = resolve_key
+        self.code = array('q')
+        self.registers = []
+        self.variables = {}
+        self.constants = {}
+        self.keys = {}
+        self.macros = {}          # 이름 -> 시작 위치
+        self.calls = {}           # 호출하는 매크로 이름(None: 본문) -> 호출하는 매크로 이름 집합
+        self.patches = []         # (OP_CALL 명령 위치, 매크로 이름) - 시작 위치를 나중에 채움
+        self.current = None
+        self.lineno = 0
+
+    def fail(self, message):
+        """현재 줄 번호를 붙인 ValueError 생성"""
+        return ValueError(f"{self.lineno}번째 줄: {message}")
+
+    def emit(self, op, a=0, b=0, c=0):
+        """명령 추가 후 그 위치 반환"""
+        pc = len(self.code)
+        self.code.extend((op, a, b, c))
+        return pc
+
+    def register(self, value):
+        """새 레지스터 추가 후 색인 반환"""
+        self.registers.append(value)
+        return len(self.registers) - 1
+
+    def constant(self, value):
+        """상수 레지스터 (같은 값은 공유)"""
+        slot = self.constants.get(value)
+        if slot is None:
+            slot = self.constants[value] = self.register(value)
+        return slot
+
+    def operand(self, token):
+        """정수 또는 변수 이름을 레지스터 색인으로 변환"""
+        try:
+            return self.constant(int(token))
+        except ValueError:
+            pass
+        slot = self.variables.get(token)
+        if slot is None:
+            raise self.fail(f"정의되지 않은 변수: {token}")
+        return slot
+
+    def count(self, token):
+        """반복 횟수 ("500", "500x", 변수)"""
+        match = _COUNT_SUFFIX.fullmatch(token)
+        return self.operand(match.group(1) if match else token)
+
+    def duration(self, tokens, pos):
+        """
+        tokens[pos]부터 시간을 읽어 (나노초 값 레지스터, 다음 위치) 반환
+
+        변수는 실행할 때 단위를 곱하는 명령을 함께 추가합니다.
+        """
+        if pos >= len(tokens):
+            raise self.fail("시간이 필요합니다")
+        token = tokens[pos]
+        match = _DURATION.fullmatch(token)
+        if match:
+            value, unit = match.groups()
+            return self.constant(round(float(value) * UNITS[unit or "ms"])), pos + 1
+        slot = self.operand(token)
+        unit = "ms"
+        if pos + 1 < len(tokens) and tokens[pos + 1] in UNITS:
+            unit = tokens[pos + 1]
+            pos += 1
+        scaled = self.register(0)
+        self.emit(OP_MUL, scaled, slot, self.constant(UNITS[unit]))
+        return scaled, pos + 1
+
+    def key(self, tokens):
+        """키 이름을 가상 키 코드로 변환 (키마다 한 번만)"""
+        if len(tokens) != 2:
+            raise self.fail(f"{tokens[0]} 뒤에는 키 이름 하나가 필요합니다")
+        name = tokens[1]
+        code = self.keys.get(name)
+        if code is None:
+            try:
+                code = self.keys[name] = self.resolve_key(name)
+            except ValueError as e:
+                raise self.fail(e) from None
+        return code
+
+    def loop(self, count, emit_body):
+        """횟수 레지스터만큼 본문을 반복하는 명령 추가 (count가 None이면 무한 반복)"""
+        if count is None:
+            start = len(self.code)
+            emit_body()
+            self.emit(OP_JUMP, start)
+            return
+        counter = self.register(0)
+        head = self.emit(OP_LOOP, counter, count)
+        emit_body()
+        self.emit(OP_NEXT, counter, head + WIDTH)
+        self.code[head + 3] = len(self.code)
+
+    def block(self, body):
+        """문장 목록 컴파일"""
+        for lineno, tokens, inner in body:
+            self.lineno = lineno
+            self.statement(tokens, inner)
+
+    def statement(self, tokens, inner):
+        """문장 하나 컴파일"""
+        word = tokens[0]
+        if word == "click":
+            self.click(tokens)
+        elif word == "wait":
+            slot, pos = self.duration(tokens, 1)
+            if pos != len(tokens):
+                raise self.fail(f"알 수 없는 토큰: {tokens[pos]}")
+            self.emit(OP_WAIT, slot)
+        elif word == "press":
+            self.emit(OP_TAP, self.key(tokens))
+        elif word == "down":
+            self.emit(OP_KEY_DOWN, self.key(tokens))
+        elif word == "up":
+            self.emit(OP_KEY_UP, self.key(tokens))
+        elif word == "move":
+            if len(tokens) != 3:
+                raise self.fail("move x y 형식이어야 합니다")
+            self.emit(OP_MOVE, self.operand(tokens[1]), self.operand(tokens[2]))
+        elif word == "set":
+            self.assign(tokens)
+        elif word == "loop":
+            count = None
+            if len(tokens) > 1:
+                count = self.count(tokens[1])
+                if len(tokens) > 2 + (tokens[2:3] == ["times"]):
+                    raise self.fail("loop [횟수] 형식이어야 합니다")
+            lineno = self.lineno
+            self.loop(count, lambda: self.block(inner))
+            self.lineno = lineno
+        elif word == "call":
+            if len(tokens) != 2 or tokens[1] not in self.macros:
+                raise self.fail(f"정의되지 않은 매크로: {' '.join(tokens[1:])}")
+            self.calls.setdefault(self.current, set()).add(tokens[1])
+            self.patches.append((self.emit(OP_CALL), tokens[1]))
+        elif word != "macro":
+            raise self.fail(f"알 수 없는 문장: {word}")
+
+    def click(self, tokens):
+        """click x y [횟수 [times]] [every 시간] [hold 시간]"""
+        if len(tokens) < 3:
+            raise self.fail("click x y 형식이어야 합니다")
+        x, y = self.operand(tokens[1]), self.operand(tokens[2])
+        count = every = None
+        hold = self.constant(round(CLICK_HOLD * NS_PER_SEC))
+        pos = 3
+        if pos < len(tokens) and tokens[pos] not in ("every", "hold"):
+            count = self.count(tokens[pos])
+            pos += 1
+            if pos < len(tokens) and tokens[pos] == "times":
+                pos += 1
+        while pos < len(tokens):
+            if tokens[pos] == "every":
+                every, pos = self.duration(tokens, pos + 1)
+            elif tokens[pos] == "hold":
+                hold, pos = self.duration(tokens, pos + 1)
+            else:
+                raise self.fail(f"알 수 없는 토큰: {tokens[pos]}")
+
+        def emit_click():
+            self.emit(OP_CLICK, x, y, hold)
+            if every is not None:
+                self.emit(OP_WAIT, every)
+
+        if count is None:
+            emit_click()
+        else:
+            self.loop(count, emit_click)
+
+    def assign(self, tokens):
+        """set 이름 = 값 [연산자 값]"""
+        if len(tokens) not in (4, 6) or tokens[2] != "=":
+            raise self.fail("set 이름 = 값 [연산자 값] 형식이어야 합니다")
+        name = tokens[1]
+        source = self.operand(tokens[3])
+        other = None
+        if len(tokens) == 6:
+            op = OPERATORS.get(tokens[4])
+            if op is None:
+                raise self.fail(f"알 수 없는 연산자: {tokens[4]}")
+            other = self.operand(tokens[5])
+        target = self.variables[name]
+        if other is None:
+            self.emit(OP_SET, target, source)
+        else:
+            self.emit(op, target, source, other)
+
+    def declare(self, body):
+        """set으로 값을 넣는 변수를 모두 미리 등록 (변수는 전역, 초기값 0 - 매크로 안에서 설정해도 어디서나 사용 가능)"""
+        for lineno, tokens, inner in body:
+            if inner is not None:
+                self.declare(inner)
+            elif tokens[0] == "set" and len(tokens) > 1 and tokens[1] not in self.variables:
+                self.lineno = lineno
+                name = tokens[1]
+                if not name.isidentifier() or name in KEYWORDS:
+                    raise self.fail(f"변수 이름으로 쓸 수 없습니다: {name}")
+                self.variables[name] = self.register(0)
+
+    def check_recursion(self):
+        """서브 매크로가 자기 자신을 (간접적으로) 호출하는지 확인 - 반복 카운터를 공유하므로 허용하지 않음"""
+        done = set()
+
+        def visit(name, path):
+            if name in path:
+                raise ValueError(f"매크로 재귀 호출: {' -> '.join(path + (name,))}")
+            if name in done:
+                return
+            for callee in self.calls.get(name, ()):
+                visit(callee, path + (name,))
+            done.add(name)
+
+        for name in self.macros:
+            visit(name, ())
+
+    def compile(self, source):
+        tree = _parse(source)
+
+        # 매크로는 정의 위치와 관계없이 호출할 수 있도록 이름부터 등록
+        definitions = []
+        for lineno, tokens, inner in tree:
+            if tokens[0] != "macro":
+                continue
+            self.lineno = lineno
+            if len(tokens) != 2 or not tokens[1].isidentifier() or tokens[1] in KEYWORDS:
+                raise self.fail("macro 이름 형식이어야 합니다")
+            if tokens[1] in self.macros:
+                raise self.fail(f"이미 정의된 매크로: {tokens[1]}")
+            self.macros[tokens[1]] = -1
+            definitions.append((tokens[1], inner))
+
+        # 본문, 실행 끝, 서브 매크로 순으로 배치
+        self.declare(tree)
+        self.block(tree)
+        self.emit(OP_HALT)
+        for name, inner in definitions:
+            self.current = name
+            self.macros[name] = len(self.code)
+            self.block(inner)
+            self.emit(OP_RET)
+        self.check_recursion()
+        for pc, name in self.patches:
+            self.code[pc + 1] = self.macros[name]
+        return MacroProgram(self.code, self.registers, self.variables, self.macros)
+
+def compile_script(source, resolve_key=None):
+    """
+    매크로 스크립트를 명령 배열로 컴파일
+
+    Args:
+        source (str): 스크립트 소스
+        resolve_key (function): 키 이름 -> 가상 키 코드 (None이면 전역 키보드 컨트롤러의 resolve_key)
+
+    Returns:
+        MacroProgram: 컴파일한 프로그램
+
+    Raises:
+        ValueError: 문법 오류 (줄 번호 포함) 또는 알 수 없는 키 이름
+    """
+    if resolve_key is None:
+        from src.core.keyboard_control import get_keyboard_controller
+        resolve_key = get_keyboard_controller().resolve_key
+    program = _Compiler(resolve_key).compile(source)
+    log.debug("매크로 스크립트 컴파일 - 명령 %d개, 레지스터 %d개", len(program), len(program.registers))
+    return program
+
+class MacroRunner:
+    """
+    매크로 스크립트 실행기
+
+    실행은 전용 스레드에서 수행하며, 중지 요청은 대기 중인 실행 스레드를 바로 깨웁니다.
+    """
+
+    def __init__(self, click_func=click_at_position, keyboard=None, backend_func=get_backend):
+        """
+        Args:
+            click_func (function): (x, y, hold)를 받아 클릭하는 함수
+            keyboard: press_code/release_code를 제공하는 키보드 컨트롤러 (None이면 전역 컨트롤러)
+            backend_func (function): 커서 이동에 사용할 입력 백엔드를 반환하는 함수
+        """
+        self.click_func = click_func
+        self.keyboard = keyboard
+        self.backend_func = backend_func
+        self.program = None
+        self.spin_ns = 1_000_000       # 데드라인 직전 바쁜 대기로 맞출 구간 (1ms)
+
+        # 실행 상태
+        self.thread = None
+        self.stop_event = threading.Event()
+        self._control_lock = threading.Lock()
+        self._keys_down = bytearray(256)
+
+        # 통계
+        self.instructions = 0          # 이번 실행에서 수행한 명령 수
+        self.waits = 0                 # 데드라인까지 기다린 대기 수
+        self.skipped_waits = 0         # 대기 시간 이상 밀려 현재 시각에 다시 맞춘 대기 수
+        self.max_lag_ns = 0            # 대기 데드라인 대비 최대 지연
+        self.lag_total_ns = 0
+        self.started_ns = 0
+        self.stopped_ns = 0
+
+    def load(self, program):
+        """실행할 프로그램 설정 (실행 중이면 중지)"""
+        self.stop(wait=True)
+        self.program = program
+
+    def is_running(self):
+        """실행 중인지 확인"""
+        return self.thread is not None and self.thread.is_alive()
+
+    def start(self):
+        """실행 스레드 시작"""
+        with self._control_lock:
+            if self.is_running() or self.program is None:
+                return False
+            self.stop_event.clear()
+            self.thread = threading.Thread(target=self._run, daemon=True, name="MacroRunner")
+            self.thread.start()
+            return True
+
+    def stop(self, wait=False):
+        """실행 중지 (눌러 둔 키는 실행 스레드가 놓고 끝남)"""
+        self.stop_event.set()
+        thread = self.thread
+        if wait and thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=1.0)
+
+    def run(self):
+        """현재 스레드에서 프로그램을 끝까지 실행 (다른 스레드에서 stop()으로 중지 가능)"""
+        self.stop_event.clear()
+        self._run_program()
+
+    def _run_program(self):
+        """통계를 초기화하고 프로그램 실행 (끝나면 눌러 둔 키 해제)"""
+        if self.keyboard is None:
+            from src.core.keyboard_control import get_keyboard_controller
+            self.keyboard = get_keyboard_controller()
+        self.instructions = 0
+        self.waits = 0
+        self.skipped_waits = 0
+        self.max_lag_ns = 0
+        self.lag_total_ns = 0
+        self.started_ns = now_ns()
+        self.stopped_ns = 0
+        try:
+            self._execute(self.program)
+        finally:
+            self.stopped_ns = now_ns()
+            self._release_all()
+
+    def _run(self):
+        """실행 스레드 함수"""
+        try:
+            with high_resolution_timer():
+                self._run_program()
+        except Exception as e:
+            log.error("매크로 스크립트 실행 중 오류: %s\n%s", e, traceback.format_exc())
+
+    def _execute(self, program):
+        """명령 해석 루프 - 자주 쓰는 명령부터 비교하며, 명령 사이에는 객체를 만들지 않음"""
+        code = program.code.tolist()
+        regs = list(program.registers)
+        stack = []
+        click = self.click_func
+        move = self.backend_func().move
+        press = self.keyboard.press_code
+        release = self.keyboard.release_code
+        keys_down = self._keys_down
+        stop_event = self.stop_event
+        stopped = stop_event.is_set
+        spin_ns = self.spin_ns
+        deadline = self.started_ns
+        pc = 0
+        executed = 0
+        try:
+            while True:
+                op = code[pc]
+                executed += 1
+                if op == OP_CLICK:
+                    click(regs[code[pc + 1]], regs[code[pc + 2]], regs[code[pc + 3]] / NS_PER_SEC)
+                    pc += WIDTH
+                elif op == OP_WAIT:
+                    # 데드라인은 이전 데드라인 기준 (주입에 걸린 시간이 누적되지 않음)
+                    self.instructions = executed
+                    period = regs[code[pc + 1]]
+                    deadline += period
+                    lag = now_ns() - deadline
+                    if lag >= period > 0:
+                        # 대기 시간 이상 밀렸으면 몰아서 건너뛰지 않고 현재 시각에 다시 맞춤
+                        deadline += lag
+                        self.skipped_waits += 1
+                    elif lag < 0:
+                        if not sleep_until(deadline, stop_event, spin_ns):
+                            break
+                        lag = now_ns() - deadline
+                        if lag > self.max_lag_ns:
+                            self.max_lag_ns = lag
+                        self.lag_total_ns += lag
+                        self.waits += 1
+                    pc += WIDTH
+                elif op == OP_NEXT:
+                    counter = code[pc + 1]
+                    regs[counter] -= 1
+                    if regs[counter] > 0:
+                        if stopped():
+                            break
+                        pc = code[pc + 2]
+                    else:
+                        pc += WIDTH
+                elif op == OP_TAP:
+                    press(code[pc + 1])
+                    release(code[pc + 1])
+                    pc += WIDTH
+                elif op <= OP_MOD:
+                    a = code[pc + 1]
+                    if op == OP_SET:
+                        regs[a] = regs[code[pc + 2]]
+                    elif op == OP_ADD:
+                        regs[a] = regs[code[pc + 2]] + regs[code[pc + 3]]
+                    elif op == OP_MUL:
+                        regs[a] = regs[code[pc + 2]] * regs[code[pc + 3]]
+                    elif op == OP_SUB:
+                        regs[a] = regs[code[pc + 2]] - regs[code[pc + 3]]
+                    elif op == OP_MOVE:
+                        move(regs[a], regs[code[pc + 2]])
+                    elif op == OP_KEY_DOWN:
+                        press(a)
+                        keys_down[a] = 1
+                    elif op == OP_KEY_UP:
+                        release(a)
+                        keys_down[a] = 0
+                    elif op == OP_HALT:
+                        break
+                    else:
+                        divisor = regs[code[pc + 3]]
+                        if divisor == 0:
+                            raise ZeroDivisionError(f"0으로 나눔 (명령 위치 {pc})")
+                        if op == OP_DIV:
+                            regs[a] = regs[code[pc + 2]] // divisor
+                        else:
+                            regs[a] = regs[code[pc + 2]] % divisor
+                    pc += WIDTH
+                elif op == OP_LOOP:
+                    count = regs[code[pc + 2]]
+                    regs[code[pc + 1]] = count
+                    pc = pc + WIDTH if count > 0 else code[pc + 3]
+                elif op == OP_JUMP:
+                    if stopped():
+                        break
+                    pc = code[pc + 1]
+                elif op == OP_CALL:
+                    stack.append(pc + WIDTH)
+                    pc = code[pc + 1]
+                else:  # OP_RET
+                    pc = stack.pop()
+        finally:
+            self.instructions = executed
+
+    def _release_all(self):
+        """실행 중 눌러 둔 키를 모두 해제"""
+        keys_down = self._keys_down
+        code = keys_down.find(1)
+        while code >= 0:
+            keys_down[code] = 0
+            try:
+                self.keyboard.release_code(code)
+            except Exception as e:
+                log.warning("키 해제 실패 (0x%02X): %s", code, e)
+            code = keys_down.find(1, code + 1)
+
+    def get_stats(self):
+        """실행 명령 수, 대기 지연 등 통계 반환"""
+        end_ns = self.stopped_ns if self.stopped_ns else now_ns()
+        elapsed = (end_ns - self.started_ns) / NS_PER_SEC if self.started_ns else 0.0
+        return {
+            "instructions": self.instructions,
+            "elapsed": elapsed,
+            "waits": self.waits,
+            "skipped_waits": self.skipped_waits,
+            "max_lag_ms": self.max_lag_ns / 1_000_000,
+            "avg_lag_ms": self.lag_total_ns / self.waits / 1_000_000 if self.waits else 0.0,
+        }
@@ -2,41 +2,71 @@
 마우스 클릭 모듈
 
 시스템 레벨에서 마우스 클릭 기능을 제공합니다.
-Windows API를 사용하여 관리자 권한으로 모든 애플리케이션에서 작동합니다.
+실제 입력은 현재 입력 백엔드(기본값: Windows API)를 통해 주입되며,
+관리자 권한으로 실행하면 모든 애플리케이션에서 작동합니다.
 """
-import pyautogui
-import ctypes
-import time
-from ctypes import wintypes
-
-# Windows API 상수
-MOUSEEVENTF_LEFTDOWN = 0x0002
-MOUSEEVENTF_LEFTUP = 0x0004
-
-# Windows API 함수 설정
-user32 = ctypes.WinDLL('user32', use_last_error=True)
-user32.SetCursorPos.argtypes = [wintypes.INT, wintypes.INT]
-user32.SetCursorPos.restype = wintypes.BOOL
-user32.mouse_event.argtypes = [wintypes.DWORD, wintypes.DWORD, wintypes.DWORD, wintypes.DWORD, wintypes.ULONG]
-
-def click_at_position(x, y):
+import threading
+
+from src.core.input_backend import create_backend, get_backend, PyAutoGuiBackend
+from src.utils.fast_log import get_logger
+
+log = get_logger("MouseClick")
+
+# 누름과 해제 사이의 짧은 지연 (초)
+CLICK_HOLD = 0.01
+
+# 현재 백엔드의 클릭이 실패했을 때 그 클릭에만 사용하는 pyautogui 백엔드 (처음 실패할 때 생성)
+_fallback = None
+_fallback_lock = threading.Lock()
+
+def _fallback_backend():
+    """예비 pyautogui 백엔드 반환 (전역 백엔드는 바꾸지 않음)"""
+    global _fallback
+    if _fallback is None:
+        with _fallback_lock:
+            if _fallback is None:
+                _fallback = create_backend(PyAutoGuiBackend.name)
+    return _fallback
+
+def hold_for_interval(interval):
+    """
+    클릭 간격에 맞는 누름 유지 시간 반환
+    
+    간격이 짧으면 누름 유지 지연이 클릭 속도를 제한하므로 지연 없이 클릭합니다.
+    """
+    return CLICK_HOLD if interval >= CLICK_HOLD * 5 else 0.0
+
+def click_at_position(x, y, hold=CLICK_HOLD):
     """
     지정된 좌표(x, y)에서 마우스 왼쪽 버튼 클릭을 수행합니다.
-    Windows API를 사용하여 시스템 레벨에서 작동합니다.
+    현재 입력 백엔드를 통해 시스템 레벨에서 작동합니다.
     
     Args:
         x (int): 클릭할 x 좌표
         y (int): 클릭할 y 좌표
+        hold (float): 누름과 해제 사이 지연 (초)
     """
-    # 방법 1: Windows API 사용 (관리자 권한 필요할 수 있음)
+    backend = get_backend()
     try:
-        # 커서 위치 설정
-        user32.SetCursorPos(int(x), int(y))
-        # 마우스 클릭 이벤트 발생
-        user32.mouse_event(MOUSEEVENTF_LEFTDOWN, 0, 0, 0, 0)
-        time.sleep(0.01)  # 짧은 지연
-        user32.mouse_event(MOUSEEVENTF_LEFTUP, 0, 0, 0, 0)
+        backend.click(x, y, hold=hold)
     except Exception as e:
-        # Windows API 실패 시 pyautogui 사용
-        print(f"Windows API 클릭 실패, pyautogui 사용: {e}")
-        pyautogui.click(x, y) 
\ No newline at end of file
+        if backend.name == PyAutoGuiBackend.name:
+            raise
+        # 이번 클릭만 pyautogui로 재시도 (전역 백엔드와 키 코드 표는 그대로 유지)
+        log.warning("%s 클릭 실패, 이번 클릭은 pyautogui 사용: %s", backend.name, e)
+        _fallback_backend().click(x, y, hold=hold)
+
+def click_burst_at_position(x, y, count):
+    """
+    지정된 좌표(x, y)에서 지연 없이 왼쪽 버튼 클릭을 count번 연속으로 수행합니다.
+    SendInput 백엔드에서는 미리 만들어 둔 입력 배열을 한 번의 호출로 전송합니다.
+    
+    Args:
+        x (int): 클릭할 x 좌표
+        y (int): 클릭할 y 좌표
+        count (int): 클릭 횟수
+    
+    Returns:
+        int: 주입한 이벤트 수
+    """
+    return get_backend().click_burst(x, y, count)
@@ -1,15 +1,377 @@
 """
 마우스 위치 모듈
 
-현재 마우스 커서의 위치를 반환하는 기능을 제공합니다.
+현재 마우스 커서의 위치를 제공하는 위치 소스를 추상화합니다.
+- hook: 저수준 마우스 훅(WH_MOUSE_LL)으로 커서가 움직일 때마다 위치를 갱신 (Windows 기본값)
+- polling: 지정한 주기로 GetCursorPos를 직접 호출해 위치를 갱신 (Windows 이외에서는 pyautogui)
+
+위치 소스는 별도 스레드에서 갱신되므로 클릭 엔진은 Tk를 거치지 않고
+position()으로 가장 최근 위치를 읽을 수 있습니다. 화면 표시처럼 변경만 알면 되는 곳은
+set_listener()로 콜백을 등록하면 위치가 바뀔 때만 호출되므로 타이머로 확인할 필요가 없습니다.
+훅 방식은 커서가 멈춰 있으면 아무 스레드도 깨어나지 않으며, 주기적으로 깨어나는 폴링 스레드는
+폴링 방식을 직접 선택했거나 훅을 사용할 수 없을 때만 실행됩니다.
+
+사용할 위치 소스는 실행 중에 set_position_source()로 바꿀 수 있으며,
+AUTO_POSITION_SOURCE 환경 변수로 기본값을 지정할 수 있습니다.
 """
-import pyautogui
+import os
+import sys
+import threading
+import ctypes
+from ctypes import wintypes
+
+from src.utils.fast_log import get_logger
+from src.utils.startup_profile import startup_profiler
+
+log = get_logger("MousePosition")
+
+# 폴링 방식 기본 갱신 주기 (Hz)
+DEFAULT_POLL_RATE = 100
+
+# 저수준 마우스 훅 상수
+WH_MOUSE_LL = 14
+WM_MOUSEMOVE = 0x0200
+WM_LBUTTONDOWN = 0x0201
+WM_LBUTTONUP = 0x0202
+WM_RBUTTONDOWN = 0x0204
+WM_RBUTTONUP = 0x0205
+WM_MBUTTONDOWN = 0x0207
+WM_MBUTTONUP = 0x0208
+WM_MOUSEWHEEL = 0x020A
+WM_QUIT = 0x0012
+
+class MSLLHOOKSTRUCT(ctypes.Structure):
+    _fields_ = [
+        ("pt", wintypes.POINT),
+        ("mouseData", wintypes.DWORD),
+        ("flags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+# WINFUNCTYPE은 Windows에서만 존재 (다른 운영체제에서는 모듈을 불러올 수만 있으면 됨)
+_WINFUNCTYPE = getattr(ctypes, "WINFUNCTYPE", ctypes.CFUNCTYPE)
+LowLevelMouseProc = _WINFUNCTYPE(
+    ctypes.c_ssize_t, ctypes.c_int, wintypes.WPARAM, wintypes.LPARAM
+)
+
+class LowLevelMouseHook:
+    """
+    저수준 마우스 훅
+
+    전용 스레드에 WH_MOUSE_LL 훅을 설치하고 메시지 루프를 실행합니다.
+    callback(메시지, x, y, mouseData)은 훅 스레드에서 호출되므로 짧게 끝나야 합니다.
+    """
+
+    def __init__(self, callback, name="MouseHook"):
+        if sys.platform != "win32":
+            raise OSError("저수준 마우스 훅은 Windows에서만 사용할 수 있습니다")
+        self.callback = callback
+        self.name = name
+        self._user32 = ctypes.WinDLL('user32', use_last_error=True)
+        self._user32.SetWindowsHookExW.argtypes = [ctypes.c_int, LowLevelMouseProc, wintypes.HINSTANCE, wintypes.DWORD]
+        self._user32.SetWindowsHookExW.restype = wintypes.HHOOK
+        self._user32.CallNextHookEx.argtypes = [wintypes.HHOOK, ctypes.c_int, wintypes.WPARAM, wintypes.LPARAM]
+        self._user32.CallNextHookEx.restype = ctypes.c_ssize_t
+        self._user32.UnhookWindowsHookEx.argtypes = [wintypes.HHOOK]
+        self._user32.PostThreadMessageW.argtypes = [wintypes.DWORD, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+        self._user32.GetCursorPos.argtypes = [ctypes.POINTER(wintypes.POINT)]
+        self._proc = LowLevelMouseProc(self._hook_proc)  # 콜백이 해제되지 않도록 참조 유지
+        self._hook = None
+        self._thread = None
+        self._thread_id = 0
+        self._ready = threading.Event()
+
+    def cursor_pos(self):
+        """현재 커서 위치 (x, y) 반환"""
+        point = wintypes.POINT()
+        self._user32.GetCursorPos(ctypes.byref(point))
+        return point.x, point.y
+
+    def _hook_proc(self, n_code, w_param, l_param):
+        """마우스 이벤트 콜백 (훅 스레드에서 호출)"""
+        if n_code >= 0:
+            info = MSLLHOOKSTRUCT.from_address(l_param)
+            self.callback(w_param, info.pt.x, info.pt.y, info.mouseData)
+        return self._user32.CallNextHookEx(None, n_code, w_param, l_param)
+
+    def is_alive(self):
+        """훅 스레드 동작 여부"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """훅 스레드 시작 (훅 설치를 최대 1초 기다림)"""
+        if self.is_alive():
+            return
+        self._ready.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True, name=self.name)
+        self._thread.start()
+        self._ready.wait(timeout=1.0)
+        if self._hook is None:
+            raise OSError("저수준 마우스 훅 설치 실패")
+
+    def stop(self):
+        """메시지 루프 종료 및 훅 해제"""
+        if self._thread is None:
+            return
+        self._user32.PostThreadMessageW(self._thread_id, WM_QUIT, 0, 0)
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+        self._thread = None
+
+    def _run(self):
+        """훅 설치 후 메시지 루프 실행"""
+        kernel32 = ctypes.WinDLL('kernel32')
+        self._thread_id = kernel32.GetCurrentThreadId()
+        self._hook = self._user32.SetWindowsHookExW(WH_MOUSE_LL, self._proc, None, 0)
+        self._ready.set()
+        if not self._hook:
+            return
+        try:
+            msg = wintypes.MSG()
+            while self._user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                pass
+        finally:
+            self._user32.UnhookWindowsHookEx(self._hook)
+            self._hook = None
+
+class PositionSource:
+    """
+    위치 소스 기본 클래스
+
+    pos: 가장 최근 커서 위치 (x, y) - 튜플 하나를 한 번에 바꾸므로 x와 y가 서로 다른 시점의 값으로 읽히지 않음
+    version: 위치가 바뀔 때마다 1씩 증가하는 값
+
+    pos, version, updates는 위치를 갱신하는 스레드 하나에서만 _set()으로 바꿉니다.
+    """
+    name = "base"
+
+    def __init__(self):
+        self.pos = (0, 0)
+        self.version = 0
+        self.updates = 0  # 위치 갱신 시도 횟수 (바뀌지 않은 경우 포함)
+        self._listener = None
+
+    def set_listener(self, callback):
+        """
+        위치가 바뀔 때마다 호출할 콜백 등록 (None이면 해제)
+
+        callback(x, y)는 위치를 갱신한 스레드에서 호출되므로 짧게 끝나야 합니다.
+        """
+        self._listener = callback
+
+    def position(self):
+        """가장 최근 커서 위치 (x, y) 반환"""
+        return self.pos
+
+    def _set(self, x, y):
+        """새 위치 기록 (바뀐 경우에만 version 증가, 갱신 스레드에서만 호출)"""
+        self.updates += 1
+        pos = (x, y)
+        if pos != self.pos:
+            self.pos = pos
+            self.version += 1
+            listener = self._listener
+            if listener is not None:
+                listener(x, y)
+
+    def start(self):
+        """위치 갱신 시작"""
+        raise NotImplementedError
+
+    def stop(self):
+        """위치 갱신 중지"""
+        pass
+
+    def get_stats(self):
+        """갱신 통계 반환"""
+        return {
+            "source": self.name,
+            "updates": self.updates,
+            "changes": self.version,
+        }
+
+class PollingPositionSource(PositionSource):
+    """
+    폴링 위치 소스
+
+    rate_hz 주기로 커서 위치를 읽습니다. Windows에서는 미리 만들어 둔 POINT 구조체에
+    GetCursorPos를 직접 호출하므로 pyautogui를 거치지 않습니다.
+    position()도 호출 시점의 위치를 직접 읽으므로 폴링 주기만큼 늦지 않습니다.
+    폴링 스레드와 position()을 호출하는 스레드가 서로의 좌표를 덮어쓰지 않도록 POINT 구조체는 따로 씁니다.
+    position()은 읽은 위치를 반환만 하고 pos와 version은 폴링 스레드만 갱신합니다.
+    """
+    name = "polling"
+
+    def __init__(self, rate_hz=DEFAULT_POLL_RATE, user32=None):
+        super().__init__()
+        self.period = 1.0 / rate_hz
+        self._stop_event = threading.Event()
+        self._thread = None
+        if user32 is None and sys.platform == "win32":
+            user32 = ctypes.WinDLL('user32', use_last_error=True)
+            user32.GetCursorPos.argtypes = [ctypes.POINTER(wintypes.POINT)]
+            user32.GetCursorPos.restype = wintypes.BOOL
+        self._read = self._init_reader(user32)       # position() 호출 스레드용
+        self._poll_read = self._init_reader(user32)  # 폴링 스레드용
+
+    def _init_reader(self, user32):
+        """현재 커서 위치를 읽는 함수 생성 (함수마다 자체 POINT 구조체 사용)"""
+        if user32 is not None:
+            get_cursor_pos = user32.GetCursorPos
+            point = wintypes.POINT()
+            point_ref = ctypes.byref(point)
+
+            def read():
+                get_cursor_pos(point_ref)
+                return point.x, point.y
+            return read
+
+        import pyautogui
+        return lambda: tuple(pyautogui.position())
+
+    def set_rate(self, rate_hz):
+        """폴링 주기 변경 (Hz)"""
+        self.period = 1.0 / max(1.0, float(rate_hz))
+
+    def position(self):
+        """현재 커서 위치를 직접 읽어 반환 (pos와 version은 바꾸지 않음)"""
+        return self._read()
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        # 첫 폴링 전까지 사용할 현재 위치 (폴링 스레드 시작 전이므로 여기서 갱신해도 됨)
+        self._set(*self._poll_read())
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="PositionPoller")
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+        self._thread = None
+
+    def _run(self):
+        """주기마다 커서 위치 갱신"""
+        while not self._stop_event.wait(self.period):
+            try:
+                self._set(*self._poll_read())
+            except Exception as e:
+                log.error("커서 위치 읽기 오류: %s", e)
+
+class HookPositionSource(PositionSource):
+    """
+    이벤트 기반 위치 소스
+
+    전용 스레드에 저수준 마우스 훅을 설치하고 메시지 루프를 실행합니다.
+    커서가 움직일 때만 위치가 갱신되므로 커서가 멈춰 있으면 아무 작업도 하지 않습니다.
+    """
+    name = "hook"
+
+    def __init__(self):
+        super().__init__()
+        self._hook = LowLevelMouseHook(self._on_mouse)
+
+    def _on_mouse(self, msg, x, y, mouse_data):
+        """마우스 이벤트 콜백 (훅 스레드에서 호출)"""
+        if msg == WM_MOUSEMOVE:
+            self._set(x, y)
+
+    def start(self):
+        if self._hook.is_alive():
+            return
+        # 첫 이동 전까지 사용할 현재 위치
+        self._set(*self._hook.cursor_pos())
+        self._hook.start()
+
+    def stop(self):
+        self._hook.stop()
+
+POSITION_SOURCES = {
+    PollingPositionSource.name: PollingPositionSource,
+    HookPositionSource.name: HookPositionSource,
+}
+
+_source = None
+_source_lock = threading.Lock()
+
+def default_position_source_name():
+    """환경 변수에 따른 기본 위치 소스 이름 반환"""
+    name = os.environ.get("AUTO_POSITION_SOURCE")
+    if name in POSITION_SOURCES:
+        return name
+    # 훅은 Windows에서만 사용할 수 있음
+    return HookPositionSource.name if sys.platform == "win32" else PollingPositionSource.name
+
+def current_position_source_name():
+    """현재 위치 소스 이름 반환 (아직 생성되지 않았으면 기본값 이름 반환)"""
+    source = _source
+    return source.name if source is not None else default_position_source_name()
+
+def get_position_source():
+    """현재 위치 소스 반환 (처음 호출 시 기본 위치 소스를 생성하고 시작)"""
+    global _source
+    source = _source
+    if source is None:
+        with _source_lock:
+            if _source is None:
+                name = default_position_source_name()
+                with startup_profiler.phase(f"위치 소스 생성 ({name})"):
+                    try:
+                        source = POSITION_SOURCES[name]()
+                        source.start()
+                    except Exception as e:
+                        log.warning("위치 소스 '%s' 시작 실패, 폴링 사용: %s", name, e)
+                        source = PollingPositionSource()
+                        source.start()
+                _source = source
+            source = _source
+    return source
+
+def set_position_source(source):
+    """
+    위치 소스 변경
+
+    Args:
+        source: PositionSource 인스턴스 또는 위치 소스 이름
+
+    Returns:
+        PositionSource: 새로 설정되어 시작된 위치 소스
+    """
+    global _source
+    if isinstance(source, str):
+        if source not in POSITION_SOURCES:
+            raise ValueError(f"알 수 없는 위치 소스: {source}")
+        source = POSITION_SOURCES[source]()
+    source.start()
+    with _source_lock:
+        old = _source
+        _source = source
+    if old is not None and old is not source and source._listener is None:
+        # 등록된 콜백은 새 위치 소스로 옮김
+        source.set_listener(old._listener)
+        old.set_listener(None)
+    if old is not None and old is not source:
+        old.stop()
+    return source
 
 def get_mouse_position():
     """
     현재 마우스 커서의 위치 좌표(x, y)를 반환합니다.
-    
+
     Returns:
         tuple: (x, y) 좌표
     """
-    return pyautogui.position() 
\ No newline at end of file
+    return get_position_source().position()
+
+def close_position_source():
+    """위치 소스 중지 (프로그램 종료 시 호출, 생성되지 않았으면 아무 작업도 하지 않음)"""
+    global _source
+    with _source_lock:
+        source = _source
+        _source = None
+    if source is not None:
+        source.set_listener(None)
+        source.stop()
@@ -0,0 +1,426 @@
+"""
+타임라인 재생 모듈
+
+녹화한 타임라인(src.core.timeline)을 절대 데드라인에 맞춰 다시 입력합니다.
+- 기록은 생성기로 하나씩 꺼내 쓰므로 Timeline.open()으로 메모리 매핑한 파일이면
+  수백만 개 기록도 일정한 메모리로, 전체를 해석하지 않고 바로 재생을 시작합니다.
+- 이벤트마다 데드라인 = 기준 시각 + (이벤트 시각 - 기준 위치) / 속도 로 계산하므로
+  주입에 걸린 시간이나 대기 오차가 다음 이벤트로 누적되지 않습니다.
+- 속도(0.25-10배)는 재생 중에도 바꿀 수 있으며, 현재 재생 위치를 기준으로 다시 계산합니다.
+- 이동(seek)하면 눌려 있던 키/버튼을 놓고, 이동한 위치 직전의 커서 위치로 옮긴 뒤 이어서 재생합니다.
+  재생하면서 SEEK_CHECKPOINT_INTERVAL개 기록마다 검사점(시각과 직전 커서 위치, 검사점당 16바이트)을 남기고,
+  이동할 때는 가장 가까운 검사점부터 앞으로 훑습니다. 아직 재생하지 않은 구간은 훑으면서 검사점을 추가합니다.
+- 이벤트마다 데드라인 대비 실제 주입 시각의 차이(타이밍 오차)를 원형 버퍼에 기록합니다.
+
+사용 예:
+    player = TimelinePlayer()
+    player.load(Timeline.open("macro.aitl"))
+    player.set_speed(2.0)
+    player.start()
+"""
+import threading
+import traceback
+from array import array
+from bisect import bisect_left
+
+from src.core.input_backend import get_backend
+from src.core.timeline import (
+    EVENT_CLICK, EVENT_KEY_DOWN, EVENT_KEY_TAP, EVENT_KEY_UP, EVENT_MOUSE_DOWN, EVENT_MOUSE_MOVE,
+    EVENT_MOUSE_UP, EVENT_WHEEL, FLAG_VK, MOUSE_BUTTONS, RECORD,
+)
+from src.core.timing import NS_PER_SEC, high_resolution_timer, now_ns, percentile, sleep_until
+from src.utils.fast_log import get_logger
+
+log = get_logger("Playback")
+
+# 재생 속도 범위
+MIN_SPEED = 0.25
+MAX_SPEED = 10.0
+
+# 반복 방식
+LOOP_ONCE = "once"        # 한 번 재생
+LOOP_COUNT = "count"      # loop_count번 재생
+LOOP_FOREVER = "forever"  # 중지할 때까지 반복
+
+# 이동용 검사점 간격 (기록 수, 2의 거듭제곱) - 이동할 때 최대 이만큼만 훑음
+SEEK_CHECKPOINT_SHIFT = 10
+SEEK_CHECKPOINT_INTERVAL = 1 << SEEK_CHECKPOINT_SHIFT
+
+# 타이밍 오차 기록 개수 - 최근 이벤트만 유지하는 원형 버퍼 (2의 거듭제곱)
+ERROR_HISTORY_SIZE = 4096
+
+def iter_events(records, start_index=0, start_ns=0):
+    """
+    기록을 하나씩 해석해 (색인, 타임라인 시각, 종류, 플래그, 코드, x, y)를 반환하는 생성기
+
+    Args:
+        records: RECORD 형식 기록 바이트열 (메모리 매핑이면 읽은 페이지만 메모리에 올라옴)
+        start_index (int): 시작 기록 색인
+        start_ns (int): 시작 기록 직전까지의 타임라인 시각
+    """
+    t = start_ns
+    index = start_index
+    view = memoryview(records)[start_index * RECORD.size:]
+    try:
+        for kind, flags, code, x, y, delta in RECORD.iter_unpack(view):
+            t += delta
+            yield index, t, kind, flags, code, x, y
+            index += 1
+    finally:
+        view.release()
+
+class TimelinePlayer:
+    """
+    타임라인 재생기
+
+    재생은 전용 스레드에서 수행하며, 속도 변경/이동/중지 요청은 _interrupt 이벤트로
+    대기 중인 재생 스레드를 바로 깨워 전달합니다.
+    """
+
+    def __init__(self, backend_func=get_backend, speed=1.0, loop=LOOP_ONCE, loop_count=1):
+        """
+        Args:
+            backend_func (function): 입력 백엔드를 반환하는 함수
+            speed (float): 재생 속도 (MIN_SPEED-MAX_SPEED)
+            loop (str): 반복 방식 (LOOP_ONCE, LOOP_COUNT, LOOP_FOREVER)
+            loop_count (int): LOOP_COUNT일 때 재생 횟수
+        """
+        self.backend_func = backend_func
+        self.timeline = None
+        self._interrupt = threading.Event()
+        self.speed = 1.0
+        self.set_speed(speed)
+        self.loop = LOOP_ONCE
+        self.loop_count = 1
+        self.set_loop(loop, loop_count)
+        self.spin_ns = 1_000_000       # 데드라인 직전 바쁜 대기로 맞출 구간 (1ms)
+
+        # 실행 상태
+        self.thread = None
+        self._stopping = False
+        self._seek_ns = None           # 이동 요청 위치 (타임라인 시각)
+        self._control_lock = threading.Lock()
+        self._key_codes = []           # 키 이름 표 색인 -> 가상 키 코드 (-1: 이름으로 주입)
+        self._checkpoint_times = array('q')      # 검사점 k: 기록 (k + 1) * 간격 - 1까지의 타임라인 시각
+        self._checkpoint_positions = array('q')  # 검사점 k: 그 기록까지의 마지막 커서 위치 기록 색인 (-1: 없음)
+        self._keys_down = bytearray(256)
+        self._names_down = set()       # 이름으로 주입해 눌러 둔 키
+        self._buttons_down = bytearray(len(MOUSE_BUTTONS))
+
+        # 재생 위치와 통계
+        self.index = 0                 # 다음에 재생할 기록 색인
+        self.position_ns = 0           # 마지막으로 재생한 이벤트의 타임라인 시각
+        self.pass_number = 0           # 현재 몇 번째 재생인지 (1부터)
+        self.events_played = 0
+        self.max_error_ns = 0
+        self.error_total_ns = 0
+        self.error_history = array('q', bytes(8 * ERROR_HISTORY_SIZE))  # 최근 이벤트의 타이밍 오차 (나노초)
+
+    def load(self, timeline):
+        """재생할 타임라인 설정 (재생 중이면 중지)"""
+        self.stop(wait=True)
+        self.timeline = timeline
+        self._key_codes = []
+        self._checkpoint_times = array('q')
+        self._checkpoint_positions = array('q')
+        self.index = 0
+        self.position_ns = 0
+
+    def set_speed(self, speed):
+        """재생 속도 설정 (재생 중에도 현재 위치부터 적용)"""
+        self.speed = min(max(float(speed), MIN_SPEED), MAX_SPEED)
+        self._interrupt.set()
+
+    def set_loop(self, loop, loop_count=1):
+        """반복 방식 설정"""
+        if loop not in (LOOP_ONCE, LOOP_COUNT, LOOP_FOREVER):
+            raise ValueError(f"알 수 없는 반복 방식: {loop}")
+        self.loop = loop
+        self.loop_count = max(int(loop_count), 1)
+
+    def seek(self, seconds):
+        """재생 위치를 타임라인 시각(초)으로 이동 (재생 중이 아니면 다음 시작 위치)"""
+        self._seek_ns = max(int(seconds * NS_PER_SEC), 0)
+        self._interrupt.set()
+
+    def is_running(self):
+        """재생 중인지 확인"""
+        return self.thread is not None and self.thread.is_alive()
+
+    def start(self):
+        """재생 스레드 시작 (처음부터 또는 seek()로 지정한 위치부터)"""
+        with self._control_lock:
+            if self.is_running() or self.timeline is None:
+                return False
+            self._stopping = False
+            self._interrupt.clear()
+            self.events_played = 0
+            self.max_error_ns = 0
+            self.error_total_ns = 0
+            self.pass_number = 1
+            self.thread = threading.Thread(target=self._run, daemon=True, name="TimelinePlayer")
+            self.thread.start()
+            return True
+
+    def stop(self, wait=False):
+        """재생 중지 (눌려 있던 키/버튼은 재생 스레드가 놓고 끝남)"""
+        self._stopping = True
+        self._interrupt.set()
+        thread = self.thread
+        if wait and thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=1.0)
+
+    def _resolve_keys(self, backend):
+        """키 이름 표를 가상 키 코드로 한 번만 변환"""
+        codes = []
+        for name in self.timeline.names:
+            try:
+                codes.append(backend.resolve_key(name))
+            except ValueError:
+                codes.append(-1)
+        self._key_codes = codes
+
+    def _run(self):
+        """재생 스레드 함수"""
+        try:
+            with high_resolution_timer():
+                self._play()
+        except Exception as e:
+            log.error("타임라인 재생 중 오류: %s\n%s", e, traceback.format_exc())
+        finally:
+            self._release_all(self.backend_func())
+
+    def _add_checkpoint(self, index, t):
+        """
+        기록 index까지 재생한 상태를 검사점으로 추가 (index + 1이 검사점 간격의 배수이고 앞 검사점이 모두 있을 때)
+
+        직전 커서 위치는 이번 구간을 뒤에서부터 훑어 찾고, 없으면 앞 검사점의 값을 이어 씁니다.
+        """
+        records = self.timeline.records
+        positions = self._checkpoint_positions
+        last_position = positions[-1] if positions else -1
+        for i in range(index, index - SEEK_CHECKPOINT_INTERVAL, -1):
+            kind = records[i * RECORD.size]
+            if EVENT_MOUSE_MOVE <= kind <= EVENT_WHEEL or kind == EVENT_CLICK:
+                last_position = i
+                break
+        self._checkpoint_times.append(t)
+        positions.append(last_position)
+
+    def _find(self, target_ns):
+        """
+        target_ns 이후 첫 기록의 (색인, 직전 타임라인 시각, 직전 커서 위치) 반환
+
+        target_ns 전의 가장 가까운 검사점부터 앞으로 훑고, 훑은 구간에 검사점이 없으면 추가합니다.
+        """
+        times = self._checkpoint_times
+        positions = self._checkpoint_positions
+        checkpoint = bisect_left(times, target_ns)
+        if checkpoint:
+            start_index = checkpoint << SEEK_CHECKPOINT_SHIFT
+            start_t = times[checkpoint - 1]
+            last_position = positions[checkpoint - 1]
+        else:
+            start_index, start_t, last_position = 0, 0, -1
+
+        checkpoint_mask = SEEK_CHECKPOINT_INTERVAL - 1
+        events = iter_events(self.timeline.records, start_index, start_t)
+        for index, t, kind, flags, code, x, y in events:
+            if t >= target_ns:
+                break
+            start_t = t
+            if EVENT_MOUSE_MOVE <= kind <= EVENT_WHEEL or kind == EVENT_CLICK:
+                last_position = index
+            if not (index + 1) & checkpoint_mask and (index + 1) >> SEEK_CHECKPOINT_SHIFT == len(times) + 1:
+                times.append(t)
+                positions.append(last_position)
+        else:
+            index = len(self.timeline)
+        events.close()
+
+        position = None
+        if last_position >= 0:
+            x, y = RECORD.unpack_from(self.timeline.records, last_position * RECORD.size)[3:5]
+            position = (x, y)
+        return index, start_t, position
+
+    def _play(self):
+        """재생 루프 - 이벤트마다 데드라인까지 대기 후 주입"""
+        backend = self.backend_func()
+        if len(self._key_codes) != len(self.timeline.names):
+            self._resolve_keys(backend)
+
+        interrupt = self._interrupt
+        error_history = self.error_history
+        error_mask = ERROR_HISTORY_SIZE - 1
+        checkpoint_times = self._checkpoint_times
+        checkpoint_mask = SEEK_CHECKPOINT_INTERVAL - 1
+        speed = self.speed
+        start_index, start_t = 0, 0
+        if self._seek_ns is not None:
+            start_index, start_t, position = self._find(self._seek_ns)
+            self._seek_ns = None
+            if position is not None:
+                backend.move(*position)
+
+        # 데드라인 = anchor_ns + (이벤트 시각 - anchor_t) / speed
+        anchor_ns = now_ns()
+        anchor_t = start_t
+        events = iter_events(self.timeline.records, start_index, start_t)
+        while True:
+            restart = None
+            for index, t, kind, flags, code, x, y in events:
+                deadline = anchor_ns + int((t - anchor_t) / speed)
+                while interrupt.is_set() or not sleep_until(deadline, interrupt, self.spin_ns):
+                    # 중지, 이동, 속도 변경 요청 (데드라인이 지났어도 먼저 처리)
+                    interrupt.clear()
+                    if self._stopping:
+                        return
+                    if self._seek_ns is not None:
+                        restart = self._seek_ns
+                        self._seek_ns = None
+                        break
+                    # 현재 재생 위치를 기준으로 새 속도 적용
+                    now = now_ns()
+                    anchor_t = min(anchor_t + int((now - anchor_ns) * speed), t)
+                    anchor_ns = now
+                    speed = self.speed
+                    deadline = anchor_ns + int((t - anchor_t) / speed)
+                if restart is not None:
+                    break
+
+                fired = now_ns()
+                self._inject(backend, kind, flags, code, x, y)
+                error = fired - deadline
+                if error > self.max_error_ns:
+                    self.max_error_ns = error
+                self.error_total_ns += error
+                error_history[self.events_played & error_mask] = error
+                self.events_played += 1
+                self.index = index + 1
+                self.position_ns = t
+
+                # 검사점 간격마다 이동용 검사점 추가 (아직 없는 경우만)
+                if not self.index & checkpoint_mask and self.index >> SEEK_CHECKPOINT_SHIFT == len(checkpoint_times) + 1:
+                    self._add_checkpoint(index, t)
+
+            if restart is not None:
+                # 이동: 눌린 입력을 놓고 이동 위치 직전의 커서 위치에서 이어서 재생
+                events.close()
+                self._release_all(backend)
+                start_index, start_t, position = self._find(restart)
+                if position is not None:
+                    backend.move(*position)
+                events = iter_events(self.timeline.records, start_index, start_t)
+                anchor_ns, anchor_t = now_ns(), start_t
+                self.index, self.position_ns = start_index, start_t
+                continue
+
+            # 끝까지 재생함
+            if self.loop == LOOP_ONCE or (self.loop == LOOP_COUNT and self.pass_number >= self.loop_count):
+                self.index = 0
+                return
+            self._release_all(backend)
+            self.pass_number += 1
+            # 마지막 이벤트의 데드라인을 다음 재생의 기준으로 사용 (반복해도 오차 누적 없음)
+            anchor_ns += int((self.position_ns - anchor_t) / speed)
+            anchor_t = 0
+            events = iter_events(self.timeline.records)
+
+    def _inject(self, backend, kind, flags, code, x, y):
+        """기록 하나를 입력으로 주입"""
+        if kind == EVENT_MOUSE_MOVE:
+            backend.move(x, y)
+        elif kind == EVENT_KEY_DOWN or kind == EVENT_KEY_UP:
+            is_down = kind == EVENT_KEY_DOWN
+            vk = code if flags & FLAG_VK else self._key_codes[code]
+            if vk < 0:
+                # 가상 키 코드로 바꿀 수 없는 키는 이름으로 주입
+                name = self.timeline.names[code]
+                if is_down:
+                    backend.key_down(name)
+                    self._names_down.add(name)
+                else:
+                    backend.key_up(name)
+                    self._names_down.discard(name)
+            elif is_down:
+                backend.key_down_code(vk)
+                self._keys_down[vk] = 1
+            else:
+                backend.key_up_code(vk)
+                self._keys_down[vk] = 0
+        elif kind == EVENT_MOUSE_DOWN:
+            backend.move(x, y)
+            backend.mouse_down(MOUSE_BUTTONS[code])
+            self._buttons_down[code] = 1
+        elif kind == EVENT_MOUSE_UP:
+            backend.move(x, y)
+            backend.mouse_up(MOUSE_BUTTONS[code])
+            self._buttons_down[code] = 0
+        elif kind == EVENT_WHEEL:
+            backend.move(x, y)
+            backend.scroll(code)
+        elif kind == EVENT_KEY_TAP:
+            vk = code if flags & FLAG_VK else self._key_codes[code]
+            if vk < 0:
+                name = self.timeline.names[code]
+                backend.key_down(name)
+                backend.key_up(name)
+            else:
+                backend.key_down_code(vk)
+                backend.key_up_code(vk)
+        elif kind == EVENT_CLICK:
+            backend.click(x, y, MOUSE_BUTTONS[code])
+
+    def _release_all(self, backend):
+        """재생 중 눌러 둔 키/버튼을 모두 해제"""
+        keys_down = self._keys_down
+        code = keys_down.find(1)
+        while code >= 0:
+            keys_down[code] = 0
+            try:
+                backend.key_up_code(code)
+            except Exception as e:
+                log.warning("키 해제 실패 (0x%02X): %s", code, e)
+            code = keys_down.find(1, code + 1)
+        while self._names_down:
+            name = self._names_down.pop()
+            try:
+                backend.key_up(name)
+            except Exception as e:
+                log.warning("키 해제 실패 (%s): %s", name, e)
+        for button, down in enumerate(self._buttons_down):
+            if down:
+                self._buttons_down[button] = 0
+                try:
+                    backend.mouse_up(MOUSE_BUTTONS[button])
+                except Exception as e:
+                    log.warning("마우스 버튼 해제 실패 (%s): %s", MOUSE_BUTTONS[button], e)
+
+    def get_errors(self):
+        """최근 이벤트의 데드라인 대비 타이밍 오차 백분위수 반환 (마이크로초)"""
+        count = min(self.events_played, ERROR_HISTORY_SIZE)
+        errors = sorted(self.error_history[:count])
+        return {
+            "p50_us": percentile(errors, 50) / 1000,
+            "p95_us": percentile(errors, 95) / 1000,
+            "p99_us": percentile(errors, 99) / 1000,
+        }
+
+    def get_stats(self):
+        """재생 위치, 재생한 이벤트 수, 타이밍 오차 통계 반환"""
+        total = len(self.timeline) if self.timeline is not None else 0
+        played = self.events_played or 1
+        stats = {
+            "running": self.is_running(),
+            "index": self.index,
+            "events": total,
+            "position_s": self.position_ns / NS_PER_SEC,
+            "pass": self.pass_number,
+            "speed": self.speed,
+            "events_played": self.events_played,
+            "error_avg_us": self.error_total_ns / played / 1000,
+            "error_max_us": self.max_error_ns / 1000,
+        }
+        stats.update(self.get_errors())
+        return stats
@@ -0,0 +1,215 @@
+"""
+입력 녹화 모듈
+
+실제 키보드/마우스 입력을 타임라인(src.core.timeline)으로 녹화합니다.
+- 키보드는 탭들이 쓰는 전역 키보드 훅(KeyHook)에 관찰 함수로 연결하므로
+  키보드 훅을 하나 더 설치하지 않습니다.
+- 마우스는 저수준 마우스 훅(LowLevelMouseHook)을 녹화하는 동안만 설치합니다.
+- 이벤트 하나는 훅 스레드에서 16바이트 기록 하나를 bytearray 끝에 붙이는 것으로 끝나며,
+  이벤트마다 dict나 이벤트 객체를 보관하지 않습니다.
+- 마우스 이동은 move_interval_ms보다 촘촘하게 들어오면 직전 이동 기록을 마지막 이동의 좌표와 시각으로
+  바꿉니다 (마우스 보고율이 1000Hz여도 기록은 기본 250Hz 이하).
+
+사용 예:
+    recorder = InputRecorder()
+    recorder.start()
+    ...
+    timeline = recorder.stop()
+    timeline.save("macro.aitl")
+"""
+import threading
+import time
+
+from src.core.key_hook import KEY_DOWN, get_key_hook
+from src.core.mouse_position import (
+    WM_LBUTTONDOWN, WM_LBUTTONUP, WM_MBUTTONDOWN, WM_MBUTTONUP, WM_MOUSEMOVE,
+    WM_MOUSEWHEEL, WM_RBUTTONDOWN, WM_RBUTTONUP, LowLevelMouseHook,
+)
+from src.core.timeline import (
+    EVENT_IDLE, EVENT_KEY_DOWN, EVENT_KEY_UP, EVENT_MOUSE_DOWN, EVENT_MOUSE_MOVE,
+    EVENT_MOUSE_UP, EVENT_WHEEL, MAX_DELTA_NS, RECORD, Timeline,
+)
+from src.utils.fast_log import get_logger
+
+log = get_logger("Recorder")
+
+# 마우스 이동 기록 최소 간격 기본값 (ms)
+MOVE_INTERVAL_MS = 4
+
+# 저수준 마우스 훅 메시지 -> (이벤트 종류, 버튼 코드)
+_MOUSE_BUTTON_EVENTS = {
+    WM_LBUTTONDOWN: (EVENT_MOUSE_DOWN, 0),
+    WM_LBUTTONUP: (EVENT_MOUSE_UP, 0),
+    WM_RBUTTONDOWN: (EVENT_MOUSE_DOWN, 1),
+    WM_RBUTTONUP: (EVENT_MOUSE_UP, 1),
+    WM_MBUTTONDOWN: (EVENT_MOUSE_DOWN, 2),
+    WM_MBUTTONUP: (EVENT_MOUSE_UP, 2),
+}
+
+class InputRecorder:
+    """
+    키보드/마우스 입력 녹화기
+
+    키보드 훅 스레드와 마우스 훅 스레드가 함께 기록하므로 기록 추가는 짧은 락으로 직렬화합니다.
+    두 훅의 이벤트 시각이 아주 조금 엇갈려 들어오면 시간 차를 0으로 기록합니다.
+    """
+
+    def __init__(self, key_hook=None, record_mouse=True, move_interval_ms=MOVE_INTERVAL_MS, ignore_keys=()):
+        """
+        Args:
+            key_hook (KeyHook): 키 이벤트를 받을 전역 키보드 훅 (None이면 get_key_hook())
+            record_mouse (bool): 마우스 이벤트 녹화 여부
+            move_interval_ms (float): 마우스 이동 기록 최소 간격 (0이면 모든 이동 기록)
+            ignore_keys (iterable): 녹화하지 않을 키 이름 (녹화/재생 단축키 등)
+        """
+        self._key_hook = key_hook
+        self.ignore_keys = frozenset(key.lower() for key in ignore_keys)
+        self.record_mouse = record_mouse
+        self.move_interval_ns = int(move_interval_ms * 1_000_000)
+        self._mouse_hook = None
+        self._lock = threading.Lock()
+
+        self.recording = False
+        self._buffer = bytearray()
+        self._names = {}              # {키 이름: 이름 표 색인}
+        self._last_ns = 0             # 마지막 기록 시각
+        self._last_move_offset = -1   # 직전 기록이 마우스 이동이면 그 위치, 아니면 -1
+        self._last_move_ns = 0        # 직전 마우스 이동 기록 시각
+        self._created_ns = 0
+
+        # 통계
+        self.events = 0               # 받은 이벤트 수
+        self.coalesced_moves = 0      # 직전 기록에 합친 마우스 이동 수
+
+    def start(self):
+        """녹화 시작 (이전 녹화 내용은 지움)"""
+        with self._lock:
+            if self.recording:
+                return
+            self._buffer = bytearray()
+            self._names = {}
+            self._last_move_offset = -1
+            self.events = 0
+            self.coalesced_moves = 0
+            self._created_ns = time.time_ns()
+            self._last_ns = time.perf_counter_ns()
+            self.recording = True
+
+        if self._key_hook is None:
+            self._key_hook = get_key_hook()
+        self._key_hook.add_listener(self._on_key)
+
+        if self.record_mouse:
+            try:
+                self._mouse_hook = LowLevelMouseHook(self._on_mouse, name="RecorderMouseHook")
+                self._mouse_hook.start()
+            except OSError as e:
+                self._mouse_hook = None
+                log.warning("마우스 훅을 사용할 수 없어 키보드만 녹화합니다: %s", e)
+        log.info("녹화 시작")
+
+    def stop(self):
+        """녹화 중지 후 타임라인 반환"""
+        if self._key_hook is not None:
+            self._key_hook.remove_listener(self._on_key)
+        if self._mouse_hook is not None:
+            self._mouse_hook.stop()
+            self._mouse_hook = None
+
+        with self._lock:
+            self.recording = False
+            names = sorted(self._names, key=self._names.get)
+            timeline = Timeline(bytes(self._buffer), names, self._created_ns)
+        log.info("녹화 중지 - 이벤트 %d개, %d바이트", len(timeline), timeline.nbytes)
+        return timeline
+
+    def record(self, event_type, code=0, x=0, y=0, event_ns=None):
+        """
+        이벤트 하나 기록
+
+        Args:
+            event_type (int): 이벤트 종류 (timeline.EVENT_*)
+            code (int): 키 이름 표 색인, 마우스 버튼 코드 또는 휠 이동량
+            x, y (int): 커서 위치
+            event_ns (int): 이벤트 시각 (perf_counter_ns, None이면 현재 시각)
+        """
+        if event_ns is None:
+            event_ns = time.perf_counter_ns()
+        with self._lock:
+            if not self.recording:
+                return
+            self.events += 1
+            buffer = self._buffer
+
+            if event_type == EVENT_MOUSE_MOVE:
+                offset = self._last_move_offset
+                if offset >= 0 and event_ns - self._last_move_ns < self.move_interval_ns:
+                    # 직전 이동 기록을 이번 이동으로 바꿈 (좌표와 함께 시간 차도 이번 이벤트 시각까지 늘림,
+                    # 기록 묶음 간격은 처음 이동 시각부터 재므로 _last_move_ns는 그대로 둠)
+                    delta = RECORD.unpack_from(buffer, offset)[5]
+                    gap = max(event_ns - self._last_ns, 0)
+                    # 늘린 시간 차가 uint32를 넘으면 합치지 않고 아래에서 EVENT_IDLE로 나눠 새로 기록
+                    if delta + gap <= MAX_DELTA_NS:
+                        if gap:
+                            self._last_ns = event_ns
+                        RECORD.pack_into(buffer, offset, EVENT_MOUSE_MOVE, 0, 0, x, y, delta + gap)
+                        self.coalesced_moves += 1
+                        return
+
+            delta = event_ns - self._last_ns
+            if delta < 0:
+                delta = 0
+            else:
+                self._last_ns = event_ns
+            while delta > MAX_DELTA_NS:
+                buffer += RECORD.pack(EVENT_IDLE, 0, 0, 0, 0, MAX_DELTA_NS)
+                delta -= MAX_DELTA_NS
+
+            if event_type == EVENT_MOUSE_MOVE:
+                self._last_move_offset = len(buffer)
+                self._last_move_ns = event_ns
+            else:
+                self._last_move_offset = -1
+            buffer += RECORD.pack(event_type, 0, code, x, y, delta)
+
+    def record_key(self, name, is_down, event_ns=None):
+        """키 누름/해제 기록 (키 이름은 이름 표 색인으로 바꿔 기록)"""
+        with self._lock:
+            code = self._names.get(name)
+            if code is None:
+                code = self._names[name] = len(self._names)
+        self.record(EVENT_KEY_DOWN if is_down else EVENT_KEY_UP, code, event_ns=event_ns)
+
+    def _on_key(self, event, event_ns):
+        """키 이벤트 관찰 함수 (키보드 훅 스레드)"""
+        name = event.name
+        if name:
+            name = name.lower()
+            if name not in self.ignore_keys:
+                self.record_key(name, event.event_type == KEY_DOWN, event_ns)
+
+    def _on_mouse(self, msg, x, y, mouse_data):
+        """마우스 이벤트 콜백 (마우스 훅 스레드)"""
+        if msg == WM_MOUSEMOVE:
+            self.record(EVENT_MOUSE_MOVE, 0, x, y)
+        elif msg == WM_MOUSEWHEEL:
+            # mouseData 상위 16비트가 부호 있는 이동량
+            amount = (mouse_data >> 16) & 0xFFFF
+            if amount >= 0x8000:
+                amount -= 0x10000
+            self.record(EVENT_WHEEL, amount, x, y)
+        else:
+            button = _MOUSE_BUTTON_EVENTS.get(msg)
+            if button is not None:
+                self.record(button[0], button[1], x, y)
+
+    def get_stats(self):
+        """녹화 중인 이벤트 수와 크기 반환"""
+        return {
+            "recording": self.recording,
+            "events": self.events,
+            "records": len(self._buffer) // RECORD.size,
+            "bytes": len(self._buffer),
+            "keys": len(self._names),
+            "coalesced_moves": self.coalesced_moves,
+        }
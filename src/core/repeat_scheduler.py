@@ -0,0 +1,431 @@
+"""
+키 반복 스케줄러 모듈
+
+하나의 스레드에서 모든 반복 키를 처리하는 스케줄러를 제공합니다.
+각 키의 다음 실행 시각(누름/해제)을 힙에 보관하고, 가장 가까운 데드라인까지만
+대기하므로 키 개수와 관계없이 스레드는 하나이며 키 시작/중지는 O(log n)입니다.
+"""
+import heapq
+import itertools
+import threading
+import time
+import traceback
+
+from src.core.timing import NS_PER_SEC, LatencyRecorder, seconds_to_ns
+from src.utils.fast_log import get_logger
+
+log = get_logger("RepeatScheduler")
+
+# 이벤트 종류
+PHASE_PRESS = 0
+PHASE_RELEASE = 1
+
+class RepeatEntry:
+    """반복 중인 키 하나의 상태"""
+    __slots__ = ("key", "generation", "cancelled", "is_down", "repeat_count", "retry_count",
+                 "cycle_ns", "last_press_ns", "interval_ema_ns", "trigger_ns")
+
+    def __init__(self, key):
+        self.key = key
+        self.generation = 0      # 예약된 이벤트의 유효성 확인용 세대 번호
+        self.cancelled = False   # 중지 요청 여부
+        self.is_down = False     # 현재 키가 눌린 상태로 주입되어 있는지
+        self.repeat_count = 0    # 누름/해제 완료 횟수
+        self.retry_count = 0     # 연속 입력 실패 횟수
+        self.cycle_ns = 0        # 현재 주기의 목표 누름 시각
+        self.last_press_ns = 0   # 마지막 누름 주입 완료 시각
+        self.interval_ema_ns = 0 # 실제 누름 간격의 지수 이동 평균
+        self.trigger_ns = 0      # 반복 시작 요청 시각 (첫 누름 주입 후 0)
+
+class RepeatScheduler:
+    def __init__(self, press_func, release_func):
+        """
+        스케줄러 초기화
+
+        Args:
+            press_func (function): 키를 받아 누름을 주입하는 함수
+            release_func (function): 키를 받아 해제를 주입하는 함수
+        """
+        self.press_func = press_func
+        self.release_func = release_func
+        self.on_finished = None        # 오류로 반복이 끝났을 때 호출할 콜백 (키 전달)
+        self.on_thread_exit = None     # 스케줄러 스레드가 예외로 종료되었을 때 호출할 콜백 (예외 전달)
+
+        # 반복 주기 설정 (나노초)
+        self.hold_ns = seconds_to_ns(0.02)     # 누름 유지 시간
+        self.period_ns = seconds_to_ns(0.04)   # 누름 시작 간 간격
+
+        # 주입 지연 보정 (측정한 누름/해제 호출 시간만큼 미리 실행)
+        self.compensate_latency = False
+        self.press_latency_ns = 0      # 누름 호출 시간의 지수 이동 평균
+        self.release_latency_ns = 0    # 해제 호출 시간의 지수 이동 평균
+        self.ema_alpha = 0.2
+
+        # 안정성 설정
+        self.max_retries = 2
+        self.retry_delay_ns = seconds_to_ns(0.05)
+
+        # 스케줄 상태 (모두 _cond로 보호)
+        lock = threading.RLock()
+        self._cond = threading.Condition(lock)     # 스케줄러 스레드 깨우기
+        self._drained = threading.Condition(lock)  # 항목 제거 알림 (wait_idle 대기용)
+        self._heap = []                # (데드라인, 순번, 항목, 세대, 단계)
+        self._entries = {}             # {키: RepeatEntry}
+        self._seq = itertools.count()  # 같은 데드라인의 순서 보장용
+        self._thread = None
+        self._closed = False
+
+        # 통계
+        self.wakeups = 0               # 스케줄러 스레드가 깨어난 횟수
+        self.cpu_ns = 0                # 스케줄러 스레드가 사용한 CPU 시간
+        self.start_latency = LatencyRecorder()  # 시작 요청부터 첫 누름 주입까지의 지연
+
+    def set_timing(self, press_delay, release_delay, min_cycle_time=0.0):
+        """누름 유지 시간과 해제 유지 시간 설정 (다음 주기부터 적용)"""
+        hold_ns = seconds_to_ns(press_delay)
+        period_ns = max(hold_ns + seconds_to_ns(release_delay), seconds_to_ns(min_cycle_time), 1)
+        with self._cond:
+            self.hold_ns = hold_ns
+            self.period_ns = period_ns
+            self.compensate_latency = False
+
+    def set_rate(self, rate_hz, hold_duration):
+        """
+        목표 반복 속도(Hz)와 누름 유지 시간 설정
+
+        누름 시작 간 간격을 1/rate_hz로 고정하고, 실제 누름/해제 호출에 걸리는
+        시간을 측정하여 그만큼 미리 주입하는 폐루프 보정을 사용합니다.
+        """
+        period_ns = max(seconds_to_ns(1.0 / rate_hz), 1)
+        # 누름 유지 시간은 주기보다 짧아야 해제 구간이 생김
+        hold_ns = min(seconds_to_ns(hold_duration), period_ns // 2)
+        with self._cond:
+            self.hold_ns = hold_ns
+            self.period_ns = period_ns
+            self.compensate_latency = True
+
+    def start(self, key, trigger_ns=None):
+        """
+        키 반복 시작 - 이미 반복 중이면 False 반환
+
+        Args:
+            key: 반복할 키
+            trigger_ns (int): 시작 지연 측정 기준 시각 (perf_counter_ns, 기본값: 호출 시각)
+        """
+        with self._cond:
+            entry = self._entries.get(key)
+            if entry is not None and not entry.cancelled:
+                return False
+
+            # 해제 대기 중인 항목은 재사용하여 누름 순서가 꼬이지 않도록 함
+            if entry is None:
+                entry = RepeatEntry(key)
+                self._entries[key] = entry
+
+            now = time.perf_counter_ns()
+            entry.cancelled = False
+            entry.retry_count = 0
+            entry.generation += 1
+            entry.cycle_ns = now
+            entry.last_press_ns = 0
+            entry.interval_ema_ns = 0
+            entry.trigger_ns = trigger_ns or now
+            phase = PHASE_RELEASE if entry.is_down else PHASE_PRESS
+            self._push(now, entry, phase)
+
+            self._ensure_thread()
+            self._cond.notify()
+            return True
+
+    def stop(self, key):
+        """키 반복 중지 - 눌린 상태라면 스케줄러 스레드가 즉시 해제"""
+        with self._cond:
+            entry = self._entries.get(key)
+            if entry is None or entry.cancelled:
+                return False
+            self._cancel(entry)
+            self._cond.notify()
+            return True
+
+    def stop_all(self):
+        """모든 키 반복 중지 - 모든 항목을 한 번에 취소하고 해제는 스케줄러 스레드가 처리"""
+        with self._cond:
+            for entry in self._entries.values():
+                if not entry.cancelled:
+                    self._cancel(entry)
+            self._cond.notify()
+
+    def wait_idle(self, timeout):
+        """
+        중지된 키의 해제가 모두 끝날 때까지 대기
+
+        키 개수와 관계없이 하나의 데드라인까지만 기다립니다.
+
+        Args:
+            timeout (float): 최대 대기 시간 (초)
+
+        Returns:
+            bool: 제시간에 모든 항목이 정리되었으면 True
+        """
+        deadline = time.perf_counter_ns() + seconds_to_ns(timeout)
+        with self._cond:
+            while any(entry.cancelled for entry in self._entries.values()):
+                remaining = deadline - time.perf_counter_ns()
+                if remaining <= 0 or not self.is_alive():
+                    return False
+                self._drained.wait(remaining / NS_PER_SEC)
+            return True
+
+    def is_active(self, key):
+        """키가 반복 중인지 확인"""
+        entry = self._entries.get(key)
+        return entry is not None and not entry.cancelled
+
+    def active_keys(self):
+        """반복 중인 키 목록 반환"""
+        with self._cond:
+            return [key for key, entry in self._entries.items() if not entry.cancelled]
+
+    def get_repeat_count(self, key):
+        """키의 반복 횟수 반환"""
+        entry = self._entries.get(key)
+        return entry.repeat_count if entry is not None else 0
+
+    def get_achieved_rate(self, key=None):
+        """
+        실제 반복 속도(Hz) 반환
+
+        Args:
+            key: 특정 키의 속도를 구할 때 지정, None이면 반복 중인 모든 키의 평균
+        """
+        with self._cond:
+            if key is not None:
+                entries = [self._entries[key]] if key in self._entries else []
+            else:
+                entries = [entry for entry in self._entries.values() if not entry.cancelled]
+            intervals = [entry.interval_ema_ns for entry in entries if entry.interval_ema_ns > 0]
+
+        if not intervals:
+            return 0.0
+        return NS_PER_SEC / (sum(intervals) / len(intervals))
+
+    def get_stats(self):
+        """스케줄러 통계 반환 (깨어난 횟수, CPU 사용 시간, 목표/실제 속도, 주입 지연)"""
+        return {
+            "active_keys": len(self.active_keys()),
+            "wakeups": self.wakeups,
+            "cpu_ms": self.cpu_ns / 1_000_000,
+            "target_hz": NS_PER_SEC / self.period_ns,
+            "achieved_hz": self.get_achieved_rate(),
+            "press_latency_us": self.press_latency_ns / 1000,
+            "release_latency_us": self.release_latency_ns / 1000,
+            "start_latency_ms": self.start_latency.last_ns / 1_000_000,
+        }
+
+    def is_alive(self):
+        """스케줄러 스레드 동작 여부 확인"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def close(self, timeout=0.05):
+        """
+        모든 반복을 중지하고 스케줄러 스레드 종료
+
+        눌린 키의 해제와 스레드 종료를 합쳐 timeout초 안에 끝냅니다.
+
+        Returns:
+            bool: 제시간에 해제와 종료가 모두 끝났으면 True
+        """
+        deadline = time.perf_counter_ns() + seconds_to_ns(timeout)
+        self.stop_all()
+        drained = self.wait_idle(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(max(deadline - time.perf_counter_ns(), 0) / NS_PER_SEC)
+            return drained and not thread.is_alive()
+        return drained
+
+    def _cancel(self, entry):
+        """항목 취소 및 즉시 해제 이벤트 예약 (락 보유 상태에서 호출)"""
+        entry.cancelled = True
+        entry.generation += 1
+        self._push(time.perf_counter_ns(), entry, PHASE_RELEASE)
+
+    def _push(self, deadline, entry, phase):
+        """이벤트 예약 (락 보유 상태에서 호출)"""
+        heapq.heappush(self._heap, (deadline, next(self._seq), entry, entry.generation, phase))
+
+    def _ensure_thread(self):
+        """스케줄러 스레드가 없으면 시작 (락 보유 상태에서 호출)"""
+        if self._thread is None or not self._thread.is_alive():
+            self._closed = False
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def restart(self):
+        """
+        스케줄러 스레드를 다시 시작
+
+        스레드가 이벤트를 처리하던 중 종료되었을 수 있으므로 반복 중인 모든 키의
+        다음 이벤트를 지금 시각으로 다시 예약합니다 (이전 예약은 세대 번호로 무효화).
+        """
+        with self._cond:
+            now = time.perf_counter_ns()
+            for entry in self._entries.values():
+                entry.generation += 1
+                entry.cycle_ns = now
+                if entry.cancelled:
+                    self._push(now, entry, PHASE_RELEASE)
+                else:
+                    self._push(now, entry, PHASE_RELEASE if entry.is_down else PHASE_PRESS)
+            self._ensure_thread()
+            self._cond.notify()
+
+    def _run(self):
+        """스케줄러 스레드 함수 - 예기치 않은 예외로 종료되면 on_thread_exit로 알림"""
+        try:
+            self._run_loop()
+        except Exception as e:
+            traceback.print_exc()
+            with self._cond:
+                if self._thread is threading.current_thread():
+                    self._thread = None
+            if self.on_thread_exit:
+                try:
+                    self.on_thread_exit(e)
+                except Exception:
+                    traceback.print_exc()
+
+    def _run_loop(self):
+        """스케줄러 루프 - 가장 가까운 데드라인까지 대기 후 실행"""
+        heap = self._heap
+        cpu_start = time.thread_time_ns()
+        while True:
+            with self._cond:
+                while True:
+                    self.cpu_ns = time.thread_time_ns() - cpu_start
+                    if self._closed:
+                        return
+                    if not heap:
+                        # 반복할 키가 없으면 시작/중지 요청이 올 때까지 대기 (주기적 깨어남 없음)
+                        self._cond.wait()
+                        self.wakeups += 1
+                        continue
+
+                    deadline, _, entry, generation, phase = heap[0]
+                    # 취소/재시작으로 무효가 된 이벤트는 버림
+                    if generation != entry.generation:
+                        heapq.heappop(heap)
+                        continue
+
+                    remaining = deadline - time.perf_counter_ns()
+                    if remaining <= 0:
+                        heapq.heappop(heap)
+                        break
+                    # 다음 데드라인까지 차단 대기 (바쁜 대기 없음)
+                    self._cond.wait(remaining / NS_PER_SEC)
+                    self.wakeups += 1
+
+            # 키 주입은 락 밖에서 수행
+            self._fire(entry, generation, phase)
+
+    def _fire(self, entry, generation, phase):
+        """예약된 이벤트 실행"""
+        key = entry.key
+
+        # 취소된 항목: 눌려 있으면 해제하고 제거
+        if entry.cancelled:
+            if entry.is_down:
+                try:
+                    self.release_func(key)
+                except Exception as e:
+                    log.warning("키 '%s' 해제 실패: %s", key, e)
+                entry.is_down = False
+            with self._cond:
+                if entry.cancelled and self._entries.get(key) is entry:
+                    del self._entries[key]
+                    self._drained.notify_all()
+            return
+
+        try:
+            alpha = self.ema_alpha
+            if phase == PHASE_PRESS:
+                started = time.perf_counter_ns()
+                self.press_func(key)
+                finished = time.perf_counter_ns()
+                entry.is_down = True
+
+                # 주입 지연과 실제 누름 간격 측정
+                self.press_latency_ns += int(alpha * ((finished - started) - self.press_latency_ns))
+                if entry.last_press_ns:
+                    interval = finished - entry.last_press_ns
+                    if entry.interval_ema_ns:
+                        entry.interval_ema_ns += int(alpha * (interval - entry.interval_ema_ns))
+                    else:
+                        entry.interval_ema_ns = interval
+                entry.last_press_ns = finished
+                if entry.trigger_ns:
+                    self.start_latency.record(finished - entry.trigger_ns)
+                    entry.trigger_ns = 0
+
+                next_deadline = entry.cycle_ns + self.hold_ns
+                if self.compensate_latency:
+                    next_deadline -= self.release_latency_ns
+                next_phase = PHASE_RELEASE
+            else:
+                started = time.perf_counter_ns()
+                self.release_func(key)
+                finished = time.perf_counter_ns()
+                entry.is_down = False
+                entry.repeat_count += 1
+                self.release_latency_ns += int(alpha * ((finished - started) - self.release_latency_ns))
+
+                # 다음 주기의 누름 시각은 이전 주기 기준으로 계산 (지연 누적 방지)
+                entry.cycle_ns += self.period_ns
+                behind = finished - entry.cycle_ns
+                if behind >= self.period_ns:
+                    # 한 주기 이상 밀렸으면 놓친 주기는 건너뜀
+                    entry.cycle_ns += (behind // self.period_ns) * self.period_ns
+
+                next_deadline = entry.cycle_ns
+                if self.compensate_latency:
+                    next_deadline -= self.press_latency_ns
+                next_phase = PHASE_PRESS
+            entry.retry_count = 0
+        except Exception as e:
+            entry.retry_count += 1
+            log.warning("키 '%s' 입력 실패 (%d/%d): %s", key, entry.retry_count, self.max_retries, e)
+            try:
+                self.release_func(key)
+            except Exception:
+                pass
+            entry.is_down = False
+
+            if entry.retry_count >= self.max_retries:
+                self._finish(entry, generation)
+                return
+            next_deadline = time.perf_counter_ns() + self.retry_delay_ns
+            entry.cycle_ns = next_deadline
+            next_phase = PHASE_PRESS
+
+        with self._cond:
+            if generation == entry.generation:
+                self._push(next_deadline, entry, next_phase)
+
+    def _finish(self, entry, generation):
+        """최대 재시도 초과로 반복 종료"""
+        with self._cond:
+            if generation != entry.generation:
+                return
+            entry.cancelled = True
+            entry.generation += 1
+            if self._entries.get(entry.key) is entry:
+                del self._entries[entry.key]
+
+        if self.on_finished:
+            try:
+                self.on_finished(entry.key)
+            except Exception:
+                traceback.print_exc()
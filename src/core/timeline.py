@@ -0,0 +1,201 @@
+"""
+입력 타임라인 모듈
+
+녹화한 키보드/마우스 이벤트를 고정 크기 이진 기록으로 저장하는 형식을 정의합니다.
+- 기록 하나는 16바이트입니다: 종류(1), 플래그(1), 코드(2), x(4), y(4), 이전 기록과의 시간 차(4, 나노초).
+- 기록은 bytearray 하나에 이어 붙이므로 이벤트마다 객체를 만들지 않습니다.
+  10분 동안 마우스를 계속 움직여도 (4ms 간격) 약 2.4MB입니다.
+- 키 코드는 파일 끝의 키 이름 표 색인입니다. FLAG_VK가 있는 기록은 코드가 가상 키 코드입니다.
+- 시간 차가 약 4.29초(uint32 최댓값)를 넘으면 그 사이에 EVENT_IDLE 기록을 넣어 나눕니다.
+
+파일 구조:
+    헤더 (HEADER) | 기록 count개 (RECORD) | 키 이름 표 (UTF-8, NUL 구분)
+
+불러올 때는 파일을 한 번 읽고 기록 영역을 memoryview로 가리키기만 하므로
+기록 수와 관계없이 거의 바로 끝납니다. 긴 매크로는 Timeline.open()으로 파일을
+메모리 매핑하면 파일을 읽지도 않고 필요한 부분만 운영체제가 페이지 단위로 읽어 옵니다.
+"""
+import mmap
+import struct
+import time
+
+MAGIC = b"AITL"
+VERSION = 1
+
+# 매직, 버전, 기록 크기, 기록 수, 녹화 시작 시각(time.time_ns), 키 이름 표 크기
+HEADER = struct.Struct("<4sHHQQI")
+
+# 종류, 플래그, 코드, x, y, 이전 기록과의 시간 차(ns)
+RECORD = struct.Struct("<BBhiiI")
+
+# 기록 하나에 담을 수 있는 최대 시간 차 (ns)
+MAX_DELTA_NS = 0xFFFFFFFF
+
+# 이벤트 종류
+EVENT_IDLE = 0        # 시간만 흐름 (긴 대기를 나누는 용도)
+EVENT_KEY_DOWN = 1    # code: 키
+EVENT_KEY_UP = 2      # code: 키
+EVENT_MOUSE_MOVE = 3  # x, y: 커서 위치
+EVENT_MOUSE_DOWN = 4  # code: 버튼, x, y: 커서 위치
+EVENT_MOUSE_UP = 5    # code: 버튼, x, y: 커서 위치
+EVENT_WHEEL = 6       # code: 휠 이동량 (120 = 한 칸), x, y: 커서 위치
+EVENT_KEY_TAP = 7     # code: 키 - 누름 직후 해제 (매크로 컴파일러가 만듦)
+EVENT_CLICK = 8       # code: 버튼, x, y: 커서 위치 - 누름 직후 해제 (매크로 컴파일러가 만듦)
+
+EVENT_NAMES = ("idle", "key_down", "key_up", "mouse_move", "mouse_down", "mouse_up", "wheel", "key_tap", "click")
+
+# 플래그
+FLAG_VK = 0x01  # code가 키 이름 표 색인이 아니라 가상 키 코드
+
+# 마우스 버튼 코드
+MOUSE_BUTTONS = ("left", "right", "middle")
+
+class Timeline:
+    """
+    녹화된 입력 이벤트 목록
+
+    records는 RECORD 형식 기록을 이어 붙인 바이트열(bytes, bytearray, memoryview)이며
+    복사하지 않고 그대로 보관합니다.
+    """
+
+    def __init__(self, records=b"", names=(), created_ns=0):
+        """
+        Args:
+            records: RECORD 형식 기록을 이어 붙인 바이트열
+            names (sequence): 키 이름 표 (키 기록의 code가 가리키는 이름)
+            created_ns (int): 녹화 시작 시각 (time.time_ns)
+
+        Raises:
+            ValueError: 기록 영역 크기가 RECORD 크기의 배수가 아님
+        """
+        if len(records) % RECORD.size:
+            raise ValueError(f"기록 영역 크기가 {RECORD.size}의 배수가 아닙니다: {len(records)}")
+        self.records = records
+        self.names = tuple(names)
+        self.created_ns = created_ns or time.time_ns()
+        self._duration_ns = None
+        self._mapped = None           # open()으로 연 경우 메모리 매핑 객체
+
+    def __len__(self):
+        return len(self.records) // RECORD.size
+
+    def __iter__(self):
+        """(종류, 플래그, 코드, x, y, 시간 차) 튜플을 순서대로 반환"""
+        return RECORD.iter_unpack(self.records)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("타임라인 색인 범위 초과")
+        return RECORD.unpack_from(self.records, index * RECORD.size)
+
+    @property
+    def duration_ns(self):
+        """첫 기록부터 마지막 기록까지의 시간 (ns)"""
+        if self._duration_ns is None:
+            self._duration_ns = sum(record[5] for record in self)
+        return self._duration_ns
+
+    @property
+    def nbytes(self):
+        """파일로 저장했을 때의 크기 (바이트)"""
+        return HEADER.size + len(self.records) + len(self._names_blob())
+
+    def key_name(self, flags, code):
+        """키 기록의 키 이름 반환"""
+        if flags & FLAG_VK:
+            from src.core.input_backend import KEY_NAMES
+            return KEY_NAMES[code]
+        return self.names[code]
+
+    def _names_blob(self):
+        return "\0".join(self.names).encode("utf-8")
+
+    def to_bytes(self):
+        """파일 형식 바이트열로 변환"""
+        names = self._names_blob()
+        header = HEADER.pack(MAGIC, VERSION, RECORD.size, len(self), self.created_ns, len(names))
+        return b"".join((header, self.records, names))
+
+    def save(self, path):
+        """파일로 저장"""
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        파일 형식 바이트열에서 생성 (기록 영역은 복사하지 않음)
+
+        Raises:
+            ValueError: 타임라인 파일이 아니거나 잘린 파일
+        """
+        if len(data) < HEADER.size:
+            raise ValueError("헤더가 잘렸습니다")
+        magic, version, record_size, count, created_ns, names_size = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("타임라인 파일이 아닙니다")
+        if version != VERSION or record_size != RECORD.size:
+            raise ValueError(f"지원하지 않는 버전입니다: {version} (기록 크기 {record_size})")
+
+        start = HEADER.size
+        end = start + count * RECORD.size
+        if len(data) < end + names_size:
+            raise ValueError("기록 영역이 잘렸습니다")
+        view = memoryview(data)
+        names_blob = bytes(view[end:end + names_size])
+        names = names_blob.decode("utf-8").split("\0") if names_size else ()
+        return cls(view[start:end], names, created_ns)
+
+    @classmethod
+    def load(cls, path):
+        """파일에서 불러오기"""
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+    @classmethod
+    def open(cls, path):
+        """
+        파일을 메모리 매핑으로 열기 (헤더와 키 이름 표만 읽고 바로 반환)
+
+        기록은 순회할 때 운영체제가 필요한 페이지만 읽어 오므로 파일 크기와 관계없이
+        메모리 사용량이 일정합니다. 다 쓴 뒤에는 close()를 호출합니다.
+        """
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            timeline = cls.from_bytes(mapped)
+        except ValueError:
+            mapped.close()
+            raise
+        timeline._mapped = mapped
+        return timeline
+
+    def close(self):
+        """메모리 매핑 해제 (open()으로 연 경우만)"""
+        mapped = self._mapped
+        if mapped is None:
+            return
+        self._mapped = None
+        records = self.records
+        self.records = b""
+        try:
+            records.release()
+            mapped.close()
+        except BufferError:
+            # 아직 순회 중인 기록이 있으면 참조가 사라질 때 해제됨
+            pass
+
+    def get_stats(self):
+        """기록 수, 길이, 크기, 종류별 개수 반환"""
+        counts = [0] * len(EVENT_NAMES)
+        for record in self:
+            counts[record[0]] += 1
+        return {
+            "events": len(self),
+            "duration_s": self.duration_ns / 1e9,
+            "bytes": self.nbytes,
+            "keys": len(self.names),
+            **{name: count for name, count in zip(EVENT_NAMES, counts)},
+        }
@@ -0,0 +1,134 @@
+"""
+정밀 타이밍 모듈
+
+perf_counter_ns 기반의 절대 데드라인 대기 기능을 제공합니다.
+상대 지연(time.sleep)을 누적하지 않고 절대 시각을 기준으로 대기하므로
+작업 자체의 소요 시간이나 OS 대기 오차가 다음 주기로 누적되지 않습니다.
+"""
+import sys
+import time
+from array import array
+
+from src.utils.fast_log import get_logger
+
+log = get_logger("Timing")
+
+NS_PER_SEC = 1_000_000_000
+
+def now_ns():
+    """현재 단조 시각 반환 (나노초)"""
+    return time.perf_counter_ns()
+
+def seconds_to_ns(seconds):
+    """초 단위 값을 나노초 정수로 변환"""
+    return int(round(seconds * NS_PER_SEC))
+
+def sleep_until(deadline_ns, stop_event=None, spin_ns=0):
+    """
+    지정된 절대 시각(perf_counter_ns 기준)까지 대기합니다.
+
+    spin_ns를 지정하면 데드라인 spin_ns 전까지만 OS 대기를 하고, 남은 구간은
+    바쁜 대기(스핀)로 채워 OS 대기 오차 없이 데드라인을 맞춥니다.
+
+    Args:
+        deadline_ns (int): 대기를 마칠 절대 시각 (나노초)
+        stop_event (threading.Event): 설정되면 즉시 대기를 중단할 이벤트
+        spin_ns (int): 데드라인 직전 바쁜 대기로 처리할 구간 (나노초)
+
+    Returns:
+        bool: 데드라인까지 대기했으면 True, 중단 신호로 깨어났으면 False
+    """
+    perf_counter_ns = time.perf_counter_ns
+    while True:
+        remaining = deadline_ns - perf_counter_ns()
+        if remaining <= 0:
+            return True
+
+        if remaining <= spin_ns:
+            # 스핀 구간: 중단 신호만 확인하며 데드라인까지 바쁜 대기
+            while perf_counter_ns() < deadline_ns:
+                if stop_event is not None and stop_event.is_set():
+                    return False
+            return True
+
+        timeout = (remaining - spin_ns) / NS_PER_SEC
+        if stop_event is not None:
+            if stop_event.wait(timeout):
+                return False
+        else:
+            time.sleep(timeout)
+
+class high_resolution_timer:
+    """
+    Windows 타이머 해상도를 1ms로 높이는 컨텍스트 관리자
+
+    Windows의 기본 타이머 해상도(약 15.6ms)에서는 짧은 대기가 크게 늦어지므로
+    짧은 간격으로 동작하는 동안에만 timeBeginPeriod(1)을 적용합니다.
+    다른 운영체제에서는 아무 일도 하지 않습니다.
+    """
+
+    def __init__(self, period_ms=1):
+        self.period_ms = period_ms
+        self._winmm = None
+
+    def __enter__(self):
+        if sys.platform == "win32":
+            try:
+                import ctypes
+                self._winmm = ctypes.WinDLL("winmm")
+                self._winmm.timeBeginPeriod(self.period_ms)
+            except Exception as e:
+                log.warning("타이머 해상도 설정 실패: %s", e)
+                self._winmm = None
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._winmm is not None:
+            self._winmm.timeEndPeriod(self.period_ms)
+            self._winmm = None
+        return False
+
+def percentile(sorted_values, p):
+    """
+    정렬된 값 목록에서 백분위수를 반환합니다 (최근접 순위 방식).
+
+    Args:
+        sorted_values (list): 오름차순으로 정렬된 값 목록
+        p (float): 백분위 (0-100)
+    """
+    if not sorted_values:
+        return 0
+    index = min(int(len(sorted_values) * p / 100), len(sorted_values) - 1)
+    return sorted_values[index]
+
+class LatencyRecorder:
+    """
+    지연 시간 기록기
+
+    최근 size개의 지연 시간(나노초)을 고정 크기 배열에 기록하고
+    백분위수 요약을 제공합니다. 기록은 배열 한 칸 쓰기뿐이므로
+    입력 주입 경로에서 호출해도 부담이 없습니다.
+    """
+
+    def __init__(self, size=256):
+        self.size = size
+        self.count = 0
+        self.last_ns = 0
+        self._values = array('q', bytes(8 * size))
+
+    def record(self, latency_ns):
+        """지연 시간 기록"""
+        self._values[self.count % self.size] = latency_ns
+        self.count += 1
+        self.last_ns = latency_ns
+
+    def get_summary(self):
+        """최근 기록의 요약 반환 (밀리초 단위)"""
+        used = sorted(self._values[:min(self.count, self.size)])
+        return {
+            "count": self.count,
+            "last_ms": self.last_ns / 1_000_000,
+            "p50_ms": percentile(used, 50) / 1_000_000,
+            "p95_ms": percentile(used, 95) / 1_000_000,
+            "max_ms": (used[-1] if used else 0) / 1_000_000,
+        }
@@ -16,6 +16,9 @@ from src.core.mouse_position import get_mouse_position
 from src.core.mouse_click import click_at_position
 from src.core.keyboard_control import keyboard_controller
 from src.utils.admin_check import is_admin, run_as_admin
+from src.utils.fast_log import get_logger
+
+log = get_logger("AutoClickerApp")
 
 class AutoClickerApp:
     def __init__(self, root):
@@ -75,16 +78,16 @@ class AutoClickerApp:
             # 앱이 종료될 때 단축키 해제를 위한 프로토콜 설정
             self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
             
-            print("GUI: 애플리케이션 초기화 완료")
+            log.debug("애플리케이션 초기화 완료")
             
         except Exception as e:
-            print(f"GUI: 애플리케이션 초기화 중 오류: {e}")
+            log.error("애플리케이션 초기화 중 오류: %s", e)
             import traceback
             traceback.print_exc()
             try:
                 messagebox.showerror("오류", f"프로그램 초기화 중 오류가 발생했습니다.\n{str(e)}")
             except:
-                print("GUI: 메시지박스 표시 실패")
+                log.warning("메시지박스 표시 실패")
     
     def _setup_styles(self):
         """스타일 설정"""
@@ -97,7 +100,7 @@ class AutoClickerApp:
             style.configure("Red.TLabel", foreground="red", font=("맑은 고딕", 12, "bold"))
             style.configure("Large.TButton", font=("맑은 고딕", 14))  # 큰 버튼 스타일
         except Exception as e:
-            print(f"GUI: 스타일 설정 중 오류: {e}")
+            log.error("스타일 설정 중 오류: %s", e)
     
     def _start_timers(self):
         """애플리케이션 타이머 시작"""
@@ -108,28 +111,28 @@ class AutoClickerApp:
             # 활성 키 갱신 타이머
             self.update_active_keys_timer()
         except Exception as e:
-            print(f"GUI: 타이머 시작 중 오류: {e}")
+            log.error("타이머 시작 중 오류: %s", e)
     
     def on_closing(self):
         """앱 종료 시 단축키 해제 및 정리"""
         try:
-            print("앱 종료 요청됨 - 정리 시작...")
+            log.debug("앱 종료 요청됨 - 정리 시작...")
             
             # 모든 키보드 후킹 해제 시도
             try:
-                print("키보드 후킹 해제 중...")
+                log.debug("키보드 후킹 해제 중...")
                 keyboard.unhook_all()  # 모든 단축키 해제
             except Exception as e:
-                print(f"키보드 후킹 해제 중 오류: {e}")
+                log.error("키보드 후킹 해제 중 오류: %s", e)
                 
             # 클릭 중지
             if self.running:
-                print("자동 클릭 중지 중...")
+                log.debug("자동 클릭 중지 중...")
                 self.running = False  # 클릭 중단
                 
             # 모든 키 반복 중지 시도
             try:
-                print("키 반복 중지 중...")
+                log.debug("키 반복 중지 중...")
                 # 키보드 모드 비활성화
                 keyboard_controller.reset_all_states()  # 전체 초기화로 변경
                 
@@ -140,14 +143,14 @@ class AutoClickerApp:
                     except:
                         pass
             except Exception as e:
-                print(f"키 반복 중지 중 오류: {e}")
+                log.error("키 반복 중지 중 오류: %s", e)
                 
             # 스레드 종료를 위한 짧은 대기
-            print("정리 완료 대기...")
+            log.debug("정리 완료 대기...")
             time.sleep(0.2)
-            print("앱 종료 준비 완료")
+            log.debug("앱 종료 준비 완료")
         except Exception as e:
-            print(f"앱 종료 처리 중 오류: {e}")
+            log.error("앱 종료 처리 중 오류: %s", e)
         finally:
             self.root.destroy()
     
@@ -478,7 +481,7 @@ class AutoClickerApp:
                 y += widget.winfo_rooty() + 20
                 self.tooltip_label.place(x=x, y=y)
             except Exception as e:
-                print(f"툴팁 표시 오류: {e}")
+                log.error("툴팁 표시 오류: %s", e)
         
         def leave(event):
             try:
@@ -486,7 +489,7 @@ class AutoClickerApp:
                 if hasattr(self, 'tooltip_label') and self.tooltip_label:
                     self.tooltip_label.place_forget()
             except Exception as e:
-                print(f"툴팁 숨기기 오류: {e}")
+                log.error("툴팁 숨기기 오류: %s", e)
         
         # 이벤트 바인딩
         widget.bind("<Enter>", enter)
@@ -507,7 +510,7 @@ class AutoClickerApp:
             
             # 모드가 이미 활성화되어 있다면 자동으로 테스트 실행
             if keyboard_controller.is_mode_active():
-                print(f"GUI: 키 '{key}' 활성화 후 자동 테스트 시도")
+                log.debug("키 '%s' 활성화 후 자동 테스트 시도", key)
                 self.root.after(100, self._test_key_press)
         else:
             self.key_buttons[key].config(bg="#f0f0f0", relief=tk.RAISED)  # 비활성화: 기본 색상
@@ -543,7 +546,7 @@ class AutoClickerApp:
             # 타이머 설정
             self._msg_timer_id = self.root.after(duration, self._hide_temp_message)
         except Exception as e:
-            print(f"임시 메시지 표시 중 오류: {e}")
+            log.error("임시 메시지 표시 중 오류: %s", e)
     
     def _hide_temp_message(self):
         """임시 메시지 숨기기"""
@@ -552,7 +555,7 @@ class AutoClickerApp:
                 self.temp_message_label.place_forget()
             self._msg_timer_id = None
         except Exception as e:
-            print(f"임시 메시지 숨기기 중 오류: {e}")
+            log.error("임시 메시지 숨기기 중 오류: %s", e)
     
     def update_key_button_styles(self):
         """활성화된 키에 따라 버튼 스타일 업데이트"""
@@ -578,7 +581,7 @@ class AutoClickerApp:
             # GUI 업데이트를 강제로 처리
             self.root.update_idletasks()
         except Exception as e:
-            print(f"GUI: 버튼 스타일 업데이트 중 오류: {e}")
+            log.error("버튼 스타일 업데이트 중 오류: %s", e)
             import traceback
             traceback.print_exc()
         
@@ -589,7 +592,7 @@ class AutoClickerApp:
             self.current_x, self.current_y = x, y
             self.position_label.config(text=f"X: {x}, Y: {y}")
         except Exception as e:
-            print(f"마우스 위치 추적 오류: {e}")
+            log.error("마우스 위치 추적 오류: %s", e)
         
         # 100ms마다 업데이트
         self.root.after(100, self.track_mouse_position)
@@ -613,7 +616,7 @@ class AutoClickerApp:
         """키보드 연속 입력 모드 활성화/비활성화 (버튼에서 호출)"""
         try:
             if not self.is_processing_hotkey:
-                print("DEBUG: 키보드 모드 토글 버튼 클릭됨")
+                log.debug("키보드 모드 토글 버튼 클릭됨")
                 self.is_processing_hotkey = True
                 
                 # 먼저 UI 상태 업데이트 (사용자 피드백)
@@ -622,10 +625,10 @@ class AutoClickerApp:
                 self.root.update_idletasks()
                 
                 # 지연 처리로 변경 - 직접 호출하지 않고 이벤트 큐에 넣기
-                print("DEBUG: 키보드 모드 토글 - 이벤트 큐에 처리 함수 등록")
+                log.debug("키보드 모드 토글 - 이벤트 큐에 처리 함수 등록")
                 self.root.after(10, self._process_toggle_key_repeat)
         except Exception as e:
-            print(f"DEBUG: 토글 버튼 처리 중 오류: {e}")
+            log.error("토글 버튼 처리 중 오류: %s", e)
             import traceback
             traceback.print_exc()
             self.is_processing_hotkey = False
@@ -638,43 +641,43 @@ class AutoClickerApp:
         """토글 처리"""
         try:
             # 로그 출력 강화
-            print("DEBUG: 키보드 모드 토글 처리 시작")
+            log.debug("키보드 모드 토글 처리 시작")
             
             # 현재 상태 확인
             current_state = keyboard_controller.is_mode_active()
-            print(f"DEBUG: 현재 모드 상태: {current_state}")
+            log.debug("현재 모드 상태: %s", current_state)
             
             # 안정적인 처리를 위해 키보드 훅 일시 중지 시도
             try:
-                print("DEBUG: 키보드 훅 일시 중지")
+                log.debug("키보드 훅 일시 중지")
                 keyboard.unhook_all()
             except Exception as e:
-                print(f"DEBUG: 키보드 훅 중지 오류: {e}")
+                log.error("키보드 훅 중지 오류: %s", e)
             
             # 모든 키 강제 해제 
             try:
-                print("DEBUG: 모드 전환 전 모든 키 해제 시도")
+                log.debug("모드 전환 전 모든 키 해제 시도")
                 keyboard_controller.reset_all_states()
             except Exception as e:
-                print(f"DEBUG: 키 해제 중 오류: {e}")
+                log.error("키 해제 중 오류: %s", e)
             
             # 토글 명령 실행
             try:
-                print(f"DEBUG: 모드 토글 시도 - 현재 상태: {current_state} -> {not current_state}")
+                log.debug("모드 토글 시도 - 현재 상태: %s -> %s", current_state, not current_state)
                 if current_state:
                     # 비활성화
                     result = keyboard_controller.enable_mode(False)
-                    print(f"DEBUG: 모드 비활성화 결과: {result}")
+                    log.debug("모드 비활성화 결과: %s", result)
                 else:
                     # 활성화
                     result = keyboard_controller.enable_mode(True)
-                    print(f"DEBUG: 모드 활성화 결과: {result}")
+                    log.debug("모드 활성화 결과: %s", result)
                     
                 # 현재 상태 다시 확인
                 new_state = keyboard_controller.is_mode_active()
-                print(f"DEBUG: 모드 토글 후 상태: {new_state}")
+                log.debug("모드 토글 후 상태: %s", new_state)
             except Exception as e:
-                print(f"DEBUG: 모드 토글 실행 오류: {e}")
+                log.error("모드 토글 실행 오류: %s", e)
                 import traceback
                 traceback.print_exc()
                 
@@ -684,10 +687,10 @@ class AutoClickerApp:
             
             # 키보드 훅 다시 설정
             try:
-                print("DEBUG: 키보드 훅 재설정")
+                log.debug("키보드 훅 재설정")
                 self._setup_keyboard_hooks()
             except Exception as e:
-                print(f"DEBUG: 키보드 훅 재설정 오류: {e}")
+                log.error("키보드 훅 재설정 오류: %s", e)
             
             # UI 업데이트
             self.update_repeat_status(new_state)
@@ -703,7 +706,7 @@ class AutoClickerApp:
                 self.show_temp_message("키보드 연속 입력 모드가 비활성화되었습니다", 3000)
             
         except Exception as e:
-            print(f"DEBUG: 모드 토글 처리 오류: {e}")
+            log.error("모드 토글 처리 오류: %s", e)
             import traceback
             traceback.print_exc()
             
@@ -718,12 +721,12 @@ class AutoClickerApp:
                 pass
         finally:
             # 무조건 플래그 해제
-            print("DEBUG: 키보드 모드 토글 처리 완료")
+            log.debug("키보드 모드 토글 처리 완료")
             self.is_processing_hotkey = False
     
     def update_repeat_status(self, active):
         """연속 입력 모드 상태 업데이트"""
-        print(f"DEBUG: UI 상태 업데이트 - 모드 활성화 상태: {active}")
+        log.debug("UI 상태 업데이트 - 모드 활성화 상태: %s", active)
         if active:
             self.key_repeat_btn.config(text="키보드 연속 입력 비활성화 (F7)")
             self.key_repeat_status.config(text="활성화", style="Green.TLabel")
@@ -737,7 +740,7 @@ class AutoClickerApp:
             self.update_key_button_styles()
             self.root.after(200, self.update_active_keys_timer)  # 200ms마다 갱신
         except Exception as e:
-            print(f"활성 키 업데이트 중 오류: {e}")
+            log.error("활성 키 업데이트 중 오류: %s", e)
             # 오류 발생 시에도 타이머 계속 실행
             self.root.after(500, self.update_active_keys_timer)
     
@@ -750,7 +753,7 @@ class AutoClickerApp:
                 self.click_counter.config(text=f"클릭 횟수: {self.click_count}")
                 time.sleep(self.click_interval)
             except Exception as e:
-                print(f"클릭 오류: {e}")
+                log.error("클릭 오류: %s", e)
                 time.sleep(0.5)
     
     def increase_interval(self):
@@ -781,7 +784,7 @@ class AutoClickerApp:
         try:
             self.toggle_clicking()
         except Exception as e:
-            print(f"클릭 토글 처리 중 오류: {e}")
+            log.error("클릭 토글 처리 중 오류: %s", e)
         finally:
             # 처리 완료 후 플래그 해제
             self.is_processing_hotkey = False
@@ -796,9 +799,9 @@ class AutoClickerApp:
         """GUI 스레드에서 실행되는 카운터 초기화 처리"""
         try:
             self.reset_counter()
-            print("GUI: 클릭 카운터 초기화 완료")
+            log.debug("클릭 카운터 초기화 완료")
         except Exception as e:
-            print(f"카운터 초기화 중 오류: {e}")
+            log.error("카운터 초기화 중 오류: %s", e)
         finally:
             # 처리 완료 후 플래그 해제
             self.is_processing_hotkey = False
@@ -808,12 +811,12 @@ class AutoClickerApp:
         try:
             # 이미 처리 중이면 무시
             if self.is_processing_hotkey:
-                print("DEBUG: 이미 핫키 처리 중 - 무시됨")
+                log.debug("이미 핫키 처리 중 - 무시됨")
                 return
             
             # 처리 중 플래그 설정
             self.is_processing_hotkey = True
-            print("DEBUG: F7 키 감지됨 - 모드 토글 시작")
+            log.debug("F7 키 감지됨 - 모드 토글 시작")
             
             # 먼저 UI 상태 업데이트 (사용자 피드백)
             self.key_repeat_status.config(text="처리 중...", foreground="orange")
@@ -823,17 +826,17 @@ class AutoClickerApp:
             # 안전한 지연 시간 적용하여 메인 스레드에서 처리
             try:
                 # 짧은 대기 후 처리 (10ms -> 100ms)
-                print("DEBUG: F7 - 이벤트 큐에 토글 처리 등록")
+                log.debug("F7 - 이벤트 큐에 토글 처리 등록")
                 self.root.after(100, self._process_toggle_key_repeat)
             except Exception as e:
-                print(f"DEBUG: after 메소드 호출 오류: {e}")
+                log.error("after 메소드 호출 오류: %s", e)
                 # 오류 발생 시 플래그 해제
                 self.is_processing_hotkey = False
                 # UI 복원
                 self.key_repeat_status.config(text="오류", foreground="red")
                 self.key_repeat_btn.config(state="normal")
         except Exception as e:
-            print(f"DEBUG: F7 단축키 처리 오류: {e}")
+            log.error("F7 단축키 처리 오류: %s", e)
             import traceback
             traceback.print_exc()
             # 오류 발생 시 플래그 해제
@@ -845,14 +848,14 @@ class AutoClickerApp:
     def _setup_keyboard_hooks(self):
         """키보드 이벤트 훅 설정"""
         try:
-            print("DEBUG: 키보드 이벤트 설정 시작")
+            log.debug("키보드 이벤트 설정 시작")
             
             # 기존 훅 제거 (중복 방지)
             try:
                 keyboard.unhook_all()
-                print("DEBUG: 기존 키보드 훅 제거됨")
+                log.debug("기존 키보드 훅 제거됨")
             except Exception as e:
-                print(f"DEBUG: 기존 키보드 훅 제거 실패: {e}")
+                log.warning("기존 키보드 훅 제거 실패: %s", e)
             
             # 단축키 시도 전 짧은 대기 (안정성 위해)
             time.sleep(0.1)
@@ -860,15 +863,15 @@ class AutoClickerApp:
             # F7 키는 모드 토글용 - 직접 등록 방식 사용
             try:
                 keyboard.add_hotkey('f7', lambda: self.root.after(1, self.safe_toggle_key_repeat))
-                print("DEBUG: F7 키 핫키 등록 성공")
+                log.debug("F7 키 핫키 등록 성공")
             except Exception as e:
-                print(f"DEBUG: F7 키 등록 실패: {e}")
+                log.warning("F7 키 등록 실패: %s", e)
                 # 대체 방법으로 시도
                 try:
                     keyboard.on_press_key('f7', lambda e: self.root.after(1, self.safe_toggle_key_repeat))
-                    print("DEBUG: F7 키 대체 방식으로 등록 성공")
+                    log.debug("F7 키 대체 방식으로 등록 성공")
                 except Exception as ex:
-                    print(f"DEBUG: F7 키 대체 등록 실패: {ex}")
+                    log.warning("F7 키 대체 등록 실패: %s", ex)
             
             # 기타 단축키와 키 이벤트 후킹 등록 (간소화)
             try:
@@ -876,11 +879,11 @@ class AutoClickerApp:
                 self._register_hotkey('f8', self.safe_reset_counter)
                 self._setup_key_hooks()
             except Exception as e:
-                print(f"DEBUG: 기타 키 이벤트 설정 오류: {e}")
+                log.error("기타 키 이벤트 설정 오류: %s", e)
             
-            print("DEBUG: 키보드 이벤트 설정 완료")
+            log.debug("키보드 이벤트 설정 완료")
         except Exception as e:
-            print(f"DEBUG: 키보드 이벤트 설정 중 오류: {e}")
+            log.error("키보드 이벤트 설정 중 오류: %s", e)
             import traceback
             traceback.print_exc()
             messagebox.showerror("오류", "키보드 이벤트 설정에 실패했습니다.")
@@ -910,20 +913,20 @@ class AutoClickerApp:
             # 임시 메시지
             self.show_temp_message("키보드 상태 업데이트 완료", 2000)
         except Exception as e:
-            print(f"키보드 상태 확인 오류: {e}")
+            log.error("키보드 상태 확인 오류: %s", e)
             self.debug_status.config(text=f"오류 발생: {str(e)}")
     
     def _force_reset_keys(self):
         """키 상태 강제 초기화 (디버깅용)"""
         try:
-            print("GUI: 키 상태 강제 초기화 시작")
+            log.debug("키 상태 강제 초기화 시작")
             
             # 기존 키보드 훅 제거
             try:
                 keyboard.unhook_all()
-                print("GUI: 키보드 훅 모두 제거")
+                log.debug("키보드 훅 모두 제거")
             except Exception as e:
-                print(f"GUI: 키보드 훅 제거 실패: {e}")
+                log.warning("키보드 훅 제거 실패: %s", e)
             
             # 모드 비활성화
             keyboard_controller.reset_all_states()
@@ -937,7 +940,7 @@ class AutoClickerApp:
             # 임시 메시지
             self.show_temp_message("키 상태 강제 초기화 완료", 2000)
         except Exception as e:
-            print(f"GUI: 키 상태 강제 초기화 오류: {e}")
+            log.error("키 상태 강제 초기화 오류: %s", e)
             import traceback
             traceback.print_exc()
             self.debug_status.config(text=f"초기화 오류: {str(e)}")
@@ -945,12 +948,12 @@ class AutoClickerApp:
     def _release_all_keys(self):
         """모든 키 해제 (디버깅용)"""
         try:
-            print("GUI: 모든 키 해제 시작")
+            log.debug("모든 키 해제 시작")
             
             # 사용 가능한 모든 키에 대해 해제 시도
             for key in "abcdefghijklmnopqrstuvwxyz0123456789":
                 try:
-                    print(f"GUI: 키 '{key}' 해제 시도")
+                    log.debug("키 '%s' 해제 시도", key)
                     keyboard.release(key)
                 except:
                     pass
@@ -959,7 +962,7 @@ class AutoClickerApp:
             for key in keyboard_controller.get_enabled_keys():
                 if keyboard_controller.is_key_pressed(key):
                     # 직접 해제 이벤트 발생
-                    print(f"GUI: 키 '{key}' 강제 해제 이벤트 발생")
+                    log.debug("키 '%s' 강제 해제 이벤트 발생", key)
                     keyboard_controller.handle_key_release(key)
             
             # 상태 업데이트
@@ -971,13 +974,13 @@ class AutoClickerApp:
             # 상태 표시
             self._check_keyboard_status()
         except Exception as e:
-            print(f"GUI: 모든 키 해제 오류: {e}")
+            log.error("모든 키 해제 오류: %s", e)
             self.debug_status.config(text=f"키 해제 오류: {str(e)}")
     
     def _reset_all_states(self):
         """전체 상태 초기화 (디버깅용)"""
         try:
-            print("GUI: 전체 상태 초기화 시작")
+            log.debug("전체 상태 초기화 시작")
             
             # 키보드 컨트롤러 상태 초기화
             keyboard_controller.reset_all_states()
@@ -993,7 +996,7 @@ class AutoClickerApp:
                 for key in "abcdefghijklmnopqrstuvwxyz0123456789":
                     keyboard.release(key)
             except Exception as e:
-                print(f"GUI: 키 직접 해제 오류: {e}")
+                log.error("키 직접 해제 오류: %s", e)
             
             # 키보드 훅 재설정
             try:
@@ -1001,7 +1004,7 @@ class AutoClickerApp:
                 time.sleep(0.1)  # 잠시 대기 후 재설정
                 self._setup_keyboard_hooks()
             except Exception as e:
-                print(f"GUI: 키보드 훅 재설정 오류: {e}")
+                log.error("키보드 훅 재설정 오류: %s", e)
             
             # UI 업데이트
             self.update_repeat_status(False)
@@ -1013,7 +1016,7 @@ class AutoClickerApp:
             # 임시 메시지
             self.show_temp_message("전체 상태 초기화 완료", 2000)
         except Exception as e:
-            print(f"GUI: 전체 상태 초기화 오류: {e}")
+            log.error("전체 상태 초기화 오류: %s", e)
             self.debug_status.config(text=f"초기화 오류: {str(e)}")
             
     def _test_key_press(self):
@@ -1029,7 +1032,7 @@ class AutoClickerApp:
             # 첫 문자만 사용
             key = key[0]
             
-            print(f"GUI: 키 '{key}' 테스트 시도")
+            log.debug("키 '%s' 테스트 시도", key)
             
             # 키가 활성화되어 있는지 확인
             if not keyboard_controller.is_key_enabled(key):
@@ -1046,20 +1049,20 @@ class AutoClickerApp:
                 self.show_temp_message("키보드 모드가 자동으로 활성화되었습니다", 2000)
             
             # 테스트 키 눌림 시뮬레이션 - 직접 반복 스레드 시작 시도
-            print(f"GUI: 키 '{key}' 반복 시작 시도")
+            log.debug("키 '%s' 반복 시작 시도", key)
             if keyboard_controller.handle_key_press(key):
-                print(f"GUI: 키 '{key}' 반복 시작 성공")
+                log.debug("키 '%s' 반복 시작 성공", key)
                 self.show_temp_message(f"키 '{key.upper()}' 테스트 성공 - 반복 시작됨", 2000)
                 self.update_key_button_styles()
             else:
-                print(f"GUI: 키 '{key}' 반복 시작 실패")
+                log.warning("키 '%s' 반복 시작 실패", key)
                 self.show_temp_message(f"키 '{key.upper()}' 테스트 실패", 2000)
                 
             # 상태 정보 확인
             keyboard_controller.print_status()
                 
         except Exception as e:
-            print(f"GUI: 키 테스트 중 오류: {e}")
+            log.error("키 테스트 중 오류: %s", e)
             self.show_temp_message(f"키 테스트 오류: {str(e)}", 2000)
     
     def _update_repeat_speed(self):
@@ -1069,37 +1072,37 @@ class AutoClickerApp:
             keyboard_controller.set_repeat_speed(speed)
             self.show_temp_message(f"키 반복 속도가 변경되었습니다: {['느림', '중간', '빠름', '매우 빠름'][speed-1]}")
         except Exception as e:
-            print(f"반복 속도 설정 오류: {e}") 
+            log.error("반복 속도 설정 오류: %s", e) 
 
     def _register_hotkey(self, key, callback):
         """단축키 등록 헬퍼 함수"""
         try:
             keyboard.add_hotkey(key, callback)
-            print(f"GUI: 단축키 '{key}' 등록 성공")
+            log.debug("단축키 '%s' 등록 성공", key)
             return True
         except Exception as e:
-            print(f"GUI: 단축키 '{key}' 등록 실패: {e}")
+            log.warning("단축키 '%s' 등록 실패: %s", key, e)
             return False 
 
     def _setup_key_hooks(self):
         """숫자와 알파벳 키 이벤트 후킹"""
         try:
-            print("GUI: 키 이벤트 후킹 시작")
+            log.debug("키 이벤트 후킹 시작")
             
             # 숫자 키 (0-9)
             for i in range(10):
                 key = str(i)
                 self._bind_key_events(key)
-                print(f"GUI: 키 '{key}' 이벤트 후킹 완료")
+                log.debug("키 '%s' 이벤트 후킹 완료", key)
             
             # 알파벳 키 (a-z)
             for c in "abcdefghijklmnopqrstuvwxyz":
                 self._bind_key_events(c)
-                print(f"GUI: 키 '{c}' 이벤트 후킹 완료")
+                log.debug("키 '%s' 이벤트 후킹 완료", c)
             
-            print("GUI: 키 이벤트 후킹 완료")
+            log.debug("키 이벤트 후킹 완료")
         except Exception as e:
-            print(f"GUI: 키 이벤트 후킹 오류: {e}")
+            log.error("키 이벤트 후킹 오류: %s", e)
             
     def _bind_key_events(self, key):
         """키별 이벤트 바인딩 함수 - 클로저 문제 해결"""
@@ -1117,39 +1120,39 @@ class AutoClickerApp:
                 suppress=False  # 시스템 이벤트 가로채지 않음
             )
             
-            # 키 해제 이벤트 - 직접 콜백에서 처리
+            # 키 해제 이벤트 - 훅 콜백은 바로 반환하고 처리는 메인 스레드에서
             keyboard.on_release_key(
                 key, 
-                lambda e, k=key: self._on_key_release_direct(k),
+                lambda e, k=key: self.root.after(1, lambda: self._on_key_release_direct(k)),
                 suppress=False  # 시스템 이벤트 가로채지 않음
             )
         except Exception as e:
-            print(f"GUI: 키 '{key}' 이벤트 바인딩 오류: {e}")
+            log.error("키 '%s' 이벤트 바인딩 오류: %s", key, e)
             
     def _on_key_event(self, key, is_press):
         """통합 키 이벤트 처리 함수"""
         try:
             # 이벤트 로깅
             action = "눌림" if is_press else "해제"
-            print(f"GUI: 키 '{key}' {action} 이벤트 감지")
+            log.debug("키 '%s' %s 이벤트 감지", key, action)
             
             # 키가 활성화되지 않았거나 모드가 비활성화면 무시
             if not keyboard_controller.is_mode_active():
-                print(f"GUI: 키 '{key}' {action} 무시 - 모드 비활성화")
+                log.debug("키 '%s' %s 무시 - 모드 비활성화", key, action)
                 return
             
             # 활성화된 키가 아니면 무시
             if not keyboard_controller.is_key_enabled(key):
-                print(f"GUI: 키 '{key}' {action} 무시 - 활성화되지 않은 키")
+                log.debug("키 '%s' %s 무시 - 활성화되지 않은 키", key, action)
                 return
 
             # 키보드 컨트롤러 상태 확인 (디버깅용)
             if is_press:
-                print(f"GUI: 키 '{key}' 눌림 처리 전 상태 - 모드: {keyboard_controller.is_mode_active()}")
+                log.debug("키 '%s' 눌림 처리 전 상태 - 모드: %s", key, keyboard_controller.is_mode_active())
                 
                 # 이미 눌려있고 반복 중이면 무시
                 if keyboard_controller.is_key_pressed(key) and keyboard_controller.is_key_repeating(key):
-                    print(f"GUI: 키 '{key}' 이미 눌려있고 반복 중 - 무시")
+                    log.debug("키 '%s' 이미 눌려있고 반복 중 - 무시", key)
                     return
             
             # 키 상태에 따라 처리
@@ -1157,13 +1160,13 @@ class AutoClickerApp:
             if is_press:
                 # 눌림 상태가 아니거나 반복 중이 아닐 때만 처리
                 if not keyboard_controller.is_key_pressed(key) or not keyboard_controller.is_key_repeating(key):
-                    print(f"GUI: 키 '{key}' 반복 처리 시작 시도")
+                    log.debug("키 '%s' 반복 처리 시작 시도", key)
                     result = keyboard_controller.handle_key_press(key)
-                    print(f"GUI: 키 '{key}' 반복 처리 결과: {result}")
+                    log.debug("키 '%s' 반복 처리 결과: %s", key, result)
                     if result:
-                        print(f"GUI: 키 '{key}' 눌림 처리 성공")
+                        log.debug("키 '%s' 눌림 처리 성공", key)
                     else:
-                        print(f"GUI: 키 '{key}' 눌림 처리 실패")
+                        log.warning("키 '%s' 눌림 처리 실패", key)
             else:
                 # 해제는 _on_key_release_direct 함수에서 처리
                 pass
@@ -1174,48 +1177,43 @@ class AutoClickerApp:
                 # 더 짧은 대기 시간으로 설정
                 self.root.after(1, self.update_key_button_styles)
         except Exception as e:
-            print(f"GUI: 키 이벤트 처리 오류 ({key}, {'눌림' if is_press else '해제'}): {e}")
+            log.error("키 이벤트 처리 오류 (%s, %s): %s", key, '눌림' if is_press else '해제', e)
             import traceback
             traceback.print_exc()
             
     def _on_key_release_direct(self, key):
-        """키 해제 이벤트 직접 처리 (UI 스레드와 분리)"""
+        """키 해제 이벤트 처리 (훅 콜백을 막지 않도록 대기 없이 처리)"""
         try:
-            print(f"GUI: 키 '{key}' 해제 이벤트 감지 (직접)")
+            log.debug("키 '%s' 해제 이벤트 감지 (직접)", key)
             
             # 모드가 비활성화 상태면 무시
             if not keyboard_controller.is_mode_active():
-                print(f"GUI: 키 '{key}' 해제 무시 - 모드 비활성화")
+                log.debug("키 '%s' 해제 무시 - 모드 비활성화", key)
                 return
             
             # 활성화된 키가 아니면 무시
             if not keyboard_controller.is_key_enabled(key):
-                print(f"GUI: 키 '{key}' 해제 무시 - 활성화되지 않은 키")
+                log.debug("키 '%s' 해제 무시 - 활성화되지 않은 키", key)
                 return
             
-            # 약간 지연 후 키 해제 처리 (키가 짧게 눌렸다 떼어진 경우 처리 개선)
-            time.sleep(0.01)
-            
             # 키 해제 직접 처리
-            print(f"GUI: 키 '{key}' 해제 처리 시도")
+            log.debug("키 '%s' 해제 처리 시도", key)
             result = keyboard_controller.handle_key_release(key)
-            print(f"GUI: 키 '{key}' 해제 처리 결과: {result}")
+            log.debug("키 '%s' 해제 처리 결과: %s", key, result)
             
             # 키보드에서 직접 해제 추가
             try:
                 keyboard.release(key)
-                time.sleep(0.01)
-                keyboard.release(key)  # 두 번 해제하여 안정성 확보
-                print(f"GUI: 키 '{key}' 직접 해제 완료")
+                log.debug("키 '%s' 직접 해제 완료", key)
             except Exception as e:
-                print(f"GUI: 키 '{key}' 직접 해제 실패: {e}")
+                log.warning("키 '%s' 직접 해제 실패: %s", key, e)
             
             # UI 업데이트는 메인 스레드에서
             if result:
-                print(f"GUI: 키 '{key}' 해제 처리 성공 (직접)")
+                log.debug("키 '%s' 해제 처리 성공 (직접)", key)
                 self.root.after(1, self.update_key_button_styles)
         except Exception as e:
-            print(f"GUI: 키 해제 직접 처리 오류 ({key}): {e}")
+            log.error("키 해제 직접 처리 오류 (%s): %s", key, e)
             import traceback
             traceback.print_exc()
             # 오류 발생 시에도 키 해제 시도
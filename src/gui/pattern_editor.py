@@ -0,0 +1,277 @@
+"""
+클릭 패턴 편집 창
+
+마우스 탭에서 여는 창으로, 격자/좌표 목록/무작위 점 패턴을 만들고
+실제로 클릭하지 않는 드라이 런으로 클릭 순서와 소요 시간을 미리 보여줍니다.
+"""
+import tkinter as tk
+from tkinter import ttk
+from tkinter import messagebox
+
+from src.core.click_pattern import (
+    PATTERN_GRID, PATTERN_LIST, PATTERN_RANDOM, ClickPattern, grid_points, parse_points, random_points,
+)
+from src.core.mouse_position import get_position_source
+from src.core.timing import now_ns
+
+# 패턴 종류 표시 이름 (None: 현재 마우스 위치 클릭)
+PATTERN_LABELS = {"현재 마우스 위치": None, "격자": PATTERN_GRID, "좌표 목록": PATTERN_LIST, "무작위": PATTERN_RANDOM}
+
+# 미리보기 크기 (픽셀)와 화면 갱신 주기 (ms)
+PREVIEW_WIDTH = 360
+PREVIEW_HEIGHT = 220
+PREVIEW_REFRESH_MS = 33
+
+# 미리보기에 그릴 최대 좌표 수 (넘으면 고르게 건너뛰어 그림)
+PREVIEW_MAX_POINTS = 2000
+
+# 편집 창 초기값
+DEFAULT_SETTINGS = {
+    "kind": "현재 마우스 위치",
+    "left": "100", "top": "100", "right": "500", "bottom": "400",
+    "columns": "5", "rows": "4", "snake": True,
+    "count": "50", "seed": "",
+    "points": "100, 100\n200, 150\n300, 100\n",
+    "cycles": "0",
+}
+
+class PatternEditor:
+    def __init__(self, parent, settings, interval_func, on_apply):
+        """
+        Args:
+            parent: 부모 위젯
+            settings (dict): 입력값 (창을 닫아도 유지되도록 호출한 쪽이 보관, DEFAULT_SETTINGS 형식)
+            interval_func (function): 현재 클릭 간격(초)과 틱당 클릭 수를 반환하는 함수
+            on_apply (function): (ClickPattern 또는 None, 설명 문자열)을 받는 함수
+        """
+        self.settings = settings
+        self.interval_func = interval_func
+        self.on_apply = on_apply
+        self._preview_timer_id = None  # 드라이 런 애니메이션 타이머 ID
+        
+        self.window = tk.Toplevel(parent)
+        self.window.title("클릭 패턴 편집")
+        self.window.resizable(False, False)
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+        
+        self.vars = {}
+        for name, value in settings.items():
+            if isinstance(value, bool):
+                self.vars[name] = tk.BooleanVar(value=value)
+            elif name != "points":
+                self.vars[name] = tk.StringVar(value=value)
+        
+        self._create_widgets()
+        self._update_fields()
+    
+    def _create_widgets(self):
+        frame = ttk.Frame(self.window, padding=10)
+        frame.pack(fill=tk.BOTH, expand=True)
+        
+        # 패턴 종류
+        kind_row = ttk.Frame(frame)
+        kind_row.pack(fill=tk.X, pady=3)
+        ttk.Label(kind_row, text="패턴:").pack(side=tk.LEFT, padx=5)
+        kind_combo = ttk.Combobox(kind_row, textvariable=self.vars["kind"], values=list(PATTERN_LABELS),
+                                  state="readonly", width=16)
+        kind_combo.pack(side=tk.LEFT, padx=5)
+        kind_combo.bind("<<ComboboxSelected>>", lambda event: self._update_fields())
+        ttk.Label(kind_row, text="반복 (0=무한):").pack(side=tk.LEFT, padx=5)
+        ttk.Spinbox(kind_row, from_=0, to=99999, width=6, textvariable=self.vars["cycles"]).pack(side=tk.LEFT, padx=5)
+        
+        # 영역 (격자/무작위)
+        self.area_frame = ttk.LabelFrame(frame, text="영역", padding=5)
+        area_row = ttk.Frame(self.area_frame)
+        area_row.pack(fill=tk.X)
+        for label, name in (("왼쪽", "left"), ("위", "top"), ("오른쪽", "right"), ("아래", "bottom")):
+            ttk.Label(area_row, text=label).pack(side=tk.LEFT, padx=2)
+            ttk.Entry(area_row, textvariable=self.vars[name], width=6).pack(side=tk.LEFT, padx=2)
+        corner_row = ttk.Frame(self.area_frame)
+        corner_row.pack(fill=tk.X, pady=(5, 0))
+        ttk.Button(corner_row, text="왼쪽 위 = 현재 커서",
+                   command=lambda: self._capture_corner("left", "top")).pack(side=tk.LEFT, padx=2, expand=True, fill=tk.X)
+        ttk.Button(corner_row, text="오른쪽 아래 = 현재 커서",
+                   command=lambda: self._capture_corner("right", "bottom")).pack(side=tk.LEFT, padx=2, expand=True, fill=tk.X)
+        
+        # 격자 설정
+        self.grid_frame = ttk.LabelFrame(frame, text="격자", padding=5)
+        ttk.Label(self.grid_frame, text="가로").pack(side=tk.LEFT, padx=2)
+        ttk.Spinbox(self.grid_frame, from_=1, to=1000, width=5, textvariable=self.vars["columns"]).pack(side=tk.LEFT, padx=2)
+        ttk.Label(self.grid_frame, text="세로").pack(side=tk.LEFT, padx=2)
+        ttk.Spinbox(self.grid_frame, from_=1, to=1000, width=5, textvariable=self.vars["rows"]).pack(side=tk.LEFT, padx=2)
+        ttk.Checkbutton(self.grid_frame, text="지그재그 순서", variable=self.vars["snake"]).pack(side=tk.LEFT, padx=8)
+        
+        # 무작위 설정
+        self.random_frame = ttk.LabelFrame(frame, text="무작위", padding=5)
+        ttk.Label(self.random_frame, text="개수").pack(side=tk.LEFT, padx=2)
+        ttk.Entry(self.random_frame, textvariable=self.vars["count"], width=8).pack(side=tk.LEFT, padx=2)
+        ttk.Label(self.random_frame, text="시드 (비우면 매번 다름)").pack(side=tk.LEFT, padx=2)
+        ttk.Entry(self.random_frame, textvariable=self.vars["seed"], width=8).pack(side=tk.LEFT, padx=2)
+        
+        # 좌표 목록
+        self.list_frame = ttk.LabelFrame(frame, text="좌표 목록 (한 줄에 x, y)", padding=5)
+        self.points_text = tk.Text(self.list_frame, height=6, width=40, font=("Consolas", 10))
+        self.points_text.pack(fill=tk.X)
+        self.points_text.insert("1.0", self.settings["points"])
+        
+        # 미리보기
+        self.preview_frame = ttk.LabelFrame(frame, text="미리보기 (드라이 런 - 실제로 클릭하지 않음)", padding=5)
+        self.canvas = tk.Canvas(self.preview_frame, width=PREVIEW_WIDTH, height=PREVIEW_HEIGHT,
+                                background="white", highlightthickness=1, highlightbackground="gray")
+        self.canvas.pack()
+        self.summary_label = ttk.Label(self.preview_frame, text="", font=("맑은 고딕", 10), justify=tk.LEFT)
+        self.summary_label.pack(anchor=tk.W, pady=(5, 0))
+        
+        # 버튼
+        self.button_row = ttk.Frame(frame)
+        ttk.Button(self.button_row, text="드라이 런", command=self._dry_run).pack(side=tk.LEFT, padx=5, expand=True, fill=tk.X)
+        ttk.Button(self.button_row, text="적용", command=self._apply).pack(side=tk.LEFT, padx=5, expand=True, fill=tk.X)
+        ttk.Button(self.button_row, text="닫기", command=self.close).pack(side=tk.LEFT, padx=5, expand=True, fill=tk.X)
+    
+    def _update_fields(self):
+        """선택한 패턴 종류에 맞는 입력 칸만 표시"""
+        kind = PATTERN_LABELS[self.vars["kind"].get()]
+        for widget in (self.area_frame, self.grid_frame, self.random_frame, self.list_frame,
+                       self.preview_frame, self.button_row):
+            widget.pack_forget()
+        if kind in (PATTERN_GRID, PATTERN_RANDOM):
+            self.area_frame.pack(fill=tk.X, pady=3)
+        if kind == PATTERN_GRID:
+            self.grid_frame.pack(fill=tk.X, pady=3)
+        elif kind == PATTERN_RANDOM:
+            self.random_frame.pack(fill=tk.X, pady=3)
+        elif kind == PATTERN_LIST:
+            self.list_frame.pack(fill=tk.X, pady=3)
+        if kind is not None:
+            self.preview_frame.pack(fill=tk.X, pady=3)
+        self.button_row.pack(fill=tk.X, pady=(8, 0))
+    
+    def _capture_corner(self, x_name, y_name):
+        """현재 커서 위치를 영역 모서리로 설정"""
+        x, y = get_position_source().position()
+        self.vars[x_name].set(str(x))
+        self.vars[y_name].set(str(y))
+    
+    def _int(self, name):
+        """정수 입력값 (잘못된 값이면 ValueError)"""
+        value = self.vars[name].get().strip()
+        try:
+            return int(value)
+        except ValueError:
+            raise ValueError(f"정수를 입력하세요: {value!r}") from None
+    
+    def _save_settings(self):
+        """입력값을 settings에 보관 (창을 다시 열 때 복원)"""
+        for name, var in self.vars.items():
+            self.settings[name] = var.get()
+        self.settings["points"] = self.points_text.get("1.0", "end-1c")
+    
+    def _build(self):
+        """
+        입력값으로 패턴 생성
+        
+        Returns:
+            tuple: (ClickPattern 또는 None, 설명 문자열)
+        
+        Raises:
+            ValueError: 잘못된 입력값
+        """
+        self._save_settings()
+        label = self.vars["kind"].get()
+        kind = PATTERN_LABELS[label]
+        if kind is None:
+            return None, label
+        cycles = self._int("cycles")
+        if kind == PATTERN_LIST:
+            points = parse_points(self.settings["points"])
+            description = f"좌표 목록 {len(points)}개"
+        else:
+            rect = (self._int("left"), self._int("top"), self._int("right"), self._int("bottom"))
+            if kind == PATTERN_GRID:
+                columns, rows = self._int("columns"), self._int("rows")
+                points = grid_points(*rect, columns, rows, snake=self.vars["snake"].get())
+                description = f"격자 {columns}x{rows}"
+            else:
+                seed = self._int("seed") if self.vars["seed"].get().strip() else None
+                points = random_points(*rect, self._int("count"), seed=seed)
+                description = f"무작위 {len(points)}개"
+        pattern = ClickPattern(points, cycles=cycles, name=description)
+        return pattern, f"{description} ({cycles}바퀴)" if cycles else f"{description} (무한 반복)"
+    
+    def _build_or_report(self):
+        """패턴 생성 (오류는 메시지 상자로 표시하고 False 반환)"""
+        try:
+            return self._build()
+        except ValueError as e:
+            messagebox.showerror("패턴 오류", str(e), parent=self.window)
+        except ImportError:
+            messagebox.showerror("패턴 오류", "클릭 패턴에는 NumPy가 필요합니다.\npip install numpy", parent=self.window)
+        return False
+    
+    def _apply(self):
+        """패턴을 클릭 엔진에 적용"""
+        result = self._build_or_report()
+        if result is not False:
+            self.on_apply(*result)
+            self.close()
+    
+    def _dry_run(self):
+        """좌표와 이동 경로를 그리고, 클릭 간격에 맞춰 클릭 순서를 한 바퀴 보여줌"""
+        result = self._build_or_report()
+        if result is False or result[0] is None:
+            return
+        pattern = result[0]
+        interval, clicks_per_tick = self.interval_func()
+        plan = pattern.dry_run(interval, clicks_per_tick)
+        
+        # 화면 전체를 미리보기 크기로 축소 (좌표가 화면 밖이면 그 범위까지 포함)
+        left, top, right, bottom = plan["bounds"]
+        width = max(self.window.winfo_screenwidth(), right + 1) - min(left, 0)
+        height = max(self.window.winfo_screenheight(), bottom + 1) - min(top, 0)
+        scale = min(PREVIEW_WIDTH / width, PREVIEW_HEIGHT / height)
+        step = max(len(pattern) // PREVIEW_MAX_POINTS, 1)
+        xs = ((pattern.points[::step, 0] - min(left, 0)) * scale).tolist()
+        ys = ((pattern.points[::step, 1] - min(top, 0)) * scale).tolist()
+        
+        canvas = self.canvas
+        canvas.delete("all")
+        canvas.create_rectangle(0, 0, self.window.winfo_screenwidth() * scale,
+                                self.window.winfo_screenheight() * scale, outline="lightgray")
+        if len(xs) > 1:
+            canvas.create_line(*[v for point in zip(xs, ys) for v in point], fill="lightblue")
+        for x, y in zip(xs, ys):
+            canvas.create_oval(x - 1.5, y - 1.5, x + 1.5, y + 1.5, fill="gray", outline="")
+        canvas.create_oval(xs[0] - 3, ys[0] - 3, xs[0] + 3, ys[0] + 3, fill="green", outline="")
+        marker = canvas.create_oval(xs[0] - 4, ys[0] - 4, xs[0] + 4, ys[0] + 4, outline="red", width=2)
+        
+        total = "무한 반복" if plan["total_s"] is None else f"전체 {plan['total_s']:.1f}초, 클릭 {plan['clicks']:,}회"
+        shown = "" if step == 1 else f" ({len(xs):,}개만 표시)"
+        self.summary_label.config(
+            text=f"좌표 {plan['points']:,}개{shown}, 영역 ({left}, {top}) - ({right}, {bottom})\n"
+                 f"한 바퀴 {plan['cycle_s']:.2f}초 (간격 {interval * 1000:g}ms), 이동 거리 {plan['path_px']:,.0f}px, {total}"
+        )
+        
+        # 클릭 엔진과 같은 간격으로 표시 위치를 옮김 (화면 갱신은 PREVIEW_REFRESH_MS마다)
+        if self._preview_timer_id is not None:
+            self.window.after_cancel(self._preview_timer_id)
+        started = now_ns()
+        period_ns = max(int(interval * step * 1e9), 1)
+        
+        def advance():
+            index = (now_ns() - started) // period_ns
+            if index >= len(xs):
+                self._preview_timer_id = None
+                canvas.coords(marker, xs[-1] - 4, ys[-1] - 4, xs[-1] + 4, ys[-1] + 4)
+                return
+            canvas.coords(marker, xs[index] - 4, ys[index] - 4, xs[index] + 4, ys[index] + 4)
+            self._preview_timer_id = self.window.after(PREVIEW_REFRESH_MS, advance)
+        
+        advance()
+    
+    def close(self):
+        """창 닫기 (입력값은 settings에 남음)"""
+        if self._preview_timer_id is not None:
+            self.window.after_cancel(self._preview_timer_id)
+            self._preview_timer_id = None
+        self._save_settings()
+        self.window.destroy()
@@ -3,19 +3,29 @@
 
 사용자 인터페이스를 탭으로 분리하여 기능별로 구분합니다.
 """
+import importlib
 import sys
-import time
 import threading
 import tkinter as tk
 from tkinter import ttk
 from tkinter import messagebox
 import ctypes
 
-from src.core.mouse_position import get_mouse_position
+from src.core.key_hook import close_key_hook
+from src.core.mouse_position import get_position_source, close_position_source
 from src.utils.admin_check import is_admin, run_as_admin
-from src.gui.tabs.mouse_clicker_tab import MouseClickerTab
-from src.gui.tabs.keyboard_tab import KeyboardTab
-from src.gui.tabs.settings_tab import SettingsTab
+from src.utils import fast_log
+from src.utils.startup_profile import startup_profiler
+from src.gui.tabs import TAB_MODULES
+
+# 탭 목록 (속성 이름, 탭 클래스 이름, 탭 제목, 시작 시간 측정 단계 이름) - 탭 모듈은 탭을 만들 때 불러옴
+TABS = (
+    ("mouse_tab", "MouseClickerTab", "마우스 자동 클릭", "마우스 탭"),
+    ("keyboard_tab", "KeyboardTab", "키보드 연타", "키보드 탭"),
+    ("macro_tab", "MacroTab", "매크로", "매크로 탭"),
+    ("script_tab", "ScriptTab", "스크립트", "스크립트 탭"),
+    ("settings_tab", "SettingsTab", "설정", "설정 탭"),
+)
 
 class TabBasedApp:
     def __init__(self, root):
@@ -36,20 +46,23 @@ class TabBasedApp:
                 return
             
             # 스타일 설정
-            self._setup_styles()
+            with startup_profiler.phase("스타일 설정"):
+                self._setup_styles()
             
             # 탭 컨트롤 생성
             self.tab_control = ttk.Notebook(self.root)
             
-            # 각 탭 생성
-            self.mouse_tab = MouseClickerTab(self.tab_control)
-            self.keyboard_tab = KeyboardTab(self.tab_control)
-            self.settings_tab = SettingsTab(self.tab_control)
+            # 탭 자리 추가 (탭 내용은 탭을 만들 때 이 프레임 안에 배치)
+            self._tab_pages = {}
+            for attr, class_name, title, label in TABS:
+                setattr(self, attr, None)
+                page = ttk.Frame(self.tab_control)
+                self.tab_control.add(page, text=title)
+                self._tab_pages[attr] = page
             
-            # 탭 추가
-            self.tab_control.add(self.mouse_tab.frame, text='마우스 자동 클릭')
-            self.tab_control.add(self.keyboard_tab.frame, text='키보드 연타')
-            self.tab_control.add(self.settings_tab.frame, text='설정')
+            # 첫 화면에 보이는 마우스 탭만 바로 생성 (나머지는 첫 화면을 그린 뒤 또는 탭을 고를 때 생성)
+            self._build_tab(0)
+            self.tab_control.bind("<<NotebookTabChanged>>", self._on_tab_changed)
             
             # 탭 컨트롤 배치
             self.tab_control.pack(expand=1, fill="both")
@@ -57,11 +70,12 @@ class TabBasedApp:
             # 앱이 종료될 때 정리 작업을 위한 프로토콜 설정
             self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
             
-            # 전역 단축키 설정
-            self._setup_global_hotkeys()
-            
             # 마우스 위치 추적 시작
-            self._start_mouse_tracking()
+            with startup_profiler.phase("마우스 위치 추적 시작"):
+                self._start_mouse_tracking()
+            
+            # 나머지 탭 생성 (단축키도 탭을 만들 때 설정되므로 첫 화면 직후 모두 생성)
+            self.root.after_idle(self._build_remaining_tabs)
             
             print("GUI: 탭 기반 애플리케이션 초기화 완료")
             
@@ -92,50 +106,92 @@ class TabBasedApp:
             print(f"GUI: 스타일 설정 중 오류: {e}")
     
     def _start_mouse_tracking(self):
-        """마우스 위치 추적 시작"""
-        # 마우스 위치 업데이트 함수
+        """마우스 위치 추적 시작 (위치 소스가 위치가 바뀌었다고 알려 줄 때만 라벨 갱신, 타이머 없음)"""
+        if not hasattr(self.mouse_tab, 'update_position'):
+            return
+        pending = threading.Event()  # 라벨 갱신이 이미 예약되어 있는지
+        
+        # 마우스 위치 표시 갱신 함수 (GUI 스레드) - 예약된 동안 여러 번 움직여도 한 번만 갱신
         def update_mouse_position():
+            pending.clear()
             try:
-                if hasattr(self.mouse_tab, 'update_position'):
-                    x, y = get_mouse_position()
-                    self.mouse_tab.update_position(x, y)
-                self.root.after(100, update_mouse_position)  # 100ms마다 업데이트
+                x, y = get_position_source().pos
+                self.mouse_tab.update_position(x, y)
             except Exception as e:
                 print(f"마우스 위치 추적 중 오류: {e}")
         
+        # 위치 소스 콜백 (위치 소스 스레드)
+        def on_position_changed(x, y):
+            if not pending.is_set():
+                pending.set()
+                try:
+                    self.root.after(0, update_mouse_position)
+                except (RuntimeError, tk.TclError):
+                    pass  # 창이 닫히는 중
+        
         # 마우스 위치 추적 시작
+        source = get_position_source()
+        source.set_listener(on_position_changed)
         update_mouse_position()
     
-    def _setup_global_hotkeys(self):
-        """전역 단축키 설정"""
-        try:
-            # 마우스 탭의 단축키 설정
-            if hasattr(self.mouse_tab, 'setup_hotkeys'):
-                self.mouse_tab.setup_hotkeys()
+    def _build_tab(self, index):
+        """탭 모듈을 불러와 탭을 만들고 단축키 설정 (이미 만들었으면 그 탭 반환)"""
+        attr, class_name, title, label = TABS[index]
+        tab = getattr(self, attr)
+        if tab is not None:
+            return tab
+        
+        with startup_profiler.phase(f"{label} 생성"):
+            module_name = TAB_MODULES[class_name]
+            with startup_profiler.phase(f"import {module_name}"):
+                module = importlib.import_module(module_name)
+            tab = getattr(module, class_name)(self._tab_pages[attr])
+            tab.frame.pack(expand=1, fill="both")
+            setattr(self, attr, tab)
             
-            # 키보드 탭의 단축키 설정
-            if hasattr(self.keyboard_tab, 'setup_hotkeys'):
-                self.keyboard_tab.setup_hotkeys()
+            # 전역 단축키 설정
+            if hasattr(tab, 'setup_hotkeys'):
+                try:
+                    tab.setup_hotkeys()
+                except Exception as e:
+                    print(f"전역 단축키 설정 중 오류 ({label}): {e}")
+        return tab
+    
+    def _build_remaining_tabs(self):
+        """아직 만들지 않은 탭 생성"""
+        for index in range(len(TABS)):
+            try:
+                self._build_tab(index)
+            except Exception as e:
+                print(f"GUI: 탭 생성 중 오류 ({TABS[index][3]}): {e}")
+    
+    def _on_tab_changed(self, event=None):
+        """고른 탭이 아직 만들어지지 않았으면 바로 생성"""
+        try:
+            self._build_tab(self.tab_control.index("current"))
         except Exception as e:
-            print(f"전역 단축키 설정 중 오류: {e}")
+            print(f"GUI: 탭 생성 중 오류: {e}")
     
     def on_closing(self):
         """앱 종료 시 정리 작업"""
         try:
             print("앱 종료 요청됨 - 정리 시작...")
             
-            # 마우스 탭 정리
-            if hasattr(self.mouse_tab, 'cleanup'):
-                self.mouse_tab.cleanup()
+            # 만들어진 탭 정리
+            for attr, class_name, title, label in TABS:
+                tab = getattr(self, attr, None)
+                if tab is not None and hasattr(tab, 'cleanup'):
+                    tab.cleanup()
+            
+            # 전역 키보드 훅 해제
+            close_key_hook()
             
-            # 키보드 탭 정리
-            if hasattr(self.keyboard_tab, 'cleanup'):
-                self.keyboard_tab.cleanup()
+            # 커서 위치 추적 중지
+            close_position_source()
             
-            # 스레드 종료를 위한 짧은 대기
-            print("정리 완료 대기...")
-            time.sleep(0.2)
+            # 각 탭의 정리는 정해진 시간 안에 끝나므로 별도 대기 없음
             print("앱 종료 준비 완료")
+            fast_log.flush()
         except Exception as e:
             print(f"앱 종료 처리 중 오류: {e}")
         finally:
@@ -2,9 +2,24 @@
 탭 UI 모듈 패키지
 
 애플리케이션의 각 기능별 탭 UI를 제공하는 모듈들을 포함합니다.
+탭 모듈은 처음 사용할 때 불러오므로 패키지를 불러와도 탭 모듈(과 그 의존 모듈)은 불러오지 않습니다.
 """
-from src.gui.tabs.mouse_clicker_tab import MouseClickerTab
-from src.gui.tabs.keyboard_tab import KeyboardTab
-from src.gui.tabs.settings_tab import SettingsTab
+import importlib
 
-__all__ = ['MouseClickerTab', 'KeyboardTab', 'SettingsTab'] 
\ No newline at end of file
+# 탭 클래스 이름 -> 모듈 이름
+TAB_MODULES = {
+    'MouseClickerTab': 'src.gui.tabs.mouse_clicker_tab',
+    'KeyboardTab': 'src.gui.tabs.keyboard_tab',
+    'MacroTab': 'src.gui.tabs.macro_tab',
+    'ScriptTab': 'src.gui.tabs.script_tab',
+    'SettingsTab': 'src.gui.tabs.settings_tab',
+}
+
+__all__ = list(TAB_MODULES)
+
+def __getattr__(name):
+    """탭 클래스에 처음 접근할 때 해당 모듈만 불러옴"""
+    module_name = TAB_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name), name)
@@ -7,9 +7,14 @@ import tkinter as tk
 from tkinter import ttk
 import threading
 import time
-import keyboard
+from functools import partial
 
-from src.core.keyboard_control import keyboard_controller
+from src.core.key_hook import get_key_hook
+from src.core.keyboard_control import get_keyboard_controller
+from src.core.timing import now_ns
+from src.utils.fast_log import get_logger
+
+log = get_logger("KeyboardTab")
 
 class KeyboardTab:
     def __init__(self, parent):
@@ -19,9 +24,11 @@ class KeyboardTab:
         # 초기 변수 설정
         self.active_keys = set()  # 활성화된 키
         self.is_repeating = False  # 키 반복 중 여부
-        self.is_processing_hotkey = False  # 핫키 처리 중 플래그
+        self._control_lock = threading.Lock()  # 모드 전환 요청 직렬화 (단축키 스레드와 GUI 스레드)
         self.key_buttons = {}  # 가상 키보드 버튼 저장
         self.repeat_speed = 0.1  # 기본 반복 속도 (초)
+        self.hold_duration = 0.02  # 키 누름 유지 시간 (초)
+        self._rate_timer_id = None  # 실제 반복 속도 표시 갱신 타이머 ID
         
         # UI 구성
         self._create_widgets()
@@ -54,9 +61,28 @@ class KeyboardTab:
         self.speed_label = ttk.Label(speed_control, text=f"{self.repeat_speed:.1f}초", font=("맑은 고딕", 12))
         self.speed_label.pack(side=tk.LEFT, padx=20, fill=tk.X, expand=True)
         
+        # 실제 반복 속도 표시
+        self.achieved_label = ttk.Label(speed_control, text=self._format_rate(), font=("맑은 고딕", 10))
+        self.achieved_label.pack(side=tk.LEFT, padx=5)
+        
         ttk.Button(speed_control, text="+", width=4,
                   command=self._increase_speed).pack(side=tk.RIGHT, padx=5)
         
+        # 누름 유지 시간 설정
+        hold_control = ttk.Frame(speed_frame)
+        hold_control.pack(fill=tk.X, pady=5)
+        
+        ttk.Label(hold_control, text="누름 유지:").pack(side=tk.LEFT, padx=5)
+        
+        ttk.Button(hold_control, text="-", width=4,
+                  command=self._decrease_hold).pack(side=tk.LEFT, padx=5)
+        
+        self.hold_label = ttk.Label(hold_control, text=f"{self.hold_duration * 1000:.0f}ms", font=("맑은 고딕", 12))
+        self.hold_label.pack(side=tk.LEFT, padx=20, fill=tk.X, expand=True)
+        
+        ttk.Button(hold_control, text="+", width=4,
+                  command=self._increase_hold).pack(side=tk.RIGHT, padx=5)
+        
         # 상태 표시
         status_frame = ttk.LabelFrame(self.frame, text="상태", padding=10)
         status_frame.pack(fill=tk.X, pady=8)
@@ -192,73 +218,109 @@ class KeyboardTab:
             # 이미 활성화된 키 비활성화
             self.active_keys.remove(key)
             self.key_buttons[key].state(["!pressed"])
+            self._unbind_key(key)
         else:
             # 키 활성화
             self.active_keys.add(key)
             self.key_buttons[key].state(["pressed"])
+            self._bind_key(key)
         
         # 키 상태 업데이트
         self._update_button_styles()
     
+    def _bind_key(self, key):
+        """
+        키 눌림/해제 처리 함수를 전역 훅 표에 등록
+        
+        훅은 하나만 사용하고 표 항목만 추가하므로 키 수와 관계없이 O(1)입니다.
+        연타 모드가 꺼져 있으면 처리 함수가 바로 반환합니다.
+        """
+        try:
+            get_key_hook().add_key(
+                key,
+                on_press=partial(self._on_key_press, key),
+                on_release=partial(self._on_key_release, key),
+            )
+            log.debug("키 '%s' 이벤트 핸들러 등록됨", key)
+        except Exception as e:
+            log.warning("키 '%s' 이벤트 핸들러 등록 실패: %s", key, e)
+    
+    def _unbind_key(self, key):
+        """전역 훅 표에서 키 처리 함수 제거"""
+        hook = get_key_hook(create=False)
+        if hook is not None:
+            hook.remove_key(key)
+    
     def toggle_key_repeat(self):
-        """키 반복 준비 상태 토글"""
-        # 반복 모드 토글
-        self.is_repeating = not self.is_repeating
+        """키 반복 준비 상태 토글 (GUI 스레드와 단축키 스레드 모두에서 호출 가능)"""
+        with self._control_lock:
+            enable = not self.is_repeating
+            if enable and not self.active_keys:
+                # 활성화된 키가 없으면 알림
+                log.warning("키보드 연타 준비 실패: 활성화된 키가 없습니다.")
+                self._notify_gui(self._show_no_active_keys)
+                return
+            self._set_repeat_mode(enable)
+        self._notify_gui(self._sync_repeat_ui)
+    
+    def _set_repeat_mode(self, enable):
+        """연타 모드 전환 - 컨트롤러 설정만 수행 (키 처리 함수는 키를 활성화할 때 등록됨, 위젯은 건드리지 않음)"""
+        controller = get_keyboard_controller()
         
+        if enable:
+            log.debug("키보드 연타 모드 활성화: %s", list(self.active_keys))
+            controller.set_repeat_rate(1.0 / self.repeat_speed, self.hold_duration)
+            
+            # 키 이름을 미리 코드로 변환해 두어 첫 눌림에서 변환하지 않도록 함
+            for key in self.active_keys:
+                controller.enable_key(key)
+        else:
+            log.debug("키보드 연타 모드 비활성화")
+            
+            # 모든 키 반복 중지
+            controller.stop_all_repeats()
+        self.is_repeating = enable
+    
+    def _sync_repeat_ui(self):
+        """연타 모드 상태를 버튼/상태 표시에 반영 (GUI 스레드)"""
         if self.is_repeating:
-            # 활성화된 키가 없으면 알림
-            if not self.active_keys:
-                print("키보드 연타 준비 실패: 활성화된 키가 없습니다.")
-                from tkinter import messagebox
-                messagebox.showinfo("알림", "키보드 연타를 시작하려면 먼저 키를 활성화해주세요.")
-                self.is_repeating = False
-                return
-                
-            print(f"키보드 연타 모드 활성화: {list(self.active_keys)}")
             self.key_repeat_btn.config(text="키보드 연타 모드 중지 (F7)")
             self.key_repeat_status.config(text="준비됨 - 키 입력 대기 중", style="Red.TLabel")
-            
-            # 키 이벤트 핸들러 등록
-            for key in self.active_keys:
-                try:
-                    # 키 눌림/해제 이벤트 핸들러 등록
-                    keyboard.on_press_key(key, lambda e, k=key: self._on_key_press(k), suppress=False)
-                    keyboard.on_release_key(key, lambda e, k=key: self._on_key_release(k), suppress=False)
-                    print(f"키 '{key}' 이벤트 핸들러 등록됨")
-                except Exception as e:
-                    print(f"키 '{key}' 이벤트 핸들러 등록 실패: {e}")
         else:
-            print("키보드 연타 모드 비활성화")
             self.key_repeat_btn.config(text="키보드 연타 모드 시작 (F7)")
             self.key_repeat_status.config(text="준비됨", style="Green.TLabel")
-            
-            # 모든 키 반복 중지 및 이벤트 핸들러 제거
-            keyboard_controller.stop_all_repeats()
-            
-            # 이벤트 핸들러 제거
-            for key in self.active_keys:
-                try:
-                    keyboard.unhook_key(key)
-                except:
-                    pass
+        self._update_achieved_rate()
+    
+    def _show_no_active_keys(self):
+        """활성화된 키가 없다는 알림 표시 (GUI 스레드)"""
+        from tkinter import messagebox
+        messagebox.showinfo("알림", "키보드 연타를 시작하려면 먼저 키를 활성화해주세요.")
     
-    def _on_key_press(self, key):
-        """키 눌림 이벤트 핸들러"""
+    def _notify_gui(self, func):
+        """GUI 스레드에서 func 실행 (이미 GUI 스레드라면 바로 실행)"""
+        if threading.current_thread() is threading.main_thread():
+            func()
+        else:
+            self.frame.after(0, func)
+    
+    def _on_key_press(self, key, trigger_ns=None):
+        """키 눌림 이벤트 핸들러 (키 이벤트 처리 스레드, trigger_ns: 훅이 이벤트를 받은 시각)"""
         if not self.is_repeating or key not in self.active_keys:
             return
             
-        print(f"키 '{key}' 눌림 감지됨 - 연타 시작")
-        # 키 연타 시작
-        keyboard_controller.start_key_repeat(key, self.repeat_speed)
+        trigger_ns = trigger_ns or now_ns()
+        log.debug("키 '%s' 눌림 감지됨 - 연타 시작", key)
+        # 키 연타 시작 (눌림 감지 시각부터 첫 주입까지의 지연 측정)
+        get_keyboard_controller().start_key_repeat(key, trigger_ns=trigger_ns)
     
-    def _on_key_release(self, key):
-        """키 해제 이벤트 핸들러"""
+    def _on_key_release(self, key, trigger_ns=None):
+        """키 해제 이벤트 핸들러 (키 이벤트 처리 스레드)"""
         if not self.is_repeating or key not in self.active_keys:
             return
             
-        print(f"키 '{key}' 해제 감지됨 - 연타 중지")
+        log.debug("키 '%s' 해제 감지됨 - 연타 중지", key)
         # 키 연타 중지
-        keyboard_controller.stop_key_repeat(key)
+        get_keyboard_controller().stop_key_repeat(key)
     
     def _update_button_styles(self):
         """버튼 스타일 업데이트"""
@@ -280,11 +342,42 @@ class KeyboardTab:
         self.speed_label.config(text=f"{self.repeat_speed:.2f}초")
         self._update_repeat_speed()
     
+    def _increase_hold(self):
+        """누름 유지 시간 증가"""
+        self.hold_duration = round(min(self.hold_duration + 0.005, 0.2), 3)
+        self.hold_label.config(text=f"{self.hold_duration * 1000:.0f}ms")
+        self._update_repeat_speed()
+    
+    def _decrease_hold(self):
+        """누름 유지 시간 감소"""
+        self.hold_duration = round(max(self.hold_duration - 0.005, 0.005), 3)
+        self.hold_label.config(text=f"{self.hold_duration * 1000:.0f}ms")
+        self._update_repeat_speed()
+    
     def _update_repeat_speed(self):
-        """반복 중인 키 속도 업데이트"""
+        """반복 속도 업데이트 - 간격을 목표 속도(Hz)로 변환하여 적용"""
+        get_keyboard_controller().set_repeat_rate(1.0 / self.repeat_speed, self.hold_duration)
+        self.achieved_label.config(text=self._format_rate())
+    
+    def _format_rate(self, achieved=None):
+        """목표/실제 반복 속도 표시 문자열"""
+        target = 1.0 / self.repeat_speed
+        if achieved is None:
+            return f"({target:.1f}Hz)"
+        return f"({target:.1f}Hz / 실제 {achieved:.1f}Hz)"
+    
+    def _update_achieved_rate(self):
+        """실제 반복 속도 표시 (연타 모드 중에는 0.5초마다 갱신)"""
+        if self._rate_timer_id is not None:
+            self.frame.after_cancel(self._rate_timer_id)
+            self._rate_timer_id = None
+        
         if self.is_repeating:
-            for key in self.active_keys:
-                keyboard_controller.update_repeat_speed(key, self.repeat_speed)
+            achieved = get_keyboard_controller().get_achieved_rate()
+            self.achieved_label.config(text=self._format_rate(achieved if achieved > 0 else None))
+            self._rate_timer_id = self.frame.after(500, self._update_achieved_rate)
+        else:
+            self.achieved_label.config(text=self._format_rate())
     
     def _test_key_press(self):
         """키 테스트"""
@@ -293,78 +386,63 @@ class KeyboardTab:
             return
             
         try:
+            # keyboard 라이브러리는 시작 시간을 줄이기 위해 키를 테스트할 때 처음 불러옴
+            import keyboard
+            
             # 키 누름 (0.1초 후 해제)
             keyboard.press(key)
             self.frame.after(100, lambda: keyboard.release(key))
         except Exception as e:
-            print(f"키 테스트 중 오류: {e}")
+            log.error("키 테스트 중 오류: %s", e)
     
-    def safe_toggle_key_repeat(self):
-        """스레드 안전한 키 반복 토글"""
-        if self.is_processing_hotkey:
-            return
-            
-        self.is_processing_hotkey = True
-        self.frame.after(0, self._process_toggle_key_repeat)
+    def safe_toggle_key_repeat(self, trigger_ns=None):
+        """단축키 콜백 - 키 이벤트 처리 스레드에서 연타 모드를 바로 전환하고 화면은 나중에 갱신"""
+        self.toggle_key_repeat()
     
-    def _process_toggle_key_repeat(self):
-        """키 반복 토글 처리 (메인 스레드)"""
-        try:
-            self.toggle_key_repeat()
-        finally:
-            self.is_processing_hotkey = False
-    
-    def safe_reset_all_keys(self):
-        """스레드 안전한 모든 키 초기화"""
-        if self.is_processing_hotkey:
-            return
+    def safe_reset_all_keys(self, trigger_ns=None):
+        """단축키 콜백 - 키 이벤트 처리 스레드에서 연타를 바로 중지하고 키 선택 해제는 GUI 스레드에서 처리"""
+        with self._control_lock:
+            # 반복 중이었다면 먼저 키 훅 해제 및 반복 중지
+            if self.is_repeating:
+                self._set_repeat_mode(False)
             
-        self.is_processing_hotkey = True
-        self.frame.after(0, self._process_reset_all_keys)
+            # 키보드 컨트롤러 초기화
+            get_keyboard_controller().reset_all_states()
+        self._notify_gui(self._process_reset_all_keys)
     
     def _process_reset_all_keys(self):
-        """모든 키 초기화 처리 (메인 스레드)"""
-        try:
-            # 이전에 활성화된 모든 키 비활성화
-            for key in list(self.active_keys):
-                self.toggle_key_active(key)
-                
-            # 키보드 컨트롤러 초기화
-            keyboard_controller.reset_all_states()
-            
-            # 반복 중이었다면 상태 업데이트
-            if self.is_repeating:
-                self.is_repeating = False
-                self.key_repeat_btn.config(text="키보드 연타 시작 (F7)")
-                self.key_repeat_status.config(text="준비됨", style="Green.TLabel")
-        finally:
-            self.is_processing_hotkey = False
+        """모든 키 선택 해제 및 상태 표시 갱신 (GUI 스레드)"""
+        for key in list(self.active_keys):
+            self.toggle_key_active(key)
+        self._sync_repeat_ui()
     
     def setup_hotkeys(self):
         """전역 단축키 설정"""
         try:
+            hook = get_key_hook()
+            
             # F7: 키보드 연타 시작/중지
-            keyboard.add_hotkey('f7', self.safe_toggle_key_repeat, suppress=True)
+            hook.add_hotkey('f7', self.safe_toggle_key_repeat)
             
             # F8: 모든 키 초기화
-            keyboard.add_hotkey('f8', self.safe_reset_all_keys, suppress=True)
+            hook.add_hotkey('f8', self.safe_reset_all_keys)
             
-            print("키보드 연타 탭 단축키 설정 완료")
+            log.debug("키보드 연타 탭 단축키 설정 완료")
         except Exception as e:
-            print(f"단축키 설정 중 오류: {e}")
+            log.error("단축키 설정 중 오류: %s", e)
     
     def cleanup(self):
         """탭 정리 작업"""
-        # 키 반복 중지
-        if self.is_repeating:
-            keyboard_controller.stop_all_repeats()
-            
-        # 모든 키 초기화
-        keyboard_controller.reset_all_states()
+        # 키 반복 중지, 눌린 키 해제, 스케줄러 종료 (컨트롤러를 사용한 적이 있을 때만)
+        controller = get_keyboard_controller(create=False)
+        if controller is not None:
+            controller.shutdown()
             
         try:
-            # 단축키 해제
-            keyboard.unhook_key('f7')
-            keyboard.unhook_key('f8')
+            # 단축키와 키 처리 함수 해제
+            hook = get_key_hook(create=False)
+            if hook is not None:
+                for key in ('f7', 'f8', *self.active_keys):
+                    hook.remove_key(key)
         except Exception as e:
-            print(f"단축키 해제 중 오류: {e}") 
\ No newline at end of file
+            log.error("단축키 해제 중 오류: %s", e) 
\ No newline at end of file
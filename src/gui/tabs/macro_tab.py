@@ -0,0 +1,340 @@
+"""
+매크로 탭
+
+키보드/마우스 입력 녹화와 녹화한 타임라인 재생 기능을 제공하는 탭 UI 구현
+"""
+import os
+import threading
+import tkinter as tk
+from tkinter import ttk
+from tkinter import filedialog, messagebox
+
+from src.core.key_hook import get_key_hook
+from src.core.macro_compiler import compile_timeline
+from src.core.playback import (
+    LOOP_COUNT, LOOP_FOREVER, LOOP_ONCE, MAX_SPEED, MIN_SPEED, TimelinePlayer,
+)
+from src.core.recorder import InputRecorder
+from src.core.timeline import Timeline
+from src.utils.fast_log import get_logger
+
+log = get_logger("MacroTab")
+
+# 녹화/재생 중 상태 표시 갱신 주기 (ms)
+STATUS_REFRESH_MS = 100
+
+# 녹화/재생 단축키 (녹화에서 제외)
+RECORD_HOTKEY = "f10"
+PLAY_HOTKEY = "f11"
+
+# 반복 방식 표시 이름
+LOOP_LABELS = {"한 번": LOOP_ONCE, "횟수 반복": LOOP_COUNT, "무한 반복": LOOP_FOREVER}
+
+# 타임라인 파일 확장자
+FILE_TYPES = [("입력 타임라인", "*.aitl"), ("모든 파일", "*.*")]
+
+class MacroTab:
+    def __init__(self, parent):
+        self.parent = parent
+        self.frame = ttk.Frame(parent, padding=15)
+        
+        # 초기 변수 설정
+        self.recorder = InputRecorder(ignore_keys=(RECORD_HOTKEY, PLAY_HOTKEY))
+        self.player = TimelinePlayer()
+        self.timeline = None  # 녹화했거나 불러온 타임라인
+        self.timeline_name = "없음"  # 타임라인 표시 이름
+        self._control_lock = threading.Lock()  # 녹화/재생 전환 요청 직렬화 (단축키 스레드와 GUI 스레드)
+        self._refresh_timer_id = None  # 상태 표시 갱신 타이머 ID
+        
+        # UI 구성
+        self._create_widgets()
+    
+    def _create_widgets(self):
+        # 탭 제목
+        title_label = ttk.Label(
+            self.frame,
+            text="매크로 녹화/재생",
+            style="Title.TLabel"
+        )
+        title_label.pack(pady=(0, 15))
+        
+        # 녹화
+        record_frame = ttk.LabelFrame(self.frame, text="녹화", padding=10)
+        record_frame.pack(fill=tk.X, pady=8)
+        
+        self.record_btn = ttk.Button(
+            record_frame,
+            text="녹화 시작 (F10)",
+            command=self.toggle_recording
+        )
+        self.record_btn.pack(fill=tk.X, ipady=5)
+        
+        self.record_status = ttk.Label(record_frame, text="준비됨", style="Green.TLabel")
+        self.record_status.pack(pady=5)
+        
+        # 파일
+        file_frame = ttk.LabelFrame(self.frame, text="타임라인", padding=10)
+        file_frame.pack(fill=tk.X, pady=8)
+        
+        self.timeline_label = ttk.Label(file_frame, text=self._format_timeline(), font=("맑은 고딕", 10))
+        self.timeline_label.pack(anchor=tk.W, pady=2)
+        
+        file_buttons = ttk.Frame(file_frame)
+        file_buttons.pack(fill=tk.X, pady=5)
+        
+        ttk.Button(file_buttons, text="저장", command=self._save_timeline).pack(side=tk.LEFT, padx=5, expand=True, fill=tk.X)
+        ttk.Button(file_buttons, text="불러오기", command=self._open_timeline).pack(side=tk.LEFT, padx=5, expand=True, fill=tk.X)
+        ttk.Button(file_buttons, text="최적화", command=self._compile_timeline).pack(side=tk.LEFT, padx=5, expand=True, fill=tk.X)
+        
+        # 재생 설정
+        play_frame = ttk.LabelFrame(self.frame, text="재생 설정", padding=10)
+        play_frame.pack(fill=tk.X, pady=8)
+        
+        speed_row = ttk.Frame(play_frame)
+        speed_row.pack(fill=tk.X, pady=3)
+        ttk.Label(speed_row, text="속도 (배):").pack(side=tk.LEFT, padx=5)
+        self.speed_var = tk.StringVar(value="1.0")
+        ttk.Spinbox(
+            speed_row, from_=MIN_SPEED, to=MAX_SPEED, increment=0.25, width=6,
+            textvariable=self.speed_var, command=self._apply_speed
+        ).pack(side=tk.LEFT, padx=5)
+        self.speed_var.trace_add("write", lambda *args: self._apply_speed())
+        
+        loop_row = ttk.Frame(play_frame)
+        loop_row.pack(fill=tk.X, pady=3)
+        ttk.Label(loop_row, text="반복:").pack(side=tk.LEFT, padx=5)
+        self.loop_var = tk.StringVar(value="한 번")
+        loop_combo = ttk.Combobox(loop_row, textvariable=self.loop_var, values=list(LOOP_LABELS),
+                                  state="readonly", width=10)
+        loop_combo.pack(side=tk.LEFT, padx=5)
+        loop_combo.bind("<<ComboboxSelected>>", lambda event: self._apply_loop())
+        ttk.Label(loop_row, text="횟수:").pack(side=tk.LEFT, padx=5)
+        self.loop_count_var = tk.StringVar(value="2")
+        ttk.Spinbox(
+            loop_row, from_=1, to=9999, width=6,
+            textvariable=self.loop_count_var, command=self._apply_loop
+        ).pack(side=tk.LEFT, padx=5)
+        
+        seek_row = ttk.Frame(play_frame)
+        seek_row.pack(fill=tk.X, pady=3)
+        ttk.Label(seek_row, text="위치 (초):").pack(side=tk.LEFT, padx=5)
+        self.seek_var = tk.StringVar(value="0")
+        ttk.Entry(seek_row, textvariable=self.seek_var, width=8).pack(side=tk.LEFT, padx=5)
+        ttk.Button(seek_row, text="이동", command=self._seek).pack(side=tk.LEFT, padx=5)
+        
+        # 재생
+        self.play_btn = ttk.Button(
+            self.frame,
+            text="재생 시작 (F11)",
+            style="Large.TButton",
+            command=self.toggle_playback
+        )
+        self.play_btn.pack(fill=tk.X, ipady=10, pady=(15, 5))
+        
+        self.play_status = ttk.Label(self.frame, text="", font=("맑은 고딕", 10))
+        self.play_status.pack(pady=5)
+        
+        # 단축키 안내
+        hotkey_frame = ttk.LabelFrame(self.frame, text="단축키 안내", padding=10)
+        hotkey_frame.pack(fill=tk.X, pady=8)
+        
+        ttk.Label(hotkey_frame, text="F10: 녹화 시작/중지", font=("맑은 고딕", 11)).pack(anchor=tk.W, pady=2)
+        ttk.Label(hotkey_frame, text="F11: 재생 시작/중지", font=("맑은 고딕", 11)).pack(anchor=tk.W, pady=2)
+    
+    def _format_timeline(self):
+        """현재 타임라인 정보 문자열"""
+        if self.timeline is None:
+            return "타임라인: 없음"
+        return f"타임라인: {self.timeline_name} (이벤트 {len(self.timeline):,}개, {self.timeline.nbytes / 1024:,.0f}KB)"
+    
+    def _set_timeline(self, timeline, name):
+        """재생할 타임라인 교체 (메모리 매핑으로 연 이전 파일은 닫음)"""
+        previous = self.timeline
+        self.player.load(timeline)
+        self.timeline = timeline
+        self.timeline_name = name
+        if previous is not None and previous is not timeline:
+            previous.close()
+        self.timeline_label.config(text=self._format_timeline())
+    
+    def toggle_recording(self):
+        """녹화 시작/중지 (GUI 스레드와 단축키 스레드 모두에서 호출 가능)"""
+        with self._control_lock:
+            if self.recorder.recording:
+                timeline = self.recorder.stop()
+                self._notify_gui(lambda: self._set_timeline(timeline, "새 녹화"))
+            else:
+                if self.player.is_running():
+                    return
+                self.recorder.start()
+        self._notify_gui(self._sync_ui)
+    
+    def toggle_playback(self):
+        """재생 시작/중지 (GUI 스레드와 단축키 스레드 모두에서 호출 가능)"""
+        with self._control_lock:
+            if self.player.is_running():
+                self.player.stop()
+            elif self.timeline is not None and not self.recorder.recording:
+                self.player.start()
+        self._notify_gui(self._sync_ui)
+    
+    def safe_toggle_recording(self, trigger_ns=None):
+        """단축키 콜백 - 녹화 시작/중지"""
+        self.toggle_recording()
+    
+    def safe_toggle_playback(self, trigger_ns=None):
+        """단축키 콜백 - 재생 시작/중지"""
+        self.toggle_playback()
+    
+    def _apply_speed(self):
+        """재생 속도 입력값 적용 (재생 중에도 적용)"""
+        try:
+            self.player.set_speed(float(self.speed_var.get()))
+        except ValueError:
+            pass
+    
+    def _apply_loop(self):
+        """반복 방식 입력값 적용"""
+        try:
+            count = int(self.loop_count_var.get())
+        except ValueError:
+            count = 1
+        self.player.set_loop(LOOP_LABELS[self.loop_var.get()], count)
+    
+    def _seek(self):
+        """입력한 위치로 이동 (재생 중이 아니면 다음 재생 시작 위치)"""
+        try:
+            seconds = float(self.seek_var.get())
+        except ValueError:
+            messagebox.showerror("입력 오류", "위치는 초 단위 숫자로 입력하세요.")
+            return
+        self.player.seek(seconds)
+    
+    def _save_timeline(self):
+        """현재 타임라인을 파일로 저장"""
+        if self.timeline is None:
+            messagebox.showinfo("저장", "저장할 타임라인이 없습니다.")
+            return
+        path = filedialog.asksaveasfilename(defaultextension=".aitl", filetypes=FILE_TYPES)
+        if not path:
+            return
+        try:
+            self.timeline.save(path)
+            self.timeline_name = os.path.basename(path)
+            self.timeline_label.config(text=self._format_timeline())
+        except OSError as e:
+            messagebox.showerror("저장 실패", str(e))
+    
+    def _open_timeline(self):
+        """타임라인 파일 불러오기 (메모리 매핑으로 열어 바로 재생 가능)"""
+        path = filedialog.askopenfilename(filetypes=FILE_TYPES)
+        if not path:
+            return
+        try:
+            timeline = Timeline.open(path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("불러오기 실패", str(e))
+            return
+        self._set_timeline(timeline, os.path.basename(path))
+        self._sync_ui()
+    
+    def _compile_timeline(self):
+        """현재 타임라인을 최적화한 타임라인으로 교체하고 줄어든 양 표시"""
+        if self.timeline is None:
+            messagebox.showinfo("최적화", "최적화할 타임라인이 없습니다.")
+            return
+        if self.player.is_running():
+            messagebox.showinfo("최적화", "재생을 중지한 뒤 최적화하세요.")
+            return
+        try:
+            compiled, report = compile_timeline(self.timeline)
+        except ImportError:
+            messagebox.showerror("최적화 실패", "최적화에는 NumPy가 필요합니다.\npip install numpy")
+            return
+        self._set_timeline(compiled, f"{self.timeline_name} (최적화)")
+        messagebox.showinfo(
+            "최적화 완료",
+            f"이벤트: {report['events_before']:,} -> {report['events_after']:,}개 "
+            f"({report['event_reduction'] * 100:.0f}% 감소)\n"
+            f"크기: {report['bytes_before'] / 1024:,.1f} -> {report['bytes_after'] / 1024:,.1f}KB "
+            f"({report['size_reduction'] * 100:.0f}% 감소)\n"
+            f"이동 합침 {report['moves_merged']:,}개, 경로 단순화 {report['moves_simplified']:,}개, "
+            f"누름/해제 합침 {report['key_taps'] + report['clicks']:,}개\n"
+            f"줄인 대기 시간 {report['idle_trimmed_s']:.1f}초"
+        )
+    
+    def _sync_ui(self):
+        """녹화/재생 상태를 버튼과 상태 표시에 반영하고 필요하면 갱신 루프 예약 (GUI 스레드)"""
+        if self._refresh_timer_id is not None:
+            self.frame.after_cancel(self._refresh_timer_id)
+            self._refresh_timer_id = None
+        
+        recording = self.recorder.recording
+        if recording:
+            stats = self.recorder.get_stats()
+            self.record_btn.config(text="녹화 중지 (F10)")
+            self.record_status.config(
+                text=f"녹화 중... 이벤트 {stats['records']:,}개, {stats['bytes'] / 1024:,.0f}KB",
+                style="Red.TLabel"
+            )
+        else:
+            self.record_btn.config(text="녹화 시작 (F10)")
+            self.record_status.config(text="준비됨", style="Green.TLabel")
+        
+        playing = self.player.is_running()
+        self.play_btn.config(text="재생 중지 (F11)" if playing else "재생 시작 (F11)")
+        if self.player.events_played:
+            stats = self.player.get_stats()
+            self.play_status.config(
+                text=f"{stats['index']:,}/{stats['events']:,} ({stats['position_s']:.1f}초, {stats['pass']}회차)\n"
+                     f"타이밍 오차 p50 {stats['p50_us']:.0f}us / p99 {stats['p99_us']:.0f}us / 최대 {stats['error_max_us']:.0f}us"
+            )
+        
+        if recording or playing:
+            self._refresh_timer_id = self.frame.after(STATUS_REFRESH_MS, self._sync_ui)
+    
+    def _notify_gui(self, func):
+        """GUI 스레드에서 func 실행 (이미 GUI 스레드라면 바로 실행)"""
+        if threading.current_thread() is threading.main_thread():
+            func()
+        else:
+            self.frame.after(0, func)
+    
+    def setup_hotkeys(self):
+        """전역 단축키 설정"""
+        try:
+            hook = get_key_hook()
+            
+            # F10: 녹화 시작/중지
+            hook.add_hotkey(RECORD_HOTKEY, self.safe_toggle_recording)
+            
+            # F11: 재생 시작/중지
+            hook.add_hotkey(PLAY_HOTKEY, self.safe_toggle_playback)
+            
+            log.debug("매크로 탭 단축키 설정 완료")
+        except Exception as e:
+            log.error("단축키 설정 중 오류: %s", e)
+    
+    def cleanup(self):
+        """탭 정리 작업"""
+        # 녹화/재생 중지 (재생 중 눌린 키/버튼은 재생 스레드가 해제)
+        if self.recorder.recording:
+            self.recorder.stop()
+        self.player.stop(wait=True)
+        
+        # 화면 갱신 중지
+        if self._refresh_timer_id is not None:
+            self.frame.after_cancel(self._refresh_timer_id)
+            self._refresh_timer_id = None
+        
+        if self.timeline is not None:
+            self.timeline.close()
+        
+        try:
+            # 단축키 해제
+            hook = get_key_hook(create=False)
+            if hook is not None:
+                hook.remove_key(RECORD_HOTKEY)
+                hook.remove_key(PLAY_HOTKEY)
+        except Exception as e:
+            log.error("단축키 해제 중 오류: %s", e)
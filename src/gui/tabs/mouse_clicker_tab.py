@@ -3,14 +3,25 @@
 
 마우스 자동 클릭 기능을 제공하는 탭 UI 구현
 """
+import math
+import threading
 import tkinter as tk
 from tkinter import ttk
-import threading
-import time
-import keyboard
 
-from src.core.mouse_position import get_mouse_position
-from src.core.mouse_click import click_at_position
+from src.core.key_hook import get_key_hook
+from src.core.mouse_position import get_position_source
+from src.core.mouse_click import click_at_position, click_burst_at_position, hold_for_interval
+from src.core.click_engine import ClickEngine, POLICY_SKIP, POLICY_CATCH_UP
+from src.core.timing import now_ns
+from src.gui.pattern_editor import DEFAULT_SETTINGS, PatternEditor
+from src.utils.fast_log import get_logger
+
+log = get_logger("MouseClickerTab")
+
+# 화면 갱신 주기 (ms) - 약 30 FPS로 제한
+GUI_REFRESH_MS = 33
+# 클릭 속도/지연 통계 표시 갱신 간격 (화면 갱신 횟수 기준, 약 0.5초)
+RATE_REFRESH_FRAMES = 15
 
 class MouseClickerTab:
     def __init__(self, parent):
@@ -19,12 +30,26 @@ class MouseClickerTab:
         
         # 초기 변수 설정
         self.running = False  # 클릭 실행 여부
-        self.click_interval = 0.1  # 클릭 간격 (초)
+        self.click_interval = 0.1  # 클릭 간격 (초, 마이크로초 단위까지 사용)
+        self.click_hold = hold_for_interval(self.click_interval)  # 누름 유지 시간 (초)
         self.current_x = 0  # 현재 마우스 X 좌표
         self.current_y = 0  # 현재 마우스 Y 좌표
-        self.click_count = 0  # 클릭 횟수
-        self.click_thread = None  # 클릭 스레드
-        self.is_processing_hotkey = False  # 핫키 처리 중 플래그
+        self._count_base = 0  # 이전 실행까지의 클릭 횟수 (카운터 초기화 반영)
+        self._shown_count = 0  # 화면에 표시된 클릭 횟수
+        self._control_lock = threading.Lock()  # 시작/중지 요청 직렬화 (단축키 스레드와 GUI 스레드)
+        
+        # 클릭 엔진 (절대 데드라인 기반)
+        self.click_engine = ClickEngine(
+            self._click, self._get_click_position, self.click_interval,
+            burst_func=click_burst_at_position
+        )
+        self.catch_up_var = None  # 밀린 클릭 따라잡기 여부
+        self.burst_var = None  # 틱당 클릭 수
+        self.cps_var = None  # 목표 CPS 입력값
+        self._refresh_timer_id = None  # 화면 갱신 타이머 ID
+        self._refresh_frame = 0  # 화면 갱신 횟수
+        self.pattern_settings = dict(DEFAULT_SETTINGS)  # 패턴 편집 창 입력값 (창을 닫아도 유지)
+        self.pattern_editor = None  # 열려 있는 패턴 편집 창
         
         # UI 구성
         self._create_widgets()
@@ -45,6 +70,15 @@ class MouseClickerTab:
         self.position_label = ttk.Label(position_frame, text="X: 0, Y: 0", font=("맑은 고딕", 12))
         self.position_label.pack(pady=5)
         
+        # 클릭 위치 (현재 마우스 위치 또는 좌표 패턴)
+        pattern_row = ttk.Frame(position_frame)
+        pattern_row.pack(fill=tk.X)
+        
+        ttk.Label(pattern_row, text="클릭 위치:").pack(side=tk.LEFT, padx=5)
+        self.pattern_label = ttk.Label(pattern_row, text="현재 마우스 위치", font=("맑은 고딕", 11))
+        self.pattern_label.pack(side=tk.LEFT, padx=5, fill=tk.X, expand=True)
+        ttk.Button(pattern_row, text="패턴 편집", command=self.open_pattern_editor).pack(side=tk.RIGHT, padx=5)
+        
         # 클릭 간격 설정
         interval_frame = ttk.LabelFrame(self.frame, text="클릭 간격 설정", padding=10)
         interval_frame.pack(fill=tk.X, pady=8)
@@ -56,13 +90,54 @@ class MouseClickerTab:
                                  command=self.decrease_interval)
         decrease_btn.pack(side=tk.LEFT, padx=5)
         
-        self.interval_label = ttk.Label(interval_control, text=f"{self.click_interval:.1f}초", font=("맑은 고딕", 12))
+        self.interval_label = ttk.Label(interval_control, text=self._format_interval(), font=("맑은 고딕", 12))
         self.interval_label.pack(side=tk.LEFT, padx=20, fill=tk.X, expand=True)
         
         increase_btn = ttk.Button(interval_control, text="+", width=4,
                                  command=self.increase_interval)
         increase_btn.pack(side=tk.RIGHT, padx=5)
         
+        # 목표 CPS 직접 입력 (초당 클릭 수, 소수점 허용)
+        cps_control = ttk.Frame(interval_frame)
+        cps_control.pack(fill=tk.X, pady=2)
+        
+        ttk.Label(cps_control, text="목표 CPS:").pack(side=tk.LEFT, padx=5)
+        
+        self.cps_var = tk.StringVar(value=f"{1.0 / self.click_interval:g}")
+        cps_entry = ttk.Entry(cps_control, textvariable=self.cps_var, width=10)
+        cps_entry.pack(side=tk.LEFT, padx=5)
+        cps_entry.bind("<Return>", lambda e: self._apply_cps())
+        
+        ttk.Button(cps_control, text="적용", command=self._apply_cps).pack(side=tk.LEFT, padx=5)
+        
+        # 지연 처리 정책
+        self.catch_up_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            interval_frame,
+            text="밀린 클릭 따라잡기 (해제 시 건너뜀)",
+            variable=self.catch_up_var,
+            command=self._update_policy
+        ).pack(anchor=tk.W, pady=2)
+        
+        # 틱당 클릭 수 (2 이상이면 한 번에 연속 클릭 전송)
+        burst_control = ttk.Frame(interval_frame)
+        burst_control.pack(fill=tk.X, pady=2)
+        
+        ttk.Label(burst_control, text="틱당 클릭 수:").pack(side=tk.LEFT, padx=5)
+        
+        self.burst_var = tk.IntVar(value=1)
+        burst_spinbox = ttk.Spinbox(
+            burst_control,
+            from_=1,
+            to=50,
+            width=5,
+            textvariable=self.burst_var,
+            command=self._update_burst
+        )
+        burst_spinbox.pack(side=tk.LEFT, padx=5)
+        burst_spinbox.bind("<Return>", lambda e: self._update_burst())
+        burst_spinbox.bind("<FocusOut>", lambda e: self._update_burst())
+        
         # 클릭 카운터
         counter_frame = ttk.LabelFrame(self.frame, text="클릭 카운터", padding=10)
         counter_frame.pack(fill=tk.X, pady=8)
@@ -88,6 +163,9 @@ class MouseClickerTab:
         )
         self.status_label.pack(pady=5)
         
+        self.rate_label = ttk.Label(status_frame, text="목표 10.0 CPS", font=("맑은 고딕", 11))
+        self.rate_label.pack(pady=2)
+        
         # 시작/중지 버튼
         control_frame = ttk.Frame(self.frame)
         control_frame.pack(fill=tk.X, pady=15)
@@ -112,100 +190,245 @@ class MouseClickerTab:
         self.current_x, self.current_y = x, y
         self.position_label.config(text=f"X: {x}, Y: {y}")
     
-    def toggle_clicking(self):
-        """자동 클릭 시작/중지"""
-        self.running = not self.running
+    def open_pattern_editor(self):
+        """클릭 패턴 편집 창 열기 (이미 열려 있으면 앞으로 가져옴)"""
+        if self.pattern_editor is not None and self.pattern_editor.window.winfo_exists():
+            self.pattern_editor.window.lift()
+            return
+        self.pattern_editor = PatternEditor(
+            self.frame, self.pattern_settings,
+            lambda: (self.click_interval, self.click_engine.clicks_per_tick),
+            self._apply_pattern
+        )
+    
+    def _apply_pattern(self, pattern, description):
+        """패턴 편집 창에서 적용한 패턴 설정 (실행 중이면 다음 시작부터 적용)"""
+        self.click_engine.set_pattern(pattern)
+        if pattern is not None and self.running:
+            description += " - 다음 시작부터 적용"
+        self.pattern_label.config(text=description)
+    
+    def toggle_clicking(self, trigger_ns=None):
+        """
+        자동 클릭 시작/중지 (GUI 스레드와 단축키 스레드 모두에서 호출 가능)
         
+        Args:
+            trigger_ns (int): 시작 지연 측정 기준 시각 (단축키가 눌린 시각)
+        """
+        with self._control_lock:
+            # 엔진은 실행마다 0부터 세므로 이전 실행의 클릭 수를 누적
+            previous = self.click_engine.click_count
+            self.running = self.click_engine.toggle(trigger_ns)
+            if self.running:
+                self._count_base += previous
+        self._notify_gui(self._sync_running_ui)
+    
+    def _sync_running_ui(self):
+        """실행 상태를 버튼/상태 표시에 반영 (GUI 스레드)"""
         if self.running:
             self.start_btn.config(text="자동 클릭 중지 (F6)")
             self.status_label.config(text="실행 중...", style="Red.TLabel")
-            # 클릭 스레드 시작
-            self.click_thread = threading.Thread(target=self.auto_click)
-            self.click_thread.daemon = True
-            self.click_thread.start()
+            self._start_gui_refresh()
         else:
             self.start_btn.config(text="자동 클릭 시작 (F6)")
             self.status_label.config(text="준비됨", style="Green.TLabel")
+            self._refresh_gui()
+    
+    def _click(self, x, y):
+        """클릭 수행 (클릭 엔진에서 호출) - 간격에 맞는 누름 유지 시간 사용"""
+        click_at_position(x, y, self.click_hold)
     
-    def auto_click(self):
-        """자동 클릭 스레드 함수"""
-        while self.running:
-            try:
-                click_at_position(self.current_x, self.current_y)
-                self.click_count += 1
-                self.click_counter.config(text=f"{self.click_count}회")
-                time.sleep(self.click_interval)
-            except Exception as e:
-                print(f"자동 클릭 중 오류: {e}")
-                break
+    def _get_click_position(self):
+        """클릭할 좌표 반환 (클릭 엔진에서 호출) - Tk를 거치지 않고 위치 소스에서 직접 읽음"""
+        return get_position_source().position()
+    
+    @property
+    def click_count(self):
+        """누적 클릭 횟수 (클릭 스레드가 올린 엔진 카운터 기준)"""
+        return self._count_base + self.click_engine.click_count
+    
+    def _start_gui_refresh(self):
+        """화면 갱신 루프 시작 (이미 실행 중이면 다시 예약하지 않음)"""
+        if self._refresh_timer_id is None:
+            self._refresh_frame = 0
+            self._refresh_gui()
+    
+    def _refresh_gui(self):
+        """
+        클릭 수/상태/클릭 속도를 화면에 반영 (메인 스레드)
+        
+        클릭 스레드는 엔진 카운터만 올리고 위젯은 건드리지 않습니다.
+        실행 중에는 GUI_REFRESH_MS마다 이 함수 하나만 예약되므로
+        클릭 속도와 관계없이 Tk 이벤트 큐에 쌓이는 작업 수가 일정합니다.
+        """
+        if self._refresh_timer_id is not None:
+            self.frame.after_cancel(self._refresh_timer_id)
+            self._refresh_timer_id = None
+        
+        # 클릭 스레드가 스스로 종료된 경우 상태 반영
+        if self.running and not self.click_engine.is_running():
+            self.running = False
+            self.start_btn.config(text="자동 클릭 시작 (F6)")
+            self.status_label.config(text="준비됨", style="Green.TLabel")
+        
+        count = self.click_count
+        if count != self._shown_count:
+            self._shown_count = count
+            self.click_counter.config(text=f"{count}회")
+        
+        if not self.running or self._refresh_frame % RATE_REFRESH_FRAMES == 0:
+            self._update_rate_label()
+        
+        if self.running:
+            self._refresh_frame += 1
+            self._refresh_timer_id = self.frame.after(GUI_REFRESH_MS, self._refresh_gui)
+    
+    def _update_rate_label(self):
+        """목표/실제 클릭 속도 표시"""
+        stats = self.click_engine.get_stats()
+        if self.running:
+            text = (f"목표 {stats['target_cps']:.1f} CPS / 실제 {stats['achieved_cps']:.1f} CPS "
+                    f"(건너뜀 {stats['skipped']}회)\n"
+                    f"지연 p50 {stats['p50_us']:.0f}us / p95 {stats['p95_us']:.0f}us / p99 {stats['p99_us']:.0f}us "
+                    f"/ 시작 {stats['start_latency_ms']:.1f}ms")
+            pattern = self.click_engine.pattern
+            if pattern is not None:
+                text += f"\n패턴 {stats['point_index']:,}/{len(pattern):,} ({stats['pattern_cycles']}바퀴 완료)"
+            if stats["unreachable"]:
+                text += " - 목표 속도 도달 불가"
+            self.rate_label.config(text=text)
+        else:
+            self.rate_label.config(text=f"목표 {stats['target_cps']:.1f} CPS")
+    
+    def _update_burst(self):
+        """틱당 클릭 수 변경"""
+        try:
+            count = int(self.burst_var.get())
+        except (tk.TclError, ValueError):
+            return
+        self.click_engine.set_clicks_per_tick(min(max(count, 1), 50))
+        self._update_rate_label()
+    
+    def _update_policy(self):
+        """지연 처리 정책 변경"""
+        self.click_engine.set_policy(POLICY_CATCH_UP if self.catch_up_var.get() else POLICY_SKIP)
+    
+    def _format_interval(self):
+        """클릭 간격 표시 문자열 (0.1초 미만은 밀리초 단위)"""
+        if self.click_interval >= 0.1:
+            return f"{self.click_interval:.2f}초 ({1.0 / self.click_interval:.1f} CPS)"
+        return f"{self.click_interval * 1000:.3f}ms ({1.0 / self.click_interval:.1f} CPS)"
+    
+    def _interval_step(self, increasing):
+        """현재 간격에 맞는 조절 단위 (0.1초 / 10ms / 1ms)"""
+        interval = self.click_interval if increasing else self.click_interval - 1e-9
+        if interval >= 0.1:
+            return 0.1
+        if interval >= 0.01:
+            return 0.01
+        return 0.001
+    
+    def set_interval(self, interval):
+        """클릭 간격 설정 (1ms-10초)"""
+        self.click_interval = min(max(interval, 0.001), 10.0)
+        self.click_hold = hold_for_interval(self.click_interval)
+        self.interval_label.config(text=self._format_interval())
+        self.cps_var.set(f"{1.0 / self.click_interval:g}")
+        self.click_engine.set_interval(self.click_interval)
+        self._update_rate_label()
     
     def increase_interval(self):
         """클릭 간격 증가"""
-        self.click_interval = round(min(self.click_interval + 0.1, 10.0), 1)
-        self.interval_label.config(text=f"{self.click_interval:.1f}초")
+        self.set_interval(round(self.click_interval + self._interval_step(True), 6))
     
     def decrease_interval(self):
         """클릭 간격 감소"""
-        self.click_interval = round(max(self.click_interval - 0.1, 0.1), 1)
-        self.interval_label.config(text=f"{self.click_interval:.1f}초")
+        self.set_interval(round(self.click_interval - self._interval_step(False), 6))
+    
+    def _apply_cps(self):
+        """입력한 목표 CPS 적용"""
+        try:
+            cps = float(self.cps_var.get())
+        except ValueError:
+            self.cps_var.set(f"{1.0 / self.click_interval:g}")
+            return
+        # nan, inf는 범위 제한을 통과하므로 먼저 거름
+        if not math.isfinite(cps) or cps <= 0:
+            self.cps_var.set(f"{1.0 / self.click_interval:g}")
+            return
+        self.set_interval(1.0 / cps)
+    
+    def _reset_count(self):
+        """클릭 수 초기화 (위젯은 건드리지 않음)"""
+        with self._control_lock:
+            self._count_base = -self.click_engine.click_count
     
     def reset_counter(self):
         """클릭 카운터 초기화"""
-        self.click_count = 0
+        self._reset_count()
+        self._shown_count = 0
         self.click_counter.config(text="0회")
     
-    def safe_toggle_clicking(self):
-        """스레드 안전한 클릭 토글"""
-        if self.is_processing_hotkey:
-            return
-            
-        self.is_processing_hotkey = True
-        self.frame.after(0, self._process_toggle_clicking)
+    def safe_toggle_clicking(self, trigger_ns=None):
+        """
+        단축키 콜백 - 키 이벤트 처리 스레드에서 클릭 엔진을 바로 시작/중지
+        
+        Tk 메인 루프를 거치지 않으므로 GUI가 바쁠 때도 시작/중지가 늦어지지 않으며,
+        화면은 엔진 상태가 바뀐 뒤에 갱신됩니다.
+        
+        Args:
+            trigger_ns (int): 단축키가 눌린 시각 (시작 지연 측정 기준, 기본값: 호출 시각)
+        """
+        self.toggle_clicking(trigger_ns or now_ns())
     
-    def _process_toggle_clicking(self):
-        """토글 클릭 처리 (메인 스레드)"""
-        try:
-            self.toggle_clicking()
-        finally:
-            self.is_processing_hotkey = False
+    def safe_reset_counter(self, trigger_ns=None):
+        """단축키 콜백 - 키 이벤트 처리 스레드에서 카운터를 바로 초기화하고 화면은 나중에 갱신"""
+        self._reset_count()
+        self._notify_gui(self._refresh_gui)
     
-    def safe_reset_counter(self):
-        """스레드 안전한 카운터 초기화"""
-        if self.is_processing_hotkey:
-            return
-            
-        self.is_processing_hotkey = True
-        self.frame.after(0, self._process_reset_counter)
-    
-    def _process_reset_counter(self):
-        """카운터 초기화 처리 (메인 스레드)"""
-        try:
-            self.reset_counter()
-        finally:
-            self.is_processing_hotkey = False
+    def _notify_gui(self, func):
+        """GUI 스레드에서 func 실행 (이미 GUI 스레드라면 바로 실행)"""
+        if threading.current_thread() is threading.main_thread():
+            func()
+        else:
+            self.frame.after(0, func)
     
     def setup_hotkeys(self):
         """전역 단축키 설정"""
         try:
+            hook = get_key_hook()
+            
             # F6: 자동 클릭 시작/중지
-            keyboard.add_hotkey('f6', self.safe_toggle_clicking, suppress=True)
+            hook.add_hotkey('f6', self.safe_toggle_clicking)
             
             # F9: 클릭 횟수 초기화
-            keyboard.add_hotkey('f9', self.safe_reset_counter, suppress=True)
+            hook.add_hotkey('f9', self.safe_reset_counter)
             
-            print("마우스 클릭 탭 단축키 설정 완료")
+            log.debug("마우스 클릭 탭 단축키 설정 완료")
         except Exception as e:
-            print(f"단축키 설정 중 오류: {e}")
+            log.error("단축키 설정 중 오류: %s", e)
     
     def cleanup(self):
         """탭 정리 작업"""
         # 클릭 중지
         if self.running:
             self.running = False  # 클릭 중단
+            self.click_engine.stop()
+        
+        # 화면 갱신 중지
+        if self._refresh_timer_id is not None:
+            self.frame.after_cancel(self._refresh_timer_id)
+            self._refresh_timer_id = None
+        
+        # 패턴 편집 창 닫기
+        if self.pattern_editor is not None and self.pattern_editor.window.winfo_exists():
+            self.pattern_editor.close()
             
         try:
             # 단축키 해제
-            keyboard.unhook_key('f6')
-            keyboard.unhook_key('f9')
+            hook = get_key_hook(create=False)
+            if hook is not None:
+                hook.remove_key('f6')
+                hook.remove_key('f9')
         except Exception as e:
-            print(f"단축키 해제 중 오류: {e}") 
\ No newline at end of file
+            log.error("단축키 해제 중 오류: %s", e) 
\ No newline at end of file
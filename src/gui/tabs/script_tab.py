@@ -0,0 +1,219 @@
+"""
+스크립트 탭
+
+매크로 스크립트(클릭/키 입력 순서, 반복, 대기, 변수, 서브 매크로) 편집과 실행 기능을 제공하는 탭 UI 구현
+"""
+import threading
+import tkinter as tk
+from tkinter import ttk
+from tkinter import filedialog, messagebox
+
+from src.core.key_hook import get_key_hook
+from src.core.macro_script import MacroRunner, compile_script
+from src.utils.fast_log import get_logger
+
+log = get_logger("ScriptTab")
+
+# 실행 중 상태 표시 갱신 주기 (ms)
+STATUS_REFRESH_MS = 100
+
+# 실행/중지 단축키
+RUN_HOTKEY = "f12"
+
+# 스크립트 파일 확장자
+FILE_TYPES = [("매크로 스크립트", "*.macro"), ("텍스트 파일", "*.txt"), ("모든 파일", "*.*")]
+
+# 처음 표시할 예제 스크립트
+EXAMPLE_SCRIPT = """# (500, 400)을 15ms마다 20번 클릭, q 누름, 200ms 대기를 500번 반복
+macro burst
+    click (500, 400) 20 times every 15ms
+end
+
+loop 500
+    call burst
+    press q
+    wait 200ms
+end
+"""
+
+class ScriptTab:
+    def __init__(self, parent):
+        self.parent = parent
+        self.frame = ttk.Frame(parent, padding=15)
+        
+        # 초기 변수 설정
+        self.runner = MacroRunner()
+        self._control_lock = threading.Lock()  # 실행/중지 전환 요청 직렬화 (단축키 스레드와 GUI 스레드)
+        self._refresh_timer_id = None  # 상태 표시 갱신 타이머 ID
+        
+        # UI 구성
+        self._create_widgets()
+    
+    def _create_widgets(self):
+        # 탭 제목
+        title_label = ttk.Label(
+            self.frame,
+            text="매크로 스크립트",
+            style="Title.TLabel"
+        )
+        title_label.pack(pady=(0, 15))
+        
+        # 편집기
+        editor_frame = ttk.LabelFrame(self.frame, text="스크립트", padding=10)
+        editor_frame.pack(fill=tk.BOTH, expand=True, pady=8)
+        
+        self.editor = tk.Text(editor_frame, height=10, width=50, font=("Consolas", 11), undo=True)
+        scrollbar = ttk.Scrollbar(editor_frame, command=self.editor.yview)
+        self.editor.config(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.editor.pack(fill=tk.BOTH, expand=True)
+        self.editor.insert("1.0", EXAMPLE_SCRIPT)
+        
+        file_buttons = ttk.Frame(self.frame)
+        file_buttons.pack(fill=tk.X, pady=5)
+        
+        ttk.Button(file_buttons, text="검사", command=self._check_script).pack(side=tk.LEFT, padx=5, expand=True, fill=tk.X)
+        ttk.Button(file_buttons, text="저장", command=self._save_script).pack(side=tk.LEFT, padx=5, expand=True, fill=tk.X)
+        ttk.Button(file_buttons, text="불러오기", command=self._open_script).pack(side=tk.LEFT, padx=5, expand=True, fill=tk.X)
+        
+        # 실행
+        self.run_btn = ttk.Button(
+            self.frame,
+            text="실행 (F12)",
+            style="Large.TButton",
+            command=self.toggle_running
+        )
+        self.run_btn.pack(fill=tk.X, ipady=10, pady=(15, 5))
+        
+        self.status_label = ttk.Label(self.frame, text="준비됨", style="Green.TLabel")
+        self.status_label.pack(pady=5)
+        
+        # 문법 안내
+        help_frame = ttk.LabelFrame(self.frame, text="문법 안내", padding=10)
+        help_frame.pack(fill=tk.X, pady=8)
+        
+        ttk.Label(
+            help_frame,
+            text="click x y [횟수 times] [every 간격] [hold 유지]  /  move x y\n"
+                 "press 키  /  down 키  /  up 키  /  wait 200ms\n"
+                 "set 변수 = 값 [+ - * / % 값]  /  loop [횟수] ... end\n"
+                 "macro 이름 ... end  /  call 이름  /  F12: 실행/중지",
+            font=("맑은 고딕", 10),
+            justify=tk.LEFT
+        ).pack(anchor=tk.W)
+    
+    def _compile(self):
+        """편집기 내용을 컴파일 (오류는 메시지 상자로 표시하고 None 반환, GUI 스레드)"""
+        try:
+            return compile_script(self.editor.get("1.0", tk.END))
+        except ValueError as e:
+            messagebox.showerror("스크립트 오류", str(e))
+            return None
+    
+    def _check_script(self):
+        """스크립트 문법 검사"""
+        program = self._compile()
+        if program is not None:
+            messagebox.showinfo(
+                "검사 완료",
+                f"명령 {len(program):,}개, 변수 {len(program.variables)}개, 서브 매크로 {len(program.macros)}개"
+            )
+    
+    def toggle_running(self):
+        """실행 시작/중지 (GUI 스레드)"""
+        with self._control_lock:
+            if self.runner.is_running():
+                self.runner.stop()
+            else:
+                program = self._compile()
+                if program is not None:
+                    self.runner.load(program)
+                    self.runner.start()
+        self._sync_ui()
+    
+    def safe_toggle_running(self, trigger_ns=None):
+        """단축키 콜백 - 실행 중이면 바로 중지, 아니면 GUI 스레드에서 편집기 내용을 읽어 실행"""
+        if self.runner.is_running():
+            self.runner.stop()
+            self.frame.after(0, self._sync_ui)
+        else:
+            self.frame.after(0, self.toggle_running)
+    
+    def _save_script(self):
+        """스크립트를 파일로 저장"""
+        path = filedialog.asksaveasfilename(defaultextension=".macro", filetypes=FILE_TYPES)
+        if not path:
+            return
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(self.editor.get("1.0", "end-1c"))
+        except OSError as e:
+            messagebox.showerror("저장 실패", str(e))
+    
+    def _open_script(self):
+        """스크립트 파일 불러오기"""
+        path = filedialog.askopenfilename(filetypes=FILE_TYPES)
+        if not path:
+            return
+        try:
+            with open(path, encoding="utf-8") as f:
+                source = f.read()
+        except (OSError, UnicodeDecodeError) as e:
+            messagebox.showerror("불러오기 실패", str(e))
+            return
+        self.editor.delete("1.0", tk.END)
+        self.editor.insert("1.0", source)
+    
+    def _sync_ui(self):
+        """실행 상태를 버튼과 상태 표시에 반영하고 실행 중이면 갱신 루프 예약 (GUI 스레드)"""
+        if self._refresh_timer_id is not None:
+            self.frame.after_cancel(self._refresh_timer_id)
+            self._refresh_timer_id = None
+        
+        running = self.runner.is_running()
+        self.run_btn.config(text="중지 (F12)" if running else "실행 (F12)")
+        stats = self.runner.get_stats()
+        if running:
+            self.status_label.config(
+                text=f"실행 중... 명령 {stats['instructions']:,}개, {stats['elapsed']:.1f}초",
+                style="Red.TLabel"
+            )
+            self._refresh_timer_id = self.frame.after(STATUS_REFRESH_MS, self._sync_ui)
+        elif stats["instructions"]:
+            self.status_label.config(
+                text=f"완료 - 명령 {stats['instructions']:,}개, {stats['elapsed']:.1f}초, "
+                     f"대기 지연 최대 {stats['max_lag_ms']:.2f}ms",
+                style="Green.TLabel"
+            )
+        else:
+            self.status_label.config(text="준비됨", style="Green.TLabel")
+    
+    def setup_hotkeys(self):
+        """전역 단축키 설정"""
+        try:
+            hook = get_key_hook()
+            
+            # F12: 스크립트 실행/중지
+            hook.add_hotkey(RUN_HOTKEY, self.safe_toggle_running)
+            
+            log.debug("스크립트 탭 단축키 설정 완료")
+        except Exception as e:
+            log.error("단축키 설정 중 오류: %s", e)
+    
+    def cleanup(self):
+        """탭 정리 작업"""
+        # 실행 중지 (눌러 둔 키는 실행 스레드가 해제)
+        self.runner.stop(wait=True)
+        
+        # 화면 갱신 중지
+        if self._refresh_timer_id is not None:
+            self.frame.after_cancel(self._refresh_timer_id)
+            self._refresh_timer_id = None
+        
+        try:
+            # 단축키 해제
+            hook = get_key_hook(create=False)
+            if hook is not None:
+                hook.remove_key(RUN_HOTKEY)
+        except Exception as e:
+            log.error("단축키 해제 중 오류: %s", e)
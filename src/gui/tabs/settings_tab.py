@@ -6,10 +6,15 @@
 import tkinter as tk
 from tkinter import ttk
 import sys
-import webbrowser
 import platform
 import ctypes
 
+from src.core.input_backend import BACKENDS, RecordingBackend, current_backend_name, set_backend
+from src.core.mouse_position import POSITION_SOURCES, current_position_source_name, set_position_source
+from src.utils.fast_log import get_logger
+
+log = get_logger("SettingsTab")
+
 class SettingsTab:
     def __init__(self, parent):
         self.parent = parent
@@ -87,7 +92,7 @@ class SettingsTab:
         github_button = ttk.Button(
             dev_frame,
             text="GitHub 저장소 방문",
-            command=lambda: webbrowser.open("https://github.com/")
+            command=lambda: self._open_url("https://github.com/")
         )
         github_button.pack(fill=tk.X, pady=5)
         
@@ -95,7 +100,7 @@ class SettingsTab:
         email_button = ttk.Button(
             dev_frame,
             text="이메일로 피드백 보내기",
-            command=lambda: webbrowser.open("mailto:example@example.com")
+            command=lambda: self._open_url("mailto:example@example.com")
         )
         email_button.pack(fill=tk.X, pady=5)
         
@@ -112,9 +117,71 @@ class SettingsTab:
             command=self._toggle_topmost
         )
         topmost_check.pack(anchor=tk.W, pady=5)
+        
+        # 입력 방식 (입력 백엔드) 선택
+        backend_frame = ttk.Frame(settings_frame)
+        backend_frame.pack(fill=tk.X, pady=5)
+        
+        ttk.Label(backend_frame, text="입력 방식:").pack(side=tk.LEFT, padx=5)
+        
+        self.backend_var = tk.StringVar(value=current_backend_name())
+        backend_combo = ttk.Combobox(
+            backend_frame,
+            textvariable=self.backend_var,
+            values=[name for name in BACKENDS if name != RecordingBackend.name],
+            state="readonly",
+            width=20
+        )
+        backend_combo.pack(side=tk.LEFT, padx=5)
+        backend_combo.bind("<<ComboboxSelected>>", self._change_backend)
+        
+        # 커서 추적 방식 (위치 소스) 선택
+        source_frame = ttk.Frame(settings_frame)
+        source_frame.pack(fill=tk.X, pady=5)
+        
+        ttk.Label(source_frame, text="커서 추적 방식:").pack(side=tk.LEFT, padx=5)
+        
+        self.position_source_var = tk.StringVar(value=current_position_source_name())
+        source_combo = ttk.Combobox(
+            source_frame,
+            textvariable=self.position_source_var,
+            values=list(POSITION_SOURCES),
+            state="readonly",
+            width=20
+        )
+        source_combo.pack(side=tk.LEFT, padx=5)
+        source_combo.bind("<<ComboboxSelected>>", self._change_position_source)
+    
+    def _open_url(self, url):
+        """브라우저로 링크 열기 (webbrowser는 필요할 때 불러옴)"""
+        import webbrowser
+        webbrowser.open(url)
+    
+    def _change_backend(self, event=None):
+        """입력 백엔드 변경"""
+        name = self.backend_var.get()
+        try:
+            set_backend(name)
+            log.info("입력 방식 변경: %s", name)
+        except Exception as e:
+            log.error("입력 방식 변경 실패 (%s): %s", name, e)
+            from tkinter import messagebox
+            messagebox.showerror("오류", f"입력 방식을 변경할 수 없습니다.\n{e}")
+            self.backend_var.set(current_backend_name())
+    
+    def _change_position_source(self, event=None):
+        """커서 추적 방식 변경"""
+        name = self.position_source_var.get()
+        try:
+            set_position_source(name)
+            log.info("커서 추적 방식 변경: %s", name)
+        except Exception as e:
+            log.error("커서 추적 방식 변경 실패 (%s): %s", name, e)
+            from tkinter import messagebox
+            messagebox.showerror("오류", f"커서 추적 방식을 변경할 수 없습니다.\n{e}")
+            self.position_source_var.set(current_position_source_name())
     
     def _toggle_topmost(self):
         """항상 위에 표시 토글"""
         # 앱의 루트 창에 속성 적용
-        if self.parent.master:
-            self.parent.master.attributes('-topmost', self.topmost_var.get()) 
\ No newline at end of file
+        self.frame.winfo_toplevel().attributes('-topmost', self.topmost_var.get()) 
\ No newline at end of file
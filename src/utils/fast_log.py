@@ -0,0 +1,235 @@
+"""
+빠른 로그 모듈
+
+입력 주입 경로에서 사용해도 부담이 없는 로그 기능을 제공합니다.
+- 비활성화된 수준의 로그 함수는 아무 일도 하지 않는 함수로 바뀌므로
+  호출 비용만 남습니다. 인자 계산도 피하려면 debug_enabled로 먼저 확인합니다.
+- 메시지는 인자만 담아 메모리 링 버퍼(deque)에 넣고, 문자열 변환과 출력은
+  백그라운드 스레드가 모아서 처리합니다. 호출한 스레드는 출력을 기다리지 않습니다.
+- 같은 메시지(호출 위치)는 1초에 RATE_LIMIT개까지만 기록하고 나머지는 생략한 개수만 남깁니다.
+
+사용 예:
+    log = get_logger("KeyboardController")
+    log.debug("키 '%s' 반복 시작됨", key)
+
+기본 수준은 INFO이며 AUTO_LOG_LEVEL 환경 변수(debug, info, warning, error)나
+main.py의 --debug 옵션으로 바꿀 수 있습니다.
+"""
+import atexit
+import os
+import sys
+import threading
+import time
+from collections import deque
+
+# 로그 수준
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+
+LEVEL_NAMES = {"debug": DEBUG, "info": INFO, "warning": WARNING, "error": ERROR}
+_LEVEL_LABELS = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARN", ERROR: "ERROR"}
+
+# 링 버퍼 크기 - 출력이 밀리면 오래된 메시지부터 버림
+RING_CAPACITY = 8192
+
+# 호출 위치별 1초당 최대 메시지 수
+RATE_LIMIT = 20
+RATE_WINDOW_NS = 1_000_000_000
+
+def _noop(*args):
+    """비활성화된 수준의 로그 함수"""
+    pass
+
+class LogSink:
+    """
+    모든 로거가 공유하는 링 버퍼와 출력 스레드
+
+    deque의 append/popleft는 스레드 안전하므로 기록하는 쪽은 락을 잡지 않습니다.
+    출력 스레드는 새 메시지가 들어왔다는 이벤트를 기다리므로 로그가 없으면 깨어나지 않습니다.
+    """
+
+    def __init__(self, capacity=RING_CAPACITY):
+        self._ring = deque(maxlen=capacity)
+        self._wake = threading.Event()
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self.pushed = 0    # 링 버퍼에 넣은 메시지 수
+        self.written = 0   # 출력한 메시지 수
+
+    def push(self, record):
+        """메시지 기록 (출력은 백그라운드 스레드가 처리)"""
+        self._ring.append(record)
+        self.pushed += 1
+        if self._thread is None:
+            self._start()
+        if not self._wake.is_set():
+            self._wake.set()
+
+    def _start(self):
+        """출력 스레드 시작"""
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True, name="LogFlusher")
+                self._thread.start()
+
+    def _run(self):
+        """출력 스레드 함수 - 메시지가 들어오면 모아서 한 번에 출력"""
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            self.flush()
+
+    def flush(self):
+        """링 버퍼에 쌓인 메시지를 모두 출력"""
+        ring = self._ring
+        lines = []
+        while True:
+            try:
+                record = ring.popleft()
+            except IndexError:
+                break
+            lines.append(_format(record))
+
+        if not lines:
+            return
+        self.written += len(lines)
+
+        # 콘솔이 없는 실행 파일에서는 버림
+        stream = sys.stdout
+        if stream is None:
+            return
+        try:
+            stream.write("\n".join(lines) + "\n")
+            stream.flush()
+        except Exception:
+            pass
+
+    def get_stats(self):
+        """기록/출력/버린 메시지 수 반환"""
+        pending = len(self._ring)
+        return {
+            "pushed": self.pushed,
+            "written": self.written,
+            "pending": pending,
+            "dropped": max(self.pushed - self.written - pending, 0),
+        }
+
+def _format(record):
+    """기록을 출력할 문자열로 변환 (출력 스레드에서 호출)"""
+    created_ns, level, name, message, args, suppressed = record
+    if args:
+        try:
+            message = message % args
+        except Exception:
+            message = f"{message} {args}"
+    clock = time.strftime("%H:%M:%S", time.localtime(_wall_offset + created_ns / 1e9))
+    millis = int(created_ns // 1_000_000 % 1000)
+    line = f"{clock}.{millis:03d} {_LEVEL_LABELS.get(level, level)} [{name}] {message}"
+    if suppressed:
+        line += f" (이전 1초 동안 같은 메시지 {suppressed}건 생략)"
+    return line
+
+class Logger:
+    """
+    이름별 로거
+
+    debug/info/warning/error는 현재 수준에 따라 기록 함수 또는 아무 일도 하지 않는
+    함수로 바뀝니다. debug_enabled는 인자 계산이 무거운 로그 앞에서 확인합니다.
+    """
+
+    def __init__(self, name, sink, level=INFO):
+        self.name = name
+        self._sink = sink
+        self._sites = {}  # {메시지 형식: [구간 시작 시각, 구간 내 기록 수, 생략 수]}
+        self.rate_limit = RATE_LIMIT
+        self.set_level(level)
+
+    def set_level(self, level):
+        """로그 수준 설정"""
+        self.level = level
+        self.debug_enabled = level <= DEBUG
+        self.debug = self._emitter(DEBUG) if level <= DEBUG else _noop
+        self.info = self._emitter(INFO) if level <= INFO else _noop
+        self.warning = self._emitter(WARNING) if level <= WARNING else _noop
+        self.error = self._emitter(ERROR) if level <= ERROR else _noop
+
+    def _emitter(self, level):
+        """
+        수준별 기록 함수 생성
+
+        호출 위치(메시지 형식)별로 1초 구간마다 rate_limit개까지만 링 버퍼에 넣고,
+        넘친 개수는 다음 구간의 첫 메시지에 함께 기록합니다.
+        """
+        sites = self._sites
+        push = self._sink.push
+        name = self.name
+        perf_counter_ns = time.perf_counter_ns
+
+        def emit(message, *args):
+            now = perf_counter_ns()
+            site = sites.get(message)
+            if site is None:
+                site = sites[message] = [now, 0, 0]
+
+            suppressed = 0
+            if now - site[0] >= RATE_WINDOW_NS:
+                suppressed = site[2]
+                site[0] = now
+                site[1] = 0
+                site[2] = 0
+            if site[1] >= self.rate_limit:
+                site[2] += 1
+                return
+            site[1] += 1
+
+            push((now, level, name, message, args, suppressed))
+        return emit
+
+# perf_counter_ns 값을 벽시계 시각으로 바꾸기 위한 차이 (초)
+_wall_offset = time.time() - time.perf_counter_ns() / 1e9
+
+_sink = LogSink()
+_loggers = {}
+_level = LEVEL_NAMES.get(os.environ.get("AUTO_LOG_LEVEL", "").lower(), INFO)
+_loggers_lock = threading.Lock()
+
+def get_logger(name):
+    """이름별 로거 반환 (없으면 현재 수준으로 생성)"""
+    logger = _loggers.get(name)
+    if logger is None:
+        with _loggers_lock:
+            logger = _loggers.get(name)
+            if logger is None:
+                logger = _loggers[name] = Logger(name, _sink, _level)
+    return logger
+
+def set_level(level):
+    """
+    모든 로거의 수준 변경
+
+    Args:
+        level: DEBUG/INFO/WARNING/ERROR 또는 수준 이름 ("debug" 등)
+    """
+    global _level
+    if isinstance(level, str):
+        level = LEVEL_NAMES[level.lower()]
+    with _loggers_lock:
+        _level = level
+        for logger in _loggers.values():
+            logger.set_level(level)
+
+def get_level():
+    """현재 기본 로그 수준 반환"""
+    return _level
+
+def flush():
+    """남은 로그를 바로 출력 (종료 시 호출)"""
+    _sink.flush()
+
+def get_stats():
+    """로그 버퍼 통계 반환"""
+    return _sink.get_stats()
+
+atexit.register(flush)
@@ -0,0 +1,91 @@
+"""
+측정 락 모듈
+
+획득 대기 시간과 보유 시간을 기록하는 재진입 락을 제공합니다.
+threading.RLock과 같은 방식(with 문, acquire/release)으로 사용할 수 있으며,
+get_stats()로 락 경합 정도를 확인할 수 있습니다.
+"""
+import threading
+import time
+
+class InstrumentedLock:
+    """
+    대기/보유 시간을 기록하는 재진입 락
+
+    통계는 락을 보유한 스레드만 갱신하므로 별도의 동기화가 필요 없습니다.
+    재진입한 경우에는 가장 바깥쪽 획득/해제만 측정합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._acquired_ns = 0
+
+        # 통계
+        self.acquisitions = 0     # 가장 바깥쪽 획득 횟수
+        self.contended = 0        # 다른 스레드가 보유 중이라 기다린 횟수
+        self.wait_ns_total = 0
+        self.wait_ns_max = 0
+        self.hold_ns_total = 0
+        self.hold_ns_max = 0
+
+    def acquire(self, blocking=True, timeout=-1):
+        """락 획득"""
+        started = time.perf_counter_ns()
+        contended = False
+        if not self._lock.acquire(False):
+            if not blocking:
+                return False
+            if not self._lock.acquire(True, timeout):
+                return False
+            contended = True
+
+        self._depth += 1
+        if self._depth == 1:
+            now = time.perf_counter_ns()
+            self._acquired_ns = now
+            self.acquisitions += 1
+            if contended:
+                wait = now - started
+                self.contended += 1
+                self.wait_ns_total += wait
+                if wait > self.wait_ns_max:
+                    self.wait_ns_max = wait
+        return True
+
+    def release(self):
+        """락 해제"""
+        self._depth -= 1
+        if self._depth == 0:
+            hold = time.perf_counter_ns() - self._acquired_ns
+            self.hold_ns_total += hold
+            if hold > self.hold_ns_max:
+                self.hold_ns_max = hold
+        self._lock.release()
+
+    __enter__ = acquire
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+        return False
+
+    def get_stats(self):
+        """획득 횟수와 대기/보유 시간 통계 반환 (마이크로초)"""
+        acquisitions = self.acquisitions or 1
+        return {
+            "acquisitions": self.acquisitions,
+            "contended": self.contended,
+            "wait_avg_us": self.wait_ns_total / acquisitions / 1000,
+            "wait_max_us": self.wait_ns_max / 1000,
+            "hold_avg_us": self.hold_ns_total / acquisitions / 1000,
+            "hold_max_us": self.hold_ns_max / 1000,
+        }
+
+    def reset_stats(self):
+        """통계 초기화"""
+        self.acquisitions = 0
+        self.contended = 0
+        self.wait_ns_total = 0
+        self.wait_ns_max = 0
+        self.hold_ns_total = 0
+        self.hold_ns_max = 0
@@ -0,0 +1,70 @@
+"""
+시작 시간 측정 모듈
+
+프로그램 시작 과정을 단계별(모듈 불러오기, 객체 생성 등)로 나누어
+소요 시간을 기록하고 출력하는 기능을 제공합니다.
+main.py를 --profile-startup 옵션으로 실행했을 때만 기록합니다.
+"""
+import sys
+import time
+from contextlib import contextmanager
+
+class StartupProfiler:
+    def __init__(self):
+        self.enabled = False
+        self.records = []     # (깊이, 단계 이름, 소요 시간 ns)
+        self._depth = 0
+        self._started_ns = 0
+
+    def enable(self):
+        """기록 시작"""
+        self.enabled = True
+        self.records = []
+        self._started_ns = time.perf_counter_ns()
+
+    @contextmanager
+    def phase(self, name):
+        """
+        단계 소요 시간 기록
+
+        사용 예:
+            with startup_profiler.phase("탭 생성"):
+                ...
+        """
+        if not self.enabled:
+            yield
+            return
+
+        index = len(self.records)
+        self.records.append((self._depth, name, 0))
+        self._depth += 1
+        started = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            self.records[index] = (self._depth, name, time.perf_counter_ns() - started)
+
+    def report(self, title="첫 화면 표시까지"):
+        """단계별 소요 시간 출력 후 기록 종료"""
+        if not self.enabled:
+            return
+        self.enabled = False
+
+        total_ms = (time.perf_counter_ns() - self._started_ns) / 1_000_000
+        lines = ["==== 시작 시간 측정 ===="]
+        for depth, name, duration_ns in self.records:
+            lines.append(f"{'  ' * depth}{name:<{40 - depth * 2}} {duration_ns / 1_000_000:8.1f}ms")
+        lines.append(f"{title:<40} {total_ms:8.1f}ms")
+        lines.append("========================")
+        text = "\n".join(lines)
+
+        # 콘솔 창이 없는 실행 파일에서는 파일로 저장
+        if sys.stdout is None:
+            with open("startup_profile.txt", "w", encoding="utf-8") as f:
+                f.write(text + "\n")
+        else:
+            print(text)
+
+# 전역 인스턴스
+startup_profiler = StartupProfiler()
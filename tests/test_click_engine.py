@@ -0,0 +1,101 @@
+"""클릭 엔진 테스트"""
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.core import click_engine
+from src.core.click_engine import POLICY_CATCH_UP, ClickEngine
+
+def _wait_for(condition, timeout=2.0):
+    """조건이 참이 될 때까지 기다림"""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.001)
+    return True
+
+def test_pattern_clicks_in_order_and_stops_after_cycles():
+    """패턴 좌표를 차례로 클릭하고 반복 횟수를 채우면 스스로 끝남"""
+    clicks = []
+    engine = ClickEngine(lambda x, y: clicks.append((x, y)), lambda: (0, 0), interval=0.001)
+    engine.set_pattern(SimpleNamespace(xs=[1, 2, 3], ys=[4, 5, 6], cycles=2))
+
+    assert engine.start() is True
+    engine.thread.join(2.0)
+
+    assert not engine.is_running()
+    assert clicks == [(1, 4), (2, 5), (3, 6)] * 2
+    stats = engine.get_stats()
+    assert stats["click_count"] == 6
+    assert stats["pattern_cycles"] == 2
+    assert stats["point_index"] == 0
+
+def test_burst_clicks_per_tick():
+    """연속 클릭 함수가 있으면 데드라인마다 지정한 횟수만큼 클릭"""
+    bursts = []
+    engine = ClickEngine(lambda x, y: None, lambda: (0, 0), interval=0.001,
+                         burst_func=lambda x, y, count: bursts.append(count))
+    engine.set_clicks_per_tick(3)
+    engine.set_pattern(SimpleNamespace(xs=[0], ys=[0], cycles=2))
+
+    engine.start()
+    engine.thread.join(2.0)
+
+    assert bursts == [3, 3]
+    assert engine.click_count == 6
+
+def test_clicks_per_tick_without_burst_func_stays_one():
+    engine = ClickEngine(lambda x, y: None, lambda: (0, 0))
+    engine.set_clicks_per_tick(5)
+    assert engine.clicks_per_tick == 1
+
+def test_invalid_policy():
+    engine = ClickEngine(lambda x, y: None, lambda: (0, 0))
+    engine.set_policy(POLICY_CATCH_UP)
+    with pytest.raises(ValueError):
+        engine.set_policy("later")
+
+def test_toggle_starts_and_stops():
+    """toggle()은 실행 중이면 중지, 아니면 시작"""
+    engine = ClickEngine(lambda x, y: None, lambda: (0, 0), interval=0.01)
+
+    assert engine.toggle() is True
+    assert _wait_for(lambda: engine.click_count > 0)
+    assert engine.toggle() is False
+    engine.thread.join(2.0)
+    assert not engine.is_running()
+
+    assert engine.toggle() is True
+    engine.stop()
+    engine.thread.join(2.0)
+
+def test_toggle_does_not_block_on_stuck_click_thread(monkeypatch):
+    """이전 클릭 스레드가 끝나지 않으면 제한 시간만 기다리고 시작하지 않음"""
+    monkeypatch.setattr(click_engine, "STOP_JOIN_TIMEOUT", 0.05)
+    entered = threading.Event()
+    release = threading.Event()
+
+    def slow_click(x, y):
+        entered.set()
+        release.wait(2.0)
+
+    engine = ClickEngine(slow_click, lambda: (0, 0), interval=0.001)
+    try:
+        assert engine.toggle() is True
+        assert entered.wait(2.0)
+        assert engine.toggle() is False  # 중지 요청
+
+        started = time.perf_counter()
+        assert engine.toggle() is False  # 클릭 중인 스레드가 끝나지 않아 시작하지 않음
+        assert time.perf_counter() - started < 1.0
+    finally:
+        release.set()
+        engine.thread.join(2.0)
+
+    assert not engine.is_running()
+    assert engine.toggle() is True
+    engine.stop()
+    engine.thread.join(2.0)
@@ -0,0 +1,76 @@
+"""클릭 패턴 테스트"""
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.core.click_pattern import MAX_POINTS, ClickPattern, grid_points, parse_points, random_points
+
+def test_grid_snake_order():
+    points = grid_points(0, 0, 20, 10, columns=3, rows=2)
+    assert points.tolist() == [[0, 0], [10, 0], [20, 0], [20, 10], [10, 10], [0, 10]]
+
+def test_grid_row_order():
+    points = grid_points(0, 0, 20, 10, columns=3, rows=2, snake=False)
+    assert points.tolist() == [[0, 0], [10, 0], [20, 0], [0, 10], [10, 10], [20, 10]]
+
+def test_grid_single_point_and_rounding():
+    assert grid_points(5, 7, 5, 7, columns=1, rows=1).tolist() == [[5, 7]]
+    assert grid_points(0, 0, 10, 0, columns=4, rows=1)[:, 0].tolist() == [0, 3, 7, 10]
+
+@pytest.mark.parametrize("args", [
+    (10, 0, 0, 10, 2, 2),
+    (0, 0, 10, 10, 0, 2),
+    (0, 0, 10, 10, MAX_POINTS, 2),
+])
+def test_grid_errors(args):
+    with pytest.raises(ValueError):
+        grid_points(*args)
+
+def test_random_points_in_bounds_and_seeded():
+    points = random_points(10, 20, 30, 40, count=500, seed=1)
+    assert points.shape == (500, 2)
+    assert points[:, 0].min() >= 10 and points[:, 0].max() <= 30
+    assert points[:, 1].min() >= 20 and points[:, 1].max() <= 40
+    assert np.array_equal(points, random_points(10, 20, 30, 40, count=500, seed=1))
+
+def test_parse_points():
+    points = parse_points("(100, 200)\n-5,6; 7 8")
+    assert points.dtype == np.int32
+    assert points.tolist() == [[100, 200], [-5, 6], [7, 8]]
+
+@pytest.mark.parametrize("text", ["", "1, 2, 3", "x y"])
+def test_parse_points_errors(text):
+    with pytest.raises(ValueError):
+        parse_points(text)
+
+def test_pattern_lists_and_bounds():
+    pattern = ClickPattern([(3, 4), (0, 0), (3, 0)], cycles=2, name="test")
+    assert len(pattern) == 3
+    assert pattern.xs == [3, 0, 3]
+    assert pattern.ys == [4, 0, 0]
+    assert all(type(value) is int for value in pattern.xs + pattern.ys)
+    assert pattern.bounds() == (0, 0, 3, 4)
+    # (3,4) -> (0,0) -> (3,0) -> (3,4)
+    assert pattern.path_length() == pytest.approx(5 + 3 + 4)
+
+@pytest.mark.parametrize("points, cycles", [([1, 2, 3], 0), ([(1, 2, 3)], 0), ([(1, 2)], -1)])
+def test_pattern_errors(points, cycles):
+    with pytest.raises(ValueError):
+        ClickPattern(points, cycles)
+
+def test_dry_run():
+    pattern = ClickPattern(grid_points(0, 0, 90, 90, columns=10, rows=10), cycles=3)
+    plan = pattern.dry_run(0.01, clicks_per_tick=2)
+    assert plan["points"] == 100
+    assert plan["bounds"] == (0, 0, 90, 90)
+    assert plan["cycle_s"] == pytest.approx(1.0)
+    assert plan["total_s"] == pytest.approx(3.0)
+    assert plan["clicks"] == 600
+    # 지그재그: 가로 9칸 x 10줄 + 세로 9칸 + 마지막 점에서 첫 점으로 복귀 90
+    assert plan["path_px"] == pytest.approx(10 * 90 + 9 * 10 + 90)
+
+def test_dry_run_forever():
+    plan = ClickPattern([(1, 1), (2, 2)]).dry_run(0.5)
+    assert plan["cycle_s"] == pytest.approx(1.0)
+    assert plan["total_s"] is None
+    assert plan["clicks"] is None
@@ -0,0 +1,93 @@
+"""빠른 로그 모듈 테스트"""
+from src.utils import fast_log
+from src.utils.fast_log import DEBUG, ERROR, INFO, WARNING, LogSink, Logger
+
+class _Sink:
+    """출력 스레드 없이 기록만 모으는 대체 링 버퍼"""
+
+    def __init__(self):
+        self.records = []
+
+    def push(self, record):
+        self.records.append(record)
+
+class _Clock:
+    """perf_counter_ns 대체 시계"""
+
+    def __init__(self):
+        self.now = 1_000_000_000
+
+    def __call__(self):
+        return self.now
+
+def test_disabled_levels_are_noop():
+    """현재 수준보다 낮은 로그 함수는 아무 일도 하지 않음"""
+    sink = _Sink()
+    log = Logger("Test", sink, WARNING)
+    log.debug("d")
+    log.info("i")
+    log.warning("w %d", 1)
+    log.error("e")
+
+    assert log.debug is fast_log._noop
+    assert not log.debug_enabled
+    assert [(r[1], r[3], r[4]) for r in sink.records] == [(WARNING, "w %d", (1,)), (ERROR, "e", ())]
+
+    log.set_level(DEBUG)
+    log.debug("d")
+    assert log.debug_enabled
+    assert sink.records[-1][1] == DEBUG
+
+def test_rate_limit_per_message_and_suppressed_count(monkeypatch):
+    """같은 메시지는 1초에 rate_limit개까지만 기록하고 생략 수는 다음 구간 첫 기록에 남김"""
+    clock = _Clock()
+    monkeypatch.setattr(fast_log.time, "perf_counter_ns", clock)
+    sink = _Sink()
+    log = Logger("Test", sink, INFO)
+    log.rate_limit = 3
+
+    for i in range(5):
+        log.info("반복 %d", i)
+    log.info("다른 메시지")
+    assert len(sink.records) == 4
+
+    clock.now += fast_log.RATE_WINDOW_NS
+    log.info("반복 %d", 5)
+    assert sink.records[-1][4] == (5,)
+    assert sink.records[-1][5] == 2
+
+def test_format_applies_args_lazily():
+    record = (0, INFO, "Test", "값 %d, %s", (3, "x"), 0)
+    assert fast_log._format(record).endswith("INFO [Test] 값 3, x")
+
+    # 형식이 맞지 않아도 예외 없이 인자를 덧붙임
+    record = (0, ERROR, "Test", "값 %d", ("x",), 4)
+    line = fast_log._format(record)
+    assert "ERROR [Test] 값 %d ('x',)" in line
+    assert line.endswith("4건 생략)")
+
+def test_sink_flush_and_stats(capsys):
+    """flush는 쌓인 메시지를 한 번에 출력하고 넘친 메시지는 버린 수로 집계"""
+    sink = LogSink(capacity=2)
+    sink._thread = object()  # 출력 스레드 없이 직접 flush
+    for i in range(3):
+        sink.push((0, INFO, "Test", "메시지 %d", (i,), 0))
+
+    assert sink.get_stats() == {"pushed": 3, "written": 0, "pending": 2, "dropped": 1}
+    sink.flush()
+    out = capsys.readouterr().out.splitlines()
+    assert [line.split("] ", 1)[1] for line in out] == ["메시지 1", "메시지 2"]
+    assert sink.get_stats() == {"pushed": 3, "written": 2, "pending": 0, "dropped": 1}
+
+def test_set_level_by_name_updates_existing_loggers():
+    previous = fast_log.get_level()
+    log = fast_log.get_logger("TestSetLevel")
+    try:
+        fast_log.set_level("error")
+        assert fast_log.get_level() == ERROR
+        assert log.warning is fast_log._noop
+        fast_log.set_level(DEBUG)
+        assert log.debug_enabled
+    finally:
+        fast_log.set_level(previous)
+    assert fast_log.get_logger("TestSetLevel") is log
@@ -0,0 +1,85 @@
+"""Windows 입력 백엔드의 커서 이동 테스트 (user32 대체 객체 사용)"""
+import threading
+
+import pytest
+
+from src.core.input_backend import Win32MouseEventBackend, Win32SendInputBackend
+
+class _User32:
+    """커서 위치만 흉내 내는 user32 대체 객체"""
+
+    def __init__(self):
+        self.x = 0
+        self.y = 0
+        self.set_calls = []
+
+    def SetCursorPos(self, x, y):
+        self.set_calls.append((x, y))
+        self.x = x
+        self.y = y
+        return 1
+
+    def GetCursorPos(self, point_ref):
+        point = point_ref._obj
+        point.x = self.x
+        point.y = self.y
+        return 1
+
+    def mouse_event(self, flags, dx, dy, data, extra):
+        pass
+
+    def SendInput(self, count, inputs, size):
+        return count
+
+    def keybd_event(self, code, scan, flags, extra):
+        pass
+
+    def MapVirtualKeyW(self, code, map_type):
+        return 0
+
+    def VkKeyScanW(self, char):
+        return -1
+
+BACKEND_CLASSES = [Win32MouseEventBackend, Win32SendInputBackend]
+
+@pytest.mark.parametrize("backend_class", BACKEND_CLASSES)
+def test_move_skipped_when_cursor_at_target(backend_class):
+    user32 = _User32()
+    backend = backend_class(user32=user32)
+    backend.click(10, 20)
+    backend.click(10, 20)
+    assert user32.set_calls == [(10, 20)]
+
+@pytest.mark.parametrize("backend_class", BACKEND_CLASSES)
+def test_move_after_user_moved_cursor(backend_class):
+    user32 = _User32()
+    backend = backend_class(user32=user32)
+    backend.click(10, 20)
+    # 사용자가 커서를 움직임
+    user32.x, user32.y = 300, 400
+    backend.click(10, 20)
+    assert user32.set_calls == [(10, 20), (10, 20)]
+
+@pytest.mark.parametrize("backend_class", BACKEND_CLASSES)
+def test_skip_disabled(backend_class):
+    user32 = _User32()
+    backend = backend_class(user32=user32, skip_unchanged=False)
+    backend.click(10, 20)
+    backend.click(10, 20)
+    assert user32.set_calls == [(10, 20), (10, 20)]
+
+def test_cursor_point_per_thread():
+    user32 = _User32()
+    backend = Win32SendInputBackend(user32=user32)
+    points = []
+
+    def read():
+        backend.move(1, 1)
+        points.append(backend._cursor_local.point[0])
+
+    threads = [threading.Thread(target=read) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert points[0] is not points[1]
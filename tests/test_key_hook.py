@@ -0,0 +1,163 @@
+"""전역 키보드 훅 분배기 테스트 (keyboard 라이브러리 대체 모듈 사용)"""
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.key_hook import KeyHook
+
+SCAN_CODES = {"a": (30,), "b": (48,), "f6": (64,), "shift": (42, 54)}
+
+class _Keyboard:
+    """key_to_scan_codes/hook/unhook만 흉내 내는 keyboard 대체 모듈"""
+
+    def __init__(self):
+        self.callback = None
+        self.hooks = 0
+        self.unhooked = []
+
+    def key_to_scan_codes(self, key):
+        return SCAN_CODES[key]
+
+    def hook(self, callback, suppress=False):
+        self.callback = callback
+        self.hooks += 1
+        return ("handle", self.hooks)
+
+    def unhook(self, handle):
+        self.unhooked.append(handle)
+
+    def send(self, scan_code, down=True):
+        """훅 스레드 대신 키 이벤트 전달 (콜백 반환값 = 다른 프로그램에 전달 여부)"""
+        event = SimpleNamespace(scan_code=scan_code, event_type="down" if down else "up")
+        return self.callback(event)
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.001)
+    return True
+
+@pytest.fixture
+def keyboard():
+    return _Keyboard()
+
+@pytest.fixture
+def hook(keyboard):
+    hook = KeyHook(keyboard)
+    yield hook
+    hook.close()
+
+def test_press_and_release_dispatched_on_consumer_thread(hook, keyboard):
+    """처리 함수는 이벤트 시각을 받아 소비 스레드에서 호출됨"""
+    calls = []
+    hook.add_key("a", on_press=lambda t: calls.append(("down", t, threading.current_thread().name)),
+                 on_release=lambda t: calls.append(("up", t, threading.current_thread().name)))
+
+    before = time.perf_counter_ns()
+    assert keyboard.send(30, True) is True   # suppress=False면 다른 프로그램에 전달
+    assert keyboard.send(30, False) is True
+    assert _wait_for(lambda: len(calls) == 2)
+
+    assert [c[0] for c in calls] == ["down", "up"]
+    assert all(c[1] >= before for c in calls)
+    assert {c[2] for c in calls} == {"KeyEventConsumer"}
+    assert keyboard.hooks == 1
+
+def test_auto_repeat_filtered_and_hotkey_suppressed(hook, keyboard):
+    """눌린 키의 반복 누름은 걸러내고 단축키 입력은 전달하지 않음"""
+    presses = []
+    hook.add_hotkey("f6", presses.append)
+
+    assert keyboard.send(64, True) is False
+    assert keyboard.send(64, True) is False
+    assert keyboard.send(64, True) is False
+    keyboard.send(64, False)
+    keyboard.send(64, True)
+
+    assert _wait_for(lambda: len(presses) == 2)
+    stats = hook.get_stats()
+    assert stats["repeats_filtered"] == 2
+    assert stats["events"] == 5
+
+def test_unregistered_keys_pass_through_and_listeners_see_everything(hook, keyboard):
+    seen = []
+    hook.add_key("a", on_press=lambda t: None)
+    hook.add_listener(lambda event, t: seen.append((event.scan_code, event.event_type)))
+
+    assert keyboard.send(48, True) is True
+    keyboard.send(30, True)
+    keyboard.send(30, True)
+
+    assert seen == [(48, "down"), (30, "down"), (30, "down")]
+    assert hook.get_stats()["listeners"] == 1
+
+def test_multi_scan_code_key_and_remove(hook, keyboard):
+    """스캔 코드가 여러 개인 키는 모든 코드로 등록되고 해제 시 모두 제거"""
+    presses = []
+    assert hook.add_key("shift", on_press=presses.append) == (42, 54)
+    keyboard.send(42, True)
+    keyboard.send(54, True)   # 같은 키의 누름 상태를 공유하므로 반복으로 걸러냄
+    keyboard.send(42, False)
+    keyboard.send(54, True)
+    assert _wait_for(lambda: len(presses) == 2)
+
+    assert hook.remove_key("shift")
+    assert not hook.remove_key("shift")
+    assert not hook.is_registered("shift")
+    assert hook.get_stats()["scan_codes"] == 0
+
+def test_add_key_replaces_previous_binding(hook, keyboard):
+    calls = []
+    hook.add_key("a", on_press=lambda t: calls.append("old"))
+    hook.add_key("a", on_press=lambda t: calls.append("new"))
+    keyboard.send(30, True)
+    assert _wait_for(lambda: calls == ["new"])
+
+def test_full_queue_drops_without_blocking_hook(keyboard):
+    """소비 스레드가 막혀 큐가 가득 차면 훅 콜백은 새 이벤트를 버리고 바로 반환"""
+    hook = KeyHook(keyboard, capacity=1)
+    entered = threading.Event()
+    release = threading.Event()
+
+    def blocking_press(t):
+        entered.set()
+        release.wait(2.0)
+
+    try:
+        hook.add_key("a", on_press=blocking_press)
+        hook.add_key("b", on_press=lambda t: None)
+        keyboard.send(30, True)
+        assert entered.wait(2.0)
+
+        keyboard.send(48, True)   # 큐에 들어감
+        keyboard.send(48, False)  # 큐가 가득 차서 버림
+        assert hook.get_stats()["dropped"] == 1
+        assert hook.get_stats()["queue_max_depth"] == 1
+    finally:
+        release.set()
+        hook.close()
+
+def test_handler_and_listener_errors_are_counted(hook, keyboard):
+    def fail(*args):
+        raise RuntimeError("boom")
+
+    hook.add_key("a", on_press=fail)
+    hook.add_listener(fail)
+
+    assert keyboard.send(30, True) is True
+    assert _wait_for(lambda: hook.get_stats()["errors"] == 2)
+
+def test_close_unhooks_and_clears_bindings(keyboard):
+    hook = KeyHook(keyboard)
+    hook.add_hotkey("f6", lambda t: None)
+    consumer = hook._consumer
+
+    hook.close()
+
+    assert keyboard.unhooked == [("handle", 1)]
+    assert not hook.is_registered("f6")
+    assert _wait_for(lambda: not consumer.is_alive())
@@ -0,0 +1,145 @@
+"""키보드 컨트롤러 테스트 (입력은 RecordingBackend에 기록)"""
+import threading
+import time
+
+import pytest
+
+from src.core import input_backend
+from src.core.input_backend import EVENT_KEY_UP, RecordingBackend
+from src.core.keyboard_control import KEY_ENABLED, KEY_PRESSED, KeyboardController
+
+def _lock_held(lock):
+    """다른 스레드에서 락을 바로 얻을 수 없으면 True (호출한 스레드가 보유 중인지 확인)"""
+    result = []
+
+    def probe():
+        acquired = lock.acquire(blocking=False)
+        if acquired:
+            lock.release()
+        result.append(not acquired)
+
+    thread = threading.Thread(target=probe)
+    thread.start()
+    thread.join()
+    return result[0]
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.001)
+    return True
+
+class _CheckingBackend(RecordingBackend):
+    """키 변환 시 컨트롤러 락 보유 여부를 기록하는 백엔드"""
+
+    controller = None
+
+    def __init__(self):
+        super().__init__()
+        self.resolved_under_lock = []
+
+    def resolve_key(self, key):
+        self.resolved_under_lock.append(_lock_held(self.controller.lock))
+        return super().resolve_key(key)
+
+@pytest.fixture
+def backend(monkeypatch):
+    backend = _CheckingBackend()
+    monkeypatch.setattr(input_backend, "_backend", backend)
+    return backend
+
+@pytest.fixture
+def controller(backend):
+    controller = KeyboardController()
+    controller.scheduler.set_timing(0.002, 0.002)
+    backend.controller = controller
+    yield controller
+    controller.shutdown(timeout=1.0)
+
+def test_resolve_key_outside_lock_and_only_once(controller, backend):
+    """키 이름 변환은 락 밖에서 키마다 한 번만 백엔드에 요청"""
+    assert controller.enable_key("a")
+    assert not controller.enable_key("a")
+    code = controller.resolve_key("a")
+
+    assert backend.resolved_under_lock == [False]
+    assert controller._names[code] == "a"
+    assert controller.is_key_enabled("a")
+
+def test_enable_unknown_key_fails(controller):
+    assert controller.enable_key("no-such-key") is False
+    assert controller.get_enabled_keys() == []
+
+def test_stale_release_token_is_skipped(controller, backend):
+    """해제를 예약한 뒤 키가 다시 눌리면 예약된 해제는 건너뜀"""
+    code = controller.resolve_key("b")
+    controller._inject_press(code)
+
+    with controller.lock:
+        release = controller._set_released(code)
+        controller._next_token(code)  # 다시 눌림
+    controller._release_keys([release])
+    assert controller._key_down[code] == 1
+    assert backend.keys_down == {"b"}
+
+    with controller.lock:
+        release = controller._set_released(code)
+    controller._release_keys([release])
+    assert controller._key_down[code] == 0
+    assert backend.events[-1][1] == EVENT_KEY_UP
+
+def test_release_skips_keys_not_injected(controller, backend):
+    code = controller.resolve_key("c")
+    with controller.lock:
+        release = controller._set_released(code)
+    controller._release_keys([release])
+    assert backend.events == []
+
+def test_supervise_clears_pressed_key_without_repeat(controller):
+    """감독: 반복이 끝났는데 눌린 상태로 남은 키는 해제 상태로 초기화"""
+    controller.enable_key("d")
+    code = controller.resolve_key("d")
+    controller._key_state[code] |= KEY_PRESSED
+
+    controller._supervise(code)
+
+    assert controller._key_state[code] == KEY_ENABLED
+    assert controller.watchdog_interventions == 1
+
+def test_supervise_stops_repeat_of_released_key(controller):
+    """감독: 눌려있지 않은데 반복 중인 키는 반복 중지"""
+    controller.enable_key("e")
+    code = controller.resolve_key("e")
+    controller.scheduler.start(code)
+
+    controller._supervise(code)
+
+    assert not controller.scheduler.is_active(code)
+    assert controller.watchdog_interventions == 1
+
+def test_supervise_restarts_scheduler_outside_lock(controller, monkeypatch):
+    """감독: 반복할 키가 남았는데 스케줄러 스레드가 없으면 락 밖에서 다시 시작"""
+    assert controller.start_key_repeat("f")
+    restarted_under_lock = []
+    monkeypatch.setattr(controller.scheduler, "is_alive", lambda: False)
+    monkeypatch.setattr(controller.scheduler, "restart",
+                        lambda: restarted_under_lock.append(_lock_held(controller.lock)))
+
+    controller._supervise()
+
+    assert restarted_under_lock == [False]
+    assert controller.watchdog_interventions == 1
+
+def test_repeat_start_and_stop_releases_key(controller, backend):
+    """반복 시작 후 중지하면 눌린 키가 남지 않음"""
+    assert controller.start_key_repeat("g")
+    assert _wait_for(lambda: controller.scheduler.get_repeat_count(controller.resolve_key("g")) >= 2)
+    assert controller.is_key_repeating("g")
+
+    controller.stop_all_repeats()
+
+    assert not controller.is_key_repeating("g")
+    assert not controller.is_key_pressed("g")
+    assert _wait_for(lambda: "g" not in backend.keys_down)
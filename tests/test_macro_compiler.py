@@ -0,0 +1,106 @@
+"""매크로 컴파일러 테스트"""
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.core.macro_compiler import _rdp_mask, compile_timeline
+from src.core.timeline import (
+    EVENT_CLICK, EVENT_IDLE, EVENT_KEY_DOWN, EVENT_KEY_TAP, EVENT_KEY_UP, EVENT_MOUSE_DOWN,
+    EVENT_MOUSE_MOVE, EVENT_MOUSE_UP, MAX_DELTA_NS, RECORD, Timeline,
+)
+
+MS = 1_000_000
+
+def _timeline(records, names=("a",)):
+    """(종류, 코드, x, y, 시간 차 ns) 목록으로 타임라인 생성"""
+    return Timeline(b"".join(RECORD.pack(kind, 0, code, x, y, delta) for kind, code, x, y, delta in records), names)
+
+def _compile(timeline, **kwargs):
+    options = {"epsilon": 0, "merge_ms": 0, "tap_max_hold_ms": None, "max_idle_ms": None}
+    options.update(kwargs)
+    return compile_timeline(timeline, **options)
+
+def test_rdp_keeps_only_corners():
+    points = np.array([(0, 0), (1, 0), (2, 0), (3, 0), (3, 1), (3, 2), (3, 3)], dtype=np.float64)
+    assert _rdp_mask(np, points, 0.5).tolist() == [True, False, False, True, False, False, True]
+
+def test_rdp_keeps_points_beyond_epsilon():
+    points = np.array([(0, 0), (5, 1), (10, 0)], dtype=np.float64)
+    assert _rdp_mask(np, points, 2.0).tolist() == [True, False, True]
+    assert _rdp_mask(np, points, 0.5).tolist() == [True, True, True]
+
+def test_path_simplification():
+    moves = [(EVENT_MOUSE_MOVE, 0, x, 0, 10 * MS) for x in range(10)]
+    compiled, report = _compile(_timeline(moves), epsilon=1.0)
+    assert [(record[3], record[4]) for record in compiled] == [(0, 0), (9, 0)]
+    assert report["moves_simplified"] == 8
+    # 지운 점의 시간은 남은 기록에 더해짐
+    assert [record[5] for record in compiled] == [10 * MS, 90 * MS]
+
+def test_key_tap_and_click_collapse():
+    compiled, report = _compile(_timeline([
+        (EVENT_KEY_DOWN, 0, 0, 0, 0),
+        (EVENT_KEY_UP, 0, 0, 0, MS // 2),
+        (EVENT_MOUSE_DOWN, 0, 5, 6, 10 * MS),
+        (EVENT_MOUSE_UP, 0, 5, 6, MS // 2),
+    ]), tap_max_hold_ms=1.0)
+    assert [record[0] for record in compiled] == [EVENT_KEY_TAP, EVENT_CLICK]
+    assert (compiled[1][3], compiled[1][4]) == (5, 6)
+    assert report["key_taps"] == 1
+    assert report["clicks"] == 1
+
+def test_long_hold_and_moved_click_are_kept():
+    kinds = [EVENT_KEY_DOWN, EVENT_KEY_UP, EVENT_MOUSE_DOWN, EVENT_MOUSE_UP]
+    compiled, report = _compile(_timeline([
+        (EVENT_KEY_DOWN, 0, 0, 0, 0),
+        (EVENT_KEY_UP, 0, 0, 0, 5 * MS),
+        (EVENT_MOUSE_DOWN, 0, 5, 6, 10 * MS),
+        (EVENT_MOUSE_UP, 0, 7, 6, MS // 2),
+    ]), tap_max_hold_ms=1.0)
+    assert [record[0] for record in compiled] == kinds
+    assert report["key_taps"] == report["clicks"] == 0
+
+def test_keys_keep_name_indexes():
+    compiled, _ = _compile(_timeline([(EVENT_KEY_DOWN, 1, 0, 0, 0), (EVENT_KEY_UP, 1, 0, 0, 5 * MS)], ("a", "b")))
+    assert [(record[1], record[2]) for record in compiled] == [(0, 1), (0, 1)]
+    assert compiled.names == ("a", "b")
+
+def test_moves_merged_into_following_click():
+    compiled, report = _compile(_timeline([
+        (EVENT_MOUSE_MOVE, 0, 1, 1, 0),
+        (EVENT_MOUSE_MOVE, 0, 2, 2, MS),
+        (EVENT_MOUSE_DOWN, 0, 2, 2, MS),
+    ]), merge_ms=8.0)
+    assert [record[0] for record in compiled] == [EVENT_MOUSE_DOWN]
+    assert report["moves_merged"] == 2
+
+def test_idle_trimmed():
+    compiled, report = _compile(_timeline([
+        (EVENT_KEY_DOWN, 0, 0, 0, 2000 * MS),
+        (EVENT_KEY_UP, 0, 0, 0, 3000 * MS),
+    ]), max_idle_ms=1000.0)
+    # 첫 입력 전 대기는 없애고 긴 대기는 max_idle_ms로 줄임
+    assert [record[5] for record in compiled] == [0, 1000 * MS]
+    assert report["idle_trimmed_s"] == pytest.approx(4.0)
+
+def test_long_gap_split_into_idle_records():
+    gap = 2 * MAX_DELTA_NS + 7
+    records = [(EVENT_KEY_DOWN, 0, 0, 0, 0)]
+    records += [(EVENT_IDLE, 0, 0, 0, MAX_DELTA_NS)] * 2
+    records += [(EVENT_KEY_UP, 0, 0, 0, 7), (EVENT_KEY_DOWN, 0, 0, 0, 3)]
+    compiled, report = _compile(_timeline(records))
+    assert [(record[0], record[5]) for record in compiled] == [
+        (EVENT_KEY_DOWN, 0),
+        (EVENT_IDLE, MAX_DELTA_NS),
+        (EVENT_IDLE, MAX_DELTA_NS),
+        (EVENT_KEY_UP, 7),
+        (EVENT_KEY_DOWN, 3),
+    ]
+    assert compiled.duration_ns == gap + 3
+
+def test_gap_of_exact_multiple():
+    compiled, _ = _compile(_timeline([(EVENT_KEY_DOWN, 0, 0, 0, 0), (EVENT_IDLE, 0, 0, 0, MAX_DELTA_NS),
+                                      (EVENT_KEY_UP, 0, 0, 0, MAX_DELTA_NS)]))
+    assert [(record[0], record[5]) for record in compiled] == [
+        (EVENT_KEY_DOWN, 0), (EVENT_IDLE, MAX_DELTA_NS), (EVENT_KEY_UP, MAX_DELTA_NS),
+    ]
@@ -0,0 +1,131 @@
+"""매크로 스크립트 컴파일러와 실행기 테스트"""
+import pytest
+
+from src.core.macro_script import (
+    OP_CALL, OP_HALT, OP_MUL, OP_RET, OP_SET, OP_WAIT, WIDTH, MacroRunner, _parse, compile_script,
+)
+
+KEY_CODES = {"q": 0x51, "shift": 0x10}
+
+def _resolve_key(name):
+    if name not in KEY_CODES:
+        raise ValueError(f"알 수 없는 키: {name}")
+    return KEY_CODES[name]
+
+class _Keyboard:
+    """키 입력을 기록만 하는 키보드 컨트롤러 대체 객체"""
+
+    def __init__(self):
+        self.events = []
+
+    def press_code(self, code):
+        self.events.append(("down", code))
+
+    def release_code(self, code):
+        self.events.append(("up", code))
+
+class _Backend:
+    def __init__(self):
+        self.moves = []
+
+    def move(self, x, y):
+        self.moves.append((x, y))
+
+def _run(source):
+    """스크립트를 현재 스레드에서 실행하고 (클릭 목록, 실행기) 반환"""
+    clicks = []
+    backend = _Backend()
+    runner = MacroRunner(
+        click_func=lambda x, y, hold: clicks.append((x, y, hold)),
+        keyboard=_Keyboard(),
+        backend_func=lambda: backend,
+    )
+    runner.load(compile_script(source, _resolve_key))
+    runner.run()
+    return clicks, runner
+
+def _ops(program):
+    return [program.code[pc] for pc in range(0, len(program.code), WIDTH)]
+
+def test_parse_tree():
+    tree = _parse("# 주석\nloop 2\n  click (1, 2)  # 클릭\nend\nmacro m\n  press q\nend\n")
+    assert tree == [
+        (2, ["loop", "2"], [(3, ["click", "1", "2"], None)]),
+        (5, ["macro", "m"], [(6, ["press", "q"], None)]),
+    ]
+
+@pytest.mark.parametrize("source, message", [
+    ("end", "1번째 줄: 짝이 맞지 않는 end"),
+    ("loop 2\n  click 1 2", "1번째 줄: 블록이 end로 닫히지 않았습니다"),
+    ("loop 2\n  macro m\n  end\nend", "2번째 줄: macro는 블록 밖에서만"),
+])
+def test_parse_errors(source, message):
+    with pytest.raises(ValueError, match=message):
+        _parse(source)
+
+def test_loop_counts():
+    clicks, _ = _run("loop 3\n  click 1 2\nend\nclick 5 6 4 times")
+    assert [(x, y) for x, y, hold in clicks] == [(1, 2)] * 3 + [(5, 6)] * 4
+
+def test_nested_loops():
+    clicks, _ = _run("loop 2\n  loop 3x\n    click 1 1\n  end\n  click 2 2\nend")
+    assert [x for x, y, hold in clicks] == [1, 1, 1, 2, 1, 1, 1, 2]
+
+def test_zero_and_variable_counts():
+    clicks, _ = _run("set n = 2\nset m = n * 3\nloop 0\n  click 9 9\nend\nloop m\n  click n m\nend")
+    assert [(x, y) for x, y, hold in clicks] == [(2, 6)] * 6
+
+def test_nested_macros():
+    source = (
+        "call outer\ncall outer\n"
+        "macro outer\n  click 1 1\n  call inner\nend\n"
+        "macro inner\n  loop 2\n    press q\n  end\nend\n"
+    )
+    program = compile_script(source, _resolve_key)
+    assert _ops(program).count(OP_CALL) == 3
+    assert _ops(program).count(OP_RET) == 2
+    assert _ops(program)[2] == OP_HALT
+    clicks, runner = _run(source)
+    assert len(clicks) == 2
+    assert runner.keyboard.events == [("down", 0x51), ("up", 0x51)] * 4
+
+def test_variable_set_in_macro_is_global():
+    clicks, _ = _run("call setup\nclick x 0\nmacro setup\n  set x = 7\nend")
+    assert [(x, y) for x, y, hold in clicks] == [(7, 0)]
+
+@pytest.mark.parametrize("source", [
+    "macro a\n  call a\nend",
+    "macro a\n  call b\nend\nmacro b\n  call c\nend\nmacro c\n  call a\nend",
+])
+def test_recursion_rejected(source):
+    with pytest.raises(ValueError, match="매크로 재귀 호출"):
+        compile_script(source, _resolve_key)
+
+def test_variable_wait():
+    program = compile_script("set t = 3\nwait t ms", _resolve_key)
+    # 변수 대기는 실행할 때 단위를 곱한 뒤 대기
+    assert _ops(program) == [OP_SET, OP_MUL, OP_WAIT, OP_HALT]
+    _, runner = _run("set t = 3\nwait t ms\nwait 2ms")
+    stats = runner.get_stats()
+    assert stats["waits"] + stats["skipped_waits"] == 2
+    assert stats["elapsed"] >= 0.005
+
+def test_keys_released_at_end():
+    _, runner = _run("down shift\npress q")
+    assert runner.keyboard.events == [("down", 0x10), ("down", 0x51), ("up", 0x51), ("up", 0x10)]
+
+def test_move_and_arithmetic():
+    _, runner = _run("set x = 17\nset y = x % 5\nset x = x / 5\nmove x y")
+    assert runner.backend_func().moves == [(3, 2)]
+
+@pytest.mark.parametrize("source, message", [
+    ("click x 1", "1번째 줄: 정의되지 않은 변수: x"),
+    ("\ncall nothing", "2번째 줄: 정의되지 않은 매크로"),
+    ("press nokey", "1번째 줄: 알 수 없는 키"),
+    ("set loop = 1", "1번째 줄: 변수 이름으로 쓸 수 없습니다"),
+    ("jump 3", "1번째 줄: 알 수 없는 문장"),
+    ("wait", "1번째 줄: 시간이 필요합니다"),
+])
+def test_compile_errors(source, message):
+    with pytest.raises(ValueError, match=message):
+        compile_script(source, _resolve_key)
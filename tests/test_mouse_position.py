@@ -0,0 +1,55 @@
+"""위치 소스 테스트 (user32 대체 객체 사용)"""
+from src.core.mouse_position import PollingPositionSource, PositionSource
+
+class _User32:
+    """GetCursorPos만 흉내 내는 user32 대체 객체"""
+
+    def __init__(self, x=0, y=0):
+        self.x = x
+        self.y = y
+
+    def GetCursorPos(self, point_ref):
+        point = point_ref._obj
+        point.x = self.x
+        point.y = self.y
+        return 1
+
+def test_set_swaps_position_tuple_and_counts_changes():
+    """_set()은 위치를 튜플 하나로 바꾸고 바뀐 경우에만 version 증가"""
+    source = PositionSource()
+    calls = []
+    source.set_listener(lambda x, y: calls.append((x, y)))
+
+    source._set(10, 20)
+    source._set(10, 20)
+    source._set(10, 21)
+
+    assert source.pos == (10, 21)
+    assert source.position() == (10, 21)
+    assert source.version == 2
+    assert source.updates == 3
+    assert calls == [(10, 20), (10, 21)]
+
+def test_polling_position_reads_without_touching_version():
+    """폴링 소스의 position()은 현재 위치를 읽기만 하고 version은 폴링 스레드만 갱신"""
+    user32 = _User32(5, 6)
+    source = PollingPositionSource(user32=user32)
+
+    user32.x, user32.y = 7, 8
+    assert source.position() == (7, 8)
+    assert source.version == 0
+    assert source.pos == (0, 0)
+
+    source._set(*source._poll_read())
+    assert source.pos == (7, 8)
+    assert source.version == 1
+
+def test_polling_start_records_initial_position():
+    """폴링 시작 시 첫 폴링 전에 현재 위치를 기록"""
+    source = PollingPositionSource(rate_hz=1, user32=_User32(3, 4))
+    source.start()
+    try:
+        assert source.pos == (3, 4)
+        assert source.version == 1
+    finally:
+        source.stop()
@@ -0,0 +1,98 @@
+"""타임라인 재생기 테스트 (입력은 RecordingBackend에 기록)"""
+import random
+
+import pytest
+
+from src.core import playback
+from src.core.input_backend import EVENT_KEY_DOWN, EVENT_KEY_UP, EVENT_MOVE, RecordingBackend
+from src.core.playback import TimelinePlayer
+from src.core.timeline import (
+    EVENT_CLICK, EVENT_KEY_DOWN as T_KEY_DOWN, EVENT_KEY_UP as T_KEY_UP, EVENT_MOUSE_MOVE, RECORD,
+    Timeline,
+)
+
+@pytest.fixture(autouse=True)
+def small_checkpoints(monkeypatch):
+    """검사점 간격을 4로 줄여 검사점 경계를 자주 지나게 함"""
+    monkeypatch.setattr(playback, "SEEK_CHECKPOINT_SHIFT", 2)
+    monkeypatch.setattr(playback, "SEEK_CHECKPOINT_INTERVAL", 4)
+
+def _random_timeline(count, seed=1):
+    """키 기록 사이사이 마우스 이동/클릭이 섞인 타임라인 (키만 이어지는 구간 포함)"""
+    rng = random.Random(seed)
+    records = []
+    for i in range(count):
+        kind = rng.choice((EVENT_MOUSE_MOVE, EVENT_CLICK, T_KEY_DOWN, T_KEY_UP, T_KEY_DOWN, T_KEY_UP))
+        if 20 <= i < 35:
+            kind = T_KEY_DOWN  # 커서 위치 기록이 없는 긴 구간
+        records.append(RECORD.pack(kind, 0, 0, i, -i, rng.randrange(0, 1000)))
+    return Timeline(b"".join(records), ["a"])
+
+def _expected(timeline, target_ns):
+    """모든 기록을 훑어 구한 _find() 기대값"""
+    t = 0
+    position = None
+    for index, (kind, flags, code, x, y, delta) in enumerate(timeline):
+        if t + delta >= target_ns:
+            return index, t, position
+        t += delta
+        if kind in (EVENT_MOUSE_MOVE, EVENT_CLICK):
+            position = (x, y)
+    return len(timeline), t, position
+
+def test_find_matches_full_scan_in_any_order():
+    """검사점이 어떤 순서로 쌓여도 전체를 훑은 결과와 같음"""
+    timeline = _random_timeline(101)
+    player = TimelinePlayer(RecordingBackend)
+    player.load(timeline)
+    duration = timeline.duration_ns
+    targets = [duration + 1, 0, 1, duration // 2, duration // 3, duration, duration // 7]
+    targets += random.Random(2).sample(range(duration + 2), 40)
+
+    for target in targets:
+        assert player._find(target) == _expected(timeline, target)
+
+    # 검사점은 구간마다 하나씩, 경계 순서대로만 추가됨
+    assert len(player._checkpoint_times) == len(timeline) // 4
+    assert list(player._checkpoint_times) == sorted(player._checkpoint_times)
+
+def test_checkpoints_from_playback_match_seek_scan():
+    """재생하면서 남긴 검사점은 이동할 때 훑어서 만든 검사점과 같음"""
+    timeline = _random_timeline(50, seed=3)
+    scanned = TimelinePlayer(RecordingBackend)
+    scanned.load(timeline)
+    scanned._find(timeline.duration_ns + 1)
+
+    backend = RecordingBackend()
+    player = TimelinePlayer(lambda: backend, speed=10.0)
+    player.load(Timeline(timeline.records, ["a"]))
+    player.spin_ns = 0
+    assert player.start()
+    player.thread.join(5.0)
+
+    assert player.events_played == len(timeline)
+    assert len(player._checkpoint_times) == len(timeline) // 4
+    assert player._checkpoint_times == scanned._checkpoint_times
+    assert player._checkpoint_positions == scanned._checkpoint_positions
+
+def test_seek_before_start_moves_cursor_and_skips_earlier_records():
+    records = b"".join((
+        RECORD.pack(EVENT_MOUSE_MOVE, 0, 0, 10, 20, 1_000),
+        RECORD.pack(T_KEY_DOWN, 0, 0, 0, 0, 1_000),
+        RECORD.pack(T_KEY_UP, 0, 0, 0, 0, 1_000),
+        RECORD.pack(EVENT_MOUSE_MOVE, 0, 0, 30, 40, 1_000),
+    ))
+    backend = RecordingBackend()
+    player = TimelinePlayer(lambda: backend)
+    player.load(Timeline(records, ["a"]))
+    player.seek(2_500 / 1_000_000_000)
+    assert player.start()
+    player.thread.join(5.0)
+
+    # 이동 위치 직전 커서 위치로 옮긴 뒤 세 번째 기록부터 재생 (누르지 않은 키의 해제도 그대로 주입)
+    assert [(kind, a, b) for t, kind, a, b in backend.events] == [
+        (EVENT_MOVE, 10, 20),
+        (EVENT_KEY_UP, "a", 0),
+        (EVENT_MOVE, 30, 40),
+    ]
+    assert EVENT_KEY_DOWN not in [kind for t, kind, a, b in backend.events]
@@ -0,0 +1,134 @@
+"""키 반복 스케줄러 테스트 (입력은 RecordingBackend에 기록)"""
+import threading
+import time
+
+import pytest
+
+from src.core.input_backend import EVENT_KEY_DOWN, EVENT_KEY_UP, RecordingBackend
+from src.core.repeat_scheduler import RepeatScheduler
+
+MS = 1_000_000
+
+@pytest.fixture
+def backend():
+    return RecordingBackend()
+
+@pytest.fixture
+def scheduler(backend):
+    scheduler = RepeatScheduler(backend.key_down, backend.key_up)
+    scheduler.set_timing(0.005, 0.005)
+    yield scheduler
+    scheduler.close(timeout=1.0)
+
+def _key_events(backend, key):
+    """키 하나의 누름/해제 순서"""
+    return [kind for t, kind, value, _ in list(backend.events) if value == key]
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.001)
+    return True
+
+def test_press_release_alternate(backend, scheduler):
+    assert scheduler.start("a")
+    assert not scheduler.start("a")
+    assert _wait_for(lambda: scheduler.get_repeat_count("a") >= 5)
+    scheduler.stop("a")
+    assert scheduler.wait_idle(1.0)
+
+    events = _key_events(backend, "a")
+    assert events[0] == EVENT_KEY_DOWN
+    assert events == [EVENT_KEY_DOWN, EVENT_KEY_UP] * (len(events) // 2)
+    assert not backend.keys_down
+
+def test_presses_follow_period(backend, scheduler):
+    scheduler.start("a")
+    assert _wait_for(lambda: scheduler.get_repeat_count("a") >= 6)
+    scheduler.stop("a")
+    scheduler.wait_idle(1.0)
+
+    presses = backend.timestamps(EVENT_KEY_DOWN, "a")
+    intervals = [b - a for a, b in zip(presses, presses[1:])]
+    # 데드라인 기준 예약이므로 간격의 평균은 주기(10ms)에 가까움
+    assert sum(intervals) / len(intervals) == pytest.approx(10 * MS, rel=0.5)
+    assert all(interval > 0 for interval in intervals)
+
+def test_events_in_deadline_order(backend, scheduler):
+    scheduler.set_timing(0.02, 0.02)
+    scheduler.start("a")
+    time.sleep(0.01)
+    scheduler.start("b")
+    assert _wait_for(lambda: scheduler.get_repeat_count("b") >= 2)
+    scheduler.stop_all()
+    assert scheduler.wait_idle(1.0)
+
+    times = [t for t, kind, value, _ in backend.events]
+    assert times == sorted(times)
+    keys = [value for t, kind, value, _ in backend.events if kind == EVENT_KEY_DOWN]
+    # 10ms 차이로 시작한 두 키는 번갈아 눌림
+    assert keys[:4] == ["a", "b", "a", "b"]
+
+def test_stop_releases_held_key_immediately(backend, scheduler):
+    scheduler.set_timing(1.0, 1.0)
+    scheduler.start("a")
+    assert _wait_for(lambda: "a" in backend.keys_down)
+    stopped = time.perf_counter_ns()
+    scheduler.stop("a")
+    assert scheduler.wait_idle(1.0)
+
+    # 누름 유지 시간(1초)을 기다리지 않고 바로 해제
+    assert backend.timestamps(EVENT_KEY_UP, "a")[-1] - stopped < 500 * MS
+    assert not scheduler.is_active("a")
+    assert scheduler.active_keys() == []
+    count = len(backend.events)
+    time.sleep(0.05)
+    assert len(backend.events) == count
+
+def test_cancel_one_key_keeps_others(backend, scheduler):
+    scheduler.start("a")
+    scheduler.start("b")
+    assert _wait_for(lambda: scheduler.get_repeat_count("b") >= 2)
+    scheduler.stop("a")
+    assert not scheduler.stop("a")
+    scheduler.wait_idle(1.0)
+    before = scheduler.get_repeat_count("b")
+    assert _wait_for(lambda: scheduler.get_repeat_count("b") > before)
+    assert scheduler.active_keys() == ["b"]
+
+def test_restart_after_stop(backend, scheduler):
+    scheduler.start("a")
+    assert _wait_for(lambda: scheduler.get_repeat_count("a") >= 1)
+    scheduler.stop("a")
+    assert scheduler.start("a")
+    assert _wait_for(lambda: scheduler.get_repeat_count("a") >= 3)
+    scheduler.stop("a")
+    scheduler.wait_idle(1.0)
+    events = _key_events(backend, "a")
+    assert events == [EVENT_KEY_DOWN, EVENT_KEY_UP] * (len(events) // 2)
+
+def test_failing_key_finishes_after_retries(backend):
+    finished = threading.Event()
+
+    def press(key):
+        raise OSError("주입 실패")
+
+    scheduler = RepeatScheduler(press, backend.key_up)
+    scheduler.retry_delay_ns = MS
+    scheduler.on_finished = lambda key: finished.set()
+    try:
+        scheduler.start("a")
+        assert finished.wait(1.0)
+        assert not scheduler.is_active("a")
+    finally:
+        scheduler.close(timeout=1.0)
+
+def test_close_stops_thread(backend):
+    scheduler = RepeatScheduler(backend.key_down, backend.key_up)
+    scheduler.start("a")
+    assert _wait_for(lambda: "a" in backend.keys_down)
+    assert scheduler.close(timeout=1.0)
+    assert not scheduler.is_alive()
+    assert not backend.keys_down
@@ -0,0 +1,141 @@
+"""타임라인 형식과 녹화기 테스트"""
+import threading
+
+import pytest
+
+from src.core.recorder import InputRecorder
+from src.core.timeline import (
+    EVENT_IDLE, EVENT_KEY_DOWN, EVENT_KEY_UP, EVENT_MOUSE_DOWN, EVENT_MOUSE_MOVE, HEADER, MAGIC,
+    MAX_DELTA_NS, RECORD, VERSION, Timeline,
+)
+
+class _NoHook:
+    """녹화기가 연결할 키보드 훅 대체 객체"""
+
+    def add_listener(self, listener):
+        pass
+
+    def remove_listener(self, listener):
+        pass
+
+def _timeline():
+    records = b"".join((
+        RECORD.pack(EVENT_MOUSE_MOVE, 0, 0, 100, -200, 0),
+        RECORD.pack(EVENT_KEY_DOWN, 0, 1, 0, 0, 1_000_000),
+        RECORD.pack(EVENT_KEY_UP, 0, 1, 0, 0, 2_000_000),
+        RECORD.pack(EVENT_MOUSE_DOWN, 0, 0, 2_147_483_647, -2_147_483_648, MAX_DELTA_NS),
+    ))
+    return Timeline(records, ["a", "한글", "shift"], created_ns=123_456_789)
+
+def test_round_trip():
+    timeline = _timeline()
+    loaded = Timeline.from_bytes(timeline.to_bytes())
+    assert list(loaded) == list(timeline)
+    assert loaded.names == ("a", "한글", "shift")
+    assert loaded.created_ns == 123_456_789
+    assert loaded.duration_ns == 3_000_000 + MAX_DELTA_NS
+
+def test_header():
+    timeline = _timeline()
+    data = timeline.to_bytes()
+    names_size = len("a\0한글\0shift".encode("utf-8"))
+    assert HEADER.unpack_from(data) == (MAGIC, VERSION, RECORD.size, 4, 123_456_789, names_size)
+    assert len(data) == timeline.nbytes == HEADER.size + 4 * RECORD.size + names_size
+
+def test_save_and_open(tmp_path):
+    path = tmp_path / "macro.aitl"
+    _timeline().save(path)
+    timeline = Timeline.open(path)
+    try:
+        assert list(timeline) == list(_timeline())
+        assert timeline[-1][0] == EVENT_MOUSE_DOWN
+    finally:
+        timeline.close()
+
+def test_empty_round_trip():
+    loaded = Timeline.from_bytes(Timeline().to_bytes())
+    assert len(loaded) == 0
+    assert loaded.names == ()
+
+@pytest.mark.parametrize("data", [
+    b"AITL",
+    b"XXXX" + bytes(HEADER.size),
+    HEADER.pack(MAGIC, VERSION + 1, RECORD.size, 0, 0, 0),
+    HEADER.pack(MAGIC, VERSION, RECORD.size, 2, 0, 0) + bytes(RECORD.size),
+])
+def test_invalid_data(data):
+    with pytest.raises(ValueError):
+        Timeline.from_bytes(data)
+
+def test_records_must_be_whole():
+    with pytest.raises(ValueError):
+        Timeline(bytes(RECORD.size + 1))
+
+def test_recorder_splits_long_gaps():
+    recorder = InputRecorder(key_hook=_NoHook(), record_mouse=False)
+    recorder.start()
+    start = recorder._last_ns
+    recorder.record_key("a", True, start + 2 * MAX_DELTA_NS + 5)
+    timeline = recorder.stop()
+    assert [record[0] for record in timeline] == [EVENT_IDLE, EVENT_IDLE, EVENT_KEY_DOWN]
+    assert [record[5] for record in timeline] == [MAX_DELTA_NS, MAX_DELTA_NS, 5]
+    assert timeline.names == ("a",)
+
+def test_recorder_coalesces_moves_at_last_event_time():
+    recorder = InputRecorder(key_hook=_NoHook(), record_mouse=False, move_interval_ms=4)
+    recorder.start()
+    start = recorder._last_ns
+    recorder.record(EVENT_MOUSE_MOVE, 0, 1, 1, start + 10_000_000)
+    recorder.record(EVENT_MOUSE_MOVE, 0, 2, 2, start + 11_000_000)
+    recorder.record(EVENT_MOUSE_MOVE, 0, 3, 3, start + 13_000_000)
+    recorder.record(EVENT_MOUSE_MOVE, 0, 4, 4, start + 15_000_000)
+    recorder.record_key("a", True, start + 20_000_000)
+    timeline = recorder.stop()
+
+    # 4ms 안의 이동은 마지막 이동의 좌표와 시각으로 합쳐짐
+    assert list(timeline) == [
+        (EVENT_MOUSE_MOVE, 0, 0, 3, 3, 13_000_000),
+        (EVENT_MOUSE_MOVE, 0, 0, 4, 4, 2_000_000),
+        (EVENT_KEY_DOWN, 0, 0, 0, 0, 5_000_000),
+    ]
+    assert timeline.duration_ns == 20_000_000
+    assert recorder.coalesced_moves == 2
+
+def test_recorder_does_not_coalesce_past_max_delta():
+    """합친 이동의 시간 차가 uint32를 넘으면 새 이동 기록으로 나눔"""
+    recorder = InputRecorder(key_hook=_NoHook(), record_mouse=False, move_interval_ms=10_000)
+    recorder.start()
+    start = recorder._last_ns
+    recorder.record(EVENT_MOUSE_MOVE, 0, 1, 1, start + MAX_DELTA_NS - 10)
+    recorder.record(EVENT_MOUSE_MOVE, 0, 2, 2, start + MAX_DELTA_NS - 5)
+    recorder.record(EVENT_MOUSE_MOVE, 0, 3, 3, start + 2 * MAX_DELTA_NS + 7)
+    timeline = recorder.stop()
+
+    assert list(timeline) == [
+        (EVENT_MOUSE_MOVE, 0, 0, 2, 2, MAX_DELTA_NS - 5),
+        (EVENT_IDLE, 0, 0, 0, 0, MAX_DELTA_NS),
+        (EVENT_MOUSE_MOVE, 0, 0, 3, 3, 12),
+    ]
+    assert timeline.duration_ns == 2 * MAX_DELTA_NS + 7
+    assert recorder.coalesced_moves == 1
+
+def test_recorder_key_names_from_threads():
+    """여러 스레드에서 기록해도 키 이름마다 색인 하나만 부여"""
+    recorder = InputRecorder(key_hook=_NoHook(), record_mouse=False)
+    recorder.start()
+    names = [f"k{i}" for i in range(50)]
+
+    def press_all():
+        for name in names:
+            recorder.record_key(name, True)
+
+    threads = [threading.Thread(target=press_all) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    timeline = recorder.stop()
+
+    assert sorted(timeline.names) == sorted(names)
+    assert len(timeline) == 200
+    assert {timeline.names[record[2]] for record in timeline} == set(names)